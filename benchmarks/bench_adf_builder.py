@@ -0,0 +1,73 @@
+"""
+Throughput of building + encoding comment payloads (POST /issue/{key}/comment bodies).
+
+Usage:
+    python -m benchmarks.bench_adf_builder [--count 10000] [--templates 20]
+
+"before" is the previous path: one hand-built paragraph dict per comment,
+serialized with json.dumps as requests does. "after" parses Markdown into
+real ADF (lists, code, links) and encodes with json_codec.encode_json.
+"""
+import argparse
+import json
+import time
+
+from src import adf_builder, json_codec, jira_payloads
+
+TEMPLATE = """Build {n} finished with **{status}**.
+
+- commit `{sha}`
+- logs: https://ci.example.com/builds/{n}
+
+```
+pytest -q -k issue_{n}
+```"""
+
+
+def legacy_comment_payload(text):
+    return {"body": {"type": "doc", "version": 1,
+                     "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]}}
+
+
+def comments(count, templates):
+    """`count` comment texts; with `templates` > 0 they cycle through that many distinct ones."""
+    distinct = templates or count
+    return [TEMPLATE.format(n=i % distinct, status="passed" if i % 3 else "failed", sha=f"{i % distinct:07x}")
+            for i in range(count)]
+
+
+def run(label, build, encode, texts):
+    start = time.perf_counter()
+    total = 0
+    for text in texts:
+        total += len(encode(build(text)))
+    elapsed = time.perf_counter() - start
+    print(f"  {label:34}{len(texts) / elapsed:12,.0f}{elapsed * 1e3:10.1f}{total / len(texts):10.0f}")
+
+
+def legacy_encode(payload):
+    return json.dumps(payload).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADF builder benchmark")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--templates", type=int, default=20)
+    args = parser.parse_args()
+
+    encoder = "orjson" if json_codec.orjson is not None else "json (compact encoder)"
+    print(f"{args.count} comment payloads, encoder: {encoder}")
+    cases = ((f"{args.templates} repeated templates", comments(args.count, args.templates)),
+             ("all distinct", comments(args.count, 0)),
+             ("all distinct, plain one-liners", [f"Deployed build {i} to staging." for i in range(args.count)]))
+    for label, texts in cases:
+        adf_builder._cached_blocks.cache_clear()
+        adf_builder._cached_inline.cache_clear()
+        print(label)
+        print(f"  {'path':34}{'payloads/s':>12}{'ms':>10}{'bytes':>10}")
+        run("before: single paragraph + dumps", legacy_comment_payload, legacy_encode, texts)
+        run("after: Markdown ADF + encode_json", jira_payloads.comment_payload, json_codec.encode_json, texts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+ADF rendering over synthetic documents: deep nesting and multi-MB width.
+
+Usage:
+    python -m benchmarks.bench_adf_renderer [--depth 5000] [--paragraphs 20000]
+
+Compares the iterative streaming renderer with a naive recursive one that
+joins child strings at every level (the usual first implementation).
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from src.adf_renderer import iter_adf, render_adf
+
+
+def deep_document(depth):
+    """Bullet lists nested `depth` levels deep."""
+    node = {"type": "paragraph", "content": [{"type": "text", "text": "leaf"}]}
+    for level in range(depth):
+        node = {"type": "bulletList", "content": [{"type": "listItem", "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": f"level {level}"}]}, node]}]}
+    return {"type": "doc", "version": 1, "content": [node]}
+
+
+def wide_document(paragraphs):
+    """Mixed blocks (paragraphs with marks, lists, code, tables) totalling `paragraphs` blocks."""
+    text = {"type": "text", "text": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. "}
+    bold = {"type": "text", "text": "important", "marks": [{"type": "strong"}]}
+    mention = {"type": "mention", "attrs": {"id": "abc", "text": "@Bench User"}}
+    blocks = []
+    for i in range(paragraphs):
+        kind = i % 4
+        if kind == 0:
+            blocks.append({"type": "paragraph", "content": [text, bold, mention]})
+        elif kind == 1:
+            blocks.append({"type": "bulletList", "content": [
+                {"type": "listItem", "content": [{"type": "paragraph", "content": [text]}]} for _ in range(3)]})
+        elif kind == 2:
+            blocks.append({"type": "codeBlock", "attrs": {"language": "python"},
+                           "content": [{"type": "text", "text": "for i in range(10):\n    print(i)"}]})
+        else:
+            cell = {"type": "tableCell", "content": [{"type": "paragraph", "content": [bold]}]}
+            blocks.append({"type": "table", "content": [{"type": "tableRow", "content": [cell] * 3}] * 2})
+    return {"type": "doc", "version": 1, "content": blocks}
+
+
+def recursive_render(node):
+    """Reference: recursive, builds a string per subtree."""
+    if node.get("type") == "text":
+        return node.get("text", "")
+    parts = [recursive_render(child) for child in node.get("content", [])]
+    separator = "\n" if node.get("type") in ("doc", "bulletList", "listItem") else ""
+    return separator.join(parts)
+
+
+def measure(fn, doc):
+    """(outcome, ms, peak KiB); timed without tracemalloc, which slows allocation-heavy code."""
+    start = time.perf_counter()
+    try:
+        fn(doc)
+    except RecursionError:
+        return "RecursionError", (time.perf_counter() - start) * 1e3, float("nan")
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(doc)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return "ok", elapsed * 1e3, peak / 1024
+
+
+def stream(doc):
+    for _ in iter_adf(doc):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ADF renderer benchmark")
+    parser.add_argument("--depth", type=int, default=5000)
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    args = parser.parse_args()
+
+    documents = {
+        f"deep ({args.depth} levels)": deep_document(args.depth),
+        f"wide ({args.paragraphs} blocks)": wide_document(args.paragraphs),
+    }
+    for name, doc in documents.items():
+        size_mb = len(json.dumps(doc)) / 1e6 if "wide" in name else None
+        print(name + (f", {size_mb:.1f} MB of ADF JSON" if size_mb else ""))
+        print(f"  {'renderer':22}{'result':>16}{'ms':>10}{'peak KiB':>12}")
+        for label, fn in (("recursive (reference)", recursive_render),
+                          ("render_adf (joined)", render_adf),
+                          ("iter_adf (streamed)", stream)):
+            outcome, ms, peak = measure(fn, doc)
+            print(f"  {label:22}{outcome:>16}{ms:10.1f}{peak:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
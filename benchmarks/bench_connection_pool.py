@@ -0,0 +1,66 @@
+"""
+Requests/second against a local stub JIRA, with and without the pooled session.
+
+Usage:
+    python -m benchmarks.bench_connection_pool [--requests 500]
+
+Note: the stub is plain HTTP on loopback, so this only measures the TCP
+connect saving. Against Atlassian Cloud the TLS handshake is also skipped
+and the gap is considerably larger.
+"""
+import argparse
+import os
+import time
+
+import requests
+
+from benchmarks.stub_jira_server import StubJiraServer
+from src.jira_client import JiraClient
+
+
+def _rate(count, elapsed):
+    return count / elapsed if elapsed else float("inf")
+
+
+def bench_unpooled(client, count):
+    url = f"{client.jira_url}/rest/api/3/myself"
+    start = time.perf_counter()
+    for _ in range(count):
+        response = requests.get(url, headers=client.headers, timeout=client.pool_config.timeout)
+        response.json()
+    return time.perf_counter() - start
+
+
+def bench_pooled(client, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        client.get("/rest/api/3/myself")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Connection pool benchmark")
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with StubJiraServer() as server:
+        os.environ.update({
+            "JIRA_URL": server.url,
+            "JIRA_USER_EMAIL": "bench@example.com",
+            "JIRA_API_TOKEN": "bench",
+            "JIRA_PROJECT_KEY": "BENCH",
+        })
+        client = JiraClient()
+        client.get("/rest/api/3/myself")  # warm up
+
+        unpooled = bench_unpooled(client, args.requests)
+        pooled = bench_pooled(client, args.requests)
+
+    print(f"Requests: {args.requests}")
+    print(f"Without pool: {_rate(args.requests, unpooled):8.1f} req/s ({unpooled:.3f}s)")
+    print(f"With pool:    {_rate(args.requests, pooled):8.1f} req/s ({pooled:.3f}s)")
+    print(f"Speedup:      {unpooled / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Wall time of a multi-step agent workflow as separate MCP tool calls vs one
+execute_batch call.
+
+Usage:
+    python -m benchmarks.bench_execute_batch [--issues 3] [--latency 0.05] [--host-overhead 0.5]
+
+For each issue the workflow reads it, moves it to In Progress and comments.
+Separate calls run one after another, as an agent issues them, and each one
+also pays `--host-overhead` seconds for the LLM host's turn between tool
+calls (not slept; added to the measured time). The batch pays it once. JIRA
+is the in-process fake with `--latency` per response.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import time
+
+import src.mcp_server as mcp_server
+from src.async_jira_client import AsyncJiraClient
+from src.async_jira_service import AsyncJiraService
+from src.http_pool import PoolConfig
+from src.rate_limiter import TokenBucket
+from tests.fake_jira_server import Faults, FakeJiraServer
+
+
+def workflow(keys):
+    """(tool, args) steps: read, move, comment for every key."""
+    steps = []
+    for key in keys:
+        steps.append(("get_issue", {"issue_key": key}))
+        steps.append(("transition_issue", {"issue_key": key, "status_name": "In Progress"}))
+        steps.append(("add_comment", {"issue_key": key, "comment_text": "Picked up by the agent"}))
+    return steps
+
+
+async def run(server, keys):
+    client = AsyncJiraClient(settings=server.settings(), pool_config=PoolConfig(), limiter=TokenBucket())
+    previous, mcp_server.jira_service = mcp_server.jira_service, AsyncJiraService(client=client)
+    tools = {"get_issue": mcp_server.get_issue, "transition_issue": mcp_server.transition_issue,
+             "add_comment": mcp_server.add_comment}
+    try:
+        await mcp_server.jira_service.get_myself_account_id()  # connection warmed for both modes
+        steps = workflow(keys)
+        started = time.perf_counter()
+        for tool, args in steps:
+            await tools[tool](**args)
+        separate = time.perf_counter() - started
+
+        for key in keys:  # back to the start state so the batch repeats the same work
+            await tools["transition_issue"](key, "READY FOR DEVELOPMENT")
+        mcp_server.jira_service.cache.invalidate()
+        started = time.perf_counter()
+        report = json.loads(await mcp_server.execute_batch([{"tool": tool, "args": args} for tool, args in steps]))
+        batched = time.perf_counter() - started
+        assert report["ok"], report
+    finally:
+        mcp_server.jira_service = previous
+        await client.aclose()
+    return len(steps), separate, batched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="execute_batch latency benchmark")
+    parser.add_argument("--issues", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake JIRA seconds per response")
+    parser.add_argument("--host-overhead", type=float, default=0.5, help="LLM host seconds per tool call")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    with FakeJiraServer(faults=Faults(latency=args.latency)) as server:
+        project_key = server.settings().project_key
+        with server.state.lock:
+            keys = [server.state.add_issue(project_key, f"Issue {i}")["key"] for i in range(args.issues)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            calls, separate, batched = asyncio.run(run(server, keys))
+
+    print(f"{calls} operations on {args.issues} issues, {args.latency * 1000:.0f} ms JIRA latency, "
+          f"{args.host_overhead:.1f} s host overhead per tool call\n")
+    print(f"{'mode':16}{'tool calls':>11}{'JIRA s':>9}{'end-to-end s':>14}")
+    print(f"{'separate calls':16}{calls:11}{separate:9.2f}{separate + calls * args.host_overhead:14.2f}")
+    print(f"{'execute_batch':16}{1:11}{batched:9.2f}{batched + args.host_overhead:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
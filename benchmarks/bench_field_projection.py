@@ -0,0 +1,102 @@
+"""
+Bytes transferred and JSON parse time per get_issue call, full vs projected.
+
+Usage:
+    python -m benchmarks.bench_field_projection [--calls 200]
+
+The stub serves a synthetic but realistically shaped issue (custom fields,
+renderedFields, changelog, comments) and honours ?fields= like JIRA does.
+"""
+import argparse
+import json
+import os
+import time
+
+from benchmarks.stub_jira_server import StubJiraServer
+from src import jira_payloads
+from src.jira_client import JiraClient
+
+ISSUE_PATH = "/rest/api/3/issue/BENCH-1"
+
+
+def _adf(text, paragraphs=3):
+    return {"type": "doc", "version": 1, "content": [
+        {"type": "paragraph", "content": [{"type": "text", "text": f"{text} {i}"}]} for i in range(paragraphs)]}
+
+
+def build_full_issue():
+    person = {"accountId": "5b10ac8d82e05b22cc7d4ef5", "displayName": "Bench User",
+              "emailAddress": "bench@example.com", "active": True, "timeZone": "UTC",
+              "avatarUrls": {size: f"https://avatar.example.com/{size}.png" for size in ("16x16", "24x24", "32x32", "48x48")}}
+    fields = {
+        "summary": "Benchmark issue",
+        "status": {"name": "In Progress", "id": "3", "self": "https://bench/rest/api/3/status/3",
+                   "statusCategory": {"id": 4, "key": "indeterminate", "name": "In Progress", "colorName": "yellow"}},
+        "assignee": person,
+        "reporter": person,
+        "creator": person,
+        "priority": {"name": "High", "id": "2", "iconUrl": "https://bench/images/icons/priorities/high.svg"},
+        "description": _adf("Description paragraph", 5),
+        "comment": {"comments": [{"id": str(i), "author": person, "body": _adf("Comment", 2),
+                                  "created": "2026-10-18T10:00:00.000+0000"} for i in range(20)], "total": 20},
+        "attachment": [{"id": str(i), "filename": f"file{i}.png", "author": person, "size": 1024 * i} for i in range(5)],
+    }
+    for i in range(80):
+        fields[f"customfield_{10000 + i}"] = {"value": f"Option {i}", "id": str(i), "self": f"https://bench/option/{i}"}
+    return {
+        "key": "BENCH-1",
+        "id": "10001",
+        "fields": fields,
+        "renderedFields": {"description": "<p>" + "Rendered text. " * 200 + "</p>"},
+        "changelog": {"histories": [{"id": str(i), "author": person, "created": "2026-10-18T10:00:00.000+0000",
+                                     "items": [{"field": "status", "fromString": "To Do", "toString": "Done"}]}
+                                    for i in range(50)]},
+    }
+
+
+FULL_ISSUE = build_full_issue()
+
+
+def issue_route(query):
+    wanted = query.get("fields", ["*all"])[0].split(",")
+    if "*all" in wanted:
+        return FULL_ISSUE
+    return {"key": FULL_ISSUE["key"], "id": FULL_ISSUE["id"],
+            "fields": {f: FULL_ISSUE["fields"][f] for f in wanted if f in FULL_ISSUE["fields"]}}
+
+
+def measure(client, params, calls):
+    total_bytes = 0
+    parse_seconds = 0.0
+    start = time.perf_counter()
+    for _ in range(calls):
+        response = client._send("GET", ISSUE_PATH, params=params)
+        total_bytes += len(response.content)
+        t0 = time.perf_counter()
+        json.loads(response.content)
+        parse_seconds += time.perf_counter() - t0
+    wall = time.perf_counter() - start
+    return total_bytes / calls, parse_seconds / calls * 1e6, wall / calls * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Field projection benchmark")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with StubJiraServer(routes={ISSUE_PATH: issue_route}) as server:
+        os.environ.update({"JIRA_URL": server.url, "JIRA_USER_EMAIL": "bench@example.com",
+                           "JIRA_API_TOKEN": "bench", "JIRA_PROJECT_KEY": "BENCH"})
+        client = JiraClient()
+        before = measure(client, {"fields": "*all", "expand": "renderedFields,changelog"}, args.calls)
+        after = measure(client, jira_payloads.issue_params(), args.calls)
+
+    print(f"Calls: {args.calls}")
+    print(f"{'':10}{'bytes/call':>12}{'parse us/call':>15}{'total ms/call':>15}")
+    print(f"{'before':10}{before[0]:12.0f}{before[1]:15.1f}{before[2]:15.2f}")
+    print(f"{'after':10}{after[0]:12.0f}{after[1]:15.1f}{after[2]:15.2f}")
+    print(f"Bytes reduced {before[0] / after[0]:.1f}x, parse time reduced {before[1] / after[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
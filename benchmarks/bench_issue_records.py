@@ -0,0 +1,79 @@
+"""
+Memory held by N search results kept as parsed JSON, as flat view dicts
+(the old issue_view cache entries) and as IssueRecords.
+
+Usage:
+    python -m benchmarks.bench_issue_records [--issues 100000]
+
+Each issue is parsed from its own JSON text, like a real response, so no
+strings are shared by accident; only IssueRecord interns its low-cardinality
+values (status, assignee, issue type, priority).
+"""
+import argparse
+import json
+import random
+import tracemalloc
+
+from src.issue_view import IssueRecord, project_issue
+
+FIELDS = ["summary", "status", "assignee", "issuetype", "priority", "updated"]
+STATUSES = ["To Do", "In Progress", "QA TESTING", "Done"]
+PEOPLE = [f"Developer {i}" for i in range(25)]
+
+
+def _person(name):
+    slug = name.lower().replace(" ", "")
+    return {"self": f"https://bench.atlassian.net/rest/api/3/user?accountId={slug}", "accountId": slug,
+            "displayName": name, "active": True, "timeZone": "UTC",
+            "avatarUrls": {size: f"https://avatar.example.com/{slug}/{size}.png" for size in ("16x16", "48x48")}}
+
+
+def issue_json(n, rng):
+    status = rng.choice(STATUSES)
+    return json.dumps({
+        "id": str(10000 + n), "key": f"BENCH-{n}", "self": f"https://bench.atlassian.net/rest/api/3/issue/{10000 + n}",
+        "fields": {
+            "summary": f"Benchmark issue number {n}",
+            "status": {"name": status, "id": str(STATUSES.index(status) + 1),
+                       "statusCategory": {"key": "indeterminate", "name": "In Progress", "colorName": "yellow"}},
+            "assignee": _person(rng.choice(PEOPLE)),
+            "issuetype": {"name": rng.choice(["Task", "Bug", "Story"]), "subtask": False,
+                          "iconUrl": "https://bench.atlassian.net/images/icons/issuetypes/task.svg"},
+            "priority": {"name": rng.choice(["High", "Medium", "Low"]), "id": "3",
+                         "iconUrl": "https://bench.atlassian.net/images/icons/priorities/medium.svg"},
+            "updated": f"2026-10-{1 + n % 28:02d}T12:00:00.000+0000",
+        },
+    })
+
+
+def measure(texts, build):
+    """Bytes still allocated after building one value per issue text (parsed JSON freed per issue)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(json.loads(text)) for text in texts]
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(kept) == len(texts)
+    return held
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IssueRecord memory benchmark")
+    parser.add_argument("--issues", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    texts = [issue_json(n, rng) for n in range(args.issues)]
+    rows = [
+        ("parsed JSON", measure(texts, lambda issue: issue)),
+        ("flat view dict", measure(texts, lambda issue: project_issue(issue, FIELDS))),
+        ("IssueRecord", measure(texts, lambda issue: IssueRecord.from_issue(issue, FIELDS))),
+    ]
+    print(f"{args.issues} issues, fields: {', '.join(FIELDS)}\n")
+    print(f"{'representation':16}{'total MiB':>11}{'bytes/issue':>13}{'vs JSON':>9}")
+    for name, held in rows:
+        print(f"{name:16}{held / 2**20:11.1f}{held / args.issues:13.0f}{held / rows[0][1]:9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+MCP server startup cost: import time and spawn-to-first-tool-response over stdio.
+
+Usage:
+    python -m benchmarks.bench_mcp_startup [--runs 3]
+
+JIRA points at a closed local port, so the background pre-warm fails fast and
+the figures cover the server itself, not a network round trip.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import json, time
+start = time.perf_counter()
+import src.mcp_server
+print(json.dumps({"import_ms": (time.perf_counter() - start) * 1000}))
+"""
+
+MESSAGES = [
+    {"jsonrpc": "2.0", "id": 1, "method": "initialize",
+     "params": {"protocolVersion": "2025-06-18", "capabilities": {},
+                "clientInfo": {"name": "startup-bench", "version": "0"}}},
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "rate_limit_metrics", "arguments": {}}},
+]
+
+
+def _env():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = {k: v for k, v in os.environ.items() if not k.startswith("JIRA_")}
+    env.update(JIRA_URL=f"http://127.0.0.1:{port}", JIRA_USER_EMAIL="a", JIRA_API_TOKEN="b",
+               JIRA_PROJECT_KEY="T", JIRA_CACHE_BACKEND="memory")
+    return env
+
+
+def import_ms(env):
+    result = subprocess.run([sys.executable, "-c", IMPORT_PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True, timeout=60)
+    return json.loads(result.stdout)["import_ms"]
+
+
+def first_response_ms(env):
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "src.mcp_server"], cwd=ROOT, env=env,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, text=True)
+    try:
+        process.stdin.write("".join(json.dumps(m) + "\n" for m in MESSAGES))
+        process.stdin.flush()
+        for line in process.stdout:
+            if json.loads(line).get("id") == 2:
+                return (time.perf_counter() - start) * 1000
+        raise RuntimeError("server exited before answering the tool call")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP server startup benchmark")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    env = _env()
+    imports = [import_ms(env) for _ in range(args.runs)]
+    responses = [first_response_ms(env) for _ in range(args.runs)]
+    print(f"{'measure':32}{'best ms':>9}{'mean ms':>9}")
+    print(f"{'import src.mcp_server':32}{min(imports):9.0f}{sum(imports) / len(imports):9.0f}")
+    print(f"{'spawn -> first tool response':32}{min(responses):9.0f}{sum(responses) / len(responses):9.0f}")
+
+
+if __name__ == "__main__":
+    main()
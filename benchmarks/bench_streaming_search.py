@@ -0,0 +1,89 @@
+"""
+Peak RSS of a large JQL search, buffered (response.json() per page) vs
+streamed (issues parsed one by one off the socket).
+
+Usage:
+    python -m benchmarks.bench_streaming_search [--issues 2000] [--page-size 500]
+        [--paragraphs 40]
+
+The fake JIRA runs in this process; each mode runs in a fresh child process
+so ru_maxrss is not shared. The search keeps only key/summary/status per issue,
+as mcp_server.search_tasks does, so the peak is dominated by response handling.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from src.http_pool import PoolConfig
+from src.jira_client import JiraClient
+from src.jira_settings import JiraSettings
+from src.rate_limiter import TokenBucket
+from src.search_paginator import SearchPaginator
+from tests.fake_jira_server import FakeJiraServer
+
+FIELDS = ["summary", "status", "description"]
+
+
+def _description(paragraphs):
+    return {"type": "doc", "version": 1, "content": [
+        {"type": "paragraph", "content": [{"type": "text", "text": f"Paragraph {i}: " + "lorem ipsum " * 12}]}
+        for i in range(paragraphs)]}
+
+
+def _max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+
+def run_child(mode, url, project_key, page_size):
+    """Search every issue in `mode`; prints a JSON line with the RSS growth and wall time."""
+    client = JiraClient(settings=JiraSettings(url, "fake@example.com", "token", project_key),
+                        pool_config=PoolConfig(), limiter=TokenBucket(), http_cache=False)
+    client.get("/rest/api/3/myself")  # connection and imports warmed before the baseline
+    baseline = _max_rss_mb()
+    started = time.perf_counter()
+    paginator = SearchPaginator(client, f"project = {project_key}", FIELDS, page_size=page_size,
+                                stream=(mode == "streamed"))
+    rows = [{"key": i["key"], "summary": i["fields"]["summary"], "status": i["fields"]["status"]["name"]}
+            for i in paginator]
+    print(json.dumps({"mode": mode, "issues": len(rows), "pages": paginator.pages_fetched,
+                      "seconds": time.perf_counter() - started, "rss_growth_mb": _max_rss_mb() - baseline}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming search memory benchmark")
+    parser.add_argument("--issues", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--paragraphs", type=int, default=40, help="Description size per issue")
+    parser.add_argument("--child", choices=["buffered", "streamed"], help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    parser.add_argument("--project", default="TEST", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.url, args.project, args.page_size)
+        return
+
+    with FakeJiraServer() as server:
+        project_key = server.settings().project_key
+        description = _description(args.paragraphs)
+        with server.state.lock:
+            for i in range(args.issues):
+                server.state.add_issue(project_key, f"Issue {i}", description=description)
+        page_bytes = len(json.dumps({"issues": list(server.state.issues.values())[:args.page_size]}))
+        print(f"{args.issues} issues, {args.page_size} per page (~{page_bytes / 2**20:.1f} MiB per page body)\n")
+        print(f"{'mode':10}{'issues':>8}{'pages':>7}{'seconds':>9}{'peak RSS growth MiB':>21}")
+        for mode in ("buffered", "streamed"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_streaming_search", "--child", mode, "--url", server.url,
+                 "--project", project_key, "--page-size", str(args.page_size)],
+                capture_output=True, text=True, check=True).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            print(f"{mode:10}{result['issues']:8}{result['pages']:7}{result['seconds']:9.2f}"
+                  f"{result['rss_growth_mb']:21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Load test: drives JiraService (threads) and the MCP tools (asyncio) against the
+in-process fake JIRA at a target concurrency, and reports throughput and
+p50/p95/p99 latency per operation.
+
+Usage:
+    python -m benchmarks.load_test [--target service|mcp|both] [--concurrency 32]
+        [--requests 2000] [--latency 0.02] [--jitter 0.01]
+        [--error-rate 0.0] [--throttle-rate 0.02] [--issues 500]
+
+Each operation is one call of the service method or tool (including any 429
+retries it needs), so latency is what a caller sees, not per HTTP request.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.async_jira_client import AsyncJiraClient
+from src.async_jira_service import AsyncJiraService
+from src.http_pool import PoolConfig
+from src.jira_client import JiraClient
+from src.jira_service import JiraService
+from src.rate_limiter import TokenBucket
+from src.retry_policy import RetryPolicy
+from tests.fake_jira_server import Faults, FakeJiraServer
+
+# Short backoff so injected 429s cost retries, not wall-clock seconds.
+LOAD_RETRY_POLICY = RetryPolicy(max_retries=6, backoff_base=0.01, backoff_max=0.2)
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples, elapsed):
+    """samples: [(operation, seconds, ok)] -> {"total": row, operation: row}."""
+    groups = {"total": samples}
+    for sample in samples:
+        groups.setdefault(sample[0], []).append(sample)
+    report = {}
+    for name, rows in groups.items():
+        latencies = sorted(seconds for _, seconds, _ in rows)
+        report[name] = {
+            "requests": len(rows),
+            "errors": sum(1 for _, _, ok in rows if not ok),
+            "throughput": len(rows) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+        }
+    return report
+
+
+def format_report(title, report):
+    lines = [title, f"{'operation':20}{'n':>7}{'err':>6}{'ops/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for name, row in sorted(report.items(), key=lambda item: item[0] == "total"):
+        lines.append(f"{name:20}{row['requests']:7}{row['errors']:6}{row['throughput']:9.1f}"
+                     f"{row['p50_ms']:9.1f}{row['p95_ms']:9.1f}{row['p99_ms']:9.1f}")
+    return "\n".join(lines)
+
+
+def operations(keys):
+    """Endless mix of (name, issue_key): mostly reads, some writes."""
+    mix = ["get_issue", "get_issue", "get_issue", "search", "comment", "transition"]
+    return zip(itertools.cycle(mix), itertools.cycle(keys))
+
+
+def run_service_load(server, total, concurrency):
+    """Drive JiraService from `concurrency` threads; returns the summary report."""
+    client = JiraClient(settings=server.settings(), pool_config=PoolConfig(pool_maxsize=concurrency),
+                        limiter=TokenBucket(), retry_policy=LOAD_RETRY_POLICY)
+    service = JiraService(client=client)
+    project = client.project_key
+    calls = {
+        "get_issue": lambda key: service.get_issue_view(key, ["summary", "status"]),
+        "search": lambda key: service.search_issues(f"project = {project}", ["summary"], max_results=50),
+        "comment": lambda key: service.add_comment(key, "Load test comment"),
+        "transition": lambda key: service.transition_issue(key, "In Progress"),
+    }
+
+    def call(op):
+        name, key = op
+        started = time.perf_counter()
+        ok = calls[name](key) not in (None, False)
+        return name, time.perf_counter() - started, ok
+
+    ops = list(itertools.islice(operations(list(server.state.issues)), total))
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(call, ops))
+        elapsed = time.perf_counter() - started
+    return summarize(samples, elapsed)
+
+
+def run_mcp_load(server, total, concurrency):
+    """Drive the MCP tool coroutines with `concurrency` in flight on one event loop."""
+    import src.mcp_server as mcp_server
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # FastMCP's logging setup turns on per-request lines
+
+    async def main():
+        client = AsyncJiraClient(settings=server.settings(), pool_config=PoolConfig(pool_maxsize=concurrency),
+                                 limiter=TokenBucket(), retry_policy=LOAD_RETRY_POLICY)
+        previous, mcp_server.jira_service = mcp_server.jira_service, AsyncJiraService(client=client)
+        project = client.project_key
+        tools = {
+            "get_issue": lambda key: mcp_server.get_issue(key),
+            "search": lambda key: mcp_server.search_tasks(f"project = {project}", 50),
+            "comment": lambda key: mcp_server.add_comment(key, "Load test comment"),
+            "transition": lambda key: mcp_server.transition_issue(key, "In Progress"),
+        }
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(op):
+            name, key = op
+            async with semaphore:
+                started = time.perf_counter()
+                result = await tools[name](key)
+                ok = not (result.startswith("Failed") or result.startswith("Issue not found")
+                          or result.startswith("No issues"))
+                return name, time.perf_counter() - started, ok
+
+        ops = list(itertools.islice(operations(list(server.state.issues)), total))
+        try:
+            started = time.perf_counter()
+            samples = await asyncio.gather(*(call(op) for op in ops))
+            elapsed = time.perf_counter() - started
+        finally:
+            mcp_server.jira_service = previous
+            await client.aclose()
+        return summarize(samples, elapsed)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test against the fake JIRA server")
+    parser.add_argument("--target", choices=["service", "mcp", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.02)
+    parser.add_argument("--issues", type=int, default=500)
+    args = parser.parse_args()
+
+    faults = Faults(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                    throttle_rate=args.throttle_rate)
+    with FakeJiraServer(faults=faults, seed=1) as server:
+        server.state.seed(args.issues)
+        print(f"Fake JIRA: {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} ms latency, "
+              f"{args.error_rate:.0%} errors, {args.throttle_rate:.0%} throttled; "
+              f"{args.requests} operations at concurrency {args.concurrency}\n")
+        if args.target in ("service", "both"):
+            print(format_report("JiraService (threads)", run_service_load(server, args.requests, args.concurrency)))
+            print()
+        if args.target in ("mcp", "both"):
+            print(format_report("MCP tools (asyncio)", run_mcp_load(server, args.requests, args.concurrency)))
+        print(f"\nServer responses by status: {dict(sorted(server.requests.items()))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import json
+import threading
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so clients can keep the connection alive between requests.
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; otherwise Nagle + delayed ACK
+    # adds ~40ms to every keep-alive response.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload, status=200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path, _, query = self.path.partition("?")
+        route = self.server.routes.get(path, {"ok": True})
+        # Callable routes receive the parsed query string (e.g. to honour ?fields=).
+        self._reply(route(parse_qs(query)) if callable(route) else route)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self._reply({"ok": True})
+
+
+class StubJiraServer:
+    """
+    Minimal local stand-in for JIRA used by the benchmarks.
+    Usage:
+        with StubJiraServer() as server:
+            url = server.url
+    """
+    def __init__(self, routes=None):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.routes = routes or {
+            "/rest/api/3/myself": {"accountId": "bench", "displayName": "Bench User"}
+        }
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
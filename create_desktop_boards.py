@@ -1,9 +1,12 @@
+import argparse
 import os
 import re
+from src import project_provisioning
 from src.jira_service import JiraService
 
 DESCRIPTION = "Creating JIRA boards for Desktop items"
 DESKTOP_PATH = "/home/rishav/Desktop"
+DEFAULT_RESUME_PATH = os.path.join("~", ".cache", "jira_agent", "desktop_boards.jsonl")
 
 def generate_project_key(name):
     """
@@ -38,11 +41,22 @@ def generate_project_key(name):
         
     return key
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument("--path", default=DESKTOP_PATH, help="Directory whose sub-directories become projects")
+    parser.add_argument("--dry-run", action="store_true", help="Print the plan without creating anything")
+    parser.add_argument("--workers", type=int, default=project_provisioning.DEFAULT_PROVISION_WORKERS,
+                        help="Projects created concurrently")
+    parser.add_argument("--resume", default=DEFAULT_RESUME_PATH,
+                        help="Resume log; directories recorded there are skipped on the next run")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     print(f"--- {DESCRIPTION} ---")
     
-    if not os.path.exists(DESKTOP_PATH):
-        print(f"Error: Path {DESKTOP_PATH} does not exist.")
+    if not os.path.exists(args.path):
+        print(f"Error: Path {args.path} does not exist.")
         return
 
     try:
@@ -56,30 +70,29 @@ def main():
         print("Failed to verify JIRA connection.")
         return
 
-    items = os.listdir(DESKTOP_PATH)
-    directories = []
-    
-    for item in items:
-        full_path = os.path.join(DESKTOP_PATH, item)
-        if os.path.isdir(full_path) and not item.startswith('.'):
-            directories.append(item)
-            
-    print(f"Found {len(directories)} directories on Desktop: {directories}")
-    
-    for dir_name in directories:
-        key = generate_project_key(dir_name)
-        project_name = dir_name.replace("-", " ").replace("_", " ").title()
-        
-        print(f"\nProcessing '{dir_name}' -> Key: {key}, Name: {project_name}")
-        
-        # Check if project exists (heuristic via create_project handled by service/JIRA usually)
-        # We'll just try to create it.
-        try:
-            # We don't have a check_exists method easily exposed without searching, 
-            # create_project prints error if fails.
-            service.create_project(key, project_name)
-        except Exception as e:
-            print(f"Error creating project for {dir_name}: {e}")
+    directories = sorted(
+        item for item in os.listdir(args.path)
+        if os.path.isdir(os.path.join(args.path, item)) and not item.startswith('.')
+    )
+    print(f"Found {len(directories)} directories in {args.path}")
+
+    # One paginated read of the existing projects instead of a failed create per duplicate.
+    existing = project_provisioning.fetch_existing_projects(service.client)
+    if existing is None:
+        print("Failed to list existing projects; nothing was created.")
+        return
+
+    resume = project_provisioning.ResumeLog(os.path.expanduser(args.resume))
+    steps = project_provisioning.plan_projects(directories, existing, generate_project_key, resume.load())
+    print(project_provisioning.format_plan(steps))
+    if args.dry_run:
+        return
+
+    report = project_provisioning.provision(service, steps, max_workers=args.workers, resume=resume)
+    for result in report["results"]:
+        if not result["ok"]:
+            print(f"Failed: {result['directory']} ({result['key']}) {result['error'] or ''}")
+    print(f"Created {report['succeeded']}/{report['total']} projects.")
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,104 @@
 import sys
+import json
+import time
 import argparse
 from src.jira_service import JiraService
+from src.jira_client import JiraClient
+from src.metadata_cache import MetadataCache
+from src import bulk_operations
+from src.promote_pipeline import PromotePipeline
+from src.issue_mirror import IssueMirror
+from src.request_metrics import format_summary, get_request_metrics
+from src.job_queue import build_job_service
+from src.write_outbox import Outbox, PENDING, FAILED
+
+def load_jsonl(path):
+    """Read one JSON object per non-empty line."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def run_bulk(service, args):
+    """Dispatch `bulk` records to the matching JiraService bulk operation."""
+    records = load_jsonl(args.file)
+    if args.action == "create":
+        specs = [bulk_operations.issue_spec_from_record(r) for r in records]
+        results = service.bulk_create_issues(specs, args.project)
+    elif args.action == "comment":
+        results = service.bulk_comment([(r["key"], r["text"]) for r in records], args.workers)
+    elif args.action == "transition":
+        results = service.bulk_transition([(r["key"], r["status"]) for r in records], args.workers)
+    else:
+        results = service.bulk_assign([r["key"] for r in records], args.user, args.workers)
+
+    report = bulk_operations.summarize(results)
+    for result in report["results"]:
+        label = result.get("key") or f"#{result['index']}"
+        print(f"[{'OK' if result['ok'] else 'FAILED'}] {label}" + (f": {result['error']}" if result["error"] else ""))
+    print(f"{report['succeeded']}/{report['total']} succeeded, {report['failed']} failed.")
+    return report
+
+def run_outbox(service):
+    """Send writes left pending in the outbox (e.g. by a stopped MCP server) and report the log."""
+    outbox = Outbox.from_env(service_factory=lambda site: service if site is None else build_job_service(site))
+    try:
+        batches = outbox.drain()
+        counts = outbox.store.counts()
+        print(f"Outbox: sent {outbox.sent} write(s) in {batches} batch(es); "
+              f"{counts.get(PENDING, 0)} pending, {counts.get(FAILED, 0)} failed.")
+        for mutation in outbox.store.pending():
+            print(f"[PENDING] {mutation.kind} {mutation.id} (attempt {mutation.attempts}): {mutation.error}")
+    finally:
+        outbox.store.close()
+
+def run_command(service, args):
+    """Dispatch one parsed CLI command."""
+    if args.command == "verify":
+        service.verify_connection()
+    elif args.command == "fetch":
+        service.get_open_tasks()
+    elif args.command == "details":
+        service.get_issue_details(args.key)
+    elif args.command == "assign":
+        service.assign_task(args.key, args.user)
+    elif args.command == "move":
+        service.transition_issue(args.key, args.status)
+    elif args.command == "comment":
+        service.add_comment(args.key, args.text)
+    elif args.command == "create":
+        service.create_issue(args.summary, args.description, args.type, args.project)
+    elif args.command == "create-project":
+        service.create_project(args.key, args.name)
+    elif args.command == "update":
+        if not args.summary and not args.description:
+            print("Error: Provide --summary or --description to update.")
+        else:
+            service.update_issue(args.key, args.summary, args.description)
+    elif args.command == "bulk":
+        run_bulk(service, args)
+    elif args.command == "sync":
+        count = service.sync_mirror(args.project)
+        if count is None:
+            print("Mirror sync failed.")
+        else:
+            print(f"Mirror sync stored {count} changed issue(s).")
+    elif args.command == "cache-clear":
+        service.cache.invalidate()
+        if service.client.http_cache is not None:
+            service.client.http_cache.clear()
+        print("Metadata and HTTP response caches cleared.")
+    elif args.command == "outbox":
+        run_outbox(service)
+    elif args.command == "promote":
+        print(f"Promoting {', '.join(args.keys)} to '{args.status}'...")
+        report = PromotePipeline(service, args.workers).promote_many(args.keys, args.status, args.comment)
+        print(f"Promoted {sum(r['moved'] for r in report['results'])}/{len(args.keys)} in "
+              f"{report['wall_seconds']:.2f}s (serial estimate {report['serial_estimate_seconds']:.2f}s, "
+              f"saved {report['saved_seconds']:.2f}s)")
 
 def main():
     parser = argparse.ArgumentParser(description="JIRA Agent CLI Tool")
+    parser.add_argument("--profile", action="store_true",
+                        help="Print a per-endpoint summary of the JIRA calls the command made")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Verify
@@ -50,10 +145,31 @@ def main():
     parser_update.add_argument("--description", type=str, help="New Description")
 
     # Promote (Composite Action)
-    parser_promote = subparsers.add_parser("promote", help="Promote an issue to a status and comment")
-    parser_promote.add_argument("key", type=str, help="Issue Key")
+    parser_promote = subparsers.add_parser("promote", help="Promote issue(s) to a status and comment")
+    parser_promote.add_argument("keys", type=str, nargs="+", metavar="key", help="Issue Key(s)")
     parser_promote.add_argument("status", type=str, help="Target Status")
     parser_promote.add_argument("--comment", type=str, required=True, help="Comment text")
+    parser_promote.add_argument("--workers", type=int, default=4, help="Issues promoted concurrently")
+
+    # Bulk
+    parser_bulk = subparsers.add_parser("bulk", help="Run a bulk operation from a JSONL file")
+    parser_bulk.add_argument("file", type=str, help="JSONL input (create: summary/title, description/body; "
+                                                   "comment: key, text; transition: key, status; assign: key)")
+    parser_bulk.add_argument("--action", choices=["create", "comment", "transition", "assign"], default="create")
+    parser_bulk.add_argument("--project", type=str, help="Project Key for created issues (Optional)")
+    parser_bulk.add_argument("--user", type=str, help="Account ID for assign (Optional, defaults to self)")
+    parser_bulk.add_argument("--workers", type=int, default=bulk_operations.DEFAULT_MAX_WORKERS,
+                             help="Concurrent requests for comment/transition/assign")
+
+    # Mirror
+    parser_sync = subparsers.add_parser("sync", help="Delta-sync a project into the local issue mirror")
+    parser_sync.add_argument("--project", type=str, help="Project Key (Optional)")
+
+    # Cache
+    parser_cache = subparsers.add_parser("cache-clear", help="Drop cached metadata and stored HTTP responses")
+
+    # Outbox
+    subparsers.add_parser("outbox", help="Send writes pending in the outbox and show what is left")
 
     args = parser.parse_args()
 
@@ -62,37 +178,24 @@ def main():
         sys.exit(1)
 
     try:
-        service = JiraService()
+        client = JiraClient()
+        # SQLite-backed metadata cache so consecutive CLI runs start warm.
+        cache = MetadataCache.from_env(scope=client.jira_url, default_backend="sqlite")
+        mirror = IssueMirror.from_env() if args.command == "sync" else None
+        service = JiraService(client=client, cache=cache, mirror=mirror)
     except Exception as e:
         print(f"Error initializing JiraService: {e}")
         sys.exit(1)
 
-    if args.command == "verify":
-        service.verify_connection()
-    elif args.command == "fetch":
-        service.get_open_tasks()
-    elif args.command == "details":
-        service.get_issue_details(args.key)
-    elif args.command == "assign":
-        service.assign_task(args.key, args.user)
-    elif args.command == "move":
-        service.transition_issue(args.key, args.status)
-    elif args.command == "comment":
-        service.add_comment(args.key, args.text)
-    elif args.command == "create":
-        service.create_issue(args.summary, args.description, args.type, args.project)
-    elif args.command == "create-project":
-        service.create_project(args.key, args.name)
-    elif args.command == "update":
-        if not args.summary and not args.description:
-            print("Error: Provide --summary or --description to update.")
-        else:
-            service.update_issue(args.key, args.summary, args.description)
-    elif args.command == "promote":
-        print(f"Promoting {args.key} to '{args.status}'...")
-        if service.add_comment(args.key, args.comment):
-            service.transition_issue(args.key, args.status)
-        service.get_issue_details(args.key)
+    started = time.perf_counter()
+    try:
+        run_command(service, args)
+    finally:
+        if args.profile:
+            print(f"\n--- Profile: {args.command} ({time.perf_counter() - started:.2f}s wall) ---")
+            print(format_summary(get_request_metrics().summary()))
+            if service.client.http_cache is not None:
+                print(f"HTTP cache: {service.client.http_cache.metrics()}")
 
 if __name__ == "__main__":
     main()
@@ -8,7 +8,9 @@ def main():
         print(f"Configuration Error: {e}")
         sys.exit(1)
         
-    service.setup_soc_statuses()
+    # Optional: setup_workflow.py "SOC Workflow" [--dry-run] also provisions the workflow.
+    names = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    service.setup_soc_statuses(workflow_name=names[0] if names else None, dry_run="--dry-run" in sys.argv)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,212 @@
+"""
+Markdown / plain text -> Atlassian Document Format (ADF).
+
+Supported: paragraphs (single newlines become hard breaks), `#` headings,
+`-`/`*` and `1.` lists (nested by indentation), fenced code blocks, `>`
+quotes, `---` rules, and inline `code`, **bold**, *italic*, ~~strike~~,
+[links](url), <url> and bare http(s) URLs. Plain text is valid input.
+
+Parsed blocks and inline runs are cached by their source text, so bulk
+jobs that repeat the same comment or template pay for parsing once. Only
+texts up to MAX_CACHED_CHARS are cached, which bounds the caches' memory
+by size rather than by entry count; longer ones are parsed every time.
+Returned documents share those cached fragments: treat them as read-only.
+"""
+import re
+from functools import lru_cache
+
+MAX_CACHED_CHARS = 4096
+
+_FENCE = re.compile(r"^\s*```\s*([\w+-]*)\s*$")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_RULE = re.compile(r"^\s*(?:-{3,}|\*{3,}|_{3,})\s*$")
+_BULLET = re.compile(r"^(\s*)[-*+]\s+(.*)$")
+_ORDERED = re.compile(r"^(\s*)(\d+)[.)]\s+(.*)$")
+_QUOTE = re.compile(r"^\s*>\s?(.*)$")
+# Cheap pre-check: lines not matching this can only be paragraph text.
+_BLOCK_HINT = re.compile(r"\s*(?:[-*+_#>`]|\d+[.)])")
+_INLINE = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|\[(?P<label>[^\]]+)\]\((?P<href>[^)\s]+)\)"
+    r"|<(?P<auto>https?://[^>\s]+)>"
+    r"|\*\*(?P<strong>.+?)\*\*"
+    r"|__(?P<strong2>.+?)__"
+    r"|~~(?P<strike>.+?)~~"
+    r"|\*(?P<em>[^\s*](?:[^*]*[^\s*])?)\*"
+    r"|(?<!\w)_(?P<em2>[^\s_](?:[^_]*[^\s_])?)_(?!\w)"
+    r"|(?P<url>https?://[^\s<>()]+[^\s<>().,;:!?'\"])"
+)
+
+_HARD_BREAK = {"type": "hardBreak"}
+
+
+def _text(text, mark=None):
+    node = {"type": "text", "text": text}
+    if mark:
+        node["marks"] = [mark]
+    return node
+
+
+def _link(href):
+    return {"type": "link", "attrs": {"href": href}}
+
+
+def _inline(line):
+    """Inline nodes for one line of text."""
+    return _cached_inline(line) if len(line) <= MAX_CACHED_CHARS else _parse_inline(line)
+
+
+def _parse_inline(line):
+    nodes = []
+    position = 0
+    for match in _INLINE.finditer(line):
+        if match.start() > position:
+            nodes.append(_text(line[position:match.start()]))
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "code":
+            nodes.append(_text(value, {"type": "code"}))
+        elif kind == "href":  # [label](href): the last group to close is the href
+            nodes.append(_text(match.group("label"), _link(value)))
+        elif kind in ("auto", "url"):
+            nodes.append(_text(value, _link(value)))
+        elif kind in ("strong", "strong2"):
+            nodes.append(_text(value, {"type": "strong"}))
+        elif kind in ("em", "em2"):
+            nodes.append(_text(value, {"type": "em"}))
+        elif kind == "strike":
+            nodes.append(_text(value, {"type": "strike"}))
+        position = match.end()
+    if position < len(line):
+        nodes.append(_text(line[position:]))
+    return tuple(nodes)
+
+
+_cached_inline = lru_cache(maxsize=8192)(_parse_inline)
+
+
+def _paragraph(lines):
+    content = []
+    for index, line in enumerate(lines):
+        if index:
+            content.append(_HARD_BREAK)
+        content.extend(_inline(line.strip()))
+    return {"type": "paragraph", "content": content}
+
+
+def _list_marker(line):
+    """(indent, list type, order, text) for a list line, else None."""
+    match = _BULLET.match(line)
+    if match and not _RULE.match(line):
+        return len(match.group(1).expandtabs(4)), "bulletList", None, match.group(2)
+    match = _ORDERED.match(line)
+    if match:
+        return len(match.group(1).expandtabs(4)), "orderedList", int(match.group(2)), match.group(3)
+    return None
+
+
+def _list(lines, start):
+    """Parse consecutive list lines from `start`; returns (list node, next index)."""
+    indent, list_type, order, _ = _list_marker(lines[start])
+    root = {"type": list_type, "content": []}
+    if list_type == "orderedList" and order != 1:
+        root["attrs"] = {"order": order}
+    stack = [(indent, root)]  # open lists, innermost last
+    index = start
+    while index < len(lines):
+        marker = _list_marker(lines[index])
+        if marker is None:
+            break
+        indent, list_type, order, text = marker
+        while len(stack) > 1 and indent < stack[-1][0]:
+            stack.pop()
+        level_indent, current = stack[-1]
+        if indent > level_indent and current["content"]:
+            nested = {"type": list_type, "content": []}
+            if list_type == "orderedList" and order != 1:
+                nested["attrs"] = {"order": order}
+            current["content"][-1]["content"].append(nested)
+            stack.append((indent, nested))
+            current = nested
+        current["content"].append({"type": "listItem", "content": [_paragraph([text])]})
+        index += 1
+    return root, index
+
+
+def _blocks(text):
+    """Top-level block nodes for `text` (cached by the whole text, if short enough)."""
+    return _cached_blocks(text) if len(text) <= MAX_CACHED_CHARS else _parse_blocks(text)
+
+
+def _parse_blocks(text):
+    lines = text.splitlines()
+    blocks = []
+    paragraph = []
+
+    def flush():
+        if paragraph:
+            blocks.append(_paragraph(paragraph))
+            paragraph.clear()
+
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if line and not _BLOCK_HINT.match(line):
+            paragraph.append(line)
+            index += 1
+            continue
+        fence = _FENCE.match(line)
+        if fence:
+            flush()
+            end = index + 1
+            while end < len(lines) and not _FENCE.match(lines[end]):
+                end += 1
+            code = "\n".join(lines[index + 1:end])
+            node = {"type": "codeBlock", "content": [_text(code)] if code else []}
+            if fence.group(1):
+                node["attrs"] = {"language": fence.group(1)}
+            blocks.append(node)
+            index = end + 1
+            continue
+        if not line.strip():
+            flush()
+        elif _RULE.match(line):
+            flush()
+            blocks.append({"type": "rule"})
+        elif _HEADING.match(line):
+            flush()
+            heading = _HEADING.match(line)
+            blocks.append({"type": "heading", "attrs": {"level": len(heading.group(1))},
+                           "content": list(_inline(heading.group(2)))})
+        elif _list_marker(line):
+            flush()
+            node, index = _list(lines, index)
+            blocks.append(node)
+            continue
+        elif _QUOTE.match(line):
+            flush()
+            end = index
+            while end < len(lines) and _QUOTE.match(lines[end]):
+                end += 1
+            quoted = "\n".join(_QUOTE.match(l).group(1) for l in lines[index:end])
+            blocks.append({"type": "blockquote", "content": list(_blocks(quoted))})
+            index = end
+            continue
+        else:
+            paragraph.append(line)
+        index += 1
+    flush()
+    return tuple(blocks)
+
+
+_cached_blocks = lru_cache(maxsize=4096)(_parse_blocks)
+
+
+def markdown_to_adf(text):
+    """ADF document for Markdown or plain `text` (empty document for None/"")."""
+    return {"type": "doc", "version": 1, "content": list(_blocks(text)) if text else []}
+
+
+def cache_info():
+    """lru_cache statistics for the block and inline caches."""
+    return {"blocks": _cached_blocks.cache_info()._asdict(), "inline": _cached_inline.cache_info()._asdict()}
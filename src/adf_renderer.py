@@ -0,0 +1,205 @@
+"""
+Atlassian Document Format (ADF) -> Markdown / plain text.
+
+The walk is iterative (explicit stack, no recursion) and output is produced
+as a generator of small string fragments, so arbitrarily deep or multi-MB
+documents neither hit the recursion limit nor build large intermediate
+strings. Use `iter_adf(doc)` to stream or `render_adf(doc)` for a string.
+"""
+from datetime import datetime, timezone
+
+# Inline marks in the order they wrap text (innermost first).
+_MARKS = {
+    "code": ("`", "`"),
+    "strong": ("**", "**"),
+    "em": ("*", "*"),
+    "strike": ("~~", "~~"),
+}
+
+_LIST_TYPES = ("bulletList", "orderedList", "taskList", "decisionList")
+# Blocks that write their own line prefix/indent.
+_PREFIXED_BLOCKS = _LIST_TYPES + ("blockquote", "panel", "table")
+# Blocks whose children are inline nodes (text, mentions, ...).
+_INLINE_CONTAINERS = ("paragraph", "heading", "taskItem", "decisionItem", "mediaSingle", "mediaGroup")
+
+
+class _Ctx:
+    """Rendering context inherited by child nodes."""
+    __slots__ = ("indent", "prefix", "block_end")
+
+    def __init__(self, indent="", prefix="", block_end=2):
+        self.indent = indent        # indentation for nested list items
+        self.prefix = prefix        # line prefix (blockquotes)
+        self.block_end = block_end  # after a block: newline count, or " " inside table cells
+
+    def child(self, indent=None, prefix=None, block_end=None):
+        return _Ctx(self.indent if indent is None else indent,
+                    self.prefix if prefix is None else prefix,
+                    self.block_end if block_end is None else block_end)
+
+
+def _text(node, markdown):
+    text = node.get("text", "")
+    marks = node.get("marks")
+    if not marks or not markdown:
+        return text
+    href = None
+    for mark in marks:
+        kind = mark.get("type")
+        if kind in _MARKS:
+            left, right = _MARKS[kind]
+            text = f"{left}{text}{right}"
+        elif kind == "link":
+            href = (mark.get("attrs") or {}).get("href")
+    return f"[{text}]({href})" if href else text
+
+
+def _inline(node, markdown):
+    """Text for leaf inline nodes, or None if `node` has to be walked."""
+    kind = node.get("type")
+    if kind == "text":
+        return _text(node, markdown)
+    attrs = node.get("attrs") or {}
+    if kind == "mention":
+        return attrs.get("text") or f"@{attrs.get('id', 'user')}"
+    if kind == "emoji":
+        return attrs.get("text") or attrs.get("shortName", "")
+    if kind in ("inlineCard", "blockCard", "embedCard"):
+        return f"<{attrs.get('url', '')}>"
+    if kind == "status":
+        return f"[{attrs.get('text', '')}]"
+    if kind == "date":
+        try:
+            stamp = int(attrs.get("timestamp")) / 1000
+            return datetime.fromtimestamp(stamp, tz=timezone.utc).strftime("%Y-%m-%d")
+        except (TypeError, ValueError):
+            return ""
+    if kind in ("media", "mediaInline"):
+        return "[media]"
+    return None
+
+
+def iter_adf(doc, markdown=True):
+    """
+    Yield the rendering of `doc` as string fragments.
+    markdown=False drops inline marks, heading hashes and code fences (plain text).
+
+    Stack entries are a str (emit it), an int (that many newlines) or a
+    (node, ctx) pair still to be expanded. Newlines are held back and only
+    written before the next text, so the output never ends in blank lines.
+    """
+    if not doc:
+        return
+    if isinstance(doc, str):  # v2-style plain-text field
+        yield doc
+        return
+    stack = [(doc, _Ctx())]
+    pending_newlines = 0
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is str:
+            if item:
+                if pending_newlines:
+                    yield "\n" * pending_newlines
+                    pending_newlines = 0
+                yield item
+            continue
+        if item_type is int:
+            pending_newlines += item
+            continue
+
+        node, ctx = item
+        node_type = node.get("type")
+        children = node.get("content") or ()
+        todo = []  # pushed in reverse at the end so they run in order
+
+        if node_type in _INLINE_CONTAINERS:
+            if node_type == "heading" and markdown:
+                level = max(1, min(6, int((node.get("attrs") or {}).get("level", 1))))
+                todo.append("#" * level + " ")
+            for child in children:
+                text = _inline(child, markdown)
+                todo.append((child, ctx) if text is None else text)
+            todo.append(ctx.block_end)
+        elif node_type == "hardBreak":
+            todo.append(1)
+            if ctx.prefix or ctx.indent:
+                todo.append(ctx.prefix + ctx.indent)
+        elif node_type in _LIST_TYPES:
+            attrs = node.get("attrs") or {}
+            start = int(attrs.get("order", 1)) if node_type == "orderedList" else None
+            for index, child in enumerate(children):
+                if start is not None:
+                    marker = f"{start + index}. "
+                elif child.get("type") == "taskItem":
+                    marker = "- [x] " if (child.get("attrs") or {}).get("state") == "DONE" else "- [ ] "
+                else:
+                    marker = "- "
+                todo.append(ctx.prefix + ctx.indent + marker)
+                todo.append((child, ctx.child(indent=ctx.indent + " " * len(marker), block_end=1)))
+            if not ctx.indent and ctx.block_end == 2:
+                todo.append(1)
+        elif node_type == "listItem":
+            # Blocks after the first (and not themselves lists) are indented under the marker.
+            for index, child in enumerate(children):
+                if index and child.get("type") not in _PREFIXED_BLOCKS:
+                    todo.append(ctx.prefix + ctx.indent)
+                todo.append((child, ctx))
+        elif node_type == "codeBlock":
+            fence = "```" if markdown else ""
+            if fence:
+                todo.append(fence + ((node.get("attrs") or {}).get("language") or ""))
+                todo.append(1)
+            todo.extend(child.get("text", "") for child in children)
+            if fence:
+                todo.append(1)
+                todo.append(ctx.prefix + ctx.indent + fence)
+            todo.append(ctx.block_end)
+        elif node_type in ("blockquote", "panel"):
+            quote = ctx.child(prefix=ctx.prefix + "> ", block_end=1)
+            for child in children:
+                if child.get("type") not in _PREFIXED_BLOCKS:
+                    todo.append(quote.prefix)
+                todo.append((child, quote))
+            if ctx.block_end == 2:
+                todo.append(1)
+        elif node_type == "rule":
+            todo.append("---")
+            todo.append(ctx.block_end)
+        elif node_type == "table":
+            for row_index, row in enumerate(children):
+                todo.append((row, ctx))
+                cells = row.get("content") or ()
+                if row_index == 0 and cells and all(c.get("type") == "tableHeader" for c in cells):
+                    todo.append(ctx.prefix + ctx.indent + "|" + " --- |" * len(cells))
+                    todo.append(1)
+            if ctx.block_end == 2:
+                todo.append(1)
+        elif node_type == "tableRow":
+            todo.append(ctx.prefix + ctx.indent + "|")
+            cell_ctx = ctx.child(block_end=" ")
+            for cell in children:
+                todo.append(" ")
+                todo.extend((child, cell_ctx) for child in (cell.get("content") or ()))
+                todo.append("|")
+            todo.append(1)
+        elif node_type in ("expand", "nestedExpand"):
+            title = (node.get("attrs") or {}).get("title")
+            if title:
+                todo.append(f"**{title}**" if markdown else title)
+                todo.append(ctx.block_end)
+            todo.extend((child, ctx) for child in children)
+        else:
+            text = _inline(node, markdown)
+            if text is not None:
+                todo.append(text)
+            # doc, media wrappers and unknown nodes: render their children.
+            todo.extend((child, ctx) for child in children)
+
+        stack.extend(reversed(todo))
+
+
+def render_adf(doc, markdown=True):
+    """Render a whole ADF document to a string (Markdown by default)."""
+    return "".join(iter_adf(doc, markdown))
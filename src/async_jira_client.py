@@ -0,0 +1,199 @@
+import time
+
+import httpx
+from .http_pool import PoolConfig
+from .jira_settings import JiraSettings
+from .json_codec import encode_json
+from .json_stream import AsyncStreamedArray, CHUNK_SIZE, streaming_enabled
+from .rate_limiter import get_rate_limiter
+from .request_metrics import RequestEvent, endpoint_template, get_request_metrics
+from .retry_policy import RetryPolicy
+from .shared_streams import AsyncSharedStreams
+from .single_flight import READ_ONLY_POSTS, AsyncSingleFlight, coalescing_enabled, request_key
+
+class AsyncJiraClient:
+    """
+    asyncio-native counterpart of JiraClient (same get/post/put/delete surface).
+    All coroutines share one httpx.AsyncClient, i.e. one keep-alive pool,
+    so many tool calls can be in flight on a single event loop.
+    """
+    def __init__(self, settings=None, pool_config=None, limiter=None, retry_policy=None):
+        self.settings = settings or JiraSettings.from_env()
+        self.jira_url = self.settings.jira_url
+        self.project_key = self.settings.project_key
+        self.headers = self.settings.auth_headers()
+        self.pool_config = pool_config or PoolConfig.from_env()
+        self._http = None
+        # Same per-site bucket as JiraClient, so threads and tasks share one budget.
+        self.limiter = limiter or get_rate_limiter(self.jira_url)
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+        # Same instrumentation surface (and process-wide registry) as JiraClient.
+        self.metrics = get_request_metrics()
+        self.observers = [self.metrics.record]
+        # Concurrent identical reads (GETs, searches) share one in-flight request.
+        self.single_flight = AsyncSingleFlight() if coalescing_enabled() else None
+        self.shared_streams = AsyncSharedStreams() if self.single_flight is not None else None
+        # Searches parse `issues` incrementally from the socket (see stream_post).
+        self.streaming = streaming_enabled()
+
+    @property
+    def http(self):
+        """Lazily build the AsyncClient so it binds to the running loop."""
+        if self._http is None or self._http.is_closed:
+            config = self.pool_config
+            self._http = httpx.AsyncClient(
+                base_url=self.jira_url,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=config.pool_maxsize,
+                    max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+                ),
+                timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+            )
+        return self._http
+
+    async def aclose(self):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _send(self, method, endpoint, params=None, payload=None, stream=False):
+        """
+        Returns the response, or None after printing the error (mirrors JiraClient).
+        With `stream`, the body is left unread for the caller to iterate.
+        """
+        url = f"{self.jira_url}{endpoint}"
+        body = encode_json(payload) if payload is not None else None
+        attempt = 0
+        response = None
+        started = time.perf_counter()
+        network = 0.0
+        try:
+            while True:
+                await self.limiter.acquire_async()
+                response = None
+                sent = time.perf_counter()
+                if stream:
+                    request = self.http.build_request(method, endpoint, params=params, content=body)
+                    response = await self.http.send(request, stream=True)
+                else:
+                    response = await self.http.request(method, endpoint, params=params, content=body)
+                network += time.perf_counter() - sent
+                if stream and response.is_error:
+                    await response.aread()  # for the error text below; also releases the connection
+                if not self.retry_policy.should_retry(response.status_code, attempt):
+                    break
+                delay = self.retry_policy.delay(attempt, response.headers.get("Retry-After"))
+                print(f"{method} {url} throttled ({response.status_code}), retrying in {delay:.1f}s")
+                self.limiter.record_retry(response.status_code)
+                self.limiter.pause(delay)
+                attempt += 1
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            print(f"{method} Error {url}: {e}")
+            if isinstance(e, httpx.HTTPStatusError):
+                print(f"Response: {e.response.text}")
+            return None
+        finally:
+            self._observe(RequestEvent(
+                method=method, endpoint=endpoint_template(endpoint),
+                status=response.status_code if response is not None else None,
+                seconds=network, wait_seconds=time.perf_counter() - started - network,
+                request_bytes=len(body) if body else 0,
+                response_bytes=self._response_bytes(response, stream),
+                retries=attempt))
+
+    @staticmethod
+    def _response_bytes(response, stream):
+        if response is None:
+            return 0
+        if stream and not response.is_closed:  # body not read yet; the declared length
+            return int(response.headers.get("Content-Length") or 0)
+        return len(response.content)
+
+    def _observe(self, event):
+        for observer in self.observers:
+            observer(event)
+
+    def _json(self, response, method, endpoint):
+        started = time.perf_counter()
+        try:
+            return response.json()
+        except ValueError as e:
+            print(f"Invalid JSON from {response.url}: {e}")
+            return None
+        finally:
+            self.metrics.record_parse(method, endpoint_template(endpoint), time.perf_counter() - started)
+
+    async def _coalesced(self, method, endpoint, fetch, params=None, body=None):
+        """Run fetch() through single-flight; coalesced callers share its (read-only) result."""
+        if self.single_flight is None:
+            return await fetch()
+        result, shared = await self.single_flight.do(request_key(method, endpoint, params, body), fetch)
+        if shared:
+            self.metrics.record_coalesced(method, endpoint_template(endpoint))
+        return result
+
+    async def get(self, endpoint, params=None):
+        """Execute GET request."""
+        async def fetch():
+            response = await self._send("GET", endpoint, params=params)
+            return self._json(response, "GET", endpoint) if response is not None else None
+
+        return await self._coalesced("GET", endpoint, fetch, params=params)
+
+    async def post(self, endpoint, payload):
+        """Execute POST request (searches are coalesced like GETs)."""
+        if endpoint in READ_ONLY_POSTS and self.single_flight is not None:
+            return await self._coalesced(
+                "POST", endpoint, lambda: self._post(endpoint, payload), body=encode_json(payload))
+        return await self._post(endpoint, payload)
+
+    async def _post(self, endpoint, payload):
+        response = await self._send("POST", endpoint, payload=payload)
+        if response is None:
+            return None
+        if response.status_code == 204:
+            return {} # Return empty dict for success with no content
+        return self._json(response, "POST", endpoint)
+
+    async def stream_post(self, endpoint, payload, array_key="issues"):
+        """
+        POST and return an AsyncStreamedArray over the top-level `array_key`
+        elements (other members in `.meta` afterwards), or None on error.
+        Concurrent identical searches read one shared stream.
+        """
+        if endpoint not in READ_ONLY_POSTS or self.shared_streams is None:
+            return await self._stream_post(endpoint, payload, array_key)
+        key = request_key("POST", endpoint, body=encode_json(payload)) + (array_key,)
+        issues, shared = await self.shared_streams.open(
+            key, lambda: self._stream_post(endpoint, payload, array_key))
+        if shared:
+            self.metrics.record_coalesced("POST", endpoint_template(endpoint))
+        return issues
+
+    async def _stream_post(self, endpoint, payload, array_key):
+        response = await self._send("POST", endpoint, payload=payload, stream=True)
+        if response is None:
+            return None
+        return AsyncStreamedArray(response.aiter_bytes(CHUNK_SIZE), array_key, on_close=response.aclose)
+
+    async def put(self, endpoint, payload):
+        """Execute PUT request."""
+        response = await self._send("PUT", endpoint, payload=payload)
+        if response is None:
+            return None
+        # PUT responses vary, sometimes 204 No Content
+        if response.status_code == 204:
+            return True
+        return self._json(response, "PUT", endpoint)
+
+    async def delete(self, endpoint, params=None):
+        """Execute DELETE request."""
+        response = await self._send("DELETE", endpoint, params=params)
+        if response is None:
+            return None
+        if response.status_code == 204 or not response.content:
+            return True
+        return self._json(response, "DELETE", endpoint)
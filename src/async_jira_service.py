@@ -0,0 +1,246 @@
+import asyncio
+import os
+import time
+from .async_jira_client import AsyncJiraClient
+from . import jira_payloads
+from .async_search_paginator import AsyncSearchPaginator
+from .metadata_cache import MetadataCache
+from . import bulk_operations
+from .issue_mirror import IssueMirror, MIRROR_FIELDS
+from .issue_view import IssueRecord
+
+class AsyncJiraService:
+    """
+    Non-blocking variant of JiraService for the MCP server.
+    Same business rules (payloads come from jira_payloads), awaited I/O.
+    """
+    def __init__(self, client=None, cache=None, mirror=None, read_mode=None):
+        self.client = client or AsyncJiraClient()
+        self.project_key = self.client.project_key
+        self.cache = cache or MetadataCache.from_env(scope=self.client.jira_url)
+        self.read_mode = read_mode or os.getenv("JIRA_READ_MODE", "live")
+        if mirror is None and self.read_mode == "mirror":
+            mirror = IssueMirror.from_env()
+        self.mirror = mirror
+
+    async def aclose(self):
+        """Release the connection pool and the mirror's SQLite handle."""
+        await self.client.aclose()
+        if self.mirror is not None:
+            self.mirror.close()
+
+    async def verify_connection(self):
+        """Verify credentials."""
+        data = await self.client.get("/rest/api/3/myself")
+        if data is not None:
+            self.cache.put("myself", "", data)
+            print(f"Connection Successful! Logged in as: {data.get('displayName')} ({data.get('emailAddress')})")
+            return True
+        return False
+
+    async def get_myself_account_id(self):
+        data = await self.cache.get_or_load_async("myself", "", lambda: self.client.get("/rest/api/3/myself"))
+        return data.get("accountId") if data is not None else None
+
+    async def _get_transitions(self, issue_key):
+        return await self.cache.get_or_load_async(
+            "transitions", issue_key,
+            lambda: self.client.get(f"/rest/api/3/issue/{issue_key}/transitions"))
+
+    def iter_search(self, jql, fields=None, max_results=None, page_size=50):
+        """Async-iterate issues across nextPageToken pages with one-page prefetch."""
+        return AsyncSearchPaginator(self.client, jql, fields, page_size, max_results).__aiter__()
+
+    async def sync_mirror(self, project_key=None):
+        """Delta-sync `project_key` into the mirror; issue count, or None on failure."""
+        if self.mirror is None:
+            return None
+        scope = project_key or self.project_key
+        started = time.time()
+        full = self.mirror.full_sync_due(scope, started)
+        paginator = AsyncSearchPaginator(self.client, self.mirror.delta_jql(scope, started), MIRROR_FIELDS,
+                                         page_size=100)
+        count, keys = 0, []
+        async for page in paginator.pages():
+            count += self.mirror.upsert(page)
+            keys.extend(issue["key"] for issue in page)
+        if paginator.failed:
+            return None
+        self.mirror.mark_synced(scope, started, keys if full else None)
+        return count
+
+    async def _mirror_ready(self, scope):
+        if self.read_mode != "mirror" or self.mirror is None:
+            return False
+        if not self.mirror.is_fresh(scope):
+            await self.sync_mirror(scope)
+        return self.mirror.is_fresh(scope)
+
+    def _projects_changed(self, results):
+        """Bulk create went through: mark the projects of the new issues stale in the mirror."""
+        if self.mirror is not None:
+            for project in {r["key"].rsplit("-", 1)[0] for r in results if r["ok"]}:
+                self.mirror.mark_dirty(project)
+
+    def _issue_changed(self, issue_key):
+        """A write went through: drop cached views and mark the mirror stale."""
+        self.cache.invalidate_prefix("issue_view", f"{issue_key}|")
+        if self.mirror is not None:
+            self.mirror.touch(issue_key)
+
+    async def search(self, jql, fields=None, max_results=50, shape=None):
+        """
+        Collect at most `max_results` issues for `jql` ([] on error), from the mirror when it can answer.
+        `shape`, if given, is applied to each issue as it is parsed and only its result is kept.
+        """
+        if self.mirror is not None:
+            planned = self.mirror.plan(jql, fields)
+            if planned and all([await self._mirror_ready(p) for p in planned[0]["project"]]):
+                issues = self.mirror.query(*planned, limit=max_results)
+                return [shape(i) for i in issues] if shape else issues
+        if shape is not None:
+            return [shape(issue) async for issue in self.iter_search(jql, fields, max_results)]
+        return [issue async for issue in self.iter_search(jql, fields, max_results)]
+
+    async def search_records(self, jql, fields=None, max_results=50):
+        """Like search, but each issue is kept as a compact IssueRecord of `fields`."""
+        fields = list(fields or jira_payloads.DEFAULT_SEARCH_FIELDS)
+        return await self.search(jql, fields, max_results, shape=lambda issue: IssueRecord.from_issue(issue, fields))
+
+    async def get_open_tasks(self, max_results=None):
+        """Fetch tasks ready for development as IssueRecords."""
+        return await self.search_records(jira_payloads.open_tasks_jql(self.project_key), max_results=max_results)
+
+    async def get_issue(self, issue_key, fields=None):
+        """Issue JSON projected to `fields` (default DETAIL_FIELDS), from the mirror when possible."""
+        mirroring = self.read_mode == "mirror" and self.mirror is not None
+        if (not fields or set(fields) <= set(MIRROR_FIELDS)) and await self._mirror_ready(issue_key.rsplit("-", 1)[0]):
+            data = self.mirror.get(issue_key)
+            if data is not None:
+                return data
+        request_fields = list(fields or jira_payloads.DETAIL_FIELDS)
+        if mirroring and "*all" not in request_fields:
+            request_fields = list(dict.fromkeys(request_fields + MIRROR_FIELDS))
+        data = await self.client.get(f"/rest/api/3/issue/{issue_key}",
+                                     params=jira_payloads.issue_params(request_fields))
+        if data is not None and mirroring:
+            self.mirror.upsert([data])
+        return data
+
+    async def get_issue_record(self, issue_key, fields=None):
+        """IssueRecord of `fields` (default DETAIL_FIELDS) for an issue, cached briefly."""
+        fields = list(fields or jira_payloads.DETAIL_FIELDS)
+
+        async def load():
+            data = await self.get_issue(issue_key, fields)
+            return IssueRecord.from_issue(data, fields) if data is not None else None
+
+        return IssueRecord.from_cached(
+            await self.cache.get_or_load_async("issue_view", f"{issue_key}|{','.join(fields)}", load))
+
+    async def get_issue_view(self, issue_key, fields=None):
+        """Compact flat view ({"key", field: value}) of an issue, built from its cached record."""
+        record = await self.get_issue_record(issue_key, fields)
+        return record.view() if record is not None else None
+
+    async def create_project(self, key, name, assign_to_me=True, shared_configuration_id=None, account_id=None):
+        """Create a new JIRA Project. `account_id` (the lead) defaults to the current user."""
+        if assign_to_me and account_id is None:
+            account_id = await self.get_myself_account_id()
+        payload = jira_payloads.project_payload(key, name, account_id, shared_configuration_id)
+        data = await self.client.post("/rest/api/3/project", payload)
+        if data is not None:
+            print(f"Successfully created project '{name}' ({key}).")
+            return True
+        return False
+
+    async def create_issue(self, summary, description, issue_type="Task", project_key=None):
+        """Create a new issue."""
+        target_project = project_key if project_key else self.project_key
+        payload = jira_payloads.issue_payload(target_project, summary, description, issue_type)
+        data = await self.client.post("/rest/api/3/issue", payload)
+        if data is not None:
+            key = data.get("key")
+            print(f"Successfully created {issue_type}: {key}")
+            if self.mirror is not None:
+                self.mirror.mark_dirty(target_project)
+            return key
+        return False
+
+    async def add_comment(self, issue_key, comment_text):
+        """Add a comment."""
+        payload = jira_payloads.comment_payload(comment_text)
+        if await self.client.post(f"/rest/api/3/issue/{issue_key}/comment", payload) is not None:
+            print(f"Successfully added comment to {issue_key}.")
+            return True
+        return False
+
+    async def transition_issue(self, issue_key, status_name="In Progress"):
+        """Move issue to status."""
+        data = await self._get_transitions(issue_key)
+        if data is None:
+            return False
+
+        transitions = data.get("transitions", [])
+        target_id = jira_payloads.find_transition_id(transitions, status_name)
+        if not target_id:
+            # The cached list may predate a workflow change; retry once live.
+            self.cache.invalidate("transitions", issue_key)
+            data = await self._get_transitions(issue_key) or {}
+            transitions = data.get("transitions", [])
+            target_id = jira_payloads.find_transition_id(transitions, status_name)
+        if not target_id:
+            print(f"Transition '{status_name}' not found for {issue_key}. Available: {[t['name'] for t in transitions]}")
+            return False
+
+        payload = jira_payloads.transition_payload(target_id)
+        self.cache.invalidate("transitions", issue_key)
+        if await self.client.post(f"/rest/api/3/issue/{issue_key}/transitions", payload) is not None:
+            print(f"Successfully moved {issue_key} to '{status_name}'.")
+            self._issue_changed(issue_key)
+            return True
+        return False
+
+    async def assign_task(self, issue_key, account_id=None):
+        """Assign task."""
+        if not account_id:
+            account_id = await self.get_myself_account_id()
+        if not account_id:
+            return False
+
+        if await self.client.put(f"/rest/api/3/issue/{issue_key}/assignee", {"accountId": account_id}) is not None:
+            print(f"Successfully assigned {issue_key}.")
+            self._issue_changed(issue_key)
+            return True
+        return False
+
+    async def update_issue(self, issue_key, summary=None, description=None):
+        """Update an issue's summary or description."""
+        update_payload = jira_payloads.update_payload(summary, description)
+        if not update_payload["fields"]:
+            print("No changes provided for update.")
+            return False
+
+        if await self.client.put(f"/rest/api/3/issue/{issue_key}", update_payload) is not None:
+            print(f"Successfully updated {issue_key}.")
+            self._issue_changed(issue_key)
+            return True
+        return False
+
+    async def bulk_create_issues(self, specs, project_key=None, chunk_size=bulk_operations.BULK_CREATE_CHUNK_SIZE,
+                                 max_concurrency=4):
+        """Bulk create in chunks of `chunk_size`, sending up to `max_concurrency` chunks at once."""
+        specs = list(specs)
+        target_project = project_key if project_key else self.project_key
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(offset, chunk):
+            async with semaphore:
+                payload = bulk_operations.bulk_create_payload(chunk, target_project)
+                data = await self.client.post(bulk_operations.BULK_CREATE_ENDPOINT, payload)
+            return bulk_operations.parse_bulk_create_response(data, offset, len(chunk))
+
+        chunk_results = await asyncio.gather(*(send(o, c) for o, c in bulk_operations.chunked(specs, chunk_size)))
+        results = [result for chunk in chunk_results for result in chunk]
+        self._projects_changed(results)
+        return results
@@ -0,0 +1,115 @@
+import asyncio
+from . import jira_payloads
+from .json_stream import supports_streaming
+from .search_paginator import SEARCH_ENDPOINT
+
+_END = object()
+_PAGE_END = object()
+
+class AsyncSearchPaginator:
+    """
+    Async counterpart of SearchPaginator: a producer task fetches ahead into
+    an asyncio.Queue (the current page plus `max_buffered_pages`) while the
+    caller consumes. With a streaming client issues are queued as they are
+    parsed from the response.
+    """
+    def __init__(self, client, jql, fields=None, page_size=50, max_results=None, max_buffered_pages=2,
+                 stream=None):
+        self.client = client
+        self.jql = jql
+        self.fields = fields
+        self.page_size = page_size
+        self.max_results = max_results
+        self.max_buffered_pages = max(1, max_buffered_pages)
+        self.stream = supports_streaming(client) if stream is None else stream
+        self.pages_fetched = 0
+        self.failed = False
+
+    async def _fetch_page(self, payload, items, remaining):
+        """Queue one page's issues; returns (issue count, meta) or None on error."""
+        count = 0
+        if self.stream:
+            issues = await self.client.stream_post(SEARCH_ENDPOINT, payload)
+            if issues is None:
+                return None
+            try:
+                async for issue in issues:
+                    if remaining is not None and count >= remaining:
+                        break
+                    count += 1
+                    await items.put(issue)
+            finally:
+                await issues.aclose()
+            return count, issues.meta
+        data = await self.client.post(SEARCH_ENDPOINT, payload)
+        if data is None:
+            return None
+        for issue in data.get("issues", [])[:remaining]:
+            count += 1
+            await items.put(issue)
+        return count, data
+
+    async def _fetch_pages(self, items, slots):
+        token = None
+        remaining = self.max_results
+        while remaining is None or remaining > 0:
+            await slots.acquire()
+            size = self.page_size if remaining is None else min(self.page_size, remaining)
+            payload = jira_payloads.search_payload(self.jql, self.fields, size, token)
+            fetched = await self._fetch_page(payload, items, remaining)
+            if fetched is None:
+                self.failed = True
+                return
+            count, meta = fetched
+            self.pages_fetched += 1
+            if remaining is not None:
+                remaining -= count
+            await items.put(_PAGE_END)
+            token = meta.get("nextPageToken")
+            if not token or meta.get("isLast") or not count:
+                return
+
+    async def _produce(self, items, slots):
+        try:
+            await self._fetch_pages(items, slots)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Search paging error: {e}")
+            self.failed = True
+        await items.put(_END)
+
+    async def _items(self):
+        items = asyncio.Queue()
+        # Free a slot per consumed page, bounding pages held to 1 + max_buffered_pages.
+        slots = asyncio.Semaphore(self.max_buffered_pages + 1)
+        producer = asyncio.create_task(self._produce(items, slots))
+        try:
+            while True:
+                item = await items.get()
+                if item is _END:
+                    return
+                if item is _PAGE_END:
+                    slots.release()
+                yield item
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    async def pages(self):
+        """Async generator of issue lists, one per search page, prefetched ahead."""
+        page = []
+        async for item in self._items():
+            if item is _PAGE_END:
+                yield page
+                page = []
+            else:
+                page.append(item)
+
+    async def __aiter__(self):
+        async for item in self._items():
+            if item is not _PAGE_END:
+                yield item
@@ -0,0 +1,175 @@
+"""
+Run a batch of tool operations in one call, concurrently where they allow it.
+
+Each operation is {"id": str (opt), "tool": name, "args": {...},
+"depends_on": [ids] (opt)}. An argument whose value is "$<id>" or
+"$<id>.<field>[.<field>...]", for the id of another operation in the batch,
+receives that operation's result (or a field of it) and implies a dependency;
+other strings starting with "$" are passed through. Operations naming the same
+`issue_key` run in list order; everything else without a dependency runs at
+once, up to `max_concurrency` at a time. A failed operation does not stop the
+batch, but the operations that depend on it are skipped.
+
+Tools listed in `queued` only queue their write (e.g. in the outbox) and reply
+with QUEUED_FIELDS, so a reference to any other field of their result (such as
+the key of an issue not created yet) is rejected.
+
+The whole batch is checked (tools, arguments, ids, references, cycles) before
+anything runs.
+"""
+import asyncio
+import inspect
+import time
+
+MAX_OPERATIONS = 50
+DEFAULT_MAX_CONCURRENCY = 8
+
+OK, ERROR, SKIPPED = "ok", "error", "skipped"
+# The result of a queued write: {"queued": True, "outbox_entry": id}.
+QUEUED_FIELDS = ("queued", "outbox_entry")
+
+
+class OperationError(Exception):
+    """A handler's failure, reported as the operation's error message."""
+
+
+def _reference(value, ids):
+    """(id, path) if `value` is a "$id.path" reference to one of `ids`, else None."""
+    if isinstance(value, str) and value.startswith("$"):
+        op_id, _, path = value[1:].partition(".")
+        if op_id in ids:
+            return op_id, [p for p in path.split(".") if p]
+    return None
+
+
+def plan_batch(operations, handlers, max_operations=MAX_OPERATIONS, queued=()):
+    """
+    Normalise `operations` into [{"id", "tool", "args", "refs", "after"}] in input order.
+    `refs` maps argument names to (id, path) references; `after` holds the ids each one
+    waits for. Raises ValueError describing the first problem.
+    """
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("operations must be a non-empty list")
+    if len(operations) > max_operations:
+        raise ValueError(f"At most {max_operations} operations per batch (got {len(operations)})")
+
+    ids = []
+    for index, op in enumerate(operations):
+        if not isinstance(op, dict):
+            raise ValueError(f"Operation {index} must be an object")
+        op_id = str(op.get("id", index))
+        if op_id in ids:
+            raise ValueError(f"Duplicate operation id '{op_id}'")
+        ids.append(op_id)
+
+    plan = []
+    for op_id, op in zip(ids, operations):
+        tool = op.get("tool")
+        handler = handlers.get(tool)
+        if handler is None:
+            raise ValueError(f"Operation '{op_id}': unknown tool '{tool}'. Available: {', '.join(sorted(handlers))}")
+        args = op.get("args") or {}
+        if not isinstance(args, dict):
+            raise ValueError(f"Operation '{op_id}': args must be an object")
+        try:
+            inspect.signature(handler).bind(**args)
+        except TypeError as e:
+            raise ValueError(f"Operation '{op_id}' ({tool}): {e}")
+        refs = {name: ref for name, ref in ((n, _reference(v, ids)) for n, v in args.items()) if ref is not None}
+        after = [str(d) for d in op.get("depends_on") or []] + [ref[0] for ref in refs.values()]
+        plan.append({"id": op_id, "tool": tool, "args": args, "refs": refs, "after": after})
+
+    tools = {step["id"]: step["tool"] for step in plan}
+    last_on_issue = {}
+    for step in plan:
+        for dep in step["after"]:
+            if dep not in ids:
+                raise ValueError(f"Operation '{step['id']}' depends on unknown operation '{dep}'")
+        for name, (op_id, path) in step["refs"].items():
+            if tools[op_id] in queued and path and path[0] not in QUEUED_FIELDS:
+                raise ValueError(f"Operation '{step['id']}': {step['args'][name]} is unavailable because "
+                                 f"'{op_id}' ({tools[op_id]}) is only queued; its result has "
+                                 f"{' and '.join(QUEUED_FIELDS)}")
+        issue_key = step["args"].get("issue_key")
+        if isinstance(issue_key, str) and "issue_key" not in step["refs"]:
+            issue_key = issue_key.upper()
+            if issue_key in last_on_issue:
+                step["after"].append(last_on_issue[issue_key])
+            last_on_issue[issue_key] = step["id"]
+        step["after"] = list(dict.fromkeys(step["after"]))
+    _check_acyclic(plan)
+    return plan
+
+
+def _check_acyclic(plan):
+    after = {step["id"]: step["after"] for step in plan}
+    state = {}  # id -> 1 visiting, 2 done
+
+    def visit(op_id, path):
+        if state.get(op_id) == 2:
+            return
+        if state.get(op_id) == 1:
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [op_id])}")
+        state[op_id] = 1
+        for dep in after[op_id]:
+            visit(dep, path + [op_id])
+        state[op_id] = 2
+
+    for op_id in after:
+        visit(op_id, [])
+
+
+def _resolve(value, ref, results):
+    op_id, path = ref
+    resolved = results[op_id]
+    for part in path:
+        if isinstance(resolved, dict) and part in resolved:
+            resolved = resolved[part]
+        elif isinstance(resolved, list) and part.isdigit() and int(part) < len(resolved):
+            resolved = resolved[int(part)]
+        else:
+            raise OperationError(f"Reference {value} not found in the result of '{op_id}'")
+    return resolved
+
+
+async def run_batch(operations, handlers, max_concurrency=DEFAULT_MAX_CONCURRENCY, queued=()):
+    """
+    Plan and run `operations`; returns {"ok", "seconds", "results"} with one
+    {"id", "tool", "status", "result" | "error", "seconds"} per operation, in input order.
+    """
+    plan = plan_batch(operations, handlers, queued=queued)
+    done = {step["id"]: asyncio.Event() for step in plan}
+    outcomes, results = {}, {}
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+    started = time.perf_counter()
+
+    async def run(step):
+        try:
+            for dep in step["after"]:
+                await done[dep].wait()
+            failed = [dep for dep in step["after"] if outcomes[dep]["status"] != OK]
+            if failed:
+                outcomes[step["id"]] = {"status": SKIPPED, "error": f"Depends on failed operation(s): {failed}"}
+                return
+            async with limit:
+                op_started = time.perf_counter()
+                try:
+                    args = {name: _resolve(value, step["refs"][name], results) if name in step["refs"] else value
+                            for name, value in step["args"].items()}
+                    result = await handlers[step["tool"]](**args)
+                    results[step["id"]] = result
+                    outcome = {"status": OK, "result": result}
+                except OperationError as e:
+                    outcome = {"status": ERROR, "error": str(e)}
+                except Exception as e:
+                    outcome = {"status": ERROR, "error": f"{type(e).__name__}: {e}"}
+                outcome["seconds"] = round(time.perf_counter() - op_started, 4)
+                outcomes[step["id"]] = outcome
+        finally:
+            outcomes.setdefault(step["id"], {"status": ERROR, "error": "Not run"})
+            done[step["id"]].set()
+
+    await asyncio.gather(*(run(step) for step in plan))
+    report = [{"id": step["id"], "tool": step["tool"], **outcomes[step["id"]]} for step in plan]
+    return {"ok": all(r["status"] == OK for r in report), "seconds": round(time.perf_counter() - started, 4),
+            "results": report}
@@ -0,0 +1,90 @@
+"""
+Helpers for bulk JIRA operations: chunking, bulk-create payloads/responses,
+and a bounded worker pool that returns one result per input item.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from . import jira_payloads
+
+BULK_CREATE_ENDPOINT = "/rest/api/3/issue/bulk"
+BULK_CREATE_CHUNK_SIZE = 50  # JIRA's per-request limit for /issue/bulk
+DEFAULT_MAX_WORKERS = 8
+
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+
+def issue_spec_from_record(record):
+    """
+    Normalise a JSONL record into create_issue arguments.
+    Accepts summary/description or title/body (e.g. requests.jsonl).
+    """
+    return {
+        "summary": record.get("summary") or record.get("title"),
+        "description": record.get("description") or record.get("body") or "",
+        "issue_type": record.get("issue_type") or record.get("type") or "Task",
+        "project_key": record.get("project_key") or record.get("project"),
+    }
+
+
+def bulk_create_payload(specs, default_project):
+    return {
+        "issueUpdates": [
+            jira_payloads.issue_payload(
+                spec.get("project_key") or default_project,
+                spec["summary"],
+                spec.get("description", ""),
+                spec.get("issue_type", "Task"),
+            )
+            for spec in specs
+        ]
+    }
+
+
+def parse_bulk_create_response(data, offset, count):
+    """
+    Map a /issue/bulk response back onto input positions.
+    JIRA lists created issues in order and reports failures by failedElementNumber.
+    """
+    if data is None:
+        return [{"index": offset + i, "ok": False, "key": None, "error": "Request failed"} for i in range(count)]
+
+    failures = {}
+    for err in data.get("errors", []):
+        element_errors = err.get("elementErrors", {})
+        message = "; ".join(element_errors.get("errorMessages", [])) or json.dumps(element_errors.get("errors", {}))
+        failures[err.get("failedElementNumber")] = message or f"HTTP {err.get('status')}"
+
+    created = iter(data.get("issues", []))
+    results = []
+    for i in range(count):
+        if i in failures:
+            results.append({"index": offset + i, "ok": False, "key": None, "error": failures[i]})
+        else:
+            issue = next(created, {})
+            results.append({"index": offset + i, "ok": bool(issue.get("key")), "key": issue.get("key"),
+                            "error": None if issue.get("key") else "Missing from response"})
+    return results
+
+
+def run_concurrently(fn, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Call fn(*item) for every item on a bounded thread pool.
+    Returns [{"index", "ok", "error"}] in input order; exceptions become failures.
+    """
+    def call(indexed):
+        index, item = indexed
+        try:
+            return {"index": index, "ok": bool(fn(*item)), "error": None}
+        except Exception as e:
+            return {"index": index, "ok": False, "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        return list(pool.map(call, enumerate(items)))
+
+
+def summarize(results):
+    ok = sum(1 for r in results if r["ok"])
+    return {"total": len(results), "succeeded": ok, "failed": len(results) - ok, "results": results}
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+class CacheBackend(ABC):
+    """
+    Storage contract for MetadataCache.
+    Implementations handle TTL expiry and LRU eviction themselves;
+    values must be JSON-serialisable so they can be persisted.
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """Return the cached value, or None if missing/expired."""
+
+    @abstractmethod
+    def set(self, key, value, ttl):
+        """Store `value` for `ttl` seconds."""
+
+    @abstractmethod
+    def delete(self, key):
+        """Drop a single key."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix):
+        """Drop every key starting with `prefix`."""
+
+    @abstractmethod
+    def clear(self):
+        """Drop everything."""
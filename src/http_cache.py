@@ -0,0 +1,224 @@
+"""
+On-disk HTTP response cache for JiraClient GETs.
+
+Responses are stored in a local SQLite file with their validators (ETag,
+Last-Modified). A fresh entry is served without touching the network; a stale
+one with validators is revalidated with If-None-Match / If-Modified-Since, and
+a 304 keeps the stored body. Freshness comes from per-endpoint TTLs, given only
+to static lookups (fields, priorities, issue types); everything else, including
+statuses, projects and boards, is only stored when JIRA sends a validator, so
+it is always revalidated. Successful writes drop the entries they affect. The
+file is bounded by total body size with least-recently-used eviction.
+"""
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+from .request_metrics import endpoint_template
+
+DEFAULT_PATH = "~/.cache/jira_agent/http.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Seconds an entry is served without asking JIRA, keyed by endpoint_template. Only
+# lookups that practically never change get a TTL: statuses, projects and boards can
+# be edited in the JIRA UI or from another host, which INVALIDATES never sees, so
+# they are stored only with a validator and revalidated on every read like issues.
+# /myself stays out: verify_connection must really reach JIRA.
+DEFAULT_TTLS = {
+    "/rest/api/3/field": 3600,
+    "/rest/api/3/priority": 3600,
+    "/rest/api/3/issuetype": 3600,
+}
+
+# Writes whose effects show up under other paths: template -> path prefixes to drop.
+# Every write also drops entries under its own path.
+INVALIDATES = {
+    "/rest/api/3/statuses": ("/rest/api/3/status", "/rest/api/3/project/"),
+    "/rest/api/3/workflows/create": ("/rest/api/3/project/",),
+    "/rest/api/3/workflows/update": ("/rest/api/3/project/",),
+    "/rest/api/3/project": ("/rest/api/3/project", "/rest/agile/1.0/board"),
+    "/rest/api/3/project/{project}": ("/rest/api/3/project/search",),
+}
+
+
+class CachedResponse:
+    """A stored response: `body` bytes, its validators, and whether it is still fresh."""
+    __slots__ = ("body", "etag", "last_modified", "fresh")
+
+    def __init__(self, body, etag, last_modified, fresh):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+    def conditional_headers(self):
+        """If-None-Match / If-Modified-Since for revalidating this entry ({} without validators)."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(identity, endpoint, params=None):
+    """Site + user + endpoint + sorted params; users with different permissions never share entries."""
+    query = urlencode(sorted((params or {}).items()), doseq=True)
+    return f"{identity}|{endpoint}?{query}" if query else f"{identity}|{endpoint}"
+
+
+def _no_store(headers):
+    return "no-store" in (headers.get("Cache-Control") or "").lower()
+
+
+class HttpCache:
+    """
+    Size-bounded SQLite store of GET responses. Thread-safe; the file is opened
+    on first use, so a client that never makes a cacheable call never creates it.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, ttls=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @classmethod
+    def from_env(cls):
+        """
+        JIRA_HTTP_CACHE: 1 | 0 (default 1)
+        JIRA_HTTP_CACHE_PATH: SQLite file (default ~/.cache/jira_agent/http.sqlite3)
+        JIRA_HTTP_CACHE_MAX_BYTES: total body size kept (default 64 MiB)
+        Returns None when disabled.
+        """
+        if os.getenv("JIRA_HTTP_CACHE", "1").lower() in ("0", "false", "off", "no"):
+            return None
+        path = os.path.expanduser(os.getenv("JIRA_HTTP_CACHE_PATH", DEFAULT_PATH))
+        return cls(path, max_bytes=int(os.getenv("JIRA_HTTP_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))))
+
+    def _connect(self):
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, path TEXT NOT NULL, body BLOB NOT NULL,"
+                " etag TEXT, last_modified TEXT, size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_path ON responses (path)")
+            self._conn.commit()
+        return self._conn
+
+    def ttl_for(self, endpoint):
+        return self.ttls.get(endpoint_template(endpoint), 0)
+
+    def lookup(self, key):
+        """The stored response for `key` (fresh or stale), or None."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            fresh = row[3] > now
+            if fresh:
+                self.hits += 1
+        return CachedResponse(row[0], row[1], row[2], fresh)
+
+    def store(self, key, endpoint, response):
+        """
+        Keep a 200 response if its endpoint has a TTL or it carries a validator.
+        Returns True when stored.
+        """
+        headers = response.headers
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        ttl = self.ttl_for(endpoint)
+        body = response.content
+        if (ttl <= 0 and not (etag or last_modified)) or _no_store(headers) or len(body) > self.max_bytes:
+            return False
+        now = time.time()
+        path = endpoint.split("?", 1)[0]
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, path, body, etag, last_modified, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, path, body, etag, last_modified, len(body), now + ttl, now),
+            )
+            self._evict(conn)
+            conn.commit()
+        return True
+
+    def refresh(self, key, endpoint, response):
+        """After a 304: the stored body is current for another TTL; take any new validators."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ?,"
+                " etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                (now + self.ttl_for(endpoint), now, response.headers.get("ETag"),
+                 response.headers.get("Last-Modified"), key),
+            )
+            conn.commit()
+            self.revalidated += 1
+
+    def _evict(self, conn):
+        """Drop least-recently-used rows until the bodies fit in max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.evicted += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def invalidate(self, endpoint):
+        """Drop entries a successful write to `endpoint` may have changed."""
+        path = endpoint.split("?", 1)[0]
+        template = endpoint_template(path)
+        if template not in self.ttls and template not in INVALIDATES:
+            return  # entries stored only for their validators are revalidated on every read anyway
+        prefixes = (path,) + INVALIDATES.get(template, ())
+        with self._lock:
+            conn = self._connect()
+            for prefix in prefixes:
+                escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                conn.execute("DELETE FROM responses WHERE path LIKE ? ESCAPE '\\'", (escaped + "%",))
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def metrics(self):
+        with self._lock:
+            entries, size = (0, 0) if self._conn is None else self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses,
+                "evicted": self.evicted, "entries": entries, "bytes": size}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,97 @@
+import os
+import threading
+from dataclasses import dataclass
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name, default):
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_bool(name, default):
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection pool settings for HTTP sessions talking to JIRA.
+    pool_connections: number of per-host pools kept by the adapter.
+    pool_maxsize: max keep-alive connections per host.
+    """
+    pool_connections: int = 10
+    pool_maxsize: int = 20
+    pool_block: bool = False
+    keep_alive: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls):
+        """Build a config from JIRA_POOL_* / JIRA_*_TIMEOUT environment variables."""
+        return cls(
+            pool_connections=_env_int("JIRA_POOL_CONNECTIONS", cls.pool_connections),
+            pool_maxsize=_env_int("JIRA_POOL_MAXSIZE", cls.pool_maxsize),
+            pool_block=_env_bool("JIRA_POOL_BLOCK", cls.pool_block),
+            keep_alive=_env_bool("JIRA_KEEP_ALIVE", cls.keep_alive),
+            connect_timeout=_env_float("JIRA_CONNECT_TIMEOUT", cls.connect_timeout),
+            read_timeout=_env_float("JIRA_READ_TIMEOUT", cls.read_timeout),
+        )
+
+    @property
+    def timeout(self):
+        """(connect, read) tuple as expected by requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def build_session(config):
+    """Create a requests.Session with a sized keep-alive pool."""
+    # Imported here so the async-only MCP server never pays for loading requests.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_session(config):
+    """
+    Return the process-wide session for this pool config.
+    Every JiraClient built with an equal config shares one pool, so the
+    service, the MCP server and helper scripts reuse warm connections.
+    """
+    with _sessions_lock:
+        session = _sessions.get(config)
+        if session is None:
+            session = build_session(config)
+            _sessions[config] = session
+        return session
+
+
+def close_sessions():
+    """Close and forget all shared sessions (used on shutdown and in tests)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
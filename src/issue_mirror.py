@@ -0,0 +1,204 @@
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from .jql_filter import parse_order_by, parse_simple_jql
+
+# Fields kept for every mirrored issue; enough for get_issue, search_tasks and fetch.
+MIRROR_FIELDS = ["summary", "status", "assignee", "priority", "issuetype", "project", "description", "updated"]
+DEFAULT_MIRROR_PATH = os.path.join("~", ".cache", "jira_agent", "mirror.sqlite3")
+
+def _order_sql(order):
+    """SQL ORDER BY terms for [(field, descending)]; keys sort by project, then number."""
+    terms = []
+    for field, descending in order:
+        direction = "DESC" if descending else "ASC"
+        if field == "key":
+            terms += [f"project {direction}", f"CAST(substr(key, instr(key, '-') + 1) AS INTEGER) {direction}"]
+        else:
+            terms.append(f"{field} {direction}")
+    return ", ".join(terms)
+
+
+class IssueMirror:
+    """
+    Local SQLite copy of issues, kept current with `updated >= -Nm` JQL deltas.
+    One sync scope per project; each records when it was last synced so reads
+    can bound staleness. Lookups are indexed and never touch the network.
+    Deltas never see issues that were deleted or moved to another project, so
+    every `full_sync_interval` seconds a scope is re-read whole and issues the
+    sweep did not return are dropped.
+    """
+    def __init__(self, path, max_staleness=300, full_sync_interval=86400):
+        self.path = path
+        self.max_staleness = max_staleness
+        self.full_sync_interval = full_sync_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            " key TEXT PRIMARY KEY, project TEXT, status TEXT, assignee TEXT, assignee_name TEXT,"
+            " issuetype TEXT, updated TEXT, data TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS issues_project_status ON issues (project, status);"
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            " scope TEXT PRIMARY KEY, last_sync REAL NOT NULL, dirty INTEGER NOT NULL DEFAULT 0);"
+            "CREATE TABLE IF NOT EXISTS full_sync (scope TEXT PRIMARY KEY, synced_at REAL NOT NULL);"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls, site=None):
+        """
+        JIRA_MIRROR_PATH, JIRA_MIRROR_MAX_STALENESS and JIRA_MIRROR_FULL_SYNC_INTERVAL (seconds).
+        A named `site` gets its own file next to it (mirror-<site>.sqlite3), since
+        issue keys are only unique within one site.
+        """
+        path = os.path.expanduser(os.getenv("JIRA_MIRROR_PATH", DEFAULT_MIRROR_PATH))
+        if site:
+            root, ext = os.path.splitext(path)
+            path = f"{root}-{site.lower()}{ext}"
+        return cls(path, max_staleness=float(os.getenv("JIRA_MIRROR_MAX_STALENESS", "300")),
+                   full_sync_interval=float(os.getenv("JIRA_MIRROR_FULL_SYNC_INTERVAL", "86400")))
+
+    @staticmethod
+    def _row(issue):
+        fields = issue.get("fields", {})
+        status = fields.get("status") or {}
+        assignee = fields.get("assignee") or {}
+        issuetype = fields.get("issuetype") or {}
+        project = (fields.get("project") or {}).get("key") or issue["key"].rsplit("-", 1)[0]
+        return (issue["key"], project.lower(), (status.get("name") or "").lower(),
+                (assignee.get("accountId") or "").lower(), (assignee.get("displayName") or "").lower(),
+                (issuetype.get("name") or "").lower(), fields.get("updated"),
+                json.dumps(issue, separators=(",", ":")))
+
+    def upsert(self, issues):
+        rows = [self._row(issue) for issue in issues]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO issues"
+                " (key, project, status, assignee, assignee_name, issuetype, updated, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+        return len(rows)
+
+    def get(self, issue_key):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM issues WHERE key = ?", (issue_key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, issue_key):
+        with self._lock:
+            self._conn.execute("DELETE FROM issues WHERE key = ?", (issue_key,))
+            self._conn.commit()
+
+    def touch(self, issue_key):
+        """A local write changed this issue: drop it and force the next read to re-sync."""
+        self.delete(issue_key)
+        self.mark_dirty(issue_key.rsplit("-", 1)[0])
+
+    def query(self, filters, order=None, limit=None):
+        """
+        Issues matching {field: set(values)} from jql_filter, sorted by `order`
+        ([(field, descending)] from parse_order_by; newest first if empty).
+        `assignee` matches account id or display name.
+        """
+        clauses, params = [], []
+        for field, values in filters.items():
+            marks = ", ".join("?" * len(values))
+            if field == "assignee":
+                clauses.append(f"(assignee IN ({marks}) OR assignee_name IN ({marks}))")
+                params.extend(list(values) * 2)
+            elif field == "key":
+                clauses.append(f"lower(key) IN ({marks})")
+                params.extend(values)
+            else:
+                clauses.append(f"{field} IN ({marks})")
+                params.extend(values)
+        sql = "SELECT data FROM issues"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY " + _order_sql(order or [("updated", True)])
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def plan(self, jql, fields=None):
+        """
+        (filters, order) if this search can be answered locally, else None.
+        Requires a `project` clause (the sync scope), only mirrored fields and
+        a sort the mirror can reproduce.
+        """
+        filters, order = parse_simple_jql(jql), parse_order_by(jql)
+        if not filters or "project" not in filters or order is None:
+            return None
+        if fields and not set(fields) <= set(MIRROR_FIELDS):
+            return None
+        return filters, order
+
+    def last_sync(self, scope):
+        with self._lock:
+            row = self._conn.execute("SELECT last_sync FROM sync_state WHERE scope = ?", (scope.lower(),)).fetchone()
+        return row[0] if row else None
+
+    def mark_synced(self, scope, synced_at, keys=None):
+        """
+        Record a sync of `scope` started at `synced_at`. For a full sweep, `keys` are
+        the issues it returned; the scope's other issues are gone from JIRA and dropped.
+        """
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO sync_state (scope, last_sync, dirty) VALUES (?, ?, 0)",
+                               (scope.lower(), synced_at))
+            if keys is not None:
+                stored = {row[0] for row in self._conn.execute("SELECT key FROM issues WHERE project = ?",
+                                                                (scope.lower(),))}
+                self._conn.executemany("DELETE FROM issues WHERE key = ?", [(k,) for k in stored - set(keys)])
+                self._conn.execute("INSERT OR REPLACE INTO full_sync (scope, synced_at) VALUES (?, ?)",
+                                   (scope.lower(), synced_at))
+            self._conn.commit()
+
+    def full_sync_due(self, scope, now=None):
+        """True if `scope` has never been read whole, or not within full_sync_interval."""
+        with self._lock:
+            row = self._conn.execute("SELECT synced_at FROM full_sync WHERE scope = ?", (scope.lower(),)).fetchone()
+        return row is None or (now or time.time()) - row[0] > self.full_sync_interval
+
+    def mark_dirty(self, scope):
+        with self._lock:
+            self._conn.execute("UPDATE sync_state SET dirty = 1 WHERE scope = ?", (scope.lower(),))
+            self._conn.commit()
+
+    def is_fresh(self, scope):
+        """True if `scope` was synced within max_staleness and has no local writes since."""
+        with self._lock:
+            row = self._conn.execute("SELECT last_sync, dirty FROM sync_state WHERE scope = ?",
+                                     (scope.lower(),)).fetchone()
+        return bool(row) and not row[1] and time.time() - row[0] <= self.max_staleness
+
+    def delta_jql(self, scope, now=None):
+        """
+        JQL for issues changed since the last sync of `scope` (all of them when a
+        full sync is due). Uses a relative `updated >= -Nm` bound (timezone
+        independent) with one minute of overlap, since JIRA compares `updated`
+        at minute granularity.
+        """
+        jql = f"project = {scope}"
+        last = self.last_sync(scope)
+        if last is not None and not self.full_sync_due(scope, now):
+            minutes = math.ceil(((now or time.time()) - last) / 60) + 1
+            jql += f' AND updated >= "-{minutes}m"'
+        return jql + " ORDER BY updated ASC"
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,126 @@
+"""
+Compact, flat projections of JIRA issue JSON.
+Nested objects (status, assignee, priority, ...) collapse to their display
+string, so cached views hold a few short strings instead of full sub-trees.
+The ADF `description` is rendered to Markdown for the same reason.
+
+`IssueRecord` is the tuple-backed form services keep in caches and result
+lists: one fixed-size tuple per issue, with status / assignee / issue type /
+priority names interned so thousands of issues share one string each.
+"""
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+from .adf_renderer import render_adf
+
+# Attribute used to flatten each nested object to one string.
+_FLATTEN_KEYS = ("displayName", "name", "key", "value")
+
+# JIRA field -> IssueRecord attribute; other requested fields go to `extra`.
+RECORD_FIELDS = {"summary": "summary", "status": "status", "assignee": "assignee", "issuetype": "issue_type",
+                 "priority": "priority", "updated": "updated", "description": "description"}
+# Low-cardinality values shared across issues.
+_INTERNED = ("status", "assignee", "issuetype", "priority")
+
+# Distinct field lists kept shared; callers normally use a handful, so this only
+# stops arbitrary per-call lists from growing the table without bound.
+MAX_FIELD_SETS = 256
+
+
+def _flatten(value):
+    if isinstance(value, dict):
+        for attr in _FLATTEN_KEYS:
+            if attr in value:
+                return value[attr]
+        return value
+    if isinstance(value, list):
+        return [_flatten(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=MAX_FIELD_SETS)
+def _shared_field_set(fields):
+    return fields
+
+
+def _field_set(fields):
+    """One shared tuple per distinct field list, instead of one list per record."""
+    return _shared_field_set(tuple(fields))
+
+
+def _flat_value(source, field):
+    value = source.get(field)
+    if field == "description":
+        return render_adf(value) or None
+    value = _flatten(value)
+    if field in _INTERNED and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class IssueRecord(namedtuple("IssueRecord", ["key", "fields", "summary", "status", "assignee", "issue_type",
+                                             "priority", "updated", "description", "extra"])):
+    """
+    Flattened issue: the requested `fields` (a shared tuple) and their values.
+    A tuple, so it serializes to a JSON list (SQLite cache) and back via from_cached.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_issue(cls, data, fields):
+        """Record of `fields` from issue JSON ({"key", "fields": {...}})."""
+        source = data.get("fields") or {}
+        values = dict.fromkeys(RECORD_FIELDS.values())
+        extra = None
+        for field in fields:
+            attr = RECORD_FIELDS.get(field)
+            if attr is not None:
+                values[attr] = _flat_value(source, field)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[field] = _flat_value(source, field)
+        return cls(data.get("key"), _field_set(fields), extra=extra, **values)
+
+    @classmethod
+    def from_view(cls, view):
+        """Record from an already-flattened view dict ({"key", field: value})."""
+        fields = [f for f in view if f != "key"]
+        values = {attr: view.get(field) for field, attr in RECORD_FIELDS.items()}
+        extra = {f: view[f] for f in fields if f not in RECORD_FIELDS} or None
+        return cls(view.get("key"), _field_set(fields), extra=extra, **values)
+
+    @classmethod
+    def from_cached(cls, value):
+        """
+        Rebuild a record a JSON backend returned as a list (records pass through;
+        view dicts cached by earlier versions are converted).
+        """
+        if value is None or isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.from_view(value)
+        record = cls._make(value)
+        return record._replace(fields=_field_set(record.fields))
+
+    def get(self, field, default=None):
+        attr = RECORD_FIELDS.get(field)
+        if attr is not None:
+            return getattr(self, attr)
+        return (self.extra or {}).get(field, default)
+
+    def view(self):
+        """{"key": ..., <field>: value, ...} for the requested fields (what tools serialize)."""
+        view = {"key": self.key}
+        for field in self.fields:
+            view[field] = self.get(field)
+        return view
+
+
+def project_issue(data, fields):
+    """
+    {"key": ..., <field>: flattened value, ...} for the requested fields.
+    `description` (ADF) becomes Markdown text, or None when empty.
+    """
+    return IssueRecord.from_issue(data, fields).view()
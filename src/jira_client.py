@@ -1,68 +1,227 @@
-import os
+import time
+
 import requests
-from base64 import b64encode
-from dotenv import load_dotenv
+from .http_cache import HttpCache, cache_key
+from .http_pool import PoolConfig, get_session
+from .jira_settings import JiraSettings
+from .json_codec import decode_json, encode_json
+from .json_stream import CHUNK_SIZE, StreamedArray, streaming_enabled
+from .rate_limiter import get_rate_limiter
+from .request_metrics import RequestEvent, endpoint_template, get_request_metrics
+from .retry_policy import RetryPolicy
+from .shared_streams import SharedStreams
+from .single_flight import READ_ONLY_POSTS, SingleFlight, coalescing_enabled, request_key
 
 class JiraClient:
     """
     Handles low-level authentications and HTTP requests to JIRA API.
     Single Responsibility: API Communication.
     """
-    def __init__(self):
-        load_dotenv()
-        self.jira_url = os.getenv("JIRA_URL")
-        self.email = os.getenv("JIRA_USER_EMAIL")
-        self.token = os.getenv("JIRA_API_TOKEN")
-        self.project_key = os.getenv("JIRA_PROJECT_KEY")
-
-        if not all([self.jira_url, self.email, self.token, self.project_key]):
-            raise ValueError("Missing JIRA configuration in environment variables.")
-
-        auth_string = f"{self.email}:{self.token}"
-        self.headers = {
-            "Authorization": f"Basic {b64encode(auth_string.encode('utf-8')).decode('utf-8')}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+    def __init__(self, settings=None, pool_config=None, limiter=None, retry_policy=None, http_cache=None):
+        self.settings = settings or JiraSettings.from_env()
+        self.jira_url = self.settings.jira_url
+        self.email = self.settings.email
+        self.token = self.settings.token
+        self.project_key = self.settings.project_key
+        self.headers = self.settings.auth_headers()
 
-    def get(self, endpoint, params=None):
-        """Execute GET request."""
+        # Shared keep-alive pool: avoids a TCP+TLS handshake per call.
+        self.pool_config = pool_config or PoolConfig.from_env()
+        self.session = get_session(self.pool_config)
+
+        # One token bucket per site, shared with AsyncJiraClient.
+        self.limiter = limiter or get_rate_limiter(self.jira_url)
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+
+        # Instrumentation: callables receiving a RequestEvent per call.
+        self.metrics = get_request_metrics()
+        self.observers = [self.metrics.record]
+        # Concurrent identical reads (GETs, searches) share one in-flight request.
+        self.single_flight = SingleFlight() if coalescing_enabled() else None
+        self.shared_streams = SharedStreams() if self.single_flight is not None else None
+        # On-disk GET cache (validators + per-endpoint TTLs); False disables it.
+        self.http_cache = HttpCache.from_env() if http_cache is None else (http_cache or None)
+        self.cache_identity = f"{self.jira_url}#{self.email}"
+        # Searches parse `issues` incrementally from the socket (see stream_post).
+        self.streaming = streaming_enabled()
+
+    def _send(self, method, endpoint, params=None, payload=None, headers=None, stream=False):
+        """
+        Send a request through the limiter, retrying 429/503 with backoff
+        (honouring Retry-After). Returns the response, or None on error.
+        `headers` are added to the auth headers (e.g. conditional GETs).
+        With `stream`, the body is left unread for the caller to iterate.
+        Every call is reported to `observers` as one RequestEvent.
+        """
         url = f"{self.jira_url}{endpoint}"
+        headers = {**self.headers, **headers} if headers else self.headers
+        # Encoded once (not per retry); headers already declare application/json.
+        body = encode_json(payload) if payload is not None else None
+        attempt = 0
+        response = None
+        started = time.perf_counter()
+        network = 0.0
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            while True:
+                self.limiter.acquire()
+                response = None
+                sent = time.perf_counter()
+                response = self.session.request(method, url, headers=headers, params=params,
+                                                data=body, timeout=self.pool_config.timeout, stream=stream)
+                network += time.perf_counter() - sent
+                if not self.retry_policy.should_retry(response.status_code, attempt):
+                    break
+                if stream:
+                    response.close()
+                delay = self.retry_policy.delay(attempt, response.headers.get("Retry-After"))
+                print(f"{method} {url} throttled ({response.status_code}), retrying in {delay:.1f}s")
+                self.limiter.record_retry(response.status_code)
+                self.limiter.pause(delay)
+                attempt += 1
             response.raise_for_status()
-            return response.json()
+            return response
         except requests.exceptions.RequestException as e:
-            print(f"GET Error {url}: {e}")
+            print(f"{method} Error {url}: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 print(f"Response: {e.response.text}")
             return None
+        finally:
+            self._observe(RequestEvent(
+                method=method, endpoint=endpoint_template(endpoint),
+                status=response.status_code if response is not None else None,
+                seconds=network, wait_seconds=time.perf_counter() - started - network,
+                request_bytes=len(body) if body else 0,
+                response_bytes=self._response_bytes(response, stream),
+                retries=attempt))
 
-    def post(self, endpoint, payload):
-        """Execute POST request."""
-        url = f"{self.jira_url}{endpoint}"
+    @staticmethod
+    def _response_bytes(response, stream):
+        if response is None:
+            return 0
+        if stream:  # body not read yet; the declared length (0 when chunked)
+            return int(response.headers.get("Content-Length") or 0)
+        return len(response.content)
+
+    def _observe(self, event):
+        for observer in self.observers:
+            observer(event)
+
+    def _json(self, response, method, endpoint):
+        started = time.perf_counter()
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
-            response.raise_for_status()
-            if response.status_code == 204:
-                return {} # Return empty dict for success with no content
             return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"POST Error {url}: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Response: {e.response.text}")
+        except ValueError as e:
+            print(f"Invalid JSON from {response.url}: {e}")
             return None
+        finally:
+            self.metrics.record_parse(method, endpoint_template(endpoint), time.perf_counter() - started)
+
+    def _coalesced(self, method, endpoint, fetch, params=None, body=None):
+        """Run fetch() through single-flight; coalesced callers share its (read-only) result."""
+        if self.single_flight is None:
+            return fetch()
+        result, shared = self.single_flight.do(request_key(method, endpoint, params, body), fetch)
+        if shared:
+            self.metrics.record_coalesced(method, endpoint_template(endpoint))
+        return result
+
+    def get(self, endpoint, params=None):
+        """Execute GET request."""
+        def fetch():
+            if self.http_cache is not None:
+                return self._cached_get(endpoint, params)
+            response = self._send("GET", endpoint, params=params)
+            return self._json(response, "GET", endpoint) if response is not None else None
+
+        return self._coalesced("GET", endpoint, fetch, params=params)
+
+    def _cached_get(self, endpoint, params):
+        """
+        GET through the on-disk cache: fresh entries skip the network, stale ones
+        with validators are revalidated (304 keeps the stored body).
+        """
+        key = cache_key(self.cache_identity, endpoint, params)
+        cached = self.http_cache.lookup(key)
+        if cached is not None and cached.fresh:
+            return self._decode_cached(cached.body, endpoint)
+        conditional = cached.conditional_headers() if cached is not None else None
+        response = self._send("GET", endpoint, params=params, headers=conditional)
+        if response is None:
+            return None
+        if response.status_code == 304 and cached is not None:
+            self.http_cache.refresh(key, endpoint, response)
+            return self._decode_cached(cached.body, endpoint)
+        data = self._json(response, "GET", endpoint)
+        if data is not None and response.status_code == 200:
+            self.http_cache.store(key, endpoint, response)
+        return data
+
+    def _decode_cached(self, body, endpoint):
+        started = time.perf_counter()
+        try:
+            return decode_json(body)
+        finally:
+            self.metrics.record_parse("GET", endpoint_template(endpoint), time.perf_counter() - started)
+
+    def _invalidate(self, endpoint):
+        """A write succeeded: drop cached GETs it may have changed."""
+        if self.http_cache is not None:
+            self.http_cache.invalidate(endpoint)
+
+    def post(self, endpoint, payload):
+        """Execute POST request (searches are coalesced like GETs)."""
+        if endpoint in READ_ONLY_POSTS and self.single_flight is not None:
+            return self._coalesced(
+                "POST", endpoint, lambda: self._post(endpoint, payload), body=encode_json(payload))
+        return self._post(endpoint, payload)
+
+    def _post(self, endpoint, payload):
+        response = self._send("POST", endpoint, payload=payload)
+        if response is None:
+            return None
+        if endpoint not in READ_ONLY_POSTS:
+            self._invalidate(endpoint)
+        if response.status_code == 204:
+            return {} # Return empty dict for success with no content
+        return self._json(response, "POST", endpoint)
+
+    def stream_post(self, endpoint, payload, array_key="issues"):
+        """
+        POST and return a StreamedArray yielding the elements of the top-level
+        `array_key` array as they arrive (other members in `.meta` afterwards),
+        or None on error. Concurrent identical searches read one shared stream.
+        """
+        if endpoint not in READ_ONLY_POSTS or self.shared_streams is None:
+            return self._stream_post(endpoint, payload, array_key)
+        key = request_key("POST", endpoint, body=encode_json(payload)) + (array_key,)
+        issues, shared = self.shared_streams.open(key, lambda: self._stream_post(endpoint, payload, array_key))
+        if shared:
+            self.metrics.record_coalesced("POST", endpoint_template(endpoint))
+        return issues
+
+    def _stream_post(self, endpoint, payload, array_key):
+        response = self._send("POST", endpoint, payload=payload, stream=True)
+        if response is None:
+            return None
+        return StreamedArray(response.iter_content(CHUNK_SIZE), array_key, on_close=response.close)
 
     def put(self, endpoint, payload):
         """Execute PUT request."""
-        url = f"{self.jira_url}{endpoint}"
-        try:
-            response = requests.put(url, headers=self.headers, json=payload)
-            response.raise_for_status()
-            # PUT responses vary, sometimes 204 No Content
-            if response.status_code == 204:
-                return True
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"PUT Error {url}: {e}")
+        response = self._send("PUT", endpoint, payload=payload)
+        if response is None:
+            return None
+        self._invalidate(endpoint)
+        # PUT responses vary, sometimes 204 No Content
+        if response.status_code == 204:
+            return True
+        return self._json(response, "PUT", endpoint)
+
+    def delete(self, endpoint, params=None):
+        """Execute DELETE request."""
+        response = self._send("DELETE", endpoint, params=params)
+        if response is None:
             return None
+        self._invalidate(endpoint)
+        if response.status_code == 204 or not response.content:
+            return True
+        return self._json(response, "DELETE", endpoint)
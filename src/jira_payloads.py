@@ -0,0 +1,90 @@
+"""
+Pure request-body builders shared by JiraService and AsyncJiraService.
+No I/O here, so both the sync and async services build identical payloads.
+"""
+from .adf_builder import markdown_to_adf
+
+DEFAULT_SEARCH_FIELDS = ["summary", "status", "assignee"]
+# What get_issue_details / the get_issue tool actually read.
+DETAIL_FIELDS = ["summary", "status", "assignee", "priority", "description"]
+PROJECT_TEMPLATE_KEY = "com.pyxis.greenhopper.jira:gh-simplified-agility-scrum"
+
+
+def open_tasks_jql(project_key):
+    return f"project = {project_key} AND status = 'READY FOR DEVELOPMENT'"
+
+
+def issue_params(fields=None, expand=None):
+    """
+    Query params projecting GET /issue/{key} to `fields` (default DETAIL_FIELDS).
+    Pass fields=["*all"] for the full issue.
+    """
+    params = {"fields": ",".join(fields or DETAIL_FIELDS)}
+    if expand:
+        params["expand"] = expand
+    return params
+
+
+def search_payload(jql, fields=None, max_results=None, next_page_token=None):
+    payload = {
+        "jql": jql,
+        "fields": list(fields) if fields else list(DEFAULT_SEARCH_FIELDS)
+    }
+    if max_results:
+        payload["maxResults"] = max_results
+    if next_page_token:
+        payload["nextPageToken"] = next_page_token
+    return payload
+
+
+def project_payload(key, name, account_id=None, shared_configuration_id=None):
+    payload = {
+        "key": key,
+        "name": name,
+        "projectTypeKey": "software",
+        "description": f"Project {name} created via AI Agent",
+        "leadAccountId": account_id,
+        "assigneeType": "PROJECT_LEAD"
+    }
+    if shared_configuration_id:
+        payload["sharedConfigurationProjectId"] = shared_configuration_id
+    else:
+        payload["projectTemplateKey"] = PROJECT_TEMPLATE_KEY
+    return payload
+
+
+def issue_payload(project_key, summary, description, issue_type="Task"):
+    return {
+        "fields": {
+            "project": {"key": project_key},
+            "summary": summary,
+            "description": markdown_to_adf(description),
+            "issuetype": {"name": issue_type}
+        }
+    }
+
+
+def comment_payload(comment_text):
+    return {"body": markdown_to_adf(comment_text)}
+
+
+def update_payload(summary=None, description=None):
+    """Returns {"fields": {...}}; fields is empty when nothing changes."""
+    payload = {"fields": {}}
+    if summary:
+        payload["fields"]["summary"] = summary
+    if description:
+        payload["fields"]["description"] = markdown_to_adf(description)
+    return payload
+
+
+def find_transition_id(transitions, status_name):
+    """Case-insensitive lookup of a transition id by its name."""
+    for t in transitions:
+        if t["name"].lower() == status_name.lower():
+            return t["id"]
+    return None
+
+
+def transition_payload(transition_id):
+    return {"transition": {"id": transition_id}}
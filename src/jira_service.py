@@ -1,67 +1,136 @@
+import os
+import time
 from .jira_client import JiraClient
+from . import jira_payloads
+from .search_paginator import SearchPaginator
+from .metadata_cache import MetadataCache
+from . import bulk_operations
+from . import workflow_provisioning
+from .issue_mirror import IssueMirror, MIRROR_FIELDS
+from .issue_view import IssueRecord
+from .adf_renderer import iter_adf
 
 class JiraService:
     """
     Handles business logic for JIRA operations.
     Uses JiraClient for API access.
     """
-    def __init__(self):
-        self.client = JiraClient()
+    def __init__(self, client=None, cache=None, mirror=None, read_mode=None):
+        self.client = client or JiraClient()
         self.project_key = self.client.project_key
+        # Statuses, transitions and /myself change rarely; see MetadataCache TTLs.
+        self.cache = cache or MetadataCache.from_env(scope=self.client.jira_url)
+        # read_mode "mirror" serves get/search/fetch from the local IssueMirror.
+        self.read_mode = read_mode or os.getenv("JIRA_READ_MODE", "live")
+        if mirror is None and self.read_mode == "mirror":
+            mirror = IssueMirror.from_env()
+        self.mirror = mirror
 
     def verify_connection(self):
         """Verify credentials."""
         data = self.client.get("/rest/api/3/myself")
         if data is not None:
+            self.cache.put("myself", "", data)
             print(f"Connection Successful! Logged in as: {data.get('displayName')} ({data.get('emailAddress')})")
             return True
         return False
 
-    def get_open_tasks(self):
-        """Fetch tasks ready for development."""
-        jql = f"project = {self.project_key} AND status = 'READY FOR DEVELOPMENT'"
-        payload = {
-            "jql": jql,
-            "fields": ["summary", "status", "assignee"]
-        }
-        data = self.client.post("/rest/api/3/search/jql", payload)
-        if data is None:
-            return []
-        
-        issues = data.get("issues", [])
-        if not issues:
+    def iter_search(self, jql, fields=None, max_results=None, page_size=50):
+        """
+        Lazily yield issues matching `jql`, following nextPageToken pages.
+        The next page is prefetched while the caller handles the current one.
+        """
+        return iter(SearchPaginator(self.client, jql, fields, page_size, max_results))
+
+    def sync_mirror(self, project_key=None):
+        """
+        Pull issues of `project_key` changed since its last sync into the mirror; when a
+        full sync is due, pull all of them and drop the ones JIRA no longer returns.
+        Returns the number of issues stored, or None if the search failed.
+        """
+        if self.mirror is None:
+            return None
+        scope = project_key or self.project_key
+        started = time.time()
+        full = self.mirror.full_sync_due(scope, started)
+        paginator = SearchPaginator(self.client, self.mirror.delta_jql(scope, started), MIRROR_FIELDS, page_size=100)
+        count, keys = 0, []
+        for page in paginator.pages():
+            count += self.mirror.upsert(page)
+            keys.extend(issue["key"] for issue in page)
+        if paginator.failed:
+            return None
+        self.mirror.mark_synced(scope, started, keys if full else None)
+        return count
+
+    def _mirror_ready(self, scope):
+        """True if reads for `scope` may be served locally (delta-syncing first if stale)."""
+        if self.read_mode != "mirror" or self.mirror is None:
+            return False
+        if not self.mirror.is_fresh(scope):
+            self.sync_mirror(scope)
+        return self.mirror.is_fresh(scope)
+
+    def _projects_changed(self, results):
+        """Bulk create went through: mark the projects of the new issues stale in the mirror."""
+        if self.mirror is not None:
+            for project in {r["key"].rsplit("-", 1)[0] for r in results if r["ok"]}:
+                self.mirror.mark_dirty(project)
+
+    def _issue_changed(self, issue_key):
+        """A write went through: drop cached views and mark the mirror stale."""
+        self.cache.invalidate_prefix("issue_view", f"{issue_key}|")
+        if self.mirror is not None:
+            self.mirror.touch(issue_key)
+
+    def search_issues(self, jql, fields=None, max_results=50, shape=None):
+        """
+        Collect up to `max_results` issues, from the mirror when it can answer.
+        `shape`, if given, is applied to each issue as it is parsed and only its result is kept.
+        """
+        if self.mirror is not None:
+            planned = self.mirror.plan(jql, fields)
+            if planned and all(self._mirror_ready(p) for p in planned[0]["project"]):
+                issues = self.mirror.query(*planned, limit=max_results)
+                return [shape(i) for i in issues] if shape else issues
+        if shape is not None:
+            return [shape(issue) for issue in self.iter_search(jql, fields, max_results)]
+        return list(self.iter_search(jql, fields, max_results))
+
+    def search_records(self, jql, fields=None, max_results=50):
+        """Like search_issues, but each issue is kept as a compact IssueRecord of `fields`."""
+        fields = list(fields or jira_payloads.DEFAULT_SEARCH_FIELDS)
+        return self.search_issues(jql, fields, max_results, shape=lambda issue: IssueRecord.from_issue(issue, fields))
+
+    def get_open_tasks(self, max_results=None):
+        """Fetch tasks ready for development (all pages unless max_results is set) as IssueRecords."""
+        jql = jira_payloads.open_tasks_jql(self.project_key)
+        records = self.search_records(jql, max_results=max_results)
+        if not records:
             print("No 'READY FOR DEVELOPMENT' tasks found.")
             return []
 
-        print(f"Found {len(issues)} open tasks:")
-        for issue in issues:
-            print(f"[{issue['key']}] {issue['fields']['summary']}")
-        return issues
+        print(f"Found {len(records)} open tasks:")
+        for record in records:
+            print(f"[{record.key}] {record.summary}")
+        return records
 
     def get_myself_account_id(self):
-        data = self.client.get("/rest/api/3/myself")
+        data = self.cache.get_or_load("myself", "", lambda: self.client.get("/rest/api/3/myself"))
         return data.get("accountId") if data is not None else None
 
-    def create_project(self, key, name, assign_to_me=True, shared_configuration_id=None):
-        """Create a new JIRA Project."""
-        account_id = None
-        if assign_to_me:
+    def _get_transitions(self, issue_key):
+        return self.cache.get_or_load(
+            "transitions", issue_key,
+            lambda: self.client.get(f"/rest/api/3/issue/{issue_key}/transitions"))
+
+    def create_project(self, key, name, assign_to_me=True, shared_configuration_id=None, account_id=None):
+        """Create a new JIRA Project. `account_id` (the lead) defaults to the current user."""
+        if assign_to_me and account_id is None:
             account_id = self.get_myself_account_id()
-        
-        payload = {
-            "key": key,
-            "name": name,
-            "projectTypeKey": "software",
-            "description": f"Project {name} created via AI Agent",
-            "leadAccountId": account_id,
-            "assigneeType": "PROJECT_LEAD"
-        }
 
-        if shared_configuration_id:
-            payload["sharedConfigurationProjectId"] = shared_configuration_id
-        else:
-            payload["projectTemplateKey"] = "com.pyxis.greenhopper.jira:gh-simplified-agility-scrum"
-        
+        payload = jira_payloads.project_payload(key, name, account_id, shared_configuration_id)
+
         data = self.client.post("/rest/api/3/project", payload)
         if data is not None:
             print(f"Successfully created project '{name}' ({key}).")
@@ -69,41 +138,45 @@ class JiraService:
             return True
         return False
 
+    def recreate_project(self, key, name, template_key=None):
+        """
+        Delete project `key` if it exists and create it again, sharing the configuration
+        of `template_key` when given. Safe to re-run: a missing project is simply created.
+        """
+        shared_configuration_id = None
+        if template_key:
+            template = self.client.get(f"/rest/api/3/project/{template_key}")
+            if not template:
+                print(f"Error: Could not find project {template_key}")
+                return False
+            shared_configuration_id = int(template["id"])
+        if self.client.get(f"/rest/api/3/project/{key}"):
+            print(f"Deleting existing {key} project to recreate it...")
+            if self.client.delete(f"/rest/api/3/project/{key}") is None:
+                print(f"Error deleting {key}.")
+                return False
+        else:
+            print(f"{key} project does not exist (clean slate).")
+        return self.create_project(key, name, shared_configuration_id=shared_configuration_id)
+
     def create_issue(self, summary, description, issue_type="Task", project_key=None):
         """Create a new issue."""
         target_project = project_key if project_key else self.project_key
-        
-        description_adf = {
-            "type": "doc",
-            "version": 1,
-            "content": [{"type": "paragraph", "content": [{"type": "text", "text": description}]}]
-        }
-        
-        payload = {
-            "fields": {
-                "project": {"key": target_project},
-                "summary": summary,
-                "description": description_adf,
-                "issuetype": {"name": issue_type}
-            }
-        }
-        
+        payload = jira_payloads.issue_payload(target_project, summary, description, issue_type)
+
         data = self.client.post("/rest/api/3/issue", payload)
         if data is not None:
             key = data.get("key")
             print(f"Successfully created {issue_type}: {key}")
+            if self.mirror is not None:
+                self.mirror.mark_dirty(target_project)
             return key
         return False
 
     def add_comment(self, issue_key, comment_text):
         """Add a comment."""
-        body_adf = {
-            "type": "doc",
-            "version": 1,
-            "content": [{"type": "paragraph", "content": [{"type": "text", "text": comment_text}]}]
-        }
-        payload = {"body": body_adf}
-        
+        payload = jira_payloads.comment_payload(comment_text)
+
         if self.client.post(f"/rest/api/3/issue/{issue_key}/comment", payload) is not None:
             print(f"Successfully added comment to {issue_key}.")
             return True
@@ -111,32 +184,32 @@ class JiraService:
 
     def transition_issue(self, issue_key, status_name="In Progress"):
         """Move issue to status."""
-        # Get transitions
-        data = self.client.get(f"/rest/api/3/issue/{issue_key}/transitions")
+        # Get transitions (cached per issue; dropped once the issue moves)
+        data = self._get_transitions(issue_key)
         if data is None:
             return False
-            
+
         transitions = data.get("transitions", [])
-        target_id = None
-        for t in transitions:
-            if t["name"].lower() == status_name.lower():
-                target_id = t["id"]
-                break
-        
+        target_id = jira_payloads.find_transition_id(transitions, status_name)
+        if not target_id:
+            # The cached list may predate a workflow change; retry once live.
+            self.cache.invalidate("transitions", issue_key)
+            data = self._get_transitions(issue_key) or {}
+            transitions = data.get("transitions", [])
+            target_id = jira_payloads.find_transition_id(transitions, status_name)
+
         if not target_id:
             print(f"Transition '{status_name}' not found for {issue_key}. Available: {[t['name'] for t in transitions]}")
             return False
             
-        payload = {"transition": {"id": target_id}}
-        if self.client.post(f"/rest/api/3/issue/{issue_key}/transitions", payload) is not None: # Post returns empty dict often on success or nothing? Requests checks status.
-            # Wrapper returns None on error.
+        payload = jira_payloads.transition_payload(target_id)
+        self.cache.invalidate("transitions", issue_key)
+        # client.post returns {} for JIRA's 204 and None on error.
+        if self.client.post(f"/rest/api/3/issue/{issue_key}/transitions", payload) is not None:
             print(f"Successfully moved {issue_key} to '{status_name}'.")
+            self._issue_changed(issue_key)
             return True
-        # Note: client.post returns None on error. if it returned dict, it was success. 
-        # But JIRA 204 means success too? My client.post expects json response or returns None if error catch.
-        # Actually client.post calls response.json(). 204 has no json. 
-        # I should update client.post to handle 204.
-        return True
+        return False
 
     def assign_task(self, issue_key, account_id=None):
         """Assign task."""
@@ -149,12 +222,64 @@ class JiraService:
         payload = {"accountId": account_id}
         if self.client.put(f"/rest/api/3/issue/{issue_key}/assignee", payload) is not None:
              print(f"Successfully assigned {issue_key}.")
+             self._issue_changed(issue_key)
              return True
         return False
 
     def get_issue_details(self, issue_key):
         """Get details."""
-        data = self.client.get(f"/rest/api/3/issue/{issue_key}")
+        data = self.get_issue(issue_key)
+        if data is not None:
+            return self.print_issue_details(issue_key, data)
+        return False
+
+    def get_issue(self, issue_key, fields=None):
+        """
+        Issue JSON projected to `fields` (default DETAIL_FIELDS; ["*all"] for everything).
+        Served from the mirror in mirror read mode when it holds those fields.
+        """
+        mirroring = self.read_mode == "mirror" and self.mirror is not None
+        if self._mirror_ready(issue_key.rsplit("-", 1)[0]) and (not fields or set(fields) <= set(MIRROR_FIELDS)):
+            data = self.mirror.get(issue_key)
+            if data is not None:
+                return data
+        request_fields = list(fields or jira_payloads.DETAIL_FIELDS)
+        if mirroring and "*all" not in request_fields:
+            request_fields = list(dict.fromkeys(request_fields + MIRROR_FIELDS))
+        data = self.client.get(f"/rest/api/3/issue/{issue_key}", params=jira_payloads.issue_params(request_fields))
+        if data is not None and mirroring:
+            self.mirror.upsert([data])
+        return data
+
+    def get_issue_record(self, issue_key, fields=None):
+        """IssueRecord of `fields` (default DETAIL_FIELDS) for an issue, cached briefly."""
+        fields = list(fields or jira_payloads.DETAIL_FIELDS)
+
+        def load():
+            data = self.get_issue(issue_key, fields)
+            return IssueRecord.from_issue(data, fields) if data is not None else None
+
+        return IssueRecord.from_cached(
+            self.cache.get_or_load("issue_view", f"{issue_key}|{','.join(fields)}", load))
+
+    def get_issue_view(self, issue_key, fields=None):
+        """Compact flat view ({"key", field: value}) of an issue, built from its cached record."""
+        record = self.get_issue_record(issue_key, fields)
+        return record.view() if record is not None else None
+
+    def get_issue_with_transitions(self, issue_key):
+        """
+        Fetch an issue together with its available transitions in one call
+        (expand=transitions) and seed the transitions cache from it.
+        """
+        params = jira_payloads.issue_params(expand="transitions")
+        data = self.client.get(f"/rest/api/3/issue/{issue_key}", params=params)
+        if data is not None and "transitions" in data:
+            self.cache.put("transitions", issue_key, {"transitions": data["transitions"]})
+        return data
+
+    def print_issue_details(self, issue_key, data):
+        """Print an already-fetched issue."""
         if data is not None:
             fields = data["fields"]
             print(f"--- Issue: {issue_key} ---")
@@ -170,25 +295,14 @@ class JiraService:
             priority_name = priority.get('name') if priority else "None"
             print(f"Priority: {priority_name}")
             
-            # Description (handling ADF potentially complex, just simplistic text extraction if possible)
-            # Or just indicating it's there. JIRA Cloud descriptions are ADF (JSON).
-            # For simplicity, we won't parse full ADF to text here, just notify.
+            # Descriptions are ADF; render them (lists, tables, code, mentions) to Markdown.
             description = fields.get('description')
             if description:
-                print("Description: [Content Available in JIRA]")
-                # Attempt simple text extraction if it's a simple doc
-                try:
-                    # Very basic ADF text extraction
-                    texts = []
-                    for content in description.get('content', []):
-                        if content.get('type') == 'paragraph':
-                             for node in content.get('content', []):
-                                 if node.get('type') == 'text':
-                                     texts.append(node.get('text', ''))
-                    if texts:
-                        print(f"Description Preview: {' '.join(texts)}")
-                except Exception:
-                    pass
+                print("Description:")
+                # Streamed fragment by fragment; large descriptions are never joined in memory.
+                for fragment in iter_adf(description):
+                    print(fragment, end="")
+                print()
             else:
                 print("Description: None")
 
@@ -198,35 +312,65 @@ class JiraService:
 
     def update_issue(self, issue_key, summary=None, description=None):
         """Update an issue's summary or description."""
-        update_payload = {"fields": {}}
-        
-        if summary:
-            update_payload["fields"]["summary"] = summary
-            
-        if description:
-            description_adf = {
-                "type": "doc",
-                "version": 1,
-                "content": [{"type": "paragraph", "content": [{"type": "text", "text": description}]}]
-            }
-            update_payload["fields"]["description"] = description_adf
-            
+        update_payload = jira_payloads.update_payload(summary, description)
+
         if not update_payload["fields"]:
             print("No changes provided for update.")
             return False
             
         if self.client.put(f"/rest/api/3/issue/{issue_key}", update_payload) is not None:
              print(f"Successfully updated {issue_key}.")
+             self._issue_changed(issue_key)
              return True
         return False
 
+    def bulk_create_issues(self, specs, project_key=None, chunk_size=bulk_operations.BULK_CREATE_CHUNK_SIZE):
+        """
+        Create many issues via /rest/api/3/issue/bulk, `chunk_size` per request.
+        specs: dicts with summary, description, issue_type (opt), project_key (opt).
+        Returns one {"index", "ok", "key", "error"} result per spec.
+        """
+        specs = list(specs)
+        target_project = project_key if project_key else self.project_key
+        results = []
+        for offset, chunk in bulk_operations.chunked(specs, chunk_size):
+            payload = bulk_operations.bulk_create_payload(chunk, target_project)
+            data = self.client.post(bulk_operations.BULK_CREATE_ENDPOINT, payload)
+            results.extend(bulk_operations.parse_bulk_create_response(data, offset, len(chunk)))
+        self._projects_changed(results)
+        created = sum(1 for r in results if r["ok"])
+        print(f"Bulk create: {created}/{len(specs)} issues created.")
+        return results
+
+    def bulk_transition(self, items, max_workers=bulk_operations.DEFAULT_MAX_WORKERS):
+        """items: (issue_key, status_name) pairs, moved concurrently."""
+        return self._bulk_apply(self.transition_issue, items, max_workers)
+
+    def bulk_comment(self, items, max_workers=bulk_operations.DEFAULT_MAX_WORKERS):
+        """items: (issue_key, comment_text) pairs, posted concurrently."""
+        return self._bulk_apply(self.add_comment, items, max_workers)
+
+    def bulk_assign(self, issue_keys, account_id=None, max_workers=bulk_operations.DEFAULT_MAX_WORKERS):
+        """Assign every key to `account_id` (default: self, resolved once)."""
+        account_id = account_id or self.get_myself_account_id()
+        if not account_id:
+            return [{"index": i, "key": k, "ok": False, "error": "No account id"} for i, k in enumerate(issue_keys)]
+        return self._bulk_apply(self.assign_task, [(k, account_id) for k in issue_keys], max_workers)
+
+    def _bulk_apply(self, fn, items, max_workers):
+        items = [tuple(item) for item in items]
+        results = bulk_operations.run_concurrently(fn, items, max_workers)
+        for result, item in zip(results, items):
+            result["key"] = item[0]
+        return results
+
     def create_status(self, name, category_id=2):
         """
         Create a global issue status if it doesn't exist.
         Categories: 2=To Do, 4=In Progress, 3=Done.
         """
-        # First check if exists to avoid 400
-        statuses = self.client.get("/rest/api/3/status")
+        # First check if exists to avoid 400 (list cached across calls)
+        statuses = self.cache.get_or_load("statuses", "", lambda: self.client.get("/rest/api/3/status"))
         if statuses:
             for s in statuses:
                 if s["name"].lower() == name.lower():
@@ -244,91 +388,54 @@ class JiraService:
         data = self.client.post("/rest/api/3/status", payload)
         if data:
              print(f"Created status '{name}' (ID: {data['id']}).")
+             if statuses is not None:
+                 self.cache.put("statuses", "", statuses + [{"id": data["id"], "name": name}])
              return data["id"]
         return None
 
     def create_workflow(self, workflow_name, statuses_map):
         """
-        Create a workflow with the given statuses.
-        statuses_map: dict of {status_name: status_id}
+        Create a global workflow over existing statuses (statuses_map: {status_name: status_id}),
+        with an initial transition into the first and a global transition into each.
         """
-        # Simplistic Workflow: All statuses can transition to all others (Global transitions)
-        # Note: API v3 'POST /rest/api/3/workflow' is complex.
-        # We will use the bulk create endpoint which is cleaner.
-        
-        # Construct transitions
-        transitions = []
-        for s_name, s_id in statuses_map.items():
-            transitions.append({
-                "name": f"Transition to {s_name}",
-                "to": {"statusId": s_id},
-                "type": "global"
-            })
+        statuses = workflow_provisioning.parse_statuses(
+            self.cache.get_or_load("statuses", "", lambda: self.client.get(workflow_provisioning.STATUS_ENDPOINT)))
+        refs = [(str(sid), name, statuses.get(name.lower(), {}).get("category", "TODO"))
+                for name, sid in statuses_map.items()]
+        payload = workflow_provisioning.workflow_create_payload(workflow_name, refs)
+        if self.client.post(workflow_provisioning.WORKFLOWS_CREATE_ENDPOINT, payload) is not None:
+            print(f"Created workflow '{workflow_name}'.")
+            return True
+        return False
 
-        payload = {
-            "statuses": [{"id": pid} for pid in statuses_map.values()],
-            "workflows": [
-                {
-                    "name": workflow_name,
-                    "description": "Generated by AI Agent",
-                    "transitions": transitions,
-                    # We need to specify initial status - usually the first one in list
-                    # API v3 requires explicit graph or scope.
-                    # Simplified: We'll try basic payload.
-                    # Actually, create workflow payload requires 'statuses' list and 'transitions'.
-                    # It's better to fetch a template or simple one.
-                    # Creating a workflow via API is very error prone without a visual editor model.
-                    # Strategy: We will create the statuses, but ASSIGNING them to a project
-                    # might be best done by just ensuring they exist and then 
-                    # user can map them if we can't fully script the workflow logic easily.
-                    # BUT, let's try a basic linear workflow if 'global' transitions are allowed.
-                }
-            ],
-            "scope": {"type": "GLOBAL"} # Project scope is for team-managed, global for company 
-        }
+    def provision(self, spec, dry_run=False):
+        """Bring statuses, workflow and board columns to `spec` (a ProvisioningSpec) with minimal calls."""
+        report = workflow_provisioning.WorkflowProvisioner(self).provision(spec, dry_run=dry_run)
+        print(f"Provisioning {'planned' if dry_run else 'done'} in {report['requests']} requests"
+              + (f"; failed: {', '.join(report['errors'])}" if report["errors"] else "."))
+        return report
 
-        # NOTE: The bulk create API is '/rest/api/3/workflows/create'
-        # But that's for 'Workflow Scheme' often? 
-        # Let's use the 'Create workflow' endpoint.
-        
-        url = "/rest/api/3/workflow"
-        
-        # Constructing the payload for 'Create workflow' (POST)
-        # "transitions" linking "from" to "to".
-        # Global transition: "from" is omitted or specific list.
-        
-        # Realistically, constructing a valid workflow JSON blindly is hard.
-        # Fallback: Just return true if we created statuses.
-        pass
-    
-    def setup_soc_statuses(self):
+    def setup_soc_statuses(self, workflow_name=None, dry_run=False):
         """
-        Orchestrate creation of SOC statuses.
+        Ensure the SOC statuses exist (and, given `workflow_name`, a workflow using them).
         """
-        # List of (Name, CategoryID)
-        # 2=To Do, 4=In Progress, 3=Done
-        desired_statuses = [
-            ("PLANNING", 2),
-            ("READY FOR DEVELOPMENT", 2),
-            ("IN DEVELOPMENT", 4),
-            ("READY FOR QA TESTING", 4), # Could be TODO or IN_PROGRESS, checking user pref order.
-            ("IN QA TESTING", 4),
-            ("PO VALIDATION", 4),
-            ("DONE", 3),
-            ("CANCELLED", 3)
-        ]
-        
-        created_ids = {}
+        spec = workflow_provisioning.ProvisioningSpec(
+            statuses=tuple(workflow_provisioning.StatusSpec(name, category) for name, category in [
+                ("PLANNING", "TODO"),
+                ("READY FOR DEVELOPMENT", "TODO"),
+                ("IN DEVELOPMENT", "IN_PROGRESS"),
+                ("READY FOR QA TESTING", "IN_PROGRESS"),
+                ("IN QA TESTING", "IN_PROGRESS"),
+                ("PO VALIDATION", "IN_PROGRESS"),
+                ("DONE", "DONE"),
+                ("CANCELLED", "DONE"),
+            ]),
+            workflow=workflow_name,
+        )
         print("Ensuring Statuses Exist...")
-        for name, cat_id in desired_statuses:
-            sid = self.create_status(name, cat_id)
-            if sid:
-                created_ids[name] = sid
-        
-        print("\nStatuses are ready.")
-        print("Note: To apply these to the project, you must associate them with the workflow.")
-        print("As fully automating workflow creation is risky, please:")
-        print("1. Go to Project Settings > Workflows")
-        print("2. Edit the workflow")
-        print("3. Add these existing statuses.")
-        return True
+        report = self.provision(spec, dry_run=dry_run)
+        if report["ok"] and not workflow_name:
+            print("\nStatuses are ready.")
+            print("Note: To apply these to the project, associate them with the workflow")
+            print("(Project Settings > Workflows), or pass a workflow name to provision one.")
+        return report["ok"]
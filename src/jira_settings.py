@@ -0,0 +1,56 @@
+import os
+from base64 import b64encode
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class JiraSettings:
+    """
+    Connection settings for one JIRA site.
+    Shared by the sync and async clients so both authenticate identically.
+    """
+    jira_url: str
+    email: str
+    token: str
+    project_key: str
+
+    @classmethod
+    def from_env(cls, site=None):
+        """
+        Read JIRA_* variables (loading .env first).
+        For a named `site`, JIRA_SITE_<SITE>_URL / _USER_EMAIL / _API_TOKEN / _PROJECT_KEY;
+        email and token fall back to the default ones, the project key to the
+        first of JIRA_SITE_<SITE>_PROJECTS.
+        """
+        load_dotenv()
+        if site:
+            prefix = f"JIRA_SITE_{site.upper()}_"
+            projects = os.getenv(f"{prefix}PROJECTS", "").split(",")
+            settings = cls(
+                jira_url=os.getenv(f"{prefix}URL"),
+                email=os.getenv(f"{prefix}USER_EMAIL") or os.getenv("JIRA_USER_EMAIL"),
+                token=os.getenv(f"{prefix}API_TOKEN") or os.getenv("JIRA_API_TOKEN"),
+                project_key=os.getenv(f"{prefix}PROJECT_KEY") or projects[0].strip(),
+            )
+        else:
+            settings = cls(
+                jira_url=os.getenv("JIRA_URL"),
+                email=os.getenv("JIRA_USER_EMAIL"),
+                token=os.getenv("JIRA_API_TOKEN"),
+                project_key=os.getenv("JIRA_PROJECT_KEY"),
+            )
+        if not all([settings.jira_url, settings.email, settings.token, settings.project_key]):
+            where = f" for site '{site}'" if site else ""
+            raise ValueError(f"Missing JIRA configuration{where} in environment variables.")
+        return settings
+
+    def auth_headers(self):
+        """Basic-auth JSON headers for every request."""
+        auth_string = f"{self.email}:{self.token}"
+        return {
+            "Authorization": f"Basic {b64encode(auth_string.encode('utf-8')).decode('utf-8')}",
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
@@ -0,0 +1,434 @@
+"""
+Background jobs for long-running JIRA operations.
+
+`JobQueue` runs jobs (project creation and recreation, status / workflow
+provisioning, bulk edits) on a small pool of worker threads with the sync
+JiraService, so an MCP tool call can return a job ID at once instead of
+blocking until JIRA finishes. Jobs and their progress are kept in a local
+SQLite file (`JobStore`): after a restart, queued jobs and jobs that were
+running are picked up again. Handlers save checkpoints as they go (bulk
+jobs record finished batches), so a resumed job skips work already done;
+the others are written to be safe to re-run.
+
+Several processes may share the file (each agent host spawns its own MCP
+server). A job is claimed with a conditional UPDATE that sets its owner
+and a lease; the owner renews the lease while the job runs, and another
+process only takes over a running job once its lease has expired.
+"""
+import inspect
+import json
+import os
+import queue
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from . import bulk_operations
+
+DEFAULT_JOBS_PATH = os.path.join("~", ".cache", "jira_agent", "jobs.sqlite3")
+DEFAULT_WORKERS = 2
+# A job interrupted this many times (server restarts mid-run) is failed instead of resumed.
+MAX_ATTEMPTS = 3
+# Items per checkpoint for bulk jobs.
+BULK_BATCH_SIZE = 50
+# Finished jobs are kept this long (seconds) for job_status / job_result.
+JOB_RETENTION = 7 * 24 * 3600
+# Seconds a claim on a running job lasts without renewal; renewed every third of that.
+JOB_LEASE = 60.0
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+
+
+@dataclass
+class Job:
+    """One job as stored. Handlers call checkpoint() to persist `progress`."""
+    id: str
+    kind: str
+    params: dict
+    site: str = None
+    status: str = QUEUED
+    progress: dict = field(default_factory=dict)
+    result: dict = None
+    error: str = None
+    attempts: int = 0
+    created_at: float = None
+    started_at: float = None
+    finished_at: float = None
+    owner: str = None
+    store: object = field(default=None, repr=False, compare=False)
+
+    def checkpoint(self, **progress):
+        self.progress.update(progress)
+        if self.store is not None:
+            self.store.save_progress(self, self.progress)
+
+    def summary(self):
+        """Everything but the result body (for job_status)."""
+        return {"job_id": self.id, "kind": self.kind, "site": self.site, "status": self.status,
+                "attempts": self.attempts, "created_at": self.created_at, "started_at": self.started_at,
+                "finished_at": self.finished_at, "progress": _progress_summary(self.progress), "error": self.error}
+
+
+def _progress_summary(progress):
+    return {k: len(v) if isinstance(v, list) else v for k, v in progress.items()}
+
+
+_COLUMNS = ("id, kind, site, params, status, progress, result, error, attempts,"
+            " created_at, started_at, finished_at, owner")
+
+
+class JobStore:
+    """SQLite-backed job table; thread-safe, and safe to share between processes."""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, kind TEXT NOT NULL, site TEXT, params TEXT NOT NULL,"
+            " status TEXT NOT NULL, progress TEXT NOT NULL DEFAULT '{}', result TEXT, error TEXT,"
+            " attempts INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL,"
+            " started_at REAL, finished_at REAL, owner TEXT, lease_until REAL)"
+        )
+        # Files written before leases existed.
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._conn.commit()
+
+    def _execute(self, sql, args=()):
+        """Run one write; returns the number of rows it changed."""
+        with self._lock:
+            changed = self._conn.execute(sql, args).rowcount
+            self._conn.commit()
+        return changed
+
+    def add(self, job):
+        self._execute(
+            "INSERT INTO jobs (id, kind, site, params, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (job.id, job.kind, job.site, json.dumps(job.params), job.status, job.created_at))
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return Job(id=row[0], kind=row[1], site=row[2], params=json.loads(row[3]), status=row[4],
+                   progress=json.loads(row[5]), result=json.loads(row[6]) if row[6] else None, error=row[7],
+                   attempts=row[8], created_at=row[9], started_at=row[10], finished_at=row[11], owner=row[12],
+                   store=self)
+
+    def claim(self, job_id, owner, lease=JOB_LEASE):
+        """
+        Atomically take a queued job, or a running one whose lease has expired, for `owner`.
+        Returns the claimed Job (attempts already counted), or None if another process holds it
+        or it has finished.
+        """
+        now = time.time()
+        claimed = self._execute(
+            "UPDATE jobs SET status = ?, owner = ?, lease_until = ?, started_at = ?, attempts = attempts + 1"
+            " WHERE id = ? AND (status = ? OR (status = ? AND COALESCE(lease_until, 0) < ?))",
+            (RUNNING, owner, now + lease, now, job_id, QUEUED, RUNNING, now))
+        return self.get(job_id) if claimed else None
+
+    def renew(self, job_id, owner, lease=JOB_LEASE):
+        """Extend `owner`'s lease on a running job; False if the claim was lost."""
+        return bool(self._execute("UPDATE jobs SET lease_until = ? WHERE id = ? AND owner = ? AND status = ?",
+                                  (time.time() + lease, job_id, owner, RUNNING)))
+
+    def save_progress(self, job, progress):
+        self._execute("UPDATE jobs SET progress = ? WHERE id = ? AND owner IS ?",
+                      (json.dumps(progress), job.id, job.owner))
+
+    def finish(self, job, status, result=None, error=None):
+        """Record the outcome; only the job's current owner can. Returns False if the claim was lost."""
+        job.status, job.result, job.error, job.finished_at = status, result, error, time.time()
+        return bool(self._execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_until = NULL"
+            " WHERE id = ? AND owner IS ?",
+            (status, json.dumps(result) if result is not None else None, error, job.finished_at, job.id, job.owner)))
+
+    def unfinished(self):
+        """IDs of queued jobs and running jobs whose lease has expired, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = ? OR (status = ? AND COALESCE(lease_until, 0) < ?)"
+                " ORDER BY created_at", (QUEUED, RUNNING, time.time())).fetchall()
+        return [row[0] for row in rows]
+
+    def prune(self, max_age):
+        """Drop finished jobs older than `max_age` seconds."""
+        self._execute("DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                      (SUCCEEDED, FAILED, time.time() - max_age))
+
+    def counts(self):
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# --- Handlers: handler(service, job, **params) -> JSON-able dict with "ok". ---
+
+def _create_project(service, job, key, name, shared_configuration_id=None):
+    return {"ok": bool(service.create_project(key, name, shared_configuration_id=shared_configuration_id))}
+
+
+def _recreate_project(service, job, key, name, template_key=None):
+    return {"ok": bool(service.recreate_project(key, name, template_key=template_key))}
+
+
+def _setup_soc_statuses(service, job, workflow_name=None):
+    return {"ok": bool(service.setup_soc_statuses(workflow_name=workflow_name))}
+
+
+def _provision(service, job, spec, dry_run=False):
+    from .workflow_provisioning import ProvisioningSpec
+
+    report = service.provision(ProvisioningSpec.from_dict(spec), dry_run=dry_run)
+    plan = report.get("plan")
+    return {"ok": report["ok"], "errors": report["errors"], "requests": report["requests"],
+            "plan": plan.describe() if plan is not None else None}
+
+
+def _in_batches(job, items, run_batch):
+    """Run `items` in BULK_BATCH_SIZE batches, checkpointing results; resumes after the last saved batch."""
+    results = job.progress.get("results", [])
+    for _, batch in bulk_operations.chunked(items[len(results):], BULK_BATCH_SIZE):
+        done = len(results)
+        for result in run_batch(batch):
+            result["index"] += done
+            results.append(result)
+        job.checkpoint(results=results)
+    report = bulk_operations.summarize(results)
+    report["ok"] = report["failed"] == 0
+    return report
+
+
+def _bulk_create_issues(service, job, issues, project_key=None):
+    specs = [bulk_operations.issue_spec_from_record(item) for item in issues]
+    return _in_batches(job, specs, lambda batch: service.bulk_create_issues(batch, project_key))
+
+
+def _bulk_transition(service, job, items):
+    """items: [{"key", "status"}]"""
+    pairs = [(item["key"], item["status"]) for item in items]
+    return _in_batches(job, pairs, service.bulk_transition)
+
+
+def _bulk_comment(service, job, items):
+    """items: [{"key", "text"}]"""
+    pairs = [(item["key"], item["text"]) for item in items]
+    return _in_batches(job, pairs, service.bulk_comment)
+
+
+def _bulk_assign(service, job, keys, account_id=None):
+    return _in_batches(job, list(keys), lambda batch: service.bulk_assign(batch, account_id))
+
+
+JOB_HANDLERS = {
+    "create_project": _create_project,
+    "recreate_project": _recreate_project,
+    "setup_soc_statuses": _setup_soc_statuses,
+    "provision": _provision,
+    "bulk_create_issues": _bulk_create_issues,
+    "bulk_transition": _bulk_transition,
+    "bulk_comment": _bulk_comment,
+    "bulk_assign": _bulk_assign,
+}
+
+
+def build_job_service(site=None):
+    """Sync JiraService for `site` (None: the default site from JIRA_URL)."""
+    from .jira_client import JiraClient
+    from .jira_service import JiraService
+    from .jira_settings import JiraSettings
+
+    if site is None:
+        return JiraService()
+    return JiraService(client=JiraClient(JiraSettings.from_env(site)))
+
+
+class JobQueue:
+    """
+    Persistent job queue with `workers` threads. submit() returns a job ID at
+    once; status() / result() read the store, so they also answer for jobs
+    finished before a restart. A lease thread renews this process's claims and
+    picks up jobs whose owner stopped renewing.
+    """
+    def __init__(self, store, service_factory=build_job_service, workers=DEFAULT_WORKERS, handlers=None,
+                 lease=JOB_LEASE):
+        self.store = store
+        self.service_factory = service_factory
+        self.workers = max(1, workers)
+        self.handlers = JOB_HANDLERS if handlers is None else handlers
+        self.lease = lease
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._queue = queue.Queue()
+        self._threads = []
+        self._services = {}
+        self._running = set()  # job IDs this process holds a lease on
+        self._queued = set()  # job IDs in self._queue, so none is queued twice
+        self._lock = threading.Lock()
+        self._finished = threading.Condition()
+        self._stopped = threading.Event()
+
+    @classmethod
+    def from_env(cls):
+        """
+        JIRA_JOBS_PATH: SQLite file (default ~/.cache/jira_agent/jobs.sqlite3)
+        JIRA_JOB_WORKERS: worker threads (default 2)
+        """
+        path = os.path.expanduser(os.getenv("JIRA_JOBS_PATH", DEFAULT_JOBS_PATH))
+        return cls(JobStore(path), workers=int(os.getenv("JIRA_JOB_WORKERS", str(DEFAULT_WORKERS))))
+
+    def start(self):
+        """Start the workers (once) and requeue jobs left queued or running by a previous process."""
+        with self._lock:
+            if self._threads:
+                return
+            self.store.prune(JOB_RETENTION)
+            for job_id in self.store.unfinished():
+                self._queued.add(job_id)
+                self._queue.put(job_id)
+            for _ in range(self.workers):
+                thread = threading.Thread(target=self._work, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            self._stopped.clear()
+            self._lease_thread = threading.Thread(target=self._renew_leases, daemon=True)
+            self._lease_thread.start()
+
+    def submit(self, kind, params=None, site=None):
+        """Store and enqueue a job; returns its ID. Raises ValueError for an unknown kind or bad params."""
+        handler = self.handlers.get(kind)
+        if handler is None:
+            raise ValueError(f"Unknown job kind '{kind}'. Available: {', '.join(sorted(self.handlers))}")
+        params = dict(params or {})
+        try:
+            inspect.signature(handler).bind(None, None, **params)
+        except TypeError as e:
+            raise ValueError(f"Invalid params for {kind}: {e}")
+        job = Job(id=uuid.uuid4().hex[:12], kind=kind, params=params, site=site, created_at=time.time())
+        self.start()  # before add(), so the new job is not also picked up as a leftover
+        self.store.add(job)
+        self._enqueue(job.id)
+        return job.id
+
+    def status(self, job_id):
+        job = self.store.get(job_id)
+        return job.summary() if job is not None else None
+
+    def result(self, job_id):
+        """The finished job's summary plus "result"; None if unknown."""
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        return {**job.summary(), "result": job.result}
+
+    def wait(self, job_id, timeout=None):
+        """Block until the job has finished (or timeout); returns its status dict."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._finished:
+            while True:
+                status = self.status(job_id)
+                if status is None or status["status"] in (SUCCEEDED, FAILED):
+                    return status
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return status
+                # Polled too: another process sharing the store may be the one running it.
+                self._finished.wait(0.5 if remaining is None else min(remaining, 0.5))
+
+    def metrics(self):
+        return {"workers": self.workers, "pending": self._queue.qsize(), "jobs": self.store.counts()}
+
+    def _enqueue(self, job_id):
+        """Put `job_id` on the local queue unless it is already waiting there."""
+        with self._lock:
+            if job_id in self._queued:
+                return
+            self._queued.add(job_id)
+        self._queue.put(job_id)
+
+    def _service(self, site):
+        with self._lock:
+            service = self._services.get(site)
+        if service is None:
+            # Built outside the lock so a slow client setup does not hold up other sites.
+            built = self.service_factory(site)
+            with self._lock:
+                service = self._services.setdefault(site, built)
+        return service
+
+    def _renew_leases(self):
+        """Every third of a lease: renew our claims, and queue jobs abandoned by other processes."""
+        while not self._stopped.wait(self.lease / 3):
+            try:
+                with self._lock:
+                    running = list(self._running)
+                for job_id in running:
+                    if not self.store.renew(job_id, self.owner, self.lease):
+                        print(f"Job {job_id}: lease lost to another process")
+                for job_id in self.store.unfinished():
+                    if job_id not in running:
+                        self._enqueue(job_id)
+            except sqlite3.Error as e:
+                print(f"Job lease renewal failed: {e}")
+
+    def _work(self):
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            with self._lock:
+                self._queued.discard(job_id)
+            try:
+                self._run(job_id)
+            finally:
+                with self._finished:
+                    self._finished.notify_all()
+
+    def _run(self, job_id):
+        # Claimed atomically: a job queued twice, or also seen by another process, runs once.
+        job = self.store.claim(job_id, self.owner, self.lease)
+        if job is None:
+            return
+        if job.attempts > MAX_ATTEMPTS:
+            self.store.finish(job, FAILED, error=f"Interrupted {job.attempts - 1} times; not resumed")
+            return
+        with self._lock:
+            self._running.add(job_id)
+        try:
+            result = self.handlers[job.kind](self._service(job.site), job, **job.params)
+        except Exception as e:
+            print(f"Job {job.id} ({job.kind}) failed: {e}")
+            self.store.finish(job, FAILED, error=str(e))
+            return
+        finally:
+            with self._lock:
+                self._running.discard(job_id)
+        ok = result.get("ok", True) if isinstance(result, dict) else bool(result)
+        if not self.store.finish(job, SUCCEEDED if ok else FAILED, result=result,
+                                 error=None if ok else "Operation reported failure; see result"):
+            print(f"Job {job.id}: finished after its lease was taken over; result not recorded")
+
+    def close(self):
+        """Stop the workers after their current job."""
+        self._stopped.set()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
@@ -0,0 +1,100 @@
+"""
+Tiny JQL subset evaluator used to answer searches from the local issue mirror.
+
+Supported: `field = value` and `field in (v1, v2)` clauses joined by AND, on
+project, status, assignee, issuetype/type and key, plus a trailing ORDER BY
+on updated and key (`parse_order_by`; without one, mirror results are ordered
+by `updated` descending). Values the mirror cannot compare literally (EMPTY /
+null, numeric project ids) and anything else return None so the caller falls
+back to a live search.
+"""
+import re
+
+SUPPORTED_FIELDS = {"project", "status", "assignee", "issuetype", "type", "key"}
+FIELD_ALIASES = {"type": "issuetype"}
+# Sorts the mirror can reproduce. JIRA sorts status, priority, type and project by their
+# configured order or name, which the mirror does not hold, so those go live.
+SORT_FIELDS = {"updated": "updated", "key": "key", "issuekey": "key"}
+
+_TOKEN = re.compile(r'"[^"]*"|\'[^\']*\'|[(),=]|!=|[^\s(),=!"\']+')
+_ORDER_BY = re.compile(r'\s+order\s+by\s+([\w\s,]+)$', re.IGNORECASE)
+
+
+def _unquote(token):
+    if token[:1] in ('"', "'") and token[-1:] == token[:1]:
+        return token[1:-1]
+    return token
+
+
+def _value(field, token):
+    """Lowercased value of `token`, or None if the mirror cannot match it literally."""
+    if token in ("(", ")", ","):
+        return None
+    value = _unquote(token).lower()
+    if value == token.lower() and value in ("empty", "null"):
+        return None  # JQL keywords for "no value", not names
+    if field == "project" and value.isdigit():
+        return None  # a project id; the mirror only holds keys
+    return value
+
+
+def parse_order_by(jql):
+    """
+    [(field, descending)] for the trailing ORDER BY of `jql` ([] if there is none),
+    or None if it sorts by anything outside SORT_FIELDS.
+    """
+    match = _ORDER_BY.search(jql.strip())
+    if not match:
+        return None if re.search(r"\border\s+by\b", jql, re.IGNORECASE) else []
+    order = []
+    for term in match.group(1).split(","):
+        words = term.lower().split()
+        if not words or words[0] not in SORT_FIELDS or len(words) > 2 or words[1:] not in ([], ["asc"], ["desc"]):
+            return None
+        order.append((SORT_FIELDS[words[0]], words[1:] == ["desc"]))
+    return order
+
+
+def parse_simple_jql(jql):
+    """Return {field: set(lowercased values)} or None if `jql` is outside the subset."""
+    tokens = _TOKEN.findall(_ORDER_BY.sub("", jql.strip()))
+    filters = {}
+    pos = 0
+    while pos < len(tokens):
+        if pos + 2 >= len(tokens):
+            return None
+        field = FIELD_ALIASES.get(tokens[pos].lower(), tokens[pos].lower())
+        op = tokens[pos + 1].lower()
+        if field not in SUPPORTED_FIELDS:
+            return None
+        pos += 2
+        if op == "=":
+            value = _value(field, tokens[pos])
+            if value is None:
+                return None
+            values = {value}
+            pos += 1
+        elif op == "in" and tokens[pos] == "(":
+            pos += 1
+            values = set()
+            while pos < len(tokens) and tokens[pos] != ")":
+                if tokens[pos] != ",":
+                    value = _value(field, tokens[pos])
+                    if value is None:
+                        return None
+                    values.add(value)
+                pos += 1
+            if pos >= len(tokens) or not values:
+                return None
+            pos += 1
+        else:
+            return None
+        # A value directly followed by "(" is a function call (e.g. currentUser()).
+        if pos < len(tokens) and tokens[pos] == "(":
+            return None
+        filters[field] = filters[field] & values if field in filters else values
+        if pos < len(tokens):
+            if tokens[pos].lower() != "and" or pos + 1 >= len(tokens):
+                return None
+            pos += 1
+    return filters or None
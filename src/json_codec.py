@@ -0,0 +1,29 @@
+"""
+Request-body encoding (and cached-body decoding) shared by JiraClient and AsyncJiraClient.
+
+Uses orjson when it is installed, otherwise one prebuilt compact
+json.JSONEncoder (no whitespace, no circular-reference walk, UTF-8 as-is),
+which is what requests/httpx would otherwise rebuild on every call.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False)
+
+
+def encode_json(payload):
+    """UTF-8 JSON bytes for `payload`."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return _ENCODER.encode(payload).encode("utf-8")
+
+
+def decode_json(data):
+    """Parse UTF-8 JSON bytes (a stored response body)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
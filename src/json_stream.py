@@ -0,0 +1,207 @@
+"""
+Incremental parsing of JSON objects that carry one large array, e.g. a
+/search/jql page: {"issues": [...], "nextPageToken": "...", "isLast": false}.
+
+`ArrayStreamParser` is fed the body in chunks as it arrives and yields the
+elements of the named top-level array one at a time, decoding each with
+json's raw_decode. Every other top-level member is collected into `meta`.
+Only the current element's text is buffered, so neither the whole raw body
+nor the whole parsed page has to be held at once.
+"""
+import codecs
+import json
+import os
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+
+def streaming_enabled():
+    """JIRA_STREAM_RESPONSES (default on)."""
+    return os.getenv("JIRA_STREAM_RESPONSES", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def supports_streaming(client):
+    """True for a JiraClient / AsyncJiraClient with streaming on; test doubles use post()."""
+    return getattr(client, "streaming", False) is True
+
+
+class ArrayStreamParser:
+    """
+    Push parser for one top-level JSON object. feed(bytes) returns the array
+    elements completed so far; close() checks the object was complete.
+    """
+    _OPEN, _KEY, _COLON, _VALUE, _ITEM, _AFTER_ITEM, _AFTER_VALUE, _DONE = range(8)
+
+    def __init__(self, array_key="issues"):
+        self.array_key = array_key
+        self.meta = {}
+        self.count = 0  # elements yielded so far
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = self._OPEN
+        self._key = None
+        # Length of the buffer when a value last failed to decode; retry once it doubles
+        # so an element split over many chunks is not re-parsed for every chunk.
+        self._retry_at = 0
+
+    def feed(self, data):
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(data)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self):
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != self._DONE:
+            raise ValueError("Truncated JSON response")
+        return items
+
+    def _skip(self):
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _expect(self, char):
+        raise ValueError(f"Expected {char} at offset {self._pos} of streamed JSON")
+
+    def _decode(self, final):
+        """The value at the cursor, or (None, False) if it is not complete yet."""
+        if not final and len(self._buffer) < self._retry_at:
+            return None, False
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._retry_at = 2 * len(self._buffer)
+            return None, False
+        # A value ending exactly at the buffer end may be a cut-off number or literal.
+        if end == len(self._buffer) and not final:
+            return None, False
+        self._pos = end
+        self._retry_at = 0
+        return value, True
+
+    def _parse(self, final):
+        items = []
+        while True:
+            char = self._skip()
+            if char is None:
+                return items
+            state = self._state
+            if state == self._OPEN:
+                if char != "{":
+                    self._expect("{")
+                self._pos += 1
+                self._state = self._KEY
+            elif state == self._KEY:
+                if char == "}":
+                    self._pos += 1
+                    self._state = self._DONE
+                    continue
+                key, ok = self._decode(final)
+                if not ok:
+                    return items
+                if not isinstance(key, str):
+                    self._expect("a key")
+                self._key, self._state = key, self._COLON
+            elif state == self._COLON:
+                if char != ":":
+                    self._expect(":")
+                self._pos += 1
+                self._state = self._VALUE
+            elif state == self._VALUE:
+                if self._key == self.array_key and char == "[":
+                    self._pos += 1
+                    self._state = self._ITEM
+                    continue
+                value, ok = self._decode(final)
+                if not ok:
+                    return items
+                self.meta[self._key] = value
+                self._state = self._AFTER_VALUE
+            elif state == self._ITEM:
+                if char == "]":
+                    self._pos += 1
+                    self._state = self._AFTER_VALUE
+                    continue
+                item, ok = self._decode(final)
+                if not ok:
+                    return items
+                items.append(item)
+                self.count += 1
+                self._state = self._AFTER_ITEM
+            elif state == self._AFTER_ITEM:
+                if char not in ",]":
+                    self._expect(", or ]")
+                self._pos += 1
+                self._state = self._ITEM if char == "," else self._AFTER_VALUE
+            elif state == self._AFTER_VALUE:
+                if char not in ",}":
+                    self._expect(", or }")
+                self._pos += 1
+                self._state = self._KEY if char == "," else self._DONE
+            else:
+                self._expect("end of input")
+
+
+class StreamedArray:
+    """
+    Iterate the `array_key` elements of a streamed response body. `meta` holds
+    the other top-level members (complete once iteration ends). Closing early
+    releases the connection.
+    """
+    def __init__(self, chunks, array_key="issues", on_close=None):
+        self.parser = ArrayStreamParser(array_key)
+        self._chunks = chunks
+        self._on_close = on_close
+
+    @property
+    def meta(self):
+        return self.parser.meta
+
+    def __iter__(self):
+        try:
+            for chunk in self._chunks:
+                yield from self.parser.feed(chunk)
+            yield from self.parser.close()
+        finally:
+            self.close()
+
+    def close(self):
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+
+class AsyncStreamedArray:
+    """Async counterpart of StreamedArray over an async iterator of byte chunks."""
+    def __init__(self, chunks, array_key="issues", on_close=None):
+        self.parser = ArrayStreamParser(array_key)
+        self._chunks = chunks
+        self._on_close = on_close
+
+    @property
+    def meta(self):
+        return self.parser.meta
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._chunks:
+                for item in self.parser.feed(chunk):
+                    yield item
+            for item in self.parser.close():
+                yield item
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        if self._on_close is not None:
+            await self._on_close()
+            self._on_close = None
@@ -1,98 +1,554 @@
-from mcp.server.fastmcp import FastMCP
-from .jira_service import JiraService
+import asyncio
 import json
+import os
+import sys
+import threading
+from contextlib import asynccontextmanager, contextmanager
+
+from mcp.server.fastmcp import FastMCP
+
+from .tenant_registry import DEFAULT_SITE, project_of
+
+# The service is built on first use, not at import: spawning the server needs
+# no credentials and does not load the client stack (httpx pool, caches,
+# sqlite, requests) until a tool actually runs or the pre-warm starts.
+jira_service = None
+_service_lock = threading.Lock()
+_prewarm_task = None
+_started = False
+# True under the stdio transport, where stdout carries the JSON-RPC stream.
+_stdout_is_protocol = False
+
+
+_tenants = None
+
+
+def get_tenants():
+    """Registry of named JIRA sites (JIRA_SITES), created on first call."""
+    global _tenants
+    if _tenants is None:
+        with _service_lock:
+            if _tenants is None:
+                from .tenant_registry import TenantRegistry
+                _tenants = TenantRegistry.from_env()
+    return _tenants
+
+
+def get_service(site=None, project_key=None):
+    """
+    The AsyncJiraService for a call, created on first use.
+    `site`, or the site `project_key` belongs to, selects a named tenant;
+    otherwise the default site from JIRA_URL is used.
+    """
+    global jira_service
+    if site or project_key:
+        tenants = get_tenants()
+        name = tenants.resolve(site, project_key)
+        if name != DEFAULT_SITE:
+            return tenants.get(name)
+    if jira_service is None:
+        with _service_lock:
+            if jira_service is None:
+                from .async_jira_service import AsyncJiraService
+                jira_service = AsyncJiraService()
+    return jira_service
+
+
+@contextmanager
+def use_service(site=None, project_key=None):
+    """
+    get_service() for the length of a call. A named site's service is checked out of the
+    tenant registry, so evicting it meanwhile defers its close until the call is done.
+    """
+    if site or project_key:
+        tenants = get_tenants()
+        name = tenants.resolve(site, project_key)
+        if name != DEFAULT_SITE:
+            with tenants.checkout(name) as service:
+                yield service
+            return
+    yield get_service()
+
+
+async def prewarm():
+    """Build the service and open a pooled connection (GET /myself) before the first tool call."""
+    try:
+        await get_service().get_myself_account_id()
+    except ValueError as e:  # missing credentials: tools will report it when called
+        print(f"Pre-warm skipped: {e}", file=sys.stderr)
+
+
+_outbox = None
+
+
+def get_outbox():
+    """Write-ahead outbox (JIRA_OUTBOX_PATH) and its sender, created on first call."""
+    global _outbox
+    if _outbox is None:
+        with _service_lock:
+            if _outbox is None:
+                from .write_outbox import Outbox
+                _outbox = Outbox.from_env()
+    return _outbox
+
+
+def outbox_enabled():
+    """JIRA_WRITE_MODE=outbox: write tools log the change and return before JIRA has applied it."""
+    return os.getenv("JIRA_WRITE_MODE", "direct").strip().lower() == "outbox"
+
+
+def resume_outbox():
+    """Restart sending writes a previous server process left pending (if it ever logged any)."""
+    from .write_outbox import DEFAULT_OUTBOX_PATH
+
+    if os.path.exists(os.path.expanduser(os.getenv("JIRA_OUTBOX_PATH", DEFAULT_OUTBOX_PATH))):
+        get_outbox().start()
+
+
+def _outbox_submit(kind, params, site=None, project_key=None):
+    """Log a write in the outbox for the site it routes to; returns the entry (ValueError if invalid)."""
+    if site or project_key:
+        site = get_tenants().resolve(site, project_key)
+    return get_outbox().submit(kind, params, None if site in (None, DEFAULT_SITE) else site)
+
+
+def _queue_write(kind, params, what, site=None, project_key=None):
+    """Log a write in the outbox; returns the tool's reply."""
+    try:
+        entry = _outbox_submit(kind, params, site, project_key)
+    except ValueError as e:
+        return str(e)
+    return f"Queued {what} (outbox entry {entry['id']}); outbox_status reports when JIRA has it."
+
+
+async def startup():
+    """
+    Once per process: start the pre-warm, resume jobs and writes. Run from the SSE
+    app's startup event (`sse_app`) and from the session lifespan (the only hook
+    under stdio); later calls do nothing, so SSE sessions do not repeat it.
+    """
+    global _prewarm_task, _started
+    if _started:
+        return
+    _started = True
+    if _prewarm_task is None and os.getenv("MCP_PREWARM", "1") != "0":
+        _prewarm_task = asyncio.create_task(prewarm())
+    resume_jobs()
+    resume_outbox()
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """
+    Runs per session, once the transport is up. Under stdio the transport already
+    holds the real stdout, so service messages (and job and outbox threads) print
+    to stderr and cannot corrupt the JSON-RPC stream.
+    """
+    stdout = sys.stdout
+    if _stdout_is_protocol:
+        sys.stdout = sys.stderr
+    try:
+        await startup()
+        yield {}
+    finally:
+        sys.stdout = stdout
+
 
 # Initialize the MCP Server
-mcp = FastMCP("Jira Automation")
+# Tools are async and await the non-blocking service, so one slow JIRA
+# response no longer stalls other agents connected over SSE.
+mcp = FastMCP("Jira Automation", lifespan=lifespan)
+
+
+def sse_app():
+    """The SSE Starlette app, with `startup` on its startup event."""
+    app = mcp.sse_app()
+    app.add_event_handler("startup", startup)
+    return app
 
-# Initialize Jira Service
-# We initialize it globally or lazily. 
-# For FastMCP, we can just instantiate it.
-jira_service = JiraService()
 
 @mcp.tool()
-def create_project(key: str, name: str) -> str:
-    """Create a new JIRA Project."""
-    if jira_service.create_project(key, name):
+async def create_project(key: str, name: str, site: str = None) -> str:
+    """Create a new JIRA Project (on `site`, default: the main site)."""
+    with use_service(site) as service:
+        ok = await service.create_project(key, name)
+    if ok:
         return f"Project {name} ({key}) created successfully."
     return f"Failed to create project {name} ({key})."
 
 @mcp.tool()
-def create_issue(summary: str, description: str, issue_type: str = "Task", project_key: str = None) -> str:
-    """Create a new JIRA Issue."""
-    key = jira_service.create_issue(summary, description, issue_type, project_key)
+async def create_issue(summary: str, description: str, issue_type: str = "Task", project_key: str = None,
+                       site: str = None) -> str:
+    """
+    Create a new JIRA Issue. `description` may use Markdown (lists, code blocks, links).
+    With JIRA_WRITE_MODE=outbox the issue is queued; outbox_status returns its key once created.
+    """
+    if outbox_enabled():
+        params = {"summary": summary, "description": description, "issue_type": issue_type,
+                  "project_key": project_key}
+        return _queue_write("create_issue", params, f"{issue_type} '{summary}'", site, project_key)
+    with use_service(site, project_key) as service:
+        key = await service.create_issue(summary, description, issue_type, project_key)
     if key:
         return f"Created {issue_type}: {key}"
     return "Failed to create issue."
 
 @mcp.tool()
-def update_issue(issue_key: str, summary: str = None, description: str = None) -> str:
-    """Update an issue's summary or description."""
-    if jira_service.update_issue(issue_key, summary, description):
+async def update_issue(issue_key: str, summary: str = None, description: str = None, site: str = None) -> str:
+    """Update an issue's summary or description (Markdown allowed)."""
+    if outbox_enabled():
+        params = {"issue_key": issue_key, "summary": summary, "description": description}
+        return _queue_write("update_issue", params, f"update of {issue_key}", site, project_of(issue_key))
+    with use_service(site, project_of(issue_key)) as service:
+        ok = await service.update_issue(issue_key, summary, description)
+    if ok:
         return f"Updated {issue_key}."
     return f"Failed to update {issue_key}."
 
 @mcp.tool()
-def transition_issue(issue_key: str, status_name: str) -> str:
+async def transition_issue(issue_key: str, status_name: str, site: str = None) -> str:
     """Move an issue to a new status."""
-    if jira_service.transition_issue(issue_key, status_name):
+    if outbox_enabled():
+        params = {"issue_key": issue_key, "status_name": status_name}
+        return _queue_write("transition_issue", params, f"move of {issue_key} to {status_name}", site,
+                            project_of(issue_key))
+    with use_service(site, project_of(issue_key)) as service:
+        ok = await service.transition_issue(issue_key, status_name)
+    if ok:
         return f"Moved {issue_key} to {status_name}."
     return f"Failed to transition {issue_key}."
 
 @mcp.tool()
-def add_comment(issue_key: str, comment_text: str) -> str:
-    """Add a comment to an issue."""
-    if jira_service.add_comment(issue_key, comment_text):
+async def add_comment(issue_key: str, comment_text: str, site: str = None) -> str:
+    """Add a comment to an issue. `comment_text` may use Markdown (lists, code blocks, links)."""
+    if outbox_enabled():
+        params = {"issue_key": issue_key, "comment_text": comment_text}
+        return _queue_write("add_comment", params, f"comment on {issue_key}", site, project_of(issue_key))
+    with use_service(site, project_of(issue_key)) as service:
+        ok = await service.add_comment(issue_key, comment_text)
+    if ok:
         return f"Comment added to {issue_key}."
     return f"Failed to add comment to {issue_key}."
 
+# Fields returned by get_issue unless the caller asks for others.
+GET_ISSUE_FIELDS = ["summary", "status", "assignee", "priority", "description"]
+
 @mcp.tool()
-def get_issue(issue_key: str) -> str:
-    """Get issue details."""
-    # JiraService prints to stdout, we need to capture it or modify JiraService to return data.
-    # Current JiraService prints. We should modify JiraService to return dict or text, 
-    # OR we capture stdout.
-    # For a robust tool, it's better if JiraService returns data.
-    # But as per "Strictly wrap", we might need to rely on what we have or modify JiraService (refactoring).
-    # Since I cannot easily verify if I can refactor JiraService deeply without user approval (though I have broad approval),
-    # I will assume I can refactor JiraService slightly or just use it.
-    # The current JiraService.get_issue_details prints.
-    # I will modify this tool to return a message saying "Check stdout" or usage of a new method if I add one.
-    # Let's try to capture logic.
-    
-    # Actually, looking at JiraService, it returns True/False.
-    # I will stick to basic success/fail for now, or maybe reads the print? No.
-    # I'll implement a new method in JiraService via `src/jira_service_extension.py` or just add it here
-    # accessing client directly?
-    
-    # Best approach: Use `jira_service.client` to get data again? 
-    # Or just say "Details fetched (check logs)"? 
-    # The requirement is "Expose capabilities". The Agent using this tool wants the data back.
-    # So I MUST return the data.
-    
-    data = jira_service.client.get(f"/rest/api/3/issue/{issue_key}")
-    if data:
-        fields = data.get("fields", {})
-        summary = fields.get("summary")
-        status = fields.get("status", {}).get("name")
-        return json.dumps({"key": issue_key, "summary": summary, "status": status}, indent=2)
+async def get_issue(issue_key: str, fields: list[str] = None, site: str = None) -> str:
+    """
+    Get issue details.
+    Only `fields` are fetched from JIRA (default: summary, status, assignee, priority, description);
+    nested values such as status or assignee are returned as their display names
+    and the description is rendered to Markdown.
+    """
+    with use_service(site, project_of(issue_key)) as service:
+        view = await service.get_issue_view(issue_key, fields or GET_ISSUE_FIELDS)
+    if view:
+        return json.dumps(view, indent=2)
     return "Issue not found."
 
+# Hard ceiling so a single call can never pull a whole project into memory.
+SEARCH_RESULTS_LIMIT = 1000
+
 @mcp.tool()
-def search_tasks(jql: str) -> str:
-    """Search tasks using JQL."""
-    payload = {
-        "jql": jql,
-        "fields": ["summary", "status", "assignee"]
-    }
-    data = jira_service.client.post("/rest/api/3/search/jql", payload)
-    if data:
-        issues = data.get("issues", [])
-        return json.dumps([{"key": i["key"], "summary": i["fields"]["summary"]} for i in issues], indent=2)
+async def search_tasks(jql: str, max_results: int = 50, fields: list[str] = None, site: str = None,
+                       project_key: str = None) -> str:
+    """
+    Search tasks using JQL.
+    Follows result pages up to `max_results` (capped at 1000).
+    `fields` selects which issue fields are returned (default: summary); nested values
+    such as status or assignee are returned as their display names, as in get_issue.
+    `site` or `project_key` selects the JIRA site to search (default: the main site).
+    """
+    from .issue_view import IssueRecord
+
+    max_results = max(1, min(max_results, SEARCH_RESULTS_LIMIT))
+    columns = list(fields or ["summary"])
+
+    # Applied as each issue is parsed off the stream, so only compact records are kept.
+    def record(issue):
+        return IssueRecord.from_issue(issue, columns)
+
+    with use_service(site, project_key) as service:
+        records = await service.search(jql, fields=fields, max_results=max_results, shape=record)
+    if records:
+        return json.dumps([r.view() for r in records], indent=2)
     return "No issues found or error."
 
+@mcp.tool()
+async def bulk_create_issues(issues: list[dict], project_key: str = None, site: str = None) -> str:
+    """
+    Create many issues in one call (sent to JIRA in chunks of 50).
+    Each item: {"summary": str, "description": str, "issue_type": str (opt), "project_key": str (opt)}.
+    Returns a per-item report.
+    """
+    from . import bulk_operations
+
+    specs = [bulk_operations.issue_spec_from_record(item) for item in issues]
+    invalid = [i for i, spec in enumerate(specs) if not spec["summary"]]
+    if invalid:
+        return f"Items missing a summary: {invalid}"
+    with use_service(site, project_key) as service:
+        results = await service.bulk_create_issues(specs, project_key)
+    return json.dumps(bulk_operations.summarize(results), indent=2)
+
+# --- execute_batch: the tools above as structured operations. Each returns a JSON-able
+# result or raises OperationError with the message the standalone tool would reply with.
+
+async def _batch_get_issue(issue_key, fields=None, site=None):
+    from .batch_executor import OperationError
+
+    with use_service(site, project_of(issue_key)) as service:
+        view = await service.get_issue_view(issue_key, fields or GET_ISSUE_FIELDS)
+    if not view:
+        raise OperationError("Issue not found.")
+    return view
+
+async def _batch_search_tasks(jql, max_results=50, fields=None, site=None, project_key=None):
+    from .issue_view import IssueRecord
+
+    columns = list(fields or ["summary"])
+    with use_service(site, project_key) as service:
+        records = await service.search(
+            jql, fields=fields, max_results=max(1, min(max_results, SEARCH_RESULTS_LIMIT)),
+            shape=lambda issue: IssueRecord.from_issue(issue, columns))
+    return [r.view() for r in records or []]
+
+def _batch_write(kind, params, site, project_key):
+    """Outbox mode: queue the write; the result names the entry."""
+    from .batch_executor import OperationError
+
+    try:
+        entry = _outbox_submit(kind, params, site, project_key)
+    except ValueError as e:
+        raise OperationError(str(e))
+    return {"queued": True, "outbox_entry": entry["id"]}
+
+async def _batch_create_issue(summary, description, issue_type="Task", project_key=None, site=None):
+    from .batch_executor import OperationError
+
+    if outbox_enabled():
+        params = {"summary": summary, "description": description, "issue_type": issue_type,
+                  "project_key": project_key}
+        return _batch_write("create_issue", params, site, project_key)
+    with use_service(site, project_key) as service:
+        key = await service.create_issue(summary, description, issue_type, project_key)
+    if not key:
+        raise OperationError("Failed to create issue.")
+    return {"key": key}
+
+async def _batch_update_issue(issue_key, summary=None, description=None, site=None):
+    from .batch_executor import OperationError
+
+    if outbox_enabled():
+        params = {"issue_key": issue_key, "summary": summary, "description": description}
+        return _batch_write("update_issue", params, site, project_of(issue_key))
+    with use_service(site, project_of(issue_key)) as service:
+        ok = await service.update_issue(issue_key, summary, description)
+    if not ok:
+        raise OperationError(f"Failed to update {issue_key}.")
+    return {"key": issue_key}
+
+async def _batch_transition_issue(issue_key, status_name, site=None):
+    from .batch_executor import OperationError
+
+    if outbox_enabled():
+        params = {"issue_key": issue_key, "status_name": status_name}
+        return _batch_write("transition_issue", params, site, project_of(issue_key))
+    with use_service(site, project_of(issue_key)) as service:
+        ok = await service.transition_issue(issue_key, status_name)
+    if not ok:
+        raise OperationError(f"Failed to transition {issue_key}.")
+    return {"key": issue_key, "status": status_name}
+
+async def _batch_add_comment(issue_key, comment_text, site=None):
+    from .batch_executor import OperationError
+
+    if outbox_enabled():
+        params = {"issue_key": issue_key, "comment_text": comment_text}
+        return _batch_write("add_comment", params, site, project_of(issue_key))
+    with use_service(site, project_of(issue_key)) as service:
+        ok = await service.add_comment(issue_key, comment_text)
+    if not ok:
+        raise OperationError(f"Failed to add comment to {issue_key}.")
+    return {"key": issue_key}
+
+BATCH_TOOLS = {
+    "get_issue": _batch_get_issue,
+    "search_tasks": _batch_search_tasks,
+    "create_issue": _batch_create_issue,
+    "update_issue": _batch_update_issue,
+    "transition_issue": _batch_transition_issue,
+    "add_comment": _batch_add_comment,
+}
+BATCH_WRITES = ("create_issue", "update_issue", "transition_issue", "add_comment")
+
+@mcp.tool()
+async def execute_batch(operations: list[dict], site: str = None) -> str:
+    """
+    Run several tool calls in one request and return every result.
+    Each operation: {"id": str (opt, default its index), "tool": one of get_issue, search_tasks,
+    create_issue, update_issue, transition_issue, add_comment, "args": {...} (as for that tool),
+    "depends_on": [ids] (opt)}.
+    Independent operations run concurrently; operations on the same issue_key run in list order.
+    An argument "$<id>" or "$<id>.<field>" takes the result of an earlier operation,
+    e.g. {"tool": "add_comment", "args": {"issue_key": "$new.key", ...}} after {"id": "new", "tool": "create_issue"}.
+    With JIRA_WRITE_MODE=outbox, writes are only queued ({"queued", "outbox_entry"}), so such a
+    "$new.key" reference is rejected.
+    Operations that depend on a failed one are skipped. `site` applies to operations that set none.
+    Returns {"ok", "seconds", "results": [{"id", "tool", "status", "result" | "error", "seconds"}]}.
+    """
+    from .batch_executor import run_batch
+
+    if site is not None and isinstance(operations, list):
+        operations = [{**op, "args": {"site": site, **(op.get("args") or {})}} if isinstance(op, dict) else op
+                      for op in operations]
+    try:
+        report = await run_batch(operations, BATCH_TOOLS, queued=BATCH_WRITES if outbox_enabled() else ())
+    except ValueError as e:
+        return f"Invalid batch: {e}"
+    return json.dumps(report, indent=2)
+
+_job_queue = None
+
+
+def get_job_queue():
+    """Background job queue (JIRA_JOBS_PATH), created on first call."""
+    global _job_queue
+    if _job_queue is None:
+        with _service_lock:
+            if _job_queue is None:
+                from .job_queue import JobQueue
+                _job_queue = JobQueue.from_env()
+    return _job_queue
+
+
+def resume_jobs():
+    """Restart jobs a previous server process left queued or running (if it ever stored any)."""
+    from .job_queue import DEFAULT_JOBS_PATH
+
+    if os.path.exists(os.path.expanduser(os.getenv("JIRA_JOBS_PATH", DEFAULT_JOBS_PATH))):
+        get_job_queue().start()
+
+@mcp.tool()
+async def submit_job(kind: str, params: dict = None, site: str = None) -> str:
+    """
+    Run a long operation in the background; returns {"job_id"} at once. Poll job_status, then job_result.
+    Kinds and params:
+      create_project {key, name, shared_configuration_id?}; recreate_project {key, name, template_key?};
+      setup_soc_statuses {workflow_name?}; provision {spec, dry_run?} (spec as in ProvisioningSpec.from_dict);
+      bulk_create_issues {issues, project_key?}; bulk_transition {items: [{key, status}]};
+      bulk_comment {items: [{key, text}]}; bulk_assign {keys, account_id?}.
+    Jobs survive a server restart and resume where their last checkpoint left off.
+    """
+    try:
+        job_id = get_job_queue().submit(kind, params, None if site in (None, DEFAULT_SITE) else site)
+    except ValueError as e:
+        return str(e)
+    return json.dumps({"job_id": job_id, "status": "queued"}, indent=2)
+
+@mcp.tool()
+async def job_status(job_id: str) -> str:
+    """State of a background job: queued, running, succeeded or failed, with progress and timestamps."""
+    status = get_job_queue().status(job_id)
+    if status is None:
+        return f"Job {job_id} not found."
+    return json.dumps(status, indent=2)
+
+@mcp.tool()
+async def job_result(job_id: str) -> str:
+    """Result of a finished background job (its status only while it is still queued or running)."""
+    result = get_job_queue().result(job_id)
+    if result is None:
+        return f"Job {job_id} not found."
+    if result["result"] is None and result["status"] in ("queued", "running"):
+        return f"Job {job_id} is still {result['status']}.\n" + json.dumps(result, indent=2)
+    return json.dumps(result, indent=2)
+
+@mcp.tool()
+async def outbox_status(entry_id: str = None) -> str:
+    """
+    State of a write queued in the outbox (pending, sent or failed; the created key for issues),
+    or, without `entry_id`, counts per state and sent/retried/failed totals.
+    """
+    if entry_id is None:
+        return json.dumps(get_outbox().metrics(), indent=2)
+    status = get_outbox().status(entry_id)
+    if status is None:
+        return f"Outbox entry {entry_id} not found."
+    return json.dumps(status, indent=2)
+
+@mcp.tool()
+async def rate_limit_metrics(site: str = None) -> str:
+    """Report client-side rate limiter state (tokens left, queued waits, retry counts) for a site."""
+    return json.dumps(get_service(site).client.limiter.metrics(), indent=2)
+
+@mcp.tool()
+async def tenant_metrics() -> str:
+    """Named JIRA sites currently loaded (idle seconds each) and how many were created or evicted."""
+    return json.dumps(get_tenants().metrics(), indent=2)
+
+@mcp.tool()
+async def metrics() -> str:
+    """Per-endpoint JIRA request metrics (latency histograms, status codes, bytes, retries) in Prometheus text format."""
+    from .request_metrics import get_request_metrics
+
+    return get_request_metrics().prometheus()
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request):
+    """Prometheus scrape endpoint (served with the SSE transport)."""
+    from starlette.responses import PlainTextResponse
+    from .request_metrics import get_request_metrics
+
+    return PlainTextResponse(get_request_metrics().prometheus(), media_type="text/plain; version=0.0.4")
+
+_webhook_handlers = {}
+
+def get_webhook_handler(site, service):
+    """
+    Webhook handler bound to the cache and mirror of `service`, the site's current service.
+    One per site, rebuilt only if the tenant registry has replaced the site's service.
+    """
+    from .webhook_handler import WebhookHandler
+    name = get_tenants().resolve(site) if site else DEFAULT_SITE
+    with _service_lock:
+        handler = _webhook_handlers.get(name)
+        if handler is None or handler.cache is not service.cache:
+            handler = _webhook_handlers[name] = WebhookHandler.from_env(service.cache, service.mirror)
+    return handler
+
+@mcp.custom_route("/webhooks/jira", methods=["POST"])
+async def jira_webhook(request):
+    """
+    JIRA webhook receiver (served with the SSE transport). Signed issue and comment
+    events update the local mirror and drop cached views, so reads are served without
+    polling. Without JIRA_WEBHOOK_SECRET deliveries are refused (403), unless
+    JIRA_WEBHOOK_ALLOW_UNSIGNED=1 accepts them as invalidation hints.
+    Register `/webhooks/jira?site=<name>` for a named site.
+    """
+    from starlette.responses import JSONResponse
+    from .webhook_handler import verify_signature
+
+    site = request.query_params.get("site")
+    body = await request.body()
+    with use_service(site) as service:  # not closed by an eviction while the event is applied
+        handler = get_webhook_handler(site, service)
+        signed = bool(handler.secret)
+        if not signed and not handler.allow_unsigned:
+            return JSONResponse({"error": "webhooks are disabled: JIRA_WEBHOOK_SECRET is not set"},
+                                status_code=403)
+        if signed and not verify_signature(handler.secret, body, request.headers.get("x-hub-signature")):
+            return JSONResponse({"error": "invalid signature"}, status_code=401)
+        try:
+            event = json.loads(body)
+        except ValueError:
+            return JSONResponse({"error": "invalid JSON"}, status_code=400)
+        if not isinstance(event, dict):
+            return JSONResponse({"error": "expected a JSON object"}, status_code=400)
+        return JSONResponse(handler.handle(event, signed=signed))
+
 import argparse
-import os
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Jira MCP Server")
@@ -113,7 +569,9 @@ if __name__ == "__main__":
         if args.host not in ("127.0.0.1", "localhost", "::1"):
             print("Binding to non-local host, disabling DNS rebinding protection.")
             mcp.settings.transport_security = None
-            
-        mcp.run(transport="sse")
+
+        import uvicorn
+        uvicorn.run(sse_app(), host=args.host, port=args.port, log_level=mcp.settings.log_level.lower())
     else:
+        _stdout_is_protocol = True
         mcp.run(transport="stdio")
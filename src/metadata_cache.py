@@ -0,0 +1,90 @@
+import os
+from .memory_cache import MemoryCache
+from .sqlite_cache import SqliteCache
+
+# Slow-changing JIRA metadata and how long each kind may be served from cache (seconds).
+DEFAULT_TTLS = {
+    "myself": 3600,
+    "statuses": 600,
+    "transitions": 120,
+    "issue_view": 30,
+}
+DEFAULT_SQLITE_PATH = os.path.join("~", ".cache", "jira_agent", "metadata.sqlite3")
+
+class MetadataCache:
+    """
+    Namespaced read-through cache for JIRA metadata (statuses, transitions, /myself).
+    Keys are scoped per site so one SQLite file can serve several JIRA instances.
+    """
+    def __init__(self, backend=None, scope="", ttls=None):
+        self.backend = backend or MemoryCache()
+        self.scope = scope
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, namespace, key):
+        return f"{self.scope}|{namespace}:{key}"
+
+    def get(self, namespace, key=""):
+        value = self.backend.get(self._key(namespace, key))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, namespace, key, value):
+        if value is not None:
+            self.backend.set(self._key(namespace, key), value, self.ttls.get(namespace, 300))
+
+    def get_or_load(self, namespace, key, loader):
+        """Return the cached value or call `loader()` and cache a non-None result."""
+        value = self.get(namespace, key)
+        if value is None:
+            value = loader()
+            self.put(namespace, key, value)
+        return value
+
+    async def get_or_load_async(self, namespace, key, loader):
+        """Async variant; `loader` is a zero-argument coroutine function."""
+        value = self.get(namespace, key)
+        if value is None:
+            value = await loader()
+            self.put(namespace, key, value)
+        return value
+
+    def invalidate(self, namespace=None, key=None):
+        """Drop one key, a whole namespace, or (no args) everything in this scope."""
+        if namespace is None:
+            self.backend.delete_prefix(f"{self.scope}|")
+        elif key is None:
+            self.backend.delete_prefix(f"{self.scope}|{namespace}:")
+        else:
+            self.backend.delete(self._key(namespace, key))
+
+    def invalidate_prefix(self, namespace, key_prefix):
+        """Drop every key in `namespace` starting with `key_prefix`."""
+        self.backend.delete_prefix(self._key(namespace, key_prefix))
+
+    def for_scope(self, scope):
+        """Same backend and TTLs, different site scope."""
+        return MetadataCache(self.backend, scope, self.ttls)
+
+    @classmethod
+    def from_env(cls, scope="", default_backend="memory"):
+        """
+        JIRA_CACHE_BACKEND: memory | sqlite | off
+        JIRA_CACHE_PATH: SQLite file (default ~/.cache/jira_agent/metadata.sqlite3)
+        JIRA_CACHE_MAX_ENTRIES: LRU bound
+        """
+        kind = os.getenv("JIRA_CACHE_BACKEND", default_backend).lower()
+        max_entries = int(os.getenv("JIRA_CACHE_MAX_ENTRIES", "1024"))
+        if kind == "sqlite":
+            path = os.path.expanduser(os.getenv("JIRA_CACHE_PATH", DEFAULT_SQLITE_PATH))
+            backend = SqliteCache(path, max_entries=max_entries)
+        elif kind == "off":
+            backend = MemoryCache(max_entries=0)
+        else:
+            backend = MemoryCache(max_entries=max_entries)
+        return cls(backend, scope)
@@ -0,0 +1,147 @@
+"""
+Batched project provisioning: one paginated read of the existing projects,
+a local plan (key collisions resolved without asking JIRA), bounded concurrent
+creation and an append-only resume log so interrupted runs pick up where they stopped.
+"""
+import json
+import os
+import re
+import threading
+
+from . import bulk_operations
+
+PROJECT_SEARCH_ENDPOINT = "/rest/api/3/project/search"
+PROJECT_KEY_MAX_LENGTH = 10  # JIRA default key limit
+DEFAULT_PROVISION_WORKERS = 4  # project creation is heavy on the JIRA side
+
+
+def fetch_existing_projects(client, page_size=50):
+    """
+    Every project visible to the user as {key: name}, following startAt pages.
+    Returns None if any page fails, since a partial list would cause bad plans.
+    """
+    projects = {}
+    start = 0
+    while True:
+        data = client.get(PROJECT_SEARCH_ENDPOINT, params={"startAt": start, "maxResults": page_size})
+        if data is None:
+            return None
+        values = data.get("values", [])
+        for project in values:
+            projects[project["key"]] = project.get("name", "")
+        start += len(values)
+        if data.get("isLast", True) or not values:
+            return projects
+
+
+def project_name(directory):
+    """Display name for a directory: 'my-cool_repo' -> 'My Cool Repo'."""
+    return directory.replace("-", " ").replace("_", " ").title()
+
+
+def unique_key(base, taken):
+    """`base`, or base with a numeric suffix (trimmed to the key limit), that is not in `taken`."""
+    base = re.sub(r"[^A-Z0-9]", "", base.upper())
+    if not base or not base[0].isalpha():
+        base = "P" + base
+    base = base[:PROJECT_KEY_MAX_LENGTH]
+    if base not in taken:
+        return base
+    suffix = 2
+    while True:
+        key = base[:PROJECT_KEY_MAX_LENGTH - len(str(suffix))] + str(suffix)
+        if key not in taken:
+            return key
+        suffix += 1
+
+
+def plan_projects(directories, existing, key_fn, done=None):
+    """
+    One step per directory, in order: {"directory", "name", "key", "action"} where action is
+    "done" (in the resume log), "exists" (a project with that name exists) or "create".
+    Keys are unique against existing projects and against each other.
+    """
+    done = done or {}
+    taken = set(existing) | set(done.values())
+    by_name = {name.lower(): key for key, name in existing.items()}
+    steps = []
+    for directory in directories:
+        name = project_name(directory)
+        if directory in done:
+            steps.append({"directory": directory, "name": name, "key": done[directory], "action": "done"})
+        elif name.lower() in by_name:
+            steps.append({"directory": directory, "name": name, "key": by_name[name.lower()], "action": "exists"})
+        else:
+            key = unique_key(key_fn(directory), taken)
+            taken.add(key)
+            steps.append({"directory": directory, "name": name, "key": key, "action": "create"})
+    return steps
+
+
+class ResumeLog:
+    """
+    Append-only JSON-lines record of provisioned directories ({"directory", "key"}).
+    Safe to append from worker threads; a truncated last line is ignored on load.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self):
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                done[entry["directory"]] = entry["key"]
+        return done
+
+    def record(self, directory, key):
+        line = json.dumps({"directory": directory, "key": key}) + "\n"
+        with self._lock:
+            directory_name = os.path.dirname(self.path)
+            if directory_name:
+                os.makedirs(directory_name, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def provision(service, steps, max_workers=DEFAULT_PROVISION_WORKERS, resume=None):
+    """
+    Create the "create" steps concurrently (lead resolved once via /myself).
+    Successful and already-existing projects are appended to `resume`.
+    Returns bulk_operations.summarize() of the create results, each with its key.
+    """
+    to_create = [step for step in steps if step["action"] == "create"]
+    if resume is not None:
+        for step in steps:
+            if step["action"] == "exists":
+                resume.record(step["directory"], step["key"])
+    account_id = service.get_myself_account_id() if to_create else None
+
+    def create(step):
+        created = service.create_project(step["key"], step["name"], account_id=account_id)
+        if created and resume is not None:
+            resume.record(step["directory"], step["key"])
+        return created
+
+    results = bulk_operations.run_concurrently(create, [(step,) for step in to_create], max_workers)
+    for result, step in zip(results, to_create):
+        result["key"] = step["key"]
+        result["directory"] = step["directory"]
+    return bulk_operations.summarize(results)
+
+
+def format_plan(steps):
+    lines = [f"{'action':8}{'key':12}{'name':40}directory"]
+    for step in steps:
+        lines.append(f"{step['action']:8}{step['key']:12}{step['name'][:39]:40}{step['directory']}")
+    counts = {}
+    for step in steps:
+        counts[step["action"]] = counts.get(step["action"], 0) + 1
+    lines.append(", ".join(f"{n} {action}" for action, n in sorted(counts.items())) or "Nothing to do.")
+    return "\n".join(lines)
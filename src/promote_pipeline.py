@@ -0,0 +1,94 @@
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+from . import jira_payloads
+
+class PromotePipeline:
+    """
+    Dependency-aware `promote`: comment + move + show details.
+
+    Stage 1 (parallel): add the comment | GET issue?expand=transitions
+    Stage 2: POST the transition (only if the comment succeeded), using the
+             transitions returned in stage 1 (seeded into the service cache)
+    Stage 3: print details from the stage-1 issue with the new status applied,
+             instead of fetching the issue again.
+
+    Per-step timings are kept so the caller can compare wall-clock time with
+    the old serial flow (comment, GET transitions, POST, GET details).
+    """
+    def __init__(self, service, max_workers=4):
+        self.service = service
+        self.max_workers = max(1, max_workers)
+
+    @staticmethod
+    def _timed(timings, name, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timings[name] = time.perf_counter() - start
+
+    def promote(self, issue_key, status_name, comment_text):
+        """Promote one issue. Returns a result dict with step timings."""
+        result = self._promote(issue_key, status_name, comment_text)
+        self._show(result)
+        return result
+
+    def _promote(self, issue_key, status_name, comment_text):
+        """The network part of `promote`; the issue to show is kept in the result, not printed."""
+        timings = {}
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            comment_future = pool.submit(self._timed, timings, "comment",
+                                         self.service.add_comment, issue_key, comment_text)
+            issue_future = pool.submit(self._timed, timings, "fetch",
+                                       self.service.get_issue_with_transitions, issue_key)
+            commented = comment_future.result()
+            issue = issue_future.result()
+
+        moved = False
+        if commented:
+            moved = self._timed(timings, "transition", self.service.transition_issue, issue_key, status_name)
+
+        if issue is not None:
+            if moved:
+                issue = self._with_new_status(issue, status_name)
+        else:
+            issue = self._timed(timings, "details", self.service.get_issue, issue_key)
+
+        wall = time.perf_counter() - start
+        # Old flow: comment, GET transitions, POST transition, GET details (all serial).
+        fetch = timings.get("fetch", 0.0)
+        serial = timings.get("comment", 0.0) + fetch + timings.get("transition", 0.0) + timings.get("details", fetch)
+        return {"key": issue_key, "commented": commented, "moved": moved, "issue": issue,
+                "wall_seconds": wall, "serial_estimate_seconds": serial, "timings": timings}
+
+    def _show(self, result):
+        if result["issue"] is not None:
+            self.service.print_issue_details(result["key"], result["issue"])
+
+    def promote_many(self, issue_keys, status_name, comment_text):
+        """
+        Promote several issues with at most `max_workers` in flight. Details are
+        printed in key order once all of them are done, so they do not interleave.
+        """
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(lambda key: self._promote(key, status_name, comment_text), issue_keys))
+        wall = time.perf_counter() - start
+        for result in results:
+            self._show(result)
+        serial = sum(r["serial_estimate_seconds"] for r in results)
+        return {"results": results, "wall_seconds": wall, "serial_estimate_seconds": serial,
+                "saved_seconds": max(0.0, serial - wall)}
+
+    @staticmethod
+    def _with_new_status(issue, status_name):
+        """Copy of the issue with its status replaced by the transition target."""
+        updated = copy.copy(issue)
+        updated["fields"] = dict(issue.get("fields", {}))
+        transitions = issue.get("transitions", [])
+        target_id = jira_payloads.find_transition_id(transitions, status_name)
+        target = next((t for t in transitions if t["id"] == target_id), {})
+        updated["fields"]["status"] = target.get("to") or {"name": status_name}
+        return updated
@@ -0,0 +1,124 @@
+import asyncio
+import os
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Client-side token bucket shared by threads and asyncio tasks.
+    Callers reserve a token under a lock and then sleep outside it
+    (time.sleep or asyncio.sleep), so neither model blocks the other.
+    `rate=None` disables throttling but still honours pause() and metrics.
+    """
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiting = 0
+        self._acquired = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._pauses = 0
+        self._retries = {}
+
+    def _refill(self, now):
+        if self.rate:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self):
+        """Take one token (possibly going negative) and return how long to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._acquired += 1
+            wait = max(0.0, self._blocked_until - now)
+            if self.rate:
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+            if wait > 0:
+                self._waits += 1
+                self._wait_seconds += wait
+                self._waiting += 1
+            return wait
+
+    def _done_waiting(self):
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self):
+        """Block the calling thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._done_waiting()
+
+    async def acquire_async(self):
+        """Await until a request may be sent without blocking the event loop."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._done_waiting()
+
+    def pause(self, seconds):
+        """Hold every caller back for `seconds` (e.g. after a 429 Retry-After)."""
+        with self._lock:
+            self._pauses += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def record_retry(self, status):
+        with self._lock:
+            self._retries[status] = self._retries.get(status, 0) + 1
+
+    def metrics(self):
+        """Snapshot of limiter state for tuning against the tenant quota."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "tokens_available": round(max(self._tokens, 0.0), 3),
+                "waiting": self._waiting,
+                "acquired_total": self._acquired,
+                "waits_total": self._waits,
+                "wait_seconds_total": round(self._wait_seconds, 3),
+                "paused_for_seconds": round(max(0.0, self._blocked_until - now), 3),
+                "pauses_total": self._pauses,
+                "retries_total": dict(self._retries),
+            }
+
+    @classmethod
+    def from_env(cls):
+        """JIRA_RATE_LIMIT (requests/second, 0 = off) and JIRA_RATE_BURST."""
+        rate = float(os.getenv("JIRA_RATE_LIMIT", "0") or 0)
+        burst = os.getenv("JIRA_RATE_BURST")
+        return cls(rate=rate or None, burst=int(burst) if burst else None)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key):
+    """Process-wide limiter per JIRA site, shared by the sync and async clients."""
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = TokenBucket.from_env()
+            _limiters[key] = limiter
+        return limiter
+
+
+def reset_rate_limiters():
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,216 @@
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+# Histogram bucket upper bounds (seconds) for request latency.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Recent durations kept per endpoint for exact percentiles in summaries.
+RECENT_SAMPLES = 1024
+
+_ISSUE_KEY = re.compile(r"/[A-Z][A-Z0-9_]*-\d+(?=/|$)")
+_NUMERIC_ID = re.compile(r"(?<!/api)/\d+(?=/|$)")  # not the API version
+_PROJECT_KEY = re.compile(r"(/project/)(?!search(?:/|$))[^/]+")
+
+
+def endpoint_template(endpoint):
+    """
+    Collapse issue keys, numeric ids and project keys so labels stay bounded:
+    /rest/api/3/issue/ABC-1/transitions -> /rest/api/3/issue/{key}/transitions
+    """
+    path = endpoint.split("?", 1)[0]
+    path = _ISSUE_KEY.sub("/{key}", path)
+    path = _NUMERIC_ID.sub("/{id}", path)
+    return _PROJECT_KEY.sub(r"\1{project}", path)
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    One logical client call, passed to every observer once it finishes.
+    seconds: time on the wire across all attempts; wait_seconds: time spent
+    in the rate limiter and retry backoff. status is None on transport errors.
+    """
+    method: str
+    endpoint: str
+    status: int | None
+    seconds: float
+    wait_seconds: float
+    request_bytes: int
+    response_bytes: int
+    retries: int
+
+
+class _EndpointStats:
+    __slots__ = ("buckets", "count", "seconds", "wait_seconds", "request_bytes", "response_bytes",
+                 "retries", "statuses", "parse_seconds", "parse_count", "coalesced", "recent")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.wait_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.statuses = {}
+        self.parse_seconds = 0.0
+        self.parse_count = 0
+        self.coalesced = 0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class RequestMetrics:
+    """
+    Per-endpoint request statistics fed by client observers (`record`),
+    JSON decoding (`record_parse`) and single-flight (`record_coalesced`). Thread-safe; export with `prometheus()`
+    or `summary()`.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _get(self, method, endpoint):
+        key = (method, endpoint)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _EndpointStats()
+        return stats
+
+    def record(self, event):
+        """Observer: fold one RequestEvent into the endpoint's statistics."""
+        with self._lock:
+            stats = self._get(event.method, event.endpoint)
+            stats.count += 1
+            stats.seconds += event.seconds
+            stats.wait_seconds += event.wait_seconds
+            stats.request_bytes += event.request_bytes
+            stats.response_bytes += event.response_bytes
+            stats.retries += event.retries
+            status = str(event.status) if event.status is not None else "error"
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.recent.append(event.seconds)
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if event.seconds <= bound:
+                    stats.buckets[index] += 1
+                    break
+
+    def record_parse(self, method, endpoint, seconds):
+        with self._lock:
+            stats = self._get(method, endpoint)
+            stats.parse_seconds += seconds
+            stats.parse_count += 1
+
+    def record_coalesced(self, method, endpoint):
+        """A caller was served by an identical in-flight request instead of sending its own."""
+        with self._lock:
+            self._get(method, endpoint).coalesced += 1
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self):
+        """Per-endpoint rows (calls, errors, latency percentiles, bytes, retries), slowest total first."""
+        with self._lock:
+            rows = []
+            for (method, endpoint), stats in self._stats.items():
+                if not stats.count:
+                    continue
+                errors = sum(n for s, n in stats.statuses.items() if s == "error" or int(s) >= 400)
+                rows.append({
+                    "method": method, "endpoint": endpoint, "calls": stats.count, "errors": errors,
+                    "retries": stats.retries, "coalesced": stats.coalesced, "total_seconds": stats.seconds,
+                    "wait_seconds": stats.wait_seconds, "parse_seconds": stats.parse_seconds,
+                    "p50_seconds": _percentile(stats.recent, 0.5), "p95_seconds": _percentile(stats.recent, 0.95),
+                    "request_bytes": stats.request_bytes, "response_bytes": stats.response_bytes,
+                    "statuses": dict(stats.statuses),
+                })
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def prometheus(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            items = sorted(self._stats.items())
+            lines = [
+                "# HELP jira_client_request_duration_seconds Time on the wire per JIRA call (all attempts).",
+                "# TYPE jira_client_request_duration_seconds histogram",
+            ]
+            for (method, endpoint), stats in items:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += count
+                    lines.append("jira_client_request_duration_seconds_bucket"
+                                 f"{_labels(method=method, endpoint=endpoint, le=bound)} {cumulative}")
+                labels = _labels(method=method, endpoint=endpoint)
+                lines.append("jira_client_request_duration_seconds_bucket"
+                             f"{_labels(method=method, endpoint=endpoint, le='+Inf')} {stats.count}")
+                lines.append(f"jira_client_request_duration_seconds_sum{labels} {stats.seconds:.6f}")
+                lines.append(f"jira_client_request_duration_seconds_count{labels} {stats.count}")
+
+            lines += ["# HELP jira_client_requests_total JIRA calls by final status (\"error\" = no response).",
+                      "# TYPE jira_client_requests_total counter"]
+            for (method, endpoint), stats in items:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append("jira_client_requests_total"
+                                 f"{_labels(method=method, endpoint=endpoint, status=status)} {count}")
+
+            counters = (
+                ("jira_client_retries_total", "Retried attempts (429/503).", "retries", "{}"),
+                ("jira_client_coalesced_total", "Calls served by an identical in-flight request.",
+                 "coalesced", "{}"),
+                ("jira_client_request_bytes_total", "Request body bytes sent.", "request_bytes", "{}"),
+                ("jira_client_response_bytes_total", "Response body bytes received.", "response_bytes", "{}"),
+                ("jira_client_wait_seconds_total", "Time spent in the rate limiter and retry backoff.",
+                 "wait_seconds", "{:.6f}"),
+                ("jira_client_json_parse_seconds_total", "Time spent decoding response JSON.",
+                 "parse_seconds", "{:.6f}"),
+            )
+            for name, help_text, attr, fmt in counters:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, endpoint), stats in items:
+                    value = fmt.format(getattr(stats, attr))
+                    lines.append(f"{name}{_labels(method=method, endpoint=endpoint)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+_metrics = RequestMetrics()
+
+
+def get_request_metrics():
+    """Process-wide registry that every client records into by default."""
+    return _metrics
+
+
+def format_summary(rows):
+    """Plain-text table of `RequestMetrics.summary()` rows for the CLI."""
+    if not rows:
+        return "No JIRA requests were made."
+    calls = sum(r["calls"] for r in rows)
+    network = sum(r["total_seconds"] for r in rows)
+    waiting = sum(r["wait_seconds"] for r in rows)
+    parsing = sum(r["parse_seconds"] for r in rows)
+    lines = [f"{calls} JIRA calls: {network * 1000:.0f} ms network, {waiting * 1000:.0f} ms waiting "
+             f"(rate limit/backoff), {parsing * 1000:.1f} ms JSON parsing",
+             f"{'call':52}{'n':>5}{'err':>5}{'retry':>6}{'p50 ms':>9}{'p95 ms':>9}{'total ms':>10}{'KB in':>8}"]
+    for r in rows:
+        name = f"{r['method']} {r['endpoint']}"
+        lines.append(f"{name[:51]:52}{r['calls']:5}{r['errors']:5}{r['retries']:6}"
+                     f"{r['p50_seconds'] * 1000:9.1f}{r['p95_seconds'] * 1000:9.1f}"
+                     f"{r['total_seconds'] * 1000:10.1f}{r['response_bytes'] / 1024:8.1f}")
+    return "\n".join(lines)
@@ -0,0 +1,52 @@
+import os
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether a throttled response is retried and for how long to back off.
+    Retry-After (seconds or HTTP date) wins over exponential backoff.
+    """
+    max_retries: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: tuple = (429, 503)
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_retries=int(os.getenv("JIRA_MAX_RETRIES", cls.max_retries)),
+            backoff_base=float(os.getenv("JIRA_BACKOFF_BASE", cls.backoff_base)),
+            backoff_max=float(os.getenv("JIRA_BACKOFF_MAX", cls.backoff_max)),
+        )
+
+    def should_retry(self, status_code, attempt):
+        return status_code in self.retry_statuses and attempt < self.max_retries
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        parsed = parse_retry_after(retry_after)
+        if parsed is not None:
+            return min(parsed, self.backoff_max)
+        backoff = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        # Jitter over the upper half of the backoff keeps concurrent callers from retrying
+        # in lockstep while still waiting at least half of it (not full jitter, which can reach 0).
+        return backoff * random.uniform(0.5, 1.0)
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header into seconds, or None if absent/invalid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,126 @@
+import queue
+import threading
+from . import jira_payloads
+from .json_stream import supports_streaming
+
+SEARCH_ENDPOINT = "/rest/api/3/search/jql"
+_END = object()
+_PAGE_END = object()
+
+class SearchPaginator:
+    """
+    Lazily iterates issues of a JQL search across `nextPageToken` pages.
+    A background thread fetches ahead while the caller handles the current
+    issues; at most `max_buffered_pages` pages' worth of issues are queued.
+    With a streaming client each issue is parsed and queued as it arrives,
+    so a page's raw body and parsed tree are never held whole.
+    """
+    def __init__(self, client, jql, fields=None, page_size=50, max_results=None, max_buffered_pages=2,
+                 stream=None):
+        self.client = client
+        self.jql = jql
+        self.fields = fields
+        self.page_size = page_size
+        self.max_results = max_results
+        self.max_buffered_pages = max(1, max_buffered_pages)
+        self.stream = supports_streaming(client) if stream is None else stream
+        self.pages_fetched = 0
+        self.failed = False
+
+    def _fetch(self, payload):
+        """(iterable of issues, dict with nextPageToken/isLast once the issues are consumed), or None."""
+        if self.stream:
+            issues = self.client.stream_post(SEARCH_ENDPOINT, payload)
+            return None if issues is None else (issues, issues.meta)
+        data = self.client.post(SEARCH_ENDPOINT, payload)
+        return None if data is None else (data.get("issues", []), data)
+
+    def _issue_requests(self, stop, slots):
+        """
+        Yield issues, then _PAGE_END, for each page in order; stops on error, last
+        page or cap. A page is only requested once `slots` has room for it.
+        """
+        token = None
+        remaining = self.max_results
+        while remaining is None or remaining > 0:
+            while not slots.acquire(timeout=0.1):
+                if stop.is_set():
+                    return
+            if stop.is_set():
+                return
+            size = self.page_size if remaining is None else min(self.page_size, remaining)
+            fetched = self._fetch(jira_payloads.search_payload(self.jql, self.fields, size, token))
+            if fetched is None:
+                self.failed = True
+                return
+            issues, meta = fetched
+            self.pages_fetched += 1
+            count = 0
+            try:
+                for issue in issues:
+                    if stop.is_set() or (remaining is not None and count >= remaining):
+                        break
+                    count += 1
+                    yield issue
+            finally:
+                if hasattr(issues, "close"):
+                    issues.close()
+            if stop.is_set():
+                return
+            if remaining is not None:
+                remaining -= count
+            yield _PAGE_END
+            token = meta.get("nextPageToken")
+            if not token or meta.get("isLast") or not count:
+                return
+
+    def _produce(self, items, stop, slots):
+        # A page that breaks off mid-stream (bad JSON, dropped connection) fails the
+        # whole search rather than ending it early, so callers never take a partial
+        # result for a complete one.
+        try:
+            for item in self._issue_requests(stop, slots):
+                items.put(item)
+        except Exception as e:
+            print(f"Search paging error: {e}")
+            self.failed = True
+        finally:
+            items.put(_END)
+
+    def _items(self):
+        """
+        Issues and page markers, fetched ahead by a background thread. The current
+        page plus `max_buffered_pages` may be in memory; the consumer frees a slot
+        when it reaches a page's end marker.
+        """
+        items = queue.Queue()
+        slots = threading.Semaphore(self.max_buffered_pages + 1)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._produce, args=(items, stop, slots), daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = items.get()
+                if item is _END:
+                    return
+                if item is _PAGE_END:
+                    slots.release()
+                yield item
+        finally:
+            stop.set()
+            worker.join()
+
+    def pages(self):
+        """Generator of issue lists, one per search page, prefetched ahead."""
+        page = []
+        for item in self._items():
+            if item is _PAGE_END:
+                yield page
+                page = []
+            else:
+                page.append(item)
+
+    def __iter__(self):
+        for item in self._items():
+            if item is not _PAGE_END:
+                yield item
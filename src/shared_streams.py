@@ -0,0 +1,292 @@
+"""
+Single-flight for streamed responses: concurrent identical streamed reads
+(e.g. search pages parsed element by element) share one response, each caller
+reading it through its own reader, instead of one request per caller.
+"""
+import asyncio
+import threading
+
+_END = object()
+
+
+class _SharedStreamReader:
+    """One caller's view of a _SharedStream; used like a StreamedArray."""
+    def __init__(self, shared):
+        self._shared = shared
+
+    @property
+    def meta(self):
+        return self._shared.source.meta
+
+    def __iter__(self):
+        try:
+            while True:
+                item = self._shared.next(self)
+                if item is _END:
+                    return
+                yield item
+        finally:
+            self.close()
+
+    def close(self):
+        self._shared.leave(self)
+
+
+class _SharedStream:
+    """
+    One streamed response read by several callers. The reader furthest ahead
+    pulls the next element from the source. Each element stays buffered only
+    until every reader has passed it. New readers can join until the first
+    element is dropped from the buffer.
+    """
+    reader_type = _SharedStreamReader
+
+    def __init__(self, on_done):
+        self.source = None
+        self.error = None
+        self._items = None
+        self._opened = threading.Event()
+        self._lock = threading.Lock()       # buffer and reader positions
+        self._pull_lock = threading.Lock()  # one reader at a time pulls from the source
+        self._buffer = []
+        self._base = 0                      # index of _buffer[0] in the stream
+        self._positions = {}                # reader -> index of its next element
+        self._exhausted = False
+        self._on_done = on_done
+
+    def join(self):
+        """A new reader, or None once the start of the stream has been dropped."""
+        with self._lock:
+            if self._base or (self._opened.is_set() and not self._positions):
+                return None
+            reader = self.reader_type(self)
+            self._positions[reader] = 0
+            return reader
+
+    def open(self, fetch):
+        try:
+            self.source = fetch()
+            self._items = iter(self.source) if self.source is not None else None
+        except BaseException as e:
+            self.error = e
+            raise
+        finally:
+            self._opened.set()
+
+    def wait_open(self):
+        self._opened.wait()
+        if self.error is not None:
+            raise self.error
+
+    def _take(self, reader):
+        """(True, element or _END) if the reader's next element is known; else (False, None)."""
+        index = self._positions[reader]
+        if index - self._base < len(self._buffer):
+            item = self._buffer[index - self._base]
+            self._positions[reader] = index + 1
+            self._trim()
+            return True, item
+        if self.error is not None:
+            raise self.error
+        return (True, _END) if self._exhausted else (False, None)
+
+    def _trim(self):
+        low = min(self._positions.values(), default=self._base + len(self._buffer))
+        if low > self._base:
+            del self._buffer[:low - self._base]
+            self._base = low
+
+    def next(self, reader):
+        with self._lock:
+            known, item = self._take(reader)
+        if known:
+            return item
+        with self._pull_lock:
+            with self._lock:  # another reader may have pulled it meanwhile
+                known, item = self._take(reader)
+            if known:
+                return item
+            try:
+                item = next(self._items)
+            except StopIteration:
+                with self._lock:
+                    self._exhausted = True
+                return _END
+            except Exception as e:
+                with self._lock:
+                    self.error = e
+                raise
+            with self._lock:
+                self._buffer.append(item)
+                return self._take(reader)[1]
+
+    def leave(self, reader):
+        with self._lock:
+            if self._positions.pop(reader, None) is None:
+                return
+            self._trim()
+            last = not self._positions
+        if last:
+            if self.source is not None:
+                self.source.close()
+            self._on_done(self)
+
+
+class SharedStreams:
+    """
+    Single-flight for streamed reads. Concurrent callers with the same key get
+    readers over one response instead of one request each. A caller that
+    arrives after the first element has been consumed by everyone starts its
+    own request. `meta` is shared, so treat it as read-only.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def open(self, key, fetch):
+        """
+        A reader over fetch()'s StreamedArray, shared with concurrent calls for `key`;
+        returns (reader or None if fetch() returned None, shared).
+        """
+        with self._lock:
+            stream = self._streams.get(key)
+            reader = stream.join() if stream is not None else None
+            leader = reader is None
+            if leader:
+                stream = self._streams[key] = _SharedStream(lambda done: self._forget(key, done))
+                reader = stream.join()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        try:
+            if leader:
+                stream.open(fetch)
+            else:
+                stream.wait_open()
+        except BaseException:
+            reader.close()
+            raise
+        if stream.source is None:
+            reader.close()
+            return None, not leader
+        return reader, not leader
+
+    def _forget(self, key, stream):
+        with self._lock:
+            if self._streams.get(key) is stream:
+                del self._streams[key]
+
+    def metrics(self):
+        with self._lock:
+            return {"executed_total": self.executed, "coalesced_total": self.coalesced,
+                    "in_flight": len(self._streams)}
+
+
+class _AsyncSharedStreamReader:
+    """One caller's view of an _AsyncSharedStream; used like an AsyncStreamedArray."""
+    def __init__(self, shared):
+        self._shared = shared
+
+    @property
+    def meta(self):
+        return self._shared.source.meta
+
+    async def __aiter__(self):
+        try:
+            while True:
+                item = await self._shared.next(self)
+                if item is _END:
+                    return
+                yield item
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        await self._shared.leave(self)
+
+
+class _AsyncSharedStream(_SharedStream):
+    """asyncio counterpart of _SharedStream over an AsyncStreamedArray."""
+    reader_type = _AsyncSharedStreamReader
+
+    def __init__(self, on_done):
+        super().__init__(on_done)
+        self._opened = asyncio.Event()
+        self._pull_lock = asyncio.Lock()
+
+    async def open(self, fetch):
+        try:
+            self.source = await fetch()
+            self._items = aiter(self.source) if self.source is not None else None
+        except BaseException as e:
+            self.error = e
+            raise
+        finally:
+            self._opened.set()
+        if self.source is not None and not self._positions:  # every caller gave up meanwhile
+            await self.source.aclose()
+
+    async def next(self, reader):
+        with self._lock:
+            known, item = self._take(reader)
+        if known:
+            return item
+        async with self._pull_lock:
+            with self._lock:
+                known, item = self._take(reader)
+            if known:
+                return item
+            try:
+                item = await anext(self._items)
+            except StopAsyncIteration:
+                with self._lock:
+                    self._exhausted = True
+                return _END
+            except Exception as e:
+                with self._lock:
+                    self.error = e
+                raise
+            with self._lock:
+                self._buffer.append(item)
+                return self._take(reader)[1]
+
+    async def leave(self, reader):
+        with self._lock:
+            if self._positions.pop(reader, None) is None:
+                return
+            self._trim()
+            last = not self._positions
+        if last:
+            if self.source is not None:
+                await self.source.aclose()
+            self._on_done(self)
+
+
+class AsyncSharedStreams(SharedStreams):
+    """
+    asyncio counterpart of SharedStreams. The request runs as its own task, so
+    a caller being cancelled never cancels it for the others.
+    """
+    async def open(self, key, fetch):
+        """Await a reader over fetch()'s AsyncStreamedArray; returns (reader or None, shared)."""
+        stream = self._streams.get(key)
+        reader = stream.join() if stream is not None else None
+        leader = reader is None
+        if leader:
+            stream = self._streams[key] = _AsyncSharedStream(lambda done: self._forget(key, done))
+            stream.opening = asyncio.ensure_future(stream.open(fetch))
+            reader = stream.join()
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        try:
+            await asyncio.shield(stream.opening)
+        except BaseException:
+            await reader.aclose()
+            raise
+        if stream.source is None:
+            await reader.aclose()
+            return None, not leader
+        return reader, not leader
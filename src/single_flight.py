@@ -0,0 +1,109 @@
+import asyncio
+import copy
+import os
+import threading
+
+# Endpoints that are POSTed to but only read, so identical bodies can share a response.
+READ_ONLY_POSTS = frozenset({"/rest/api/3/search/jql", "/rest/api/3/search"})
+
+
+def coalescing_enabled():
+    """JIRA_COALESCE_READS (default on)."""
+    return os.getenv("JIRA_COALESCE_READS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def request_key(method, endpoint, params=None, body=None):
+    """Hashable identity of a read: method, endpoint, sorted params and encoded body."""
+    return (method, endpoint, tuple(sorted((params or {}).items())), body)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Thread-level request coalescing: while a call for `key` is in flight,
+    other callers with the same key wait for it and get its result instead
+    of repeating it. When a result is shared, every caller gets its own deep
+    copy, so one caller changing it never shows through to another.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """Run fn() once per concurrent `key`; returns (result, shared)."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.followers += 1
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result), True
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]  # no one can join from here, so `followers` is final
+            call.done.set()
+        return (copy.deepcopy(call.result) if call.followers else call.result), False
+
+    def metrics(self):
+        with self._lock:
+            return {"executed_total": self.executed, "coalesced_total": self.coalesced,
+                    "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight. The shared call runs as its own task,
+    so a caller being cancelled never cancels the request for the others.
+    Callers join only while the task is running, and a shared result is deep
+    copied per caller, as in SingleFlight.
+    """
+    def __init__(self):
+        self._calls = {}  # key -> [task, followers]
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key, fn):
+        """Await fn() once per concurrent `key`; returns (result, shared)."""
+        call = self._calls.get(key)
+        if call is not None and not call[0].done():
+            call[1] += 1
+            self.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(call[0])), True
+        task = asyncio.ensure_future(fn())
+        call = self._calls[key] = [task, 0]
+        self.executed += 1
+        task.add_done_callback(lambda done: self._forget(key, call))
+        result = await asyncio.shield(task)
+        return (copy.deepcopy(result) if call[1] else result), False
+
+    def _forget(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def metrics(self):
+        return {"executed_total": self.executed, "coalesced_total": self.coalesced,
+                "in_flight": len(self._calls)}
+
@@ -0,0 +1,169 @@
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+DEFAULT_SITE = "default"
+
+
+def configured_sites():
+    """Named sites from JIRA_SITES (comma-separated), in addition to the default one."""
+    return [name.strip().lower() for name in os.getenv("JIRA_SITES", "").split(",") if name.strip()]
+
+
+def project_routes(sites=None):
+    """Project key -> site, from JIRA_SITE_<SITE>_PROJECTS. Unlisted projects use the default site."""
+    routes = {}
+    for site in configured_sites() if sites is None else sites:
+        for key in os.getenv(f"JIRA_SITE_{site.upper()}_PROJECTS", "").split(","):
+            if key.strip():
+                routes[key.strip().upper()] = site
+    return routes
+
+
+def project_of(issue_key):
+    """Project key of an issue key (ABC-12 -> ABC)."""
+    return issue_key.rsplit("-", 1)[0] if issue_key else None
+
+
+def build_tenant_service(site):
+    """
+    AsyncJiraService for a named site with its own settings, connection pool,
+    metadata cache and (in mirror mode) mirror file. The rate limiter is the
+    process-wide one for the site's URL, so tenants that reach the same JIRA
+    under different names or credentials share its budget.
+    """
+    from .async_jira_client import AsyncJiraClient
+    from .async_jira_service import AsyncJiraService
+    from .issue_mirror import IssueMirror
+    from .jira_settings import JiraSettings
+
+    client = AsyncJiraClient(JiraSettings.from_env(site))
+    mirror = IssueMirror.from_env(site) if os.getenv("JIRA_READ_MODE", "live") == "mirror" else None
+    return AsyncJiraService(client, mirror=mirror)
+
+
+class TenantRegistry:
+    """
+    Services for named JIRA sites, built on first use by `factory(site)`.
+    Each keeps its own pool and caches. Tenants unused for `max_idle`
+    seconds, or beyond `max_tenants` (least recently used first), are closed
+    and dropped so memory stays bounded; the next call rebuilds them.
+    Calls hold a service through `checkout(site)`: a checked-out tenant is not
+    idle, and if it is evicted anyway (over `max_tenants`) its close waits
+    until the last checkout ends.
+    """
+    def __init__(self, factory=build_tenant_service, max_idle=600, max_tenants=16, routes=None,
+                 clock=time.monotonic):
+        self.factory = factory
+        self.max_idle = max_idle
+        self.max_tenants = max_tenants
+        self.routes = project_routes() if routes is None else routes
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._tenants = OrderedDict()  # site -> [service, last_used, checkouts]
+        self._retired = {}  # id(service) -> entry: evicted while checked out, closed on the last release
+        self._closing = set()
+        self.created = 0
+        self.evicted = 0
+
+    @classmethod
+    def from_env(cls, factory=build_tenant_service):
+        """JIRA_TENANT_IDLE_SECONDS (default 600) and JIRA_TENANT_MAX (default 16)."""
+        return cls(factory, max_idle=float(os.getenv("JIRA_TENANT_IDLE_SECONDS", "600")),
+                   max_tenants=int(os.getenv("JIRA_TENANT_MAX", "16")))
+
+    def resolve(self, site=None, project_key=None):
+        """Site name for a call: explicit `site`, else the project's site, else the default."""
+        if site:
+            return site.strip().lower()
+        if project_key:
+            return self.routes.get(project_key.upper(), DEFAULT_SITE)
+        return DEFAULT_SITE
+
+    def get(self, site):
+        """The service for `site`, creating it (and evicting idle tenants) as needed."""
+        return self._acquire(site, hold=False)
+
+    @contextmanager
+    def checkout(self, site):
+        """get(site) for the length of the block; the service is not closed before the block ends."""
+        service = self._acquire(site, hold=True)
+        try:
+            yield service
+        finally:
+            self._release(site, service)
+
+    def _acquire(self, site, hold):
+        built = None
+        while True:
+            now = self.clock()
+            with self._lock:
+                entry = self._tenants.pop(site, None)
+                if entry is None and built is not None:
+                    entry, built = [built, now, 0], None
+                    self.created += 1
+                if entry is not None:
+                    entry[1] = now
+                    entry[2] += hold
+                    self._tenants[site] = entry
+                    evicted = [name for name, (_, used, held) in self._tenants.items()
+                               if name != site and not held and now - used > self.max_idle]
+                    over = len(self._tenants) - len(evicted) - self.max_tenants
+                    if over > 0:  # least recently used first, preferring tenants not in use
+                        rest = [name for name in self._tenants if name != site and name not in evicted]
+                        evicted += sorted(rest, key=lambda name: self._tenants[name][2] > 0)[:over]
+                    closing = self._evict(evicted)
+                    break
+            # Built outside the lock so one tenant's client setup does not stall the others.
+            built = self.factory(site)
+        if built is not None:  # another caller built the same site first
+            closing.append(built)
+        for service in closing:
+            self._close(service)
+        return entry[0]
+
+    def _evict(self, names):
+        """Drop `names` (under the lock); returns the services that can be closed now."""
+        closing = []
+        for name in names:
+            entry = self._tenants.pop(name)
+            if entry[2]:
+                self._retired[id(entry[0])] = entry
+            else:
+                closing.append(entry[0])
+        self.evicted += len(names)
+        return closing
+
+    def _release(self, site, service):
+        with self._lock:
+            entry = self._tenants.get(site)
+            if entry is None or entry[0] is not service:
+                entry = self._retired[id(service)]
+            entry[2] -= 1
+            close = entry[2] == 0 and self._retired.pop(id(service), None) is not None
+        if close:
+            self._close(service)
+
+    def _close(self, service):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                asyncio.run(service.aclose())
+            except Exception as e:
+                print(f"Closing tenant service failed: {e}")
+            return
+        task = loop.create_task(service.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def metrics(self):
+        now = self.clock()
+        with self._lock:
+            return {"idle_seconds": {name: round(now - used, 1) for name, (_, used, _) in self._tenants.items()},
+                    "in_use": {name: held for name, (_, _, held) in self._tenants.items() if held},
+                    "created_total": self.created, "evicted_total": self.evicted,
+                    "closing_after_use": len(self._retired)}
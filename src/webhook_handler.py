@@ -0,0 +1,115 @@
+import hashlib
+import hmac
+import os
+
+from .issue_mirror import MIRROR_FIELDS
+
+ISSUE_EVENTS = ("jira:issue_created", "jira:issue_updated")
+COMMENT_EVENTS = ("comment_created", "comment_updated", "comment_deleted")
+
+
+def verify_signature(secret, body, signature):
+    """
+    Check JIRA's `X-Hub-Signature: sha256=<hex>` header (HMAC-SHA256 of the raw body).
+    Always False when no secret is configured.
+    """
+    if not secret or not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.split("=", 1)[1])
+
+
+def status_change(event):
+    """(from, to) status names if the event's changelog moved the issue, else None."""
+    for item in (event.get("changelog") or {}).get("items", []):
+        if item.get("field") == "status":
+            return item.get("fromString"), item.get("toString")
+    return None
+
+
+class WebhookHandler:
+    """
+    Applies JIRA webhook events to local state so reads need not poll:
+    - jira:issue_created / jira:issue_updated: the issue is written to the mirror
+      (mirrored fields only; out-of-order events older than the stored copy are skipped)
+      and its cached views are dropped; a status change also drops cached transitions.
+    - jira:issue_deleted: the issue is removed from the mirror and caches.
+    - comment_*: cached views are dropped; mirrored fields in the payload are merged.
+    Unsigned events (only accepted with `allow_unsigned`) are hints: the issue's views
+    and mirror copy are dropped so the next read fetches it from JIRA, and the payload
+    itself is never stored.
+    """
+    def __init__(self, cache, mirror=None, secret=None, allow_unsigned=False):
+        self.cache = cache
+        self.mirror = mirror
+        self.secret = secret
+        self.allow_unsigned = allow_unsigned
+        self.received = 0
+        self.applied = {}
+
+    @classmethod
+    def from_env(cls, cache, mirror=None):
+        """
+        JIRA_WEBHOOK_SECRET is required for deliveries to be applied;
+        JIRA_WEBHOOK_ALLOW_UNSIGNED=1 accepts unsigned ones as invalidation hints.
+        """
+        allow_unsigned = os.getenv("JIRA_WEBHOOK_ALLOW_UNSIGNED", "0").strip().lower() in ("1", "true", "yes", "on")
+        return cls(cache, mirror, secret=os.getenv("JIRA_WEBHOOK_SECRET") or None, allow_unsigned=allow_unsigned)
+
+    def handle(self, event, signed=True):
+        """Apply one decoded webhook body; returns a short report of what changed."""
+        self.received += 1
+        name = event.get("webhookEvent", "")
+        issue = event.get("issue") or {}
+        key = issue.get("key")
+        report = {"event": name, "key": key, "actions": []}
+        if not key:
+            return report
+
+        if not signed:
+            if name == "jira:issue_deleted" or name in ISSUE_EVENTS or name in COMMENT_EVENTS:
+                self.cache.invalidate_prefix("issue_view", f"{key}|")
+                self.cache.invalidate("transitions", key)
+                report["actions"].append("views_invalidated")
+                if self.mirror is not None:
+                    self.mirror.touch(key)
+                    report["actions"].append("mirror_invalidated")
+        elif name == "jira:issue_deleted":
+            self.cache.invalidate_prefix("issue_view", f"{key}|")
+            self.cache.invalidate("transitions", key)
+            report["actions"].append("views_invalidated")
+            if self.mirror is not None:
+                self.mirror.delete(key)
+                report["actions"].append("mirror_deleted")
+        elif name in ISSUE_EVENTS or name in COMMENT_EVENTS:
+            self.cache.invalidate_prefix("issue_view", f"{key}|")
+            report["actions"].append("views_invalidated")
+            if status_change(event):
+                self.cache.invalidate("transitions", key)
+                report["actions"].append("transitions_invalidated")
+            if self.mirror is not None and self._merge(issue, complete=name in ISSUE_EVENTS):
+                report["actions"].append("mirror_updated")
+
+        if report["actions"]:
+            self.applied[name] = self.applied.get(name, 0) + 1
+        return report
+
+    def _merge(self, issue, complete):
+        """
+        Write the mirrored fields of `issue` over the stored copy. Partial payloads
+        (comment events) only update issues the mirror already holds.
+        """
+        incoming = {f: v for f, v in (issue.get("fields") or {}).items() if f in MIRROR_FIELDS}
+        stored = self.mirror.get(issue["key"])
+        if stored is None and not complete:
+            return False
+        if stored is not None:
+            known, new = stored.get("fields", {}).get("updated"), incoming.get("updated")
+            if known and new and new < known:
+                return False  # a newer version was already applied
+            incoming = {**stored.get("fields", {}), **incoming}
+        self.mirror.upsert([{"key": issue["key"], "id": issue.get("id"), "fields": incoming}])
+        return True
+
+    def metrics(self):
+        return {"received_total": self.received, "applied_total": dict(self.applied)}
@@ -0,0 +1,300 @@
+"""
+Declarative status / workflow / board-column provisioning.
+
+A `ProvisioningSpec` describes the desired state. `WorkflowProvisioner` fetches the
+current state once (statuses, the named workflow, the board's columns), `diff_state`
+computes the minimal change set, and `apply` sends it with the batched endpoints:
+one POST /statuses for all new statuses, one PUT /statuses for category changes,
+one workflows/create or workflows/update, and one board configuration PUT.
+A project is reconfigured in a handful of requests, with status IDs looked up by
+name instead of hardcoded.
+"""
+from dataclasses import dataclass, field
+
+# Status categories as the bulk status API names them, keyed by the legacy ids
+# (2=To Do, 4=In Progress, 3=Done) and the statusCategory keys GET /status returns.
+CATEGORY_BY_ID = {2: "TODO", 4: "IN_PROGRESS", 3: "DONE"}
+CATEGORY_BY_KEY = {"new": "TODO", "indeterminate": "IN_PROGRESS", "done": "DONE"}
+
+STATUS_ENDPOINT = "/rest/api/3/status"
+STATUSES_ENDPOINT = "/rest/api/3/statuses"
+WORKFLOWS_SEARCH_ENDPOINT = "/rest/api/3/workflows"
+WORKFLOWS_CREATE_ENDPOINT = "/rest/api/3/workflows/create"
+WORKFLOWS_UPDATE_ENDPOINT = "/rest/api/3/workflows/update"
+
+
+@dataclass(frozen=True)
+class StatusSpec:
+    name: str
+    category: str = "TODO"  # TODO | IN_PROGRESS | DONE
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    name: str
+    statuses: tuple  # status names
+
+
+@dataclass(frozen=True)
+class ProvisioningSpec:
+    """
+    Desired state for one project. `workflow` (a workflow name) gets every status
+    in `statuses` with a global transition into each; `columns` is applied to
+    `board_id`, or to the first board of `project_key`.
+    """
+    statuses: tuple
+    workflow: str = None
+    columns: tuple = ()
+    project_key: str = None
+    board_id: int = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """From JSON-style data: statuses as [name, category] pairs or {"name", "category"}."""
+        statuses = []
+        for item in data.get("statuses", []):
+            name, category = (item["name"], item.get("category", "TODO")) if isinstance(item, dict) else item
+            statuses.append(StatusSpec(name, normalize_category(category)))
+        columns = tuple(ColumnSpec(c["name"], tuple(c.get("statuses") or [c["name"]]))
+                        for c in data.get("columns", []))
+        return cls(tuple(statuses), data.get("workflow"), columns, data.get("project_key"), data.get("board_id"))
+
+
+def normalize_category(category):
+    """2 / "new" / "todo" -> "TODO", etc."""
+    if isinstance(category, int):
+        return CATEGORY_BY_ID[category]
+    value = str(category).strip()
+    return CATEGORY_BY_KEY.get(value.lower(), value.upper().replace(" ", "_"))
+
+
+@dataclass
+class ProvisioningState:
+    """Current state as fetched: statuses by lower-cased name, the workflow, the board columns."""
+    statuses: dict
+    workflow: dict = None
+    workflow_statuses: set = None  # lower-cased names of the workflow's statuses
+    board_id: int = None
+    columns: list = None
+
+
+@dataclass
+class ProvisioningPlan:
+    create_statuses: list = field(default_factory=list)
+    update_statuses: list = field(default_factory=list)  # (status id, StatusSpec)
+    workflow_action: str = None  # "create" | "update" | None
+    workflow_missing: list = field(default_factory=list)  # status names to add
+    columns: list = None  # new columnConfig columns (names), None if unchanged
+
+    def is_empty(self):
+        return not (self.create_statuses or self.update_statuses or self.workflow_action or self.columns)
+
+    def describe(self):
+        lines = [f"+ status {s.name} ({s.category})" for s in self.create_statuses]
+        lines += [f"~ status {s.name} -> {s.category}" for _, s in self.update_statuses]
+        if self.workflow_action == "create":
+            lines.append("+ workflow")
+        elif self.workflow_action == "update":
+            lines.append(f"~ workflow: add {', '.join(self.workflow_missing)}")
+        if self.columns is not None:
+            lines.append("~ board columns: " + " | ".join(c["name"] for c in self.columns))
+        return "\n".join(lines) or "No changes."
+
+
+def parse_statuses(data):
+    """GET /rest/api/3/status -> {lower name: {"id", "name", "category"}}."""
+    return {
+        s["name"].lower(): {"id": str(s["id"]), "name": s["name"],
+                            "category": CATEGORY_BY_KEY.get((s.get("statusCategory") or {}).get("key"), "TODO")}
+        for s in data or []
+    }
+
+
+def diff_state(spec, state):
+    """Minimal change set that takes `state` to `spec`."""
+    plan = ProvisioningPlan()
+    for status in spec.statuses:
+        current = state.statuses.get(status.name.lower())
+        if current is None:
+            plan.create_statuses.append(status)
+        elif current["category"] != status.category:
+            plan.update_statuses.append((current["id"], status))
+
+    if spec.workflow:
+        if state.workflow is None:
+            plan.workflow_action = "create"
+        else:
+            plan.workflow_missing = [s.name for s in spec.statuses if s.name.lower() not in state.workflow_statuses]
+            if plan.workflow_missing:
+                plan.workflow_action = "update"
+
+    if spec.columns:
+        desired = [{"name": c.name, "statuses": [n.lower() for n in c.statuses]} for c in spec.columns]
+        if desired != state.columns:
+            plan.columns = desired
+    return plan
+
+
+def _status_ref(status_id, name, category):
+    return {"id": status_id, "name": name, "statusCategory": category, "statusReference": status_id}
+
+
+def workflow_create_payload(name, statuses):
+    """
+    workflows/create body for `statuses` [(id, name, category)]: an initial transition
+    into the first status and a global transition into every status.
+    """
+    transitions = [{"id": "1", "name": "Create", "type": "INITIAL", "toStatusReference": statuses[0][0],
+                    "links": [], "properties": {}}]
+    transitions += [{"id": str(11 + 10 * i), "name": status_name, "type": "GLOBAL",
+                     "toStatusReference": status_id, "links": [], "properties": {}}
+                    for i, (status_id, status_name, _) in enumerate(statuses)]
+    return {
+        "scope": {"type": "GLOBAL"},
+        "statuses": [_status_ref(*s) for s in statuses],
+        "workflows": [{
+            "name": name,
+            "description": "Provisioned via AI Agent",
+            "statuses": [{"statusReference": s[0], "properties": {}} for s in statuses],
+            "transitions": transitions,
+        }],
+    }
+
+
+def workflow_update_payload(workflow, added):
+    """workflows/update body adding `added` [(id, name, category)] with a global transition each."""
+    used = [int(t["id"]) for t in workflow["transitions"] if str(t.get("id", "")).isdigit()]
+    next_id = max(used, default=1) + 10
+    transitions = list(workflow["transitions"])
+    for offset, (status_id, status_name, _) in enumerate(added):
+        transitions.append({"id": str(next_id + 10 * offset), "name": status_name, "type": "GLOBAL",
+                            "toStatusReference": status_id, "links": [], "properties": {}})
+    return {
+        "statuses": [_status_ref(*s) for s in added],
+        "workflows": [{
+            "id": workflow["id"],
+            "version": workflow["version"],
+            "statuses": list(workflow["statuses"]) + [{"statusReference": s[0], "properties": {}} for s in added],
+            "transitions": transitions,
+        }],
+    }
+
+
+class WorkflowProvisioner:
+    """
+    Fetch, diff and apply a ProvisioningSpec through a JiraService.
+    `requests` counts the JIRA calls made, for comparison with the old scripts.
+    """
+    def __init__(self, service):
+        self.service = service
+        self.client = service.client
+        self.requests = 0
+
+    def _call(self, method, *args, **kwargs):
+        self.requests += 1
+        return getattr(self.client, method)(*args, **kwargs)
+
+    def fetch(self, spec):
+        """Current state in one request per resource (statuses, workflow, board)."""
+        statuses = self._call("get", STATUS_ENDPOINT)
+        if statuses is None:
+            return None
+        state = ProvisioningState(parse_statuses(statuses))
+
+        if spec.workflow:
+            data = self._call("post", WORKFLOWS_SEARCH_ENDPOINT, {"workflowNames": [spec.workflow]})
+            workflows = (data or {}).get("workflows", [])
+            if workflows:
+                names = {s["statusReference"]: s["name"].lower() for s in (data.get("statuses") or [])}
+                state.workflow = workflows[0]
+                state.workflow_statuses = {names.get(s["statusReference"], "") for s in state.workflow.get("statuses", [])}
+
+        if spec.columns:
+            state.board_id = spec.board_id or self._find_board(spec.project_key)
+            if state.board_id is not None:
+                config = self._call("get", f"/rest/agile/1.0/board/{state.board_id}/configuration")
+                if config is not None:
+                    by_id = {s["id"]: s["name"].lower() for s in state.statuses.values()}
+                    state.columns = [
+                        {"name": c["name"], "statuses": [by_id.get(str(s["id"]), str(s["id"])) for s in c["statuses"]]}
+                        for c in config.get("columnConfig", {}).get("columns", [])
+                    ]
+        return state
+
+    def _find_board(self, project_key):
+        if not project_key:
+            return None
+        data = self._call("get", "/rest/agile/1.0/board", params={"projectKeyOrId": project_key})
+        boards = (data or {}).get("values", [])
+        return boards[0]["id"] if boards else None
+
+    def apply(self, spec, state, plan):
+        """
+        Send the plan; returns {"ok", "status_ids", "errors"}. Later steps that need
+        IDs from a failed step are skipped.
+        """
+        status_ids = {name: s["id"] for name, s in state.statuses.items()}
+        errors = []
+
+        if plan.create_statuses:
+            payload = {"scope": {"type": "GLOBAL"},
+                       "statuses": [{"name": s.name, "statusCategory": s.category,
+                                     "description": f"Created via AI Agent: {s.name}"} for s in plan.create_statuses]}
+            created = self._call("post", STATUSES_ENDPOINT, payload)
+            if created is None:
+                errors.append("create statuses")
+            else:
+                for item in created:
+                    status_ids[item["name"].lower()] = str(item["id"])
+                # The status list cached by create_status is now stale.
+                self.service.cache.invalidate("statuses")
+
+        if plan.update_statuses:
+            payload = {"statuses": [{"id": sid, "name": s.name, "statusCategory": s.category}
+                                    for sid, s in plan.update_statuses]}
+            if self._call("put", STATUSES_ENDPOINT, payload) is None:
+                errors.append("update statuses")
+
+        def resolved(names):
+            by_name = {s.name.lower(): s for s in spec.statuses}
+            refs = [(status_ids.get(n.lower()), n, by_name[n.lower()].category) for n in names]
+            return refs if all(ref[0] for ref in refs) else None
+
+        if plan.workflow_action == "create":
+            refs = resolved([s.name for s in spec.statuses])
+            if refs is None or self._call("post", WORKFLOWS_CREATE_ENDPOINT,
+                                          workflow_create_payload(spec.workflow, refs)) is None:
+                errors.append("create workflow")
+        elif plan.workflow_action == "update":
+            refs = resolved(plan.workflow_missing)
+            if refs is None or self._call("post", WORKFLOWS_UPDATE_ENDPOINT,
+                                          workflow_update_payload(state.workflow, refs)) is None:
+                errors.append("update workflow")
+
+        if plan.columns is not None:
+            ids = [[status_ids.get(n) for n in c["statuses"]] for c in plan.columns]
+            if state.board_id is None or not all(all(col) for col in ids):
+                errors.append("board columns")
+            else:
+                payload = {"columnConfig": {"columns": [
+                    {"name": c["name"], "statuses": [{"id": i} for i in col]} for c, col in zip(plan.columns, ids)
+                ]}}
+                # Not every JIRA Cloud site accepts this (no public column API); reported as an error then.
+                if self._call("put", f"/rest/agile/1.0/board/{state.board_id}/configuration", payload) is None:
+                    errors.append("board columns")
+
+        return {"ok": not errors, "status_ids": status_ids, "errors": errors}
+
+    def provision(self, spec, dry_run=False):
+        """Fetch, diff and (unless dry_run) apply. Returns the report with the plan and request count."""
+        state = self.fetch(spec)
+        if state is None:
+            return {"ok": False, "errors": ["fetch statuses"], "plan": None, "requests": self.requests}
+        plan = diff_state(spec, state)
+        print(plan.describe())
+        if dry_run or plan.is_empty():
+            status_ids = {name: s["id"] for name, s in state.statuses.items()}
+            return {"ok": True, "errors": [], "status_ids": status_ids, "plan": plan, "requests": self.requests}
+        report = self.apply(spec, state, plan)
+        report.update(plan=plan, requests=self.requests)
+        return report
@@ -0,0 +1,523 @@
+"""
+Durable write-ahead outbox for JIRA mutations.
+
+`Outbox.submit()` appends a mutation (create_issue, add_comment,
+transition_issue, assign_task, update_issue) to a local SQLite log and
+returns as soon as it is on disk; a background sender then applies the
+log to JIRA with the sync JiraService. The sender:
+
+- sends due entries in batches: first-attempt creates go through one
+  /issue/bulk request, the rest run concurrently. Writes to the same issue
+  keep their order: an entry waits while an earlier one for that issue is
+  pending, including one backing off after a failure.
+- retries failed writes with exponential backoff and marks an entry failed
+  after `max_attempts`, so JIRA slowdowns delay writes instead of losing them.
+- tags creates and comments with their idempotency key (an entity property).
+  A retry first looks for the tagged issue or comment, so a write whose
+  response was lost is not applied twice. Transitions check the current
+  status; assignments and updates are PUTs and safe to repeat.
+
+Submitting a key that is already in the log returns the existing entry.
+
+Several processes may share the log (each agent host runs its own MCP server,
+and `jira_agent.py outbox` can run next to them). A sender claims an entry
+with a conditional UPDATE (owner plus lease) before sending it, and the claim
+counts as an attempt. An entry claimed before - whose earlier send may have
+reached JIRA, even if its process died before recording it - is always
+checked against JIRA first, as above.
+"""
+import inspect
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from . import bulk_operations
+from . import jira_payloads
+from .retry_policy import RetryPolicy
+
+DEFAULT_OUTBOX_PATH = os.path.join("~", ".cache", "jira_agent", "outbox.sqlite3")
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 10
+# Sent and failed entries are kept this long (seconds) for outbox_status.
+OUTBOX_RETENTION = 7 * 24 * 3600
+# Issue/comment property holding the idempotency key of the write that created it.
+OUTBOX_PROPERTY = "jira_agent.outbox"
+# How far back a retried create looks for an issue it may already have created.
+CREATED_LOOKBACK = "-2d"
+# Seconds a sender's claim on an entry lasts; after that another sender may take it over.
+OUTBOX_LEASE = 300.0
+
+PENDING, SENT, FAILED = "pending", "sent", "failed"
+
+
+@dataclass
+class Mutation:
+    """One logged write. `id` is its idempotency key."""
+    id: str
+    kind: str
+    params: dict
+    site: str = None
+    status: str = PENDING
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    result: dict = None
+    error: str = None
+    created_at: float = None
+    sent_at: float = None
+    owner: str = None
+    lease_until: float = None
+
+    @property
+    def resent(self):
+        """True once claimed more than once: an earlier send may already have reached JIRA."""
+        return self.attempts > 1
+
+    def in_flight(self, now):
+        """Claimed by a sender whose lease is still running."""
+        return self.lease_until is not None and self.lease_until > now
+
+    @property
+    def target(self):
+        """Writes with the same target are applied in submission order (None: unordered)."""
+        issue_key = self.params.get("issue_key")
+        return f"{self.site}|{issue_key.upper()}" if issue_key else None
+
+    def summary(self):
+        return {"id": self.id, "kind": self.kind, "site": self.site, "status": self.status,
+                "attempts": self.attempts, "created_at": self.created_at, "sent_at": self.sent_at,
+                "next_attempt_at": self.next_attempt_at if self.status == PENDING else None,
+                "result": self.result, "error": self.error}
+
+
+_COLUMNS = ("id, kind, site, params, status, attempts, next_attempt_at, result, error, created_at, sent_at,"
+            " owner, lease_until")
+
+
+def _mutation(row):
+    return Mutation(id=row[0], kind=row[1], site=row[2], params=json.loads(row[3]), status=row[4],
+                    attempts=row[5], next_attempt_at=row[6], result=json.loads(row[7]) if row[7] else None,
+                    error=row[8], created_at=row[9], sent_at=row[10], owner=row[11], lease_until=row[12])
+
+
+class OutboxStore:
+    """SQLite log of mutations in submission order; thread-safe."""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # An acknowledged write must survive a crash or power loss.
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS mutations ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL UNIQUE, kind TEXT NOT NULL, site TEXT,"
+            " params TEXT NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0,"
+            " next_attempt_at REAL NOT NULL DEFAULT 0, result TEXT, error TEXT,"
+            " created_at REAL NOT NULL, sent_at REAL, owner TEXT, lease_until REAL)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(mutations)")}
+        for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE mutations ADD COLUMN {column} {kind}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS mutations_status ON mutations (status, seq)")
+        self._conn.commit()
+
+    def _execute(self, sql, args=()):
+        with self._lock:
+            self._conn.execute(sql, args)
+            self._conn.commit()
+
+    def append(self, mutation):
+        """Log `mutation`; returns the stored entry (the earlier one if its id was already logged)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO mutations (id, kind, site, params, status, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (mutation.id, mutation.kind, mutation.site, json.dumps(mutation.params), PENDING,
+                 mutation.created_at))
+            self._conn.commit()
+        return self.get(mutation.id)
+
+    def get(self, mutation_id):
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM mutations WHERE id = ?", (mutation_id,)).fetchone()
+        return _mutation(row) if row is not None else None
+
+    def pending(self, limit=1000):
+        """The oldest `limit` pending entries, in submission order."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM mutations WHERE status = ? ORDER BY seq LIMIT ?",
+                                      (PENDING, limit)).fetchall()
+        return [_mutation(row) for row in rows]
+
+    def claim(self, mutations, owner, lease=OUTBOX_LEASE):
+        """
+        Atomically take the pending, unclaimed (or lease-expired) entries among `mutations`
+        for `owner`, counting an attempt on each. Returns the claimed entries, refreshed.
+        """
+        now = time.time()
+        claimed = []
+        with self._lock:
+            for mutation in mutations:
+                changed = self._conn.execute(
+                    "UPDATE mutations SET owner = ?, lease_until = ?, attempts = attempts + 1"
+                    " WHERE id = ? AND status = ? AND COALESCE(lease_until, 0) <= ?",
+                    (owner, now + lease, mutation.id, PENDING, now)).rowcount
+                if changed:
+                    claimed.append(mutation.id)
+            self._conn.commit()
+        return [m for m in map(self.get, claimed) if m is not None]
+
+    def mark_sent(self, mutation, result):
+        mutation.status, mutation.result, mutation.sent_at = SENT, result, time.time()
+        self._execute("UPDATE mutations SET status = ?, result = ?, error = NULL, sent_at = ?, lease_until = NULL"
+                      " WHERE id = ? AND owner IS ?", (SENT, json.dumps(result), mutation.sent_at, mutation.id,
+                                                       mutation.owner))
+
+    def mark_retry(self, mutation, next_attempt_at, error):
+        mutation.next_attempt_at, mutation.error = next_attempt_at, error
+        self._execute("UPDATE mutations SET next_attempt_at = ?, error = ?, lease_until = NULL"
+                      " WHERE id = ? AND owner IS ?", (next_attempt_at, error, mutation.id, mutation.owner))
+
+    def mark_failed(self, mutation, error):
+        mutation.status, mutation.error = FAILED, error
+        self._execute("UPDATE mutations SET status = ?, error = ?, sent_at = ?, lease_until = NULL"
+                      " WHERE id = ? AND owner IS ?", (FAILED, error, time.time(), mutation.id, mutation.owner))
+
+    def prune(self, max_age):
+        """Drop sent and failed entries older than `max_age` seconds."""
+        self._execute("DELETE FROM mutations WHERE status IN (?, ?) AND sent_at < ?",
+                      (SENT, FAILED, time.time() - max_age))
+
+    def counts(self):
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM mutations GROUP BY status").fetchall())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def next_batch(pending, now, size, skip=()):
+    """
+    Due entries to send together, in order: at most one per issue, and none
+    queued behind an earlier pending entry for the same issue. Entries another
+    sender is sending, and ids in `skip`, are treated as not due.
+    """
+    batch, seen = [], set()
+    for mutation in pending:
+        target = mutation.target
+        if target is not None:
+            if target in seen:
+                continue
+            seen.add(target)
+        if mutation.next_attempt_at <= now and not mutation.in_flight(now) and mutation.id not in skip:
+            batch.append(mutation)
+            if len(batch) >= size:
+                break
+    return batch
+
+
+def _marker(mutation):
+    return [{"key": OUTBOX_PROPERTY, "value": {"id": mutation.id}}]
+
+
+def _tagged(properties, mutation):
+    """True if `properties` (a list of {key, value} or a {key: value} dict) carry this mutation's key."""
+    if isinstance(properties, list):
+        properties = {p.get("key"): p.get("value") for p in properties}
+    return ((properties or {}).get(OUTBOX_PROPERTY) or {}).get("id") == mutation.id
+
+
+def _find_created(service, mutation, project_key):
+    """Key of an issue an earlier attempt of `mutation` already created, or None."""
+    payload = jira_payloads.search_payload(
+        f'project = "{project_key}" AND reporter = currentUser() AND created >= {CREATED_LOOKBACK}'
+        " ORDER BY created DESC", ["summary"], max_results=100)
+    payload["properties"] = [OUTBOX_PROPERTY]
+    data = service.client.post("/rest/api/3/search/jql", payload) or {}
+    return next((i["key"] for i in data.get("issues", []) if _tagged(i.get("properties"), mutation)), None)
+
+
+def _find_comment(service, mutation, issue_key):
+    """Id of a comment an earlier attempt of `mutation` already added, or None."""
+    data = service.client.get(f"/rest/api/3/issue/{issue_key}/comment",
+                              params={"expand": "properties", "orderBy": "-created", "maxResults": 100}) or {}
+    return next((c["id"] for c in data.get("comments", []) if _tagged(c.get("properties"), mutation)), None)
+
+
+# --- Senders: sender(service, mutation, **params) -> result dict, or None if the write failed. ---
+
+def _create_issue(service, mutation, summary, description, issue_type="Task", project_key=None):
+    project_key = project_key or service.project_key
+    if mutation.resent:
+        key = _find_created(service, mutation, project_key)
+        if key:
+            return {"key": key}
+    payload = jira_payloads.issue_payload(project_key, summary, description, issue_type)
+    payload["properties"] = _marker(mutation)
+    data = service.client.post("/rest/api/3/issue", payload)
+    if not data or not data.get("key"):
+        return None
+    if service.mirror is not None:
+        service.mirror.mark_dirty(project_key)
+    return {"key": data["key"]}
+
+
+def _add_comment(service, mutation, issue_key, comment_text):
+    if mutation.resent:
+        comment_id = _find_comment(service, mutation, issue_key)
+        if comment_id:
+            return {"comment_id": comment_id}
+    payload = jira_payloads.comment_payload(comment_text)
+    payload["properties"] = _marker(mutation)
+    data = service.client.post(f"/rest/api/3/issue/{issue_key}/comment", payload)
+    return {"comment_id": data.get("id")} if data is not None else None
+
+
+def _transition_issue(service, mutation, issue_key, status_name="In Progress"):
+    if mutation.resent:
+        issue = service.client.get(f"/rest/api/3/issue/{issue_key}", params=jira_payloads.issue_params(["status"]))
+        current = (((issue or {}).get("fields") or {}).get("status") or {}).get("name") or ""
+        if current.lower() == status_name.lower():
+            return {"status": current}
+    return {"status": status_name} if service.transition_issue(issue_key, status_name) else None
+
+
+def _assign_task(service, mutation, issue_key, account_id=None):
+    return {} if service.assign_task(issue_key, account_id) else None
+
+
+def _update_issue(service, mutation, issue_key, summary=None, description=None):
+    return {} if service.update_issue(issue_key, summary, description) else None
+
+
+SENDERS = {
+    "create_issue": _create_issue,
+    "add_comment": _add_comment,
+    "transition_issue": _transition_issue,
+    "assign_task": _assign_task,
+    "update_issue": _update_issue,
+}
+
+
+def _bulk_create(service, mutations):
+    """First-attempt creates in /issue/bulk requests; returns a result (or None) per mutation."""
+    results = []
+    for offset, chunk in bulk_operations.chunked(mutations, bulk_operations.BULK_CREATE_CHUNK_SIZE):
+        updates = []
+        for mutation in chunk:
+            params = mutation.params
+            update = jira_payloads.issue_payload(params.get("project_key") or service.project_key, params["summary"],
+                                                 params["description"], params.get("issue_type", "Task"))
+            update["properties"] = _marker(mutation)
+            updates.append(update)
+        data = service.client.post(bulk_operations.BULK_CREATE_ENDPOINT, {"issueUpdates": updates})
+        for result in bulk_operations.parse_bulk_create_response(data, offset, len(chunk)):
+            results.append({"key": result["key"]} if result["ok"] else None)
+    if service.mirror is not None and any(results):
+        for project_key in {m.params.get("project_key") or service.project_key for m in mutations}:
+            service.mirror.mark_dirty(project_key)
+    return results
+
+
+def _build_service(site=None):
+    from .job_queue import build_job_service
+
+    return build_job_service(site)
+
+
+class Outbox:
+    """
+    Write-ahead log plus its background sender. submit() returns once the
+    mutation is stored; start() (called by submit) runs the sender thread.
+    """
+    def __init__(self, store, service_factory=_build_service, batch_size=DEFAULT_BATCH_SIZE,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, retry_policy=None, poll_interval=5.0,
+                 max_workers=bulk_operations.DEFAULT_MAX_WORKERS):
+        self.store = store
+        self.service_factory = service_factory
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        # Slower than the client's own 429/503 retries: by the time a write lands here they have run out.
+        self.retry_policy = retry_policy or RetryPolicy(backoff_base=2.0, backoff_max=300.0)
+        self.poll_interval = poll_interval
+        self.max_workers = max_workers
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._services = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Condition()
+        self._thread = None
+        self._closed = False
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        """
+        JIRA_OUTBOX_PATH: SQLite file (default ~/.cache/jira_agent/outbox.sqlite3)
+        JIRA_OUTBOX_BATCH_SIZE: entries sent per batch (default 20)
+        JIRA_OUTBOX_MAX_ATTEMPTS: attempts before an entry is marked failed (default 10)
+        Other keyword arguments go to the constructor (e.g. service_factory).
+        """
+        path = os.path.expanduser(os.getenv("JIRA_OUTBOX_PATH", DEFAULT_OUTBOX_PATH))
+        kwargs.setdefault("batch_size", int(os.getenv("JIRA_OUTBOX_BATCH_SIZE", str(DEFAULT_BATCH_SIZE))))
+        kwargs.setdefault("max_attempts", int(os.getenv("JIRA_OUTBOX_MAX_ATTEMPTS", str(DEFAULT_MAX_ATTEMPTS))))
+        return cls(OutboxStore(path), **kwargs)
+
+    def start(self):
+        """Start the sender thread (once); it picks up entries left pending by a previous process."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.store.prune(OUTBOX_RETENTION)
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+
+    def submit(self, kind, params, site=None, idempotency_key=None):
+        """
+        Log a mutation and return its summary (status "pending"). Raises ValueError for an
+        unknown kind or bad params. Resubmitting an `idempotency_key` returns the first entry.
+        """
+        sender = SENDERS.get(kind)
+        if sender is None:
+            raise ValueError(f"Unknown mutation '{kind}'. Available: {', '.join(sorted(SENDERS))}")
+        params = dict(params or {})
+        try:
+            inspect.signature(sender).bind(None, None, **params)
+        except TypeError as e:
+            raise ValueError(f"Invalid params for {kind}: {e}")
+        if kind == "update_issue" and not (params.get("summary") or params.get("description")):
+            raise ValueError("update_issue needs a summary or a description")
+        mutation = self.store.append(Mutation(id=idempotency_key or uuid.uuid4().hex, kind=kind, params=params,
+                                              site=site, created_at=time.time()))
+        self.start()
+        with self._wake:
+            self._wake.notify_all()
+        return mutation.summary()
+
+    def status(self, mutation_id):
+        mutation = self.store.get(mutation_id)
+        return mutation.summary() if mutation is not None else None
+
+    def metrics(self):
+        return {"entries": self.store.counts(), "sent": self.sent, "retried": self.retried, "failed": self.failed}
+
+    def drain(self):
+        """
+        Send due entries now, in this thread, trying each at most once (a failed one stays
+        pending, and so do later writes to its issue). Returns the number of batches sent.
+        """
+        batches, tried = 0, set()
+        while True:
+            batch = next_batch(self.store.pending(), time.time(), self.batch_size, skip=tried)
+            if not batch:
+                return batches
+            tried.update(m.id for m in batch)
+            self._send(batch)
+            batches += 1
+
+    def flush(self, timeout=None):
+        """Wait until nothing is pending (or timeout); returns the number of entries still pending."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._wake:
+            while True:
+                pending = self.store.counts().get(PENDING, 0)
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not pending or (remaining is not None and remaining <= 0):
+                    return pending
+                self._wake.wait(remaining if remaining is not None else self.poll_interval)
+
+    def _service(self, site):
+        with self._lock:
+            if site not in self._services:
+                self._services[site] = self.service_factory(site)
+            return self._services[site]
+
+    def _loop(self):
+        while not self._closed:
+            try:
+                pending = self.store.pending()
+                batch = next_batch(pending, time.time(), self.batch_size)
+                if batch:
+                    self._send(batch)
+                    continue
+                # Sleep until the earliest retry or lease expiry, a submit() wakes us, or the poll
+                # interval. Entries already due are waiting on another owner's in-flight send.
+                now = time.time()
+                due = min((t for t in (max(m.next_attempt_at, m.lease_until or 0.0) for m in pending) if t > now),
+                          default=None)
+                delay = self.poll_interval if due is None else min(self.poll_interval, due - now)
+            except sqlite3.Error as e:
+                print(f"Outbox error: {e}")
+                delay = self.poll_interval
+            with self._wake:
+                if not self._closed:
+                    self._wake.wait(delay)
+
+    def _send(self, batch):
+        # Entries another sender claimed since they were read are left to it.
+        batch = self.store.claim(batch, self.owner)
+        by_site = {}
+        for mutation in batch:
+            by_site.setdefault(mutation.site, []).append(mutation)
+        for site, mutations in by_site.items():
+            try:
+                service = self._service(site)
+            except Exception as e:  # e.g. missing credentials for the site
+                for mutation in mutations:
+                    self._record(mutation, None, str(e))
+                continue
+            # Retried creates go one by one: each first looks for the issue it may have created.
+            creates = [m for m in mutations if m.kind == "create_issue" and not m.resent]
+            if len(creates) < 2:
+                creates = []
+            others = [m for m in mutations if m not in creates]
+            for mutation, result in zip(creates, _bulk_create(service, creates) if creates else []):
+                self._record(mutation, result)
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(others) or 1))) as pool:
+                outcomes = list(pool.map(lambda m: self._apply(service, m), others))
+            for mutation, (result, error) in zip(others, outcomes):
+                self._record(mutation, result, error)
+        with self._wake:
+            self._wake.notify_all()
+
+    def _apply(self, service, mutation):
+        try:
+            return SENDERS[mutation.kind](service, mutation, **mutation.params), None
+        except Exception as e:
+            return None, str(e)
+
+    def _record(self, mutation, result, error=None):
+        if result is not None:
+            self.store.mark_sent(mutation, result)
+            self.sent += 1
+            return
+        error = error or "JIRA did not accept the write"
+        if mutation.attempts >= self.max_attempts:
+            print(f"Outbox: giving up on {mutation.kind} {mutation.id} after {mutation.attempts} attempts: {error}")
+            self.store.mark_failed(mutation, error)
+            self.failed += 1
+            return
+        self.store.mark_retry(mutation, time.time() + self.retry_policy.delay(mutation.attempts - 1), error)
+        self.retried += 1
+
+    def close(self):
+        """Stop the sender after its current batch; pending entries stay in the log."""
+        self._closed = True
+        with self._wake:
+            self._wake.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,5 @@
+import os
+
+# Tests mock the HTTP session; keep JiraClient's on-disk response cache out of the way
+# (tests that cover it build their own HttpCache in a temporary directory).
+os.environ.setdefault("JIRA_HTTP_CACHE", "0")
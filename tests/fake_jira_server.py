@@ -0,0 +1,479 @@
+"""
+In-process fake JIRA Cloud for integration and load tests.
+
+Serves the REST endpoints this project calls (search/jql, issue CRUD, bulk create,
+transitions, comments, assignee, status/statuses, projects, agile boards) from
+in-memory state over real HTTP, with injectable latency, errors and 429 throttling:
+
+    with FakeJiraServer(faults=Faults(latency=0.02, throttle_rate=0.05)) as jira:
+        client = JiraClient(settings=jira.settings())
+"""
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from src.jira_settings import JiraSettings
+from src.jql_filter import parse_simple_jql
+
+DEFAULT_STATUSES = [
+    ("10000", "To Do", "new"),
+    ("10001", "READY FOR DEVELOPMENT", "new"),
+    ("10002", "In Progress", "indeterminate"),
+    ("10003", "Done", "done"),
+]
+
+
+@dataclass
+class Faults:
+    """
+    latency/jitter: seconds added to every response (uniform jitter on top).
+    error_rate: fraction answered with HTTP 500.
+    throttle_rate: fraction answered with 429 and `Retry-After: retry_after`.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float = 0
+
+
+class FakeJiraState:
+    """In-memory JIRA data; all mutations hold `lock`."""
+    def __init__(self, project_key="TEST"):
+        self.lock = threading.Lock()
+        self.myself = {"accountId": "fake-user", "displayName": "Fake User", "emailAddress": "fake@example.com"}
+        self.statuses = {sid: {"id": sid, "name": name, "statusCategory": {"key": key}}
+                         for sid, name, key in DEFAULT_STATUSES}
+        self.projects = {}
+        self.issues = {}
+        self.comments = {}
+        self.boards = {}
+        self._next_id = 10000
+        self.add_project(project_key, project_key.title())
+
+    def next_id(self):
+        self._next_id += 1
+        return str(self._next_id)
+
+    def add_project(self, key, name):
+        project = {"id": self.next_id(), "key": key, "name": name, "counter": 0}
+        self.projects[key] = project
+        board_id = len(self.boards) + 1
+        self.boards[board_id] = {"id": board_id, "name": f"{key} board", "type": "scrum", "project": key,
+                                 "columns": [{"name": s["name"], "statuses": [{"id": s["id"]}]}
+                                             for s in self.statuses.values()]}
+        return project
+
+    def add_issue(self, project_key, summary, issue_type="Task", status="READY FOR DEVELOPMENT", **fields):
+        project = self.projects[project_key]
+        project["counter"] += 1
+        key = f"{project_key}-{project['counter']}"
+        status_obj = next(s for s in self.statuses.values() if s["name"].lower() == status.lower())
+        self.issues[key] = {
+            "id": self.next_id(), "key": key,
+            "fields": {"summary": summary, "status": dict(status_obj), "issuetype": {"name": issue_type},
+                       "project": {"key": project_key}, "assignee": None, "priority": {"name": "Medium"},
+                       "description": None, "updated": _now(), **fields},
+        }
+        self.comments[key] = []
+        return self.issues[key]
+
+    def seed(self, count, project_key=None):
+        """Add `count` generated issues (for load tests)."""
+        project_key = project_key or next(iter(self.projects))
+        with self.lock:
+            for i in range(count):
+                self.add_issue(project_key, f"Generated issue {i}")
+
+
+def _now():
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime())
+
+
+def _project(issue, fields, properties=None):
+    """Issue limited to `fields`; entity properties only when asked for (as search's `properties`)."""
+    if not fields or "*all" in fields:
+        if "properties" not in issue and not properties:
+            return issue
+        result = {k: v for k, v in issue.items() if k != "properties"}
+    else:
+        result = {"id": issue["id"], "key": issue["key"],
+                  "fields": {f: issue["fields"].get(f) for f in fields if f in issue["fields"]}}
+    if properties:
+        stored = issue.get("properties", {})
+        result["properties"] = {k: stored[k] for k in properties if k in stored}
+    return result
+
+
+def _properties(body):
+    """Entity properties sent with a create ([{key, value}]) as a dict."""
+    return {p["key"]: p["value"] for p in body.get("properties", [])}
+
+
+def _matches(issue, filters):
+    fields = issue["fields"]
+    values = {
+        "project": fields["project"]["key"].lower(),
+        "status": fields["status"]["name"].lower(),
+        "assignee": ((fields.get("assignee") or {}).get("accountId") or "").lower(),
+        "issuetype": fields["issuetype"]["name"].lower(),
+        "key": issue["key"].lower(),
+    }
+    return all(values.get(field) in wanted for field, wanted in filters.items())
+
+
+class _Routes:
+    """(method, regex) -> handler(state, match, query, body) returning (status, payload)."""
+    def __init__(self):
+        self.table = []
+
+    def add(self, method, pattern):
+        def register(handler):
+            self.table.append((method, re.compile(pattern + "$"), handler))
+            return handler
+        return register
+
+    def find(self, method, path):
+        for route_method, pattern, handler in self.table:
+            match = pattern.match(path)
+            if match and route_method == method:
+                return handler, match
+        return None, None
+
+
+routes = _Routes()
+ISSUE = r"/rest/api/3/issue/(?P<key>[A-Z][A-Z0-9_]*-\d+)"
+
+
+def _issue_or_404(state, key):
+    issue = state.issues.get(key)
+    if issue is None:
+        return None, (404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]})
+    return issue, None
+
+
+@routes.add("GET", r"/rest/api/3/myself")
+def _myself(state, match, query, body):
+    return 200, state.myself
+
+
+@routes.add("GET", r"/rest/api/3/status")
+def _statuses(state, match, query, body):
+    return 200, list(state.statuses.values())
+
+
+@routes.add("POST", r"/rest/api/3/statuses")
+def _create_statuses(state, match, query, body):
+    keys = {"TODO": "new", "IN_PROGRESS": "indeterminate", "DONE": "done"}
+    created = []
+    with state.lock:
+        for spec in body["statuses"]:
+            sid = state.next_id()
+            state.statuses[sid] = {"id": sid, "name": spec["name"],
+                                   "statusCategory": {"key": keys.get(spec.get("statusCategory"), "new")}}
+            created.append(state.statuses[sid])
+    return 200, created
+
+
+@routes.add("POST", r"/rest/api/3/status")
+def _create_status(state, match, query, body):
+    with state.lock:
+        if any(s["name"].lower() == body["name"].lower() for s in state.statuses.values()):
+            return 400, {"errorMessages": ["A status with this name already exists."]}
+        sid = state.next_id()
+        state.statuses[sid] = {"id": sid, "name": body["name"], "statusCategory": {"key": "new"}}
+    return 201, state.statuses[sid]
+
+
+@routes.add("GET", r"/rest/api/3/project/search")
+def _project_search(state, match, query, body):
+    start = int(query.get("startAt", ["0"])[0])
+    size = int(query.get("maxResults", ["50"])[0])
+    projects = [{"id": p["id"], "key": p["key"], "name": p["name"]} for p in state.projects.values()]
+    page = projects[start:start + size]
+    return 200, {"values": page, "startAt": start, "maxResults": size, "total": len(projects),
+                 "isLast": start + size >= len(projects)}
+
+
+@routes.add("GET", r"/rest/api/3/project/(?P<key>[^/]+)")
+def _get_project(state, match, query, body):
+    project = state.projects.get(match["key"])
+    if project is None:
+        return 404, {"errorMessages": ["No project could be found."]}
+    return 200, {"id": project["id"], "key": project["key"], "name": project["name"]}
+
+
+@routes.add("POST", r"/rest/api/3/project")
+def _create_project(state, match, query, body):
+    with state.lock:
+        if body["key"] in state.projects or any(p["name"] == body["name"] for p in state.projects.values()):
+            return 400, {"errors": {"projectKey": "A project with that key or name already exists."}}
+        project = state.add_project(body["key"], body["name"])
+    return 201, {"id": project["id"], "key": project["key"], "self": f"/rest/api/3/project/{project['id']}"}
+
+
+@routes.add("POST", r"/rest/api/3/search/jql")
+def _search(state, match, query, body):
+    filters = parse_simple_jql(body.get("jql", "")) or {}
+    start = int(body.get("nextPageToken") or 0)
+    size = int(body.get("maxResults") or 50)
+    with state.lock:
+        hits = [issue for issue in state.issues.values() if _matches(issue, filters)]
+    page = [_project(issue, body.get("fields"), body.get("properties")) for issue in hits[start:start + size]]
+    result = {"issues": page, "isLast": start + size >= len(hits)}
+    if not result["isLast"]:
+        result["nextPageToken"] = str(start + size)
+    return 200, result
+
+
+def _create_one(state, update):
+    fields = update["fields"]
+    project_key = fields["project"]["key"]
+    if project_key not in state.projects:
+        return None
+    extra = {k: v for k, v in fields.items() if k not in ("project", "summary", "issuetype")}
+    issue = state.add_issue(project_key, fields["summary"], fields.get("issuetype", {}).get("name", "Task"), **extra)
+    if update.get("properties"):
+        issue["properties"] = _properties(update)
+    return issue
+
+
+@routes.add("POST", r"/rest/api/3/issue")
+def _create_issue(state, match, query, body):
+    with state.lock:
+        issue = _create_one(state, body)
+    if issue is None:
+        return 400, {"errors": {"project": "valid project is required"}}
+    return 201, {"id": issue["id"], "key": issue["key"], "self": f"/rest/api/3/issue/{issue['id']}"}
+
+
+@routes.add("POST", r"/rest/api/3/issue/bulk")
+def _bulk_create(state, match, query, body):
+    issues, errors = [], []
+    with state.lock:
+        for index, update in enumerate(body["issueUpdates"]):
+            issue = _create_one(state, update)
+            if issue is None:
+                errors.append({"status": 400, "failedElementNumber": index,
+                               "elementErrors": {"errors": {"project": "valid project is required"}}})
+            else:
+                issues.append({"id": issue["id"], "key": issue["key"]})
+    return 201, {"issues": issues, "errors": errors}
+
+
+@routes.add("GET", ISSUE)
+def _get_issue(state, match, query, body):
+    issue, error = _issue_or_404(state, match["key"])
+    if error:
+        return error
+    fields = query.get("fields", [""])[0].split(",") if "fields" in query else None
+    result = _project(issue, fields)
+    if "transitions" in query.get("expand", [""])[0]:
+        result = {**result, "transitions": _transition_list(state)}
+    return 200, result
+
+
+@routes.add("PUT", ISSUE)
+def _update_issue(state, match, query, body):
+    issue, error = _issue_or_404(state, match["key"])
+    if error:
+        return error
+    with state.lock:
+        issue["fields"].update(body.get("fields", {}))
+        issue["fields"]["updated"] = _now()
+    return 204, None
+
+
+@routes.add("DELETE", ISSUE)
+def _delete_issue(state, match, query, body):
+    with state.lock:
+        if state.issues.pop(match["key"], None) is None:
+            return 404, {"errorMessages": ["Issue does not exist."]}
+    return 204, None
+
+
+@routes.add("PUT", ISSUE + r"/assignee")
+def _assign(state, match, query, body):
+    issue, error = _issue_or_404(state, match["key"])
+    if error:
+        return error
+    with state.lock:
+        issue["fields"]["assignee"] = {"accountId": body.get("accountId"), "displayName": "Fake User"}
+    return 204, None
+
+
+def _transition_list(state):
+    return [{"id": s["id"], "name": s["name"], "to": s} for s in state.statuses.values()]
+
+
+@routes.add("GET", ISSUE + r"/transitions")
+def _transitions(state, match, query, body):
+    issue, error = _issue_or_404(state, match["key"])
+    return error or (200, {"transitions": _transition_list(state)})
+
+
+@routes.add("POST", ISSUE + r"/transitions")
+def _transition(state, match, query, body):
+    issue, error = _issue_or_404(state, match["key"])
+    if error:
+        return error
+    status = state.statuses.get(str(body["transition"]["id"]))
+    if status is None:
+        return 400, {"errorMessages": ["Transition id is not valid."]}
+    with state.lock:
+        issue["fields"]["status"] = dict(status)
+        issue["fields"]["updated"] = _now()
+    return 204, None
+
+
+@routes.add("POST", ISSUE + r"/comment")
+def _comment(state, match, query, body):
+    issue, error = _issue_or_404(state, match["key"])
+    if error:
+        return error
+    with state.lock:
+        comment = {"id": state.next_id(), "body": body["body"], "author": state.myself, "created": _now(),
+                   "properties": body.get("properties", [])}
+        state.comments[match["key"]].append(comment)
+    return 201, comment
+
+
+@routes.add("GET", ISSUE + r"/comment")
+def _comments(state, match, query, body):
+    issue, error = _issue_or_404(state, match["key"])
+    if error:
+        return error
+    comments = state.comments[match["key"]]
+    return 200, {"comments": comments, "total": len(comments), "startAt": 0, "maxResults": len(comments)}
+
+
+@routes.add("GET", r"/rest/agile/1.0/board")
+def _boards(state, match, query, body):
+    project = query.get("projectKeyOrId", [None])[0]
+    boards = [{"id": b["id"], "name": b["name"], "type": b["type"]} for b in state.boards.values()
+              if project is None or b["project"] == project]
+    return 200, {"values": boards, "isLast": True}
+
+
+@routes.add("GET", r"/rest/agile/1.0/board/(?P<id>\d+)/configuration")
+def _board_config(state, match, query, body):
+    board = state.boards.get(int(match["id"]))
+    if board is None:
+        return 404, {"errorMessages": ["Board does not exist."]}
+    return 200, {"id": board["id"], "name": board["name"], "columnConfig": {"columns": board["columns"]}}
+
+
+@routes.add("PUT", r"/rest/agile/1.0/board/(?P<id>\d+)/configuration")
+def _update_board_config(state, match, query, body):
+    board = state.boards.get(int(match["id"]))
+    if board is None:
+        return 404, {"errorMessages": ["Board does not exist."]}
+    with state.lock:
+        board["columns"] = body["columnConfig"]["columns"]
+    return 200, {"id": board["id"], "columnConfig": {"columns": board["columns"]}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, payload, headers=None):
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method):
+        path, _, query = self.path.partition("?")
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        server = self.server.fake
+        fault = server.inject()
+        if fault is not None:
+            return self._reply(*fault)
+        handler, match = routes.find(method, path)
+        if handler is None:
+            server.count(404)
+            return self._reply(404, {"errorMessages": [f"No fake route for {method} {path}"]})
+        status, payload = handler(server.state, match, parse_qs(query), json.loads(raw) if raw else {})
+        server.count(status)
+        self._reply(status, payload)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class FakeJiraServer:
+    """
+    Real HTTP server on 127.0.0.1 backed by FakeJiraState. `faults` can be changed
+    while running; `requests` counts served responses by status.
+    """
+    def __init__(self, state=None, faults=None, seed=None):
+        self.state = state or FakeJiraState()
+        self.faults = faults or Faults()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def settings(self, project_key=None):
+        return JiraSettings(self.url, "fake@example.com", "token", project_key or next(iter(self.state.projects)))
+
+    def inject(self):
+        """Apply latency; return (status, payload, headers) for an injected failure, else None."""
+        faults = self.faults
+        with self._lock:
+            roll = self._random.random()
+            delay = faults.latency + (self._random.uniform(0, faults.jitter) if faults.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        if roll < faults.throttle_rate:
+            self.count(429)
+            return 429, {"errorMessages": ["Rate limit exceeded."]}, {"Retry-After": str(faults.retry_after)}
+        if roll < faults.throttle_rate + faults.error_rate:
+            self.count(500)
+            return 500, {"errorMessages": ["Injected failure."]}, None
+        return None
+
+    def count(self, status):
+        with self._lock:
+            self.requests[status] = self.requests.get(status, 0) + 1
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
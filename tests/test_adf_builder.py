@@ -0,0 +1,56 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from src import adf_builder, json_codec
+from src.adf_builder import markdown_to_adf
+from src.adf_renderer import render_adf
+from src.jira_payloads import comment_payload
+
+
+class TestAdfBuilder(unittest.TestCase):
+    def test_plain_text_is_one_paragraph(self):
+        self.assertEqual(markdown_to_adf("Hello world"), {
+            "type": "doc", "version": 1,
+            "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Hello world"}]}]})
+
+    def test_empty_text_is_empty_document(self):
+        self.assertEqual(markdown_to_adf(None)["content"], [])
+
+    def test_markdown_blocks_and_inline_marks(self):
+        text = ("# Release\n\nShip **now**, see [notes](https://x.io) or https://y.io.\n"
+                "Keep snake_case_names.\n\n- one\n  - nested\n- two\n\n2. b\n3. c\n\n```py\nx = 1\n```\n\n> quoted")
+        doc = markdown_to_adf(text)
+        self.assertEqual([b["type"] for b in doc["content"]],
+                         ["heading", "paragraph", "bulletList", "orderedList", "codeBlock", "blockquote"])
+        self.assertEqual(doc["content"][3]["attrs"], {"order": 2})
+        self.assertEqual(doc["content"][4]["attrs"], {"language": "py"})
+        self.assertEqual(render_adf(doc),
+                         "# Release\n\nShip **now**, see [notes](https://x.io) or [https://y.io](https://y.io).\n"
+                         "Keep snake_case_names.\n\n- one\n  - nested\n- two\n\n2. b\n3. c\n\n```py\nx = 1\n```\n\n> quoted")
+
+    def test_repeated_text_is_parsed_once(self):
+        adf_builder._cached_blocks.cache_clear()
+        comment_payload("same *text*")
+        comment_payload("same *text*")
+        self.assertEqual(adf_builder.cache_info()["blocks"]["hits"], 1)
+
+    def test_long_text_is_not_cached(self):
+        adf_builder._cached_blocks.cache_clear()
+        adf_builder._cached_inline.cache_clear()
+        text = "word " * adf_builder.MAX_CACHED_CHARS
+        self.assertEqual(markdown_to_adf(text), markdown_to_adf(text))
+        self.assertEqual(adf_builder.cache_info()["blocks"]["currsize"], 0)
+        self.assertEqual(adf_builder.cache_info()["inline"]["currsize"], 0)
+
+    def test_encode_json_is_compact_utf8(self):
+        payload = comment_payload("naïve")
+        self.assertEqual(json.loads(json_codec.encode_json(payload)), payload)
+        with patch.object(json_codec, "orjson", None):
+            encoded = json_codec.encode_json(payload)
+        self.assertIn("naïve".encode("utf-8"), encoded)
+        self.assertNotIn(b": ", encoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import sys
+import unittest
+from src.adf_renderer import iter_adf, render_adf
+from src.issue_view import project_issue
+
+
+def text(value, **extra):
+    return {"type": "text", "text": value, **extra}
+
+
+def paragraph(*content):
+    return {"type": "paragraph", "content": list(content)}
+
+
+def item(*content):
+    return {"type": "listItem", "content": list(content)}
+
+
+class TestAdfRenderer(unittest.TestCase):
+    def test_renders_marks_mentions_and_breaks(self):
+        doc = {"type": "doc", "content": [paragraph(
+            text("Ping "), {"type": "mention", "attrs": {"id": "1", "text": "@Dev"}},
+            {"type": "hardBreak"}, text("bold", marks=[{"type": "strong"}]), text(" "),
+            text("docs", marks=[{"type": "link", "attrs": {"href": "https://x"}}]))]}
+        self.assertEqual(render_adf(doc), "Ping @Dev\n**bold** [docs](https://x)")
+
+    def test_renders_nested_lists_code_and_tables(self):
+        doc = {"type": "doc", "content": [
+            {"type": "heading", "attrs": {"level": 2}, "content": [text("Steps")]},
+            {"type": "bulletList", "content": [
+                item(paragraph(text("one")), {"type": "orderedList", "content": [item(paragraph(text("sub")))]}),
+                item(paragraph(text("two")))]},
+            {"type": "codeBlock", "attrs": {"language": "py"}, "content": [text("x = 1")]},
+            {"type": "table", "content": [
+                {"type": "tableRow", "content": [{"type": "tableHeader", "content": [paragraph(text("H"))]}]},
+                {"type": "tableRow", "content": [{"type": "tableCell", "content": [paragraph(text("c"))]}]}]},
+        ]}
+        self.assertEqual(render_adf(doc),
+                         "## Steps\n\n- one\n  1. sub\n- two\n\n```py\nx = 1\n```\n\n| H |\n| --- |\n| c |")
+
+    def test_plain_text_mode_drops_markup(self):
+        doc = {"type": "doc", "content": [
+            {"type": "heading", "attrs": {"level": 1}, "content": [text("Title")]},
+            paragraph(text("bold", marks=[{"type": "strong"}]))]}
+        self.assertEqual(render_adf(doc, markdown=False), "Title\n\nbold")
+
+    def test_deep_documents_do_not_recurse(self):
+        node = paragraph(text("leaf"))
+        depth = sys.getrecursionlimit() * 2
+        for _ in range(depth):
+            node = {"type": "blockquote", "content": [node]}
+        rendered = render_adf({"type": "doc", "content": [node]})
+        self.assertTrue(rendered.endswith("> leaf"))
+        self.assertEqual(rendered.count(">"), depth)
+
+    def test_streams_fragments(self):
+        doc = {"type": "doc", "content": [paragraph(text(f"p{i}")) for i in range(100)]}
+        fragments = iter_adf(doc)
+        self.assertEqual(next(fragments), "p0")
+
+    def test_issue_view_renders_description(self):
+        data = {"key": "T-1", "fields": {"description": {"type": "doc", "content": [paragraph(text("Hi"))]}}}
+        self.assertEqual(project_issue(data, ["description"])["description"], "Hi")
+        self.assertIsNone(project_issue({"key": "T-1", "fields": {}}, ["description"])["description"])
+
+
+if __name__ == '__main__':
+    unittest.main()
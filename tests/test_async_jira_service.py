@@ -0,0 +1,59 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock
+
+import httpx
+
+from src.async_jira_client import AsyncJiraClient
+from src.async_jira_service import AsyncJiraService
+from src.jira_settings import JiraSettings
+
+SETTINGS = JiraSettings("https://test.atlassian.net", "test@example.com", "token", "TEST")
+
+
+class TestAsyncJiraService(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = AsyncMock()
+        self.mock_client.project_key = "TEST"
+        self.service = AsyncJiraService(client=self.mock_client)
+
+    def test_create_issue_success(self):
+        self.mock_client.post.return_value = {"key": "TEST-1"}
+        key = asyncio.run(self.service.create_issue("Summary", "Description"))
+        self.assertEqual(key, "TEST-1")
+        payload = self.mock_client.post.call_args.args[1]
+        self.assertEqual(payload["fields"]["project"], {"key": "TEST"})
+
+    def test_transition_issue_not_found(self):
+        self.mock_client.get.return_value = {"transitions": [{"id": "11", "name": "Done"}]}
+        self.assertFalse(asyncio.run(self.service.transition_issue("TEST-1", "In Progress")))
+        self.mock_client.post.assert_not_called()
+
+    def test_search_returns_empty_on_error(self):
+        self.mock_client.post.return_value = None
+        self.assertEqual(asyncio.run(self.service.search("project = TEST")), [])
+
+
+class TestAsyncJiraClient(unittest.TestCase):
+
+    def _client(self, handler):
+        client = AsyncJiraClient(settings=SETTINGS)
+        client._http = httpx.AsyncClient(base_url=SETTINGS.jira_url, transport=httpx.MockTransport(handler))
+        return client
+
+    def test_post_no_content_returns_empty_dict(self):
+        client = self._client(lambda request: httpx.Response(204))
+        self.assertEqual(asyncio.run(client.post("/rest/api/3/issue/TEST-1/transitions", {})), {})
+
+    def test_get_error_returns_none(self):
+        client = self._client(lambda request: httpx.Response(404, text="missing"))
+        self.assertIsNone(asyncio.run(client.get("/rest/api/3/issue/TEST-404")))
+
+    def test_get_parses_json(self):
+        client = self._client(lambda request: httpx.Response(200, content=json.dumps({"key": "TEST-1"})))
+        self.assertEqual(asyncio.run(client.get("/rest/api/3/issue/TEST-1")), {"key": "TEST-1"})
+
+if __name__ == '__main__':
+    unittest.main()
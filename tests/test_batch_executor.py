@@ -0,0 +1,160 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from src.batch_executor import ERROR, OK, SKIPPED, OperationError, plan_batch, run_batch
+
+
+class Recorder:
+    """Handlers that sleep briefly and log start/end order."""
+
+    def __init__(self):
+        self.log = []
+
+    async def get_issue(self, issue_key, fields=None):
+        self.log.append(("start", "get", issue_key))
+        await asyncio.sleep(0.05)
+        self.log.append(("end", "get", issue_key))
+        return {"key": issue_key, "status": "To Do"}
+
+    async def create_issue(self, summary, description=""):
+        await asyncio.sleep(0.05)
+        if summary == "bad":
+            raise OperationError("Failed to create issue.")
+        return {"key": "TEST-9"}
+
+    async def add_comment(self, issue_key, comment_text):
+        self.log.append(("start", "comment", issue_key))
+        await asyncio.sleep(0.05)
+        self.log.append(("end", "comment", issue_key))
+        return {"key": issue_key, "text": comment_text}
+
+    def handlers(self):
+        return {"get_issue": self.get_issue, "create_issue": self.create_issue, "add_comment": self.add_comment}
+
+
+class TestBatchExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.recorder = Recorder()
+        self.handlers = self.recorder.handlers()
+
+    def test_rejects_invalid_batches_before_running(self):
+        cases = [
+            [{"tool": "drop_table"}],
+            [{"tool": "get_issue", "args": {}}],
+            [{"tool": "get_issue", "args": {"issue_key": "A-1"}, "depends_on": ["nope"]}],
+            [{"id": "a", "tool": "get_issue", "args": {"issue_key": "A-1"}},
+             {"id": "a", "tool": "get_issue", "args": {"issue_key": "A-2"}}],
+            [{"id": "a", "tool": "get_issue", "args": {"issue_key": "A-1"}, "depends_on": ["b"]},
+             {"id": "b", "tool": "get_issue", "args": {"issue_key": "A-2"}, "depends_on": ["a"]}],
+        ]
+        for operations in cases:
+            with self.assertRaises(ValueError):
+                plan_batch(operations, self.handlers)
+
+    def test_rejects_fields_of_queued_writes(self):
+        operations = [
+            {"id": "new", "tool": "create_issue", "args": {"summary": "ok"}},
+            {"id": "note", "tool": "add_comment", "args": {"issue_key": "$new.key", "comment_text": "hi"}},
+        ]
+        plan_batch(operations, self.handlers)
+        with self.assertRaisesRegex(ValueError, r"\$new.key is unavailable"):
+            plan_batch(operations, self.handlers, queued=("create_issue",))
+        operations[1]["args"]["comment_text"] = "$new.outbox_entry"
+        operations[1]["args"]["issue_key"] = "TEST-1"
+        self.assertEqual(plan_batch(operations, self.handlers, queued=("create_issue",))[1]["after"], ["new"])
+
+    def test_independent_operations_run_concurrently(self):
+        operations = [{"tool": "get_issue", "args": {"issue_key": f"TEST-{i}"}} for i in range(5)]
+        started = time.perf_counter()
+        report = asyncio.run(run_batch(operations, self.handlers))
+
+        self.assertTrue(report["ok"])
+        self.assertLess(time.perf_counter() - started, 0.2)  # 5 x 50 ms, overlapped
+        self.assertEqual([r["result"]["key"] for r in report["results"]], [f"TEST-{i}" for i in range(5)])
+
+    def test_same_issue_runs_in_list_order(self):
+        operations = [
+            {"tool": "add_comment", "args": {"issue_key": "TEST-1", "comment_text": "first"}},
+            {"tool": "get_issue", "args": {"issue_key": "test-1"}},
+            {"tool": "get_issue", "args": {"issue_key": "TEST-2"}},
+        ]
+        asyncio.run(run_batch(operations, self.handlers))
+
+        on_one = [entry for entry in self.recorder.log if entry[2].upper() == "TEST-1"]
+        self.assertEqual([e[:2] for e in on_one],
+                         [("start", "comment"), ("end", "comment"), ("start", "get"), ("end", "get")])
+        self.assertLess(self.recorder.log.index(("start", "get", "TEST-2")),
+                        self.recorder.log.index(("end", "comment", "TEST-1")))
+
+    def test_references_and_skipped_dependents(self):
+        operations = [
+            {"id": "new", "tool": "create_issue", "args": {"summary": "ok"}},
+            {"id": "note", "tool": "add_comment", "args": {"issue_key": "$new.key", "comment_text": "$5 fix"}},
+            {"id": "broken", "tool": "create_issue", "args": {"summary": "bad"}},
+            {"id": "after", "tool": "get_issue", "args": {"issue_key": "TEST-3"}, "depends_on": ["broken"]},
+            {"id": "typo", "tool": "get_issue", "args": {"issue_key": "$new.id"}},
+        ]
+        report = asyncio.run(run_batch(operations, self.handlers))
+        results = {r["id"]: r for r in report["results"]}
+
+        self.assertFalse(report["ok"])
+        self.assertEqual(results["note"]["result"], {"key": "TEST-9", "text": "$5 fix"})
+        self.assertEqual((results["broken"]["status"], results["broken"]["error"]), (ERROR, "Failed to create issue."))
+        self.assertEqual(results["after"]["status"], SKIPPED)
+        self.assertEqual(results["typo"]["status"], ERROR)
+        self.assertEqual(results["new"]["status"], OK)
+
+
+class TestExecuteBatchTool(unittest.TestCase):
+
+    def setUp(self):
+        self.patcher = patch('src.mcp_server.jira_service', new_callable=AsyncMock)
+        self.mock_service = self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_get_transition_comment_in_one_call(self):
+        from src.mcp_server import execute_batch
+        self.mock_service.get_issue_view.return_value = {"key": "TEST-1", "status": "To Do"}
+        self.mock_service.transition_issue.return_value = True
+        self.mock_service.add_comment.return_value = False
+
+        report = json.loads(asyncio.run(execute_batch([
+            {"id": "read", "tool": "get_issue", "args": {"issue_key": "TEST-1"}},
+            {"id": "move", "tool": "transition_issue", "args": {"issue_key": "TEST-1", "status_name": "Done"}},
+            {"id": "say", "tool": "add_comment", "args": {"issue_key": "TEST-1", "comment_text": "Shipped"}},
+        ])))
+
+        self.assertEqual([r["status"] for r in report["results"]], [OK, OK, ERROR])
+        self.assertEqual(report["results"][1]["result"], {"key": "TEST-1", "status": "Done"})
+        self.assertEqual(report["results"][2]["error"], "Failed to add comment to TEST-1.")
+        self.mock_service.transition_issue.assert_awaited_once_with("TEST-1", "Done")
+
+    @patch.dict("os.environ", {"JIRA_WRITE_MODE": "outbox"})
+    def test_outbox_mode_rejects_key_of_queued_create(self):
+        from src.mcp_server import execute_batch
+
+        with patch("src.mcp_server._outbox") as outbox:
+            reply = asyncio.run(execute_batch([
+                {"id": "new", "tool": "create_issue", "args": {"summary": "S", "description": "D"}},
+                {"tool": "add_comment", "args": {"issue_key": "$new.key", "comment_text": "Hi"}},
+            ]))
+        self.assertIn("Invalid batch", reply)
+        self.assertIn("only queued", reply)
+        outbox.submit.assert_not_called()
+
+    def test_invalid_batch(self):
+        from src.mcp_server import execute_batch
+
+        reply = asyncio.run(execute_batch([{"tool": "delete_everything"}]))
+        self.assertIn("Invalid batch", reply)
+        self.mock_service.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src import bulk_operations
+from src.async_jira_service import AsyncJiraService
+from src.jira_service import JiraService
+
+
+class TestBulkCreate(unittest.TestCase):
+
+    @patch('src.jira_service.JiraClient')
+    def setUp(self, MockJiraClient):
+        self.mock_client = MockJiraClient.return_value
+        self.mock_client.jira_url = "https://test.atlassian.net"
+        self.mock_client.project_key = "TEST"
+        self.service = JiraService()
+
+    def test_chunks_of_fifty_and_maps_errors(self):
+        specs = [{"summary": f"Issue {i}", "description": ""} for i in range(60)]
+
+        def bulk_post(endpoint, payload):
+            count = len(payload["issueUpdates"])
+            if count == 50:
+                return {"issues": [{"key": f"TEST-{i}"} for i in range(49)],
+                        "errors": [{"failedElementNumber": 3, "status": 400,
+                                    "elementErrors": {"errorMessages": ["bad type"]}}]}
+            return {"issues": [{"key": f"TEST-{100 + i}"} for i in range(count)], "errors": []}
+
+        self.mock_client.post.side_effect = bulk_post
+        results = self.service.bulk_create_issues(specs)
+
+        self.assertEqual(self.mock_client.post.call_count, 2)
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results[3], {"index": 3, "ok": False, "key": None, "error": "bad type"})
+        self.assertEqual(results[4]["key"], "TEST-3")
+        self.assertEqual(results[59]["key"], "TEST-109")
+
+    def test_failed_request_marks_chunk_failed(self):
+        self.mock_client.post.return_value = None
+        results = self.service.bulk_create_issues([{"summary": "A"}, {"summary": "B"}])
+        self.assertFalse(any(r["ok"] for r in results))
+
+    def test_bulk_comment_runs_concurrently(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_post(endpoint, payload):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return {}
+
+        self.mock_client.post.side_effect = slow_post
+        results = self.service.bulk_comment([(f"TEST-{i}", "hi") for i in range(8)], max_workers=4)
+        self.assertTrue(all(r["ok"] for r in results))
+        self.assertEqual(results[5]["key"], "TEST-5")
+        self.assertEqual(peak[0], 4)
+
+    def test_issue_spec_from_requests_jsonl(self):
+        spec = bulk_operations.issue_spec_from_record({"request_id": "x", "title": "T", "body": "B"})
+        self.assertEqual(spec, {"summary": "T", "description": "B", "issue_type": "Task", "project_key": None})
+
+
+class TestAsyncBulkCreate(unittest.TestCase):
+
+    def test_chunks_sent_concurrently(self):
+        client = AsyncMock()
+        client.project_key = "TEST"
+        client.post.side_effect = lambda endpoint, payload: {
+            "issues": [{"key": "TEST-1"}] * len(payload["issueUpdates"])}
+        service = AsyncJiraService(client=client)
+        results = asyncio.run(service.bulk_create_issues([{"summary": str(i)} for i in range(120)]))
+        self.assertEqual(len(results), 120)
+        self.assertEqual(client.post.call_count, 3)
+
+    def test_marks_mirror_dirty(self):
+        client = AsyncMock()
+        client.project_key = "TEST"
+        client.post.return_value = {"issues": [{"key": "TEST-1"}, {"key": "OTHER-7"}], "errors": []}
+        mirror = MagicMock()
+        service = AsyncJiraService(client=client, mirror=mirror)
+        asyncio.run(service.bulk_create_issues([{"summary": "A"}, {"summary": "B", "project_key": "OTHER"}]))
+        self.assertEqual(sorted(c.args[0] for c in mirror.mark_dirty.call_args_list), ["OTHER", "TEST"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+from benchmarks.load_test import LOAD_RETRY_POLICY, run_mcp_load, run_service_load
+from src.http_pool import PoolConfig
+from src.jira_client import JiraClient
+from src.jira_service import JiraService
+from src.rate_limiter import TokenBucket
+from tests.fake_jira_server import Faults, FakeJiraServer
+
+
+def _service(server):
+    client = JiraClient(settings=server.settings(), pool_config=PoolConfig(), limiter=TokenBucket(),
+                        retry_policy=LOAD_RETRY_POLICY)
+    return JiraService(client=client)
+
+
+class TestFakeJiraServer(unittest.TestCase):
+    """JiraService over real HTTP against the in-process fake."""
+
+    def setUp(self):
+        self.server = FakeJiraServer(seed=7).__enter__()
+        self.service = _service(self.server)
+        self.print = patch("builtins.print")
+        self.print.start()
+
+    def tearDown(self):
+        self.print.stop()
+        self.server.__exit__(None, None, None)
+
+    def test_issue_lifecycle(self):
+        key = self.service.create_issue("Write the fake", "Some *Markdown*")
+        self.assertEqual(key, "TEST-1")
+        self.assertTrue(self.service.add_comment(key, "Looks good"))
+        self.assertTrue(self.service.transition_issue(key, "Done"))
+        self.assertTrue(self.service.update_issue(key, summary="Renamed"))
+        view = self.service.get_issue_view(key, ["summary", "status"])
+        self.assertEqual(view, {"key": key, "summary": "Renamed", "status": "Done"})
+        self.assertEqual(len(self.server.state.comments[key]), 1)
+
+    def test_search_pages_and_filters(self):
+        self.server.state.seed(120)
+        issues = self.service.search_issues("project = TEST AND status = 'READY FOR DEVELOPMENT'", max_results=None)
+        self.assertEqual(len(issues), 120)
+        self.assertEqual(self.service.search_issues("project = OTHER"), [])
+
+    def test_injected_throttling_is_retried(self):
+        self.server.state.seed(5)
+        self.server.faults = Faults(throttle_rate=0.5)
+        for key in self.server.state.issues:
+            self.assertIsNotNone(self.service.get_issue(key))
+        self.assertGreater(self.server.requests[429], 0)
+
+    def test_injected_errors_fail_the_call(self):
+        self.server.state.seed(1)
+        self.server.faults = Faults(error_rate=1.0)
+        self.assertIsNone(self.service.get_issue("TEST-1"))
+        self.assertEqual(self.server.requests[500], 1)
+
+
+class TestLoadHarness(unittest.TestCase):
+
+    def test_service_and_mcp_load(self):
+        with FakeJiraServer(faults=Faults(throttle_rate=0.05), seed=3) as server:
+            server.state.seed(20)
+            for run in (run_service_load, run_mcp_load):
+                report = run(server, 60, 8)
+                self.assertEqual(report["total"]["requests"], 60)
+                self.assertEqual(report["total"]["errors"], 0, run.__name__)
+                self.assertLessEqual(report["total"]["p50_ms"], report["total"]["p99_ms"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.http_cache import HttpCache
+from src.http_pool import close_sessions
+from src.jira_client import JiraClient
+from src.rate_limiter import reset_rate_limiters
+from tests.test_jira_client import ENV
+
+
+def _response(status, data=None, headers=None):
+    body = json.dumps(data).encode() if data is not None else b""
+    response = MagicMock(status_code=status, content=body, headers=headers or {})
+    response.json.return_value = data
+    return response
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self.env = patch.dict('os.environ', ENV)
+        self.env.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(os.path.join(self.tmp.name, "http.sqlite3"))
+        self.client = JiraClient(http_cache=self.cache)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+        self.env.stop()
+        close_sessions()
+        reset_rate_limiters()
+
+    def test_fresh_metadata_served_from_disk(self):
+        priorities = [{"id": "1", "name": "High"}]
+        with patch.object(self.client.session, 'request', return_value=_response(200, priorities)) as request:
+            self.assertEqual(self.client.get("/rest/api/3/priority"), priorities)
+            # A new client (next CLI run) reads the same file.
+            other = JiraClient(http_cache=HttpCache(self.cache.path))
+            self.assertEqual(other.get("/rest/api/3/priority"), priorities)
+        self.assertEqual(request.call_count, 1)
+        other.http_cache.close()
+
+    def test_mutable_metadata_always_revalidated(self):
+        columns = {"columnConfig": {"columns": [{"name": "To Do"}]}}
+        responses = [_response(200, columns, {"ETag": '"v1"'}), _response(304, headers={})]
+        with patch.object(self.client.session, 'request', side_effect=responses) as request:
+            self.client.get("/rest/agile/1.0/board/7/configuration")
+            self.assertEqual(self.client.get("/rest/agile/1.0/board/7/configuration"), columns)
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(request.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_stale_entry_revalidated_with_etag(self):
+        first = _response(200, {"key": "TEST-1"}, {"ETag": '"v1"'})
+        not_modified = _response(304, headers={})
+        with patch.object(self.client.session, 'request', side_effect=[first, not_modified]) as request:
+            self.assertEqual(self.client.get("/rest/api/3/issue/TEST-1"), {"key": "TEST-1"})
+            # Issues have no TTL: the second read asks JIRA, which answers 304.
+            self.assertEqual(self.client.get("/rest/api/3/issue/TEST-1"), {"key": "TEST-1"})
+        self.assertEqual(request.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(self.cache.metrics()["revalidated"], 1)
+
+    def test_uncacheable_responses_not_stored(self):
+        with patch.object(self.client.session, 'request',
+                          return_value=_response(200, {"key": "TEST-1"})) as request:
+            self.client.get("/rest/api/3/issue/TEST-1")
+            self.client.get("/rest/api/3/issue/TEST-1")
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(self.cache.metrics()["entries"], 0)
+
+    def test_writes_invalidate_affected_entries(self):
+        statuses = [{"id": "1", "name": "To Do"}]
+        responses = [_response(200, statuses, {"ETag": '"v1"'}), _response(201, [{"id": "2", "name": "QA"}]),
+                     _response(200, statuses + [{"id": "2", "name": "QA"}])]
+        with patch.object(self.client.session, 'request', side_effect=responses) as request:
+            self.client.get("/rest/api/3/status")
+            self.client.post("/rest/api/3/statuses", {"statuses": [{"name": "QA"}]})
+            self.assertEqual(len(self.client.get("/rest/api/3/status")), 2)
+        self.assertEqual(request.call_count, 3)
+        self.assertNotIn("If-None-Match", request.call_args.kwargs.get("headers") or {})
+
+    def test_lru_eviction_bounds_size(self):
+        cache = HttpCache(os.path.join(self.tmp.name, "small.sqlite3"), max_bytes=100)
+        for n in range(5):
+            cache.store(f"k{n}", "/rest/api/3/field", _response(200, {"pad": "x" * 30}))
+        metrics = cache.metrics()
+        self.assertLessEqual(metrics["bytes"], 100)
+        self.assertEqual(metrics["evicted"], 3)
+        self.assertIsNone(cache.lookup("k0"))
+        self.assertTrue(cache.lookup("k4").fresh)
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
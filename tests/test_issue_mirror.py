@@ -0,0 +1,130 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.issue_mirror import IssueMirror
+from src.jira_service import JiraService
+from src.jql_filter import parse_order_by, parse_simple_jql
+
+
+def _issue(key, status="READY FOR DEVELOPMENT", updated="2026-10-18T10:00:00.000+0000"):
+    return {"key": key, "fields": {"summary": f"Summary {key}", "status": {"name": status},
+                                   "project": {"key": key.split("-")[0]}, "updated": updated}}
+
+
+class TestJqlFilter(unittest.TestCase):
+
+    def test_supported_subset(self):
+        self.assertEqual(parse_simple_jql("project = TEST AND status in ('Done', \"To Do\") ORDER BY rank"),
+                         {"project": {"test"}, "status": {"done", "to do"}})
+
+    def test_unsupported_falls_back(self):
+        for jql in ["assignee = currentUser()", "project = A OR project = B", "text ~ bug", "project =",
+                    "project = TEST AND assignee = EMPTY", "project = TEST AND assignee is EMPTY",
+                    "project = TEST AND assignee in (null)", "project = 10000", "project in (TEST, 10001)"]:
+            self.assertIsNone(parse_simple_jql(jql), jql)
+
+    def test_order_by(self):
+        self.assertEqual(parse_order_by("project = TEST"), [])
+        self.assertEqual(parse_order_by("project = TEST ORDER BY issuekey, updated DESC"),
+                         [("key", False), ("updated", True)])
+        for jql in ["project = TEST ORDER BY rank", "project = TEST ORDER BY created DESC",
+                    'project = TEST ORDER BY "Story Points"', "project = TEST ORDER BY key sideways"]:
+            self.assertIsNone(parse_order_by(jql), jql)
+
+
+class TestIssueMirror(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mirror = IssueMirror(os.path.join(self.tmp.name, "mirror.sqlite3"), max_staleness=60)
+
+    def tearDown(self):
+        self.mirror.close()
+        self.tmp.cleanup()
+
+    def test_query_and_delta_jql(self):
+        self.mirror.upsert([_issue("TEST-1"), _issue("TEST-2", "Done"), _issue("OTHER-1")])
+        keys = [i["key"] for i in self.mirror.query(parse_simple_jql("project = TEST AND status = Done"))]
+        self.assertEqual(keys, ["TEST-2"])
+        self.assertEqual(self.mirror.delta_jql("TEST"), "project = TEST ORDER BY updated ASC")
+        self.mirror.mark_synced("TEST", time.time() - 125, keys=["TEST-1", "TEST-2"])
+        self.assertIn('updated >= "-4m"', self.mirror.delta_jql("TEST"))
+
+    def test_full_sync_drops_issues_jira_no_longer_returns(self):
+        self.mirror.full_sync_interval = 3600
+        self.mirror.upsert([_issue("TEST-1"), _issue("TEST-2"), _issue("OTHER-1")])
+        self.mirror.mark_synced("TEST", time.time(), keys=["TEST-1", "TEST-2"])
+        self.assertFalse(self.mirror.full_sync_due("TEST"))
+
+        self.mirror.mark_synced("TEST", time.time())  # a delta sync never drops anything
+        self.assertIsNotNone(self.mirror.get("TEST-2"))
+        self.assertTrue(self.mirror.full_sync_due("TEST", time.time() + 3601))
+        self.assertNotIn("updated >=", self.mirror.delta_jql("TEST", time.time() + 3601))
+
+        self.mirror.mark_synced("TEST", time.time(), keys=["TEST-1"])  # TEST-2 deleted or moved
+        self.assertIsNone(self.mirror.get("TEST-2"))
+        self.assertIsNotNone(self.mirror.get("TEST-1"))
+        self.assertIsNotNone(self.mirror.get("OTHER-1"))
+
+    def test_honours_order_by_or_goes_live(self):
+        self.mirror.upsert([_issue("TEST-10", updated="2026-10-18T09:00:00.000+0000"), _issue("TEST-9"),
+                            _issue("TEST-2", updated="2026-10-18T11:00:00.000+0000")])
+        keys = lambda jql: [i["key"] for i in self.mirror.query(*self.mirror.plan(jql))]
+        self.assertEqual(keys("project = TEST"), ["TEST-2", "TEST-9", "TEST-10"])
+        self.assertEqual(keys("project = TEST ORDER BY key"), ["TEST-2", "TEST-9", "TEST-10"])
+        self.assertEqual(keys("project = TEST ORDER BY key DESC"), ["TEST-10", "TEST-9", "TEST-2"])
+        self.assertEqual(keys("project = TEST ORDER BY updated"), ["TEST-10", "TEST-9", "TEST-2"])
+        self.assertIsNone(self.mirror.plan("project = TEST ORDER BY priority DESC"))
+
+    def test_touch_marks_scope_stale(self):
+        self.mirror.upsert([_issue("TEST-1")])
+        self.mirror.mark_synced("TEST", time.time())
+        self.assertTrue(self.mirror.is_fresh("TEST"))
+        self.mirror.touch("TEST-1")
+        self.assertFalse(self.mirror.is_fresh("TEST"))
+        self.assertIsNone(self.mirror.get("TEST-1"))
+
+
+class TestServiceMirrorMode(unittest.TestCase):
+
+    @patch('src.jira_service.JiraClient')
+    def setUp(self, MockJiraClient):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mock_client = MockJiraClient.return_value
+        self.mock_client.jira_url = "https://test.atlassian.net"
+        self.mock_client.project_key = "TEST"
+        self.mock_client.post.return_value = {"issues": [_issue("TEST-1"), _issue("TEST-2", "Done")]}
+        mirror = IssueMirror(os.path.join(self.tmp.name, "mirror.sqlite3"), max_staleness=60)
+        self.service = JiraService(mirror=mirror, read_mode="mirror")
+
+    def tearDown(self):
+        self.service.mirror.close()
+        self.tmp.cleanup()
+
+    def test_reads_served_locally_after_one_sync(self):
+        self.assertEqual(len(self.service.get_open_tasks()), 1)
+        start = time.perf_counter()
+        for _ in range(200):
+            self.assertEqual(self.service.get_issue("TEST-2")["fields"]["status"]["name"], "Done")
+        per_read = (time.perf_counter() - start) / 200
+        self.assertEqual(self.mock_client.post.call_count, 1)  # the initial sync only
+        self.mock_client.get.assert_not_called()
+        self.assertLess(per_read, 0.001)
+
+    def test_unsupported_jql_goes_live(self):
+        self.service.search_issues("text ~ 'login'")
+        self.assertNotIn("updated", self.mock_client.post.call_args.args[1]["jql"])
+
+    def test_write_forces_delta_sync(self):
+        self.service.get_open_tasks()
+        self.mock_client.get.return_value = {"transitions": [{"id": "1", "name": "Done"}]}
+        self.service.transition_issue("TEST-1", "Done")
+        self.service.get_open_tasks()
+        self.assertEqual(self.mock_client.post.call_args_list[-1].args[0], "/rest/api/3/search/jql")
+        self.assertIn("updated >=", self.mock_client.post.call_args_list[-1].args[1]["jql"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.issue_view import MAX_FIELD_SETS, IssueRecord, _shared_field_set
+from src.jira_service import JiraService
+from src.metadata_cache import MetadataCache
+from src.sqlite_cache import SqliteCache
+
+
+def _issue(n, status="In Progress"):
+    # Built via JSON so equal strings are distinct objects, as in a real response.
+    return json.loads(json.dumps({
+        "key": f"TEST-{n}",
+        "fields": {"summary": f"Issue {n}", "status": {"name": status, "id": "3"},
+                   "assignee": {"displayName": "Developer", "accountId": "abc"},
+                   "labels": ["backend"], "description": None}}))
+
+
+class TestIssueRecord(unittest.TestCase):
+
+    def test_record_flattens_and_interns(self):
+        fields = ["summary", "status", "assignee", "labels"]
+        first, second = (IssueRecord.from_issue(_issue(n), fields) for n in (1, 2))
+        self.assertEqual(first.view(), {"key": "TEST-1", "summary": "Issue 1", "status": "In Progress",
+                                        "assignee": "Developer", "labels": ["backend"]})
+        self.assertIs(first.status, second.status)
+        self.assertIs(first.assignee, second.assignee)
+        self.assertIs(first.fields, second.fields)
+        self.assertEqual(first.get("labels"), ["backend"])
+
+    def test_json_round_trip(self):
+        record = IssueRecord.from_issue(_issue(1), ["summary", "status"])
+        restored = IssueRecord.from_cached(json.loads(json.dumps(record)))
+        self.assertEqual(restored, record)
+        self.assertIs(restored.fields, record.fields)
+        # Views cached by earlier versions still load.
+        self.assertEqual(IssueRecord.from_cached(record.view()), record)
+
+    def test_shared_field_sets_are_bounded(self):
+        for n in range(MAX_FIELD_SETS * 2):
+            IssueRecord.from_issue(_issue(1), ["summary", f"customfield_{n}"])
+        self.assertEqual(_shared_field_set.cache_info().currsize, MAX_FIELD_SETS)
+
+
+class TestServiceRecords(unittest.TestCase):
+
+    @patch('src.jira_service.JiraClient')
+    def setUp(self, MockJiraClient):
+        self.mock_client = MockJiraClient.return_value
+        self.mock_client.jira_url = "https://test.atlassian.net"
+        self.mock_client.project_key = "TEST"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.backend = SqliteCache(os.path.join(self.tmp.name, "metadata.sqlite3"))
+        self.service = JiraService(cache=MetadataCache(self.backend))
+
+    def tearDown(self):
+        self.backend.close()
+        self.tmp.cleanup()
+
+    def test_issue_record_cached_in_sqlite(self):
+        self.mock_client.get.return_value = _issue(1)
+        record = self.service.get_issue_record("TEST-1", ["summary", "status"])
+        again = self.service.get_issue_record("TEST-1", ["summary", "status"])
+        self.assertIsInstance(again, IssueRecord)
+        self.assertEqual(again, record)
+        self.assertEqual(self.mock_client.get.call_count, 1)
+
+    def test_open_tasks_are_records(self):
+        self.mock_client.post.return_value = {"issues": [_issue(n, "READY FOR DEVELOPMENT") for n in range(3)]}
+        with patch("builtins.print"):
+            records = self.service.get_open_tasks()
+        self.assertEqual([r.key for r in records], ["TEST-0", "TEST-1", "TEST-2"])
+        self.assertEqual({r.status for r in records}, {"READY FOR DEVELOPMENT"})
+
+
+if __name__ == '__main__':
+    unittest.main()
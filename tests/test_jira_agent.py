@@ -44,6 +44,14 @@ class TestJiraService(unittest.TestCase):
         result = self.service.transition_issue("TEST-1", "In Progress")
         self.assertTrue(result)
 
+    def test_transition_issue_failure(self):
+        self.mock_client.get.return_value = {
+            "transitions": [{"id": "11", "name": "In Progress"}]
+        }
+        self.mock_client.post.return_value = None  # JIRA rejected the transition
+
+        self.assertFalse(self.service.transition_issue("TEST-1", "In Progress"))
+
     def test_update_issue_success(self):
         self.mock_client.put.return_value = {} # Success returns empty dict or True
         result = self.service.update_issue("TEST-1", summary="New Summary", description="New Desc")
@@ -67,5 +75,27 @@ class TestJiraService(unittest.TestCase):
         result = self.service.get_issue_details("TEST-1")
         self.assertTrue(result)
 
+    def test_get_issue_projects_fields(self):
+        self.mock_client.get.return_value = {"key": "TEST-1", "fields": {"summary": "Summary"}}
+        self.service.get_issue("TEST-1")
+        params = self.mock_client.get.call_args.kwargs["params"]
+        self.assertEqual(params["fields"], "summary,status,assignee,priority,description")
+
+    def test_issue_view_is_compact_and_invalidated_on_update(self):
+        self.mock_client.get.return_value = {
+            "key": "TEST-1",
+            "fields": {"summary": "Summary", "status": {"name": "Done", "self": "https://..."},
+                       "assignee": {"displayName": "Developer", "accountId": "abc"}}
+        }
+        view = self.service.get_issue_view("TEST-1", ["summary", "status", "assignee"])
+        self.assertEqual(view, {"key": "TEST-1", "summary": "Summary", "status": "Done", "assignee": "Developer"})
+        self.service.get_issue_view("TEST-1", ["summary", "status", "assignee"])
+        self.assertEqual(self.mock_client.get.call_count, 1)
+
+        self.mock_client.put.return_value = True
+        self.service.update_issue("TEST-1", summary="New")
+        self.service.get_issue_view("TEST-1", ["summary", "status", "assignee"])
+        self.assertEqual(self.mock_client.get.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from src.http_pool import PoolConfig, close_sessions, get_session
+from src.jira_client import JiraClient
+from src.rate_limiter import TokenBucket, reset_rate_limiters
+from src.retry_policy import RetryPolicy, parse_retry_after
+
+ENV = {
+    "JIRA_URL": "https://test.atlassian.net",
+    "JIRA_USER_EMAIL": "test@example.com",
+    "JIRA_API_TOKEN": "token",
+    "JIRA_PROJECT_KEY": "TEST",
+}
+
+
+class TestJiraClient(unittest.TestCase):
+
+    def setUp(self):
+        self.env = patch.dict('os.environ', ENV)
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        close_sessions()
+        reset_rate_limiters()
+
+    def test_clients_share_pooled_session(self):
+        first = JiraClient()
+        second = JiraClient()
+        self.assertIs(first.session, second.session)
+
+    def test_pool_config_from_env(self):
+        with patch.dict('os.environ', {"JIRA_POOL_MAXSIZE": "5", "JIRA_READ_TIMEOUT": "2.5"}):
+            config = PoolConfig.from_env()
+        self.assertEqual(config.pool_maxsize, 5)
+        self.assertEqual(config.timeout, (5.0, 2.5))
+        adapter = get_session(config).get_adapter("https://test.atlassian.net")
+        self.assertEqual(adapter._pool_maxsize, 5)
+
+    def test_get_uses_session_with_timeout(self):
+        client = JiraClient()
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"accountId": "abc"}
+        with patch.object(client.session, 'request', return_value=response) as mock_request:
+            self.assertEqual(client.get("/rest/api/3/myself"), {"accountId": "abc"})
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], client.pool_config.timeout)
+
+    def test_post_sends_encoded_body(self):
+        client = JiraClient()
+        response = MagicMock(status_code=204)
+        with patch.object(client.session, 'request', return_value=response) as mock_request:
+            self.assertEqual(client.post("/rest/api/3/issue/TEST-1/comment", {"body": "déjà"}), {})
+        body = mock_request.call_args.kwargs["data"]
+        self.assertEqual(json.loads(body), {"body": "déjà"})
+        self.assertNotIn(b" ", body)
+
+    def test_delete_no_content(self):
+        client = JiraClient()
+        response = MagicMock(status_code=204, content=b"")
+        with patch.object(client.session, 'request', return_value=response):
+            self.assertTrue(client.delete("/rest/api/3/project/SOC"))
+
+    def test_retries_429_honouring_retry_after(self):
+        limiter = TokenBucket()
+        client = JiraClient(limiter=limiter, retry_policy=RetryPolicy(max_retries=2))
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "0.05"})
+        ok = MagicMock(status_code=200, headers={})
+        ok.json.return_value = {"key": "TEST-1"}
+        with patch.object(client.session, 'request', side_effect=[throttled, ok]):
+            self.assertEqual(client.get("/rest/api/3/issue/TEST-1"), {"key": "TEST-1"})
+        metrics = limiter.metrics()
+        self.assertEqual(metrics["retries_total"], {429: 1})
+        self.assertEqual(metrics["waits_total"], 1)
+        self.assertGreaterEqual(metrics["wait_seconds_total"], 0.04)
+
+    def test_gives_up_after_max_retries(self):
+        client = JiraClient(limiter=TokenBucket(), retry_policy=RetryPolicy(max_retries=1, backoff_base=0.001))
+        throttled = MagicMock(status_code=503, headers={})
+        throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(response=throttled)
+        with patch.object(client.session, 'request', return_value=throttled) as mock_request:
+            self.assertIsNone(client.post("/rest/api/3/issue", {}))
+        self.assertEqual(mock_request.call_count, 2)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_bucket_throttles_beyond_burst(self):
+        bucket = TokenBucket(rate=100, burst=2)
+        for _ in range(4):
+            bucket.acquire()
+        metrics = bucket.metrics()
+        self.assertEqual(metrics["acquired_total"], 4)
+        self.assertEqual(metrics["waits_total"], 2)
+
+    def test_bucket_shared_with_async_tasks(self):
+        bucket = TokenBucket(rate=50, burst=1)
+
+        async def run():
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        # Four tokens beyond the burst at 50/s => at least ~80ms.
+        self.assertGreaterEqual(time.monotonic() - start, 0.07)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+if __name__ == '__main__':
+    unittest.main()
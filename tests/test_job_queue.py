@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src import job_queue
+from src.job_queue import FAILED, RUNNING, SUCCEEDED, Job, JobQueue, JobStore
+
+
+def _transitioned(items):
+    return [{"index": i, "key": key, "ok": True, "error": None} for i, (key, _) in enumerate(items)]
+
+
+class TestJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "jobs.sqlite3")
+        self.service = MagicMock()
+        self.service.bulk_transition.side_effect = _transitioned
+        self.queues = []
+
+    def tearDown(self):
+        for q in self.queues:
+            q.close()
+            q.store.close()
+        self.tmp.cleanup()
+
+    def _queue(self):
+        q = JobQueue(JobStore(self.path), service_factory=lambda site: self.service, workers=1)
+        self.queues.append(q)
+        return q
+
+    def test_submit_runs_in_background_and_stores_result(self):
+        q = self._queue()
+        self.service.create_project.return_value = True
+
+        job_id = q.submit("create_project", {"key": "NEW", "name": "New Project"})
+        status = q.wait(job_id, timeout=5)
+
+        self.assertEqual(status["status"], SUCCEEDED)
+        self.assertEqual(q.result(job_id)["result"], {"ok": True})
+        self.service.create_project.assert_called_once_with("NEW", "New Project", shared_configuration_id=None)
+
+    def test_failures_are_recorded(self):
+        q = self._queue()
+        self.service.setup_soc_statuses.side_effect = RuntimeError("boom")
+        self.service.create_project.return_value = False
+
+        raised = q.submit("setup_soc_statuses")
+        refused = q.submit("create_project", {"key": "NEW", "name": "New"})
+
+        self.assertEqual(q.wait(raised, timeout=5)["error"], "boom")
+        self.assertEqual(q.wait(refused, timeout=5)["status"], FAILED)
+        self.assertEqual(q.result(refused)["result"], {"ok": False})
+
+    def test_rejects_unknown_kind_and_bad_params(self):
+        q = self._queue()
+        with self.assertRaises(ValueError):
+            q.submit("drop_everything")
+        with self.assertRaises(ValueError):
+            q.submit("create_project", {"key": "NEW"})  # name missing
+        self.assertEqual(q.store.counts(), {})
+
+    def test_resumes_interrupted_job_after_last_checkpoint(self):
+        items = [{"key": f"TEST-{i}", "status": "Done"} for i in range(120)]
+        # A previous process ran the first batch, then died mid-job.
+        store = JobStore(self.path)
+        store.add(Job(id="abc123", kind="bulk_transition", params={"items": items}, created_at=1.0))
+        job = store.claim("abc123", "dead-process", lease=-1)  # its lease has already run out
+        job.checkpoint(results=_transitioned([(i["key"], i["status"]) for i in items[:job_queue.BULK_BATCH_SIZE]]))
+        store.close()
+
+        q = self._queue()
+        q.start()
+        status = q.wait("abc123", timeout=5)
+
+        self.assertEqual(status["status"], SUCCEEDED)
+        self.assertEqual(status["attempts"], 2)
+        sent = [key for call in self.service.bulk_transition.call_args_list for key, _ in call.args[0]]
+        self.assertEqual(sent, [f"TEST-{i}" for i in range(job_queue.BULK_BATCH_SIZE, 120)])
+        result = q.result("abc123")["result"]
+        self.assertEqual(result["total"], 120)
+        self.assertEqual([r["index"] for r in result["results"]], list(range(120)))
+
+    def test_gives_up_after_max_attempts(self):
+        store = JobStore(self.path)
+        store.add(Job(id="stuck", kind="setup_soc_statuses", params={}, created_at=1.0))
+        for _ in range(job_queue.MAX_ATTEMPTS):
+            store.claim("stuck", "dead-process", lease=-1)
+        store.close()
+
+        q = self._queue()
+        q.start()
+
+        self.assertEqual(q.wait("stuck", timeout=5)["status"], FAILED)
+        self.service.setup_soc_statuses.assert_not_called()
+
+    def test_lease_renewal_does_not_requeue_waiting_jobs(self):
+        q = JobQueue(JobStore(self.path), service_factory=lambda site: self.service, workers=1, lease=0.03)
+        self.queues.append(q)
+        gate = threading.Event()
+        self.service.create_project.side_effect = lambda *a, **k: gate.wait(5)
+        job_ids = [q.submit("create_project", {"key": f"NEW{i}", "name": "New"}) for i in range(4)]
+        time.sleep(0.2)  # many renewal rounds while the first job holds the only worker
+
+        self.assertEqual(q.metrics()["pending"], 3)
+        gate.set()
+        self.assertEqual([q.wait(job_id, timeout=5)["status"] for job_id in job_ids], [SUCCEEDED] * 4)
+        self.assertEqual(self.service.create_project.call_count, 4)
+
+    def test_processes_sharing_a_file_run_a_job_once(self):
+        store = JobStore(self.path)
+        store.add(Job(id="live", kind="setup_soc_statuses", params={}, created_at=1.0))
+        held = store.claim("live", "other-process")  # running elsewhere, lease still valid
+
+        first, second = self._queue(), self._queue()
+        self.service.create_project.side_effect = lambda *a, **k: time.sleep(0.05) or True
+        job_id = first.submit("create_project", {"key": "NEW", "name": "New"})
+        second.start()
+        second._queue.put(job_id)  # as if its lease thread had seen the job
+        first.wait(job_id, timeout=5)
+
+        self.service.create_project.assert_called_once()
+        self.service.setup_soc_statuses.assert_not_called()
+        self.assertEqual(store.get("live").owner, held.owner)
+        self.assertIsNone(store.claim("live", "third-process"))
+        store.close()
+
+
+class TestJobTools(unittest.TestCase):
+
+    def test_submit_status_and_result(self):
+        from src import mcp_server
+
+        q = MagicMock()
+        q.submit.return_value = "abc123"
+        q.status.return_value = {"job_id": "abc123", "status": RUNNING}
+        q.result.return_value = {"job_id": "abc123", "status": SUCCEEDED, "result": {"ok": True}}
+        with patch.object(mcp_server, "_job_queue", q):
+            submitted = json.loads(asyncio.run(mcp_server.submit_job("bulk_assign", {"keys": ["TEST-1"]})))
+            status = json.loads(asyncio.run(mcp_server.job_status("abc123")))
+            result = json.loads(asyncio.run(mcp_server.job_result("abc123")))
+
+            q.submit.side_effect = ValueError("Unknown job kind 'nope'")
+            refused = asyncio.run(mcp_server.submit_job("nope"))
+
+        self.assertEqual(submitted, {"job_id": "abc123", "status": "queued"})
+        q.submit.assert_any_call("bulk_assign", {"keys": ["TEST-1"]}, None)
+        self.assertEqual(status["status"], RUNNING)
+        self.assertEqual(result["result"], {"ok": True})
+        self.assertIn("Unknown job kind", refused)
+
+
+if __name__ == '__main__':
+    unittest.main()
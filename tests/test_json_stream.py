@@ -0,0 +1,88 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.async_jira_client import AsyncJiraClient
+from src.async_search_paginator import AsyncSearchPaginator
+from src.http_pool import close_sessions
+from src.json_stream import ArrayStreamParser
+from src.jira_client import JiraClient
+from src.rate_limiter import reset_rate_limiters
+from src.search_paginator import SearchPaginator
+from tests.fake_jira_server import FakeJiraServer
+from tests.test_jira_client import ENV
+
+PAGE = {"startAt": 0,
+        "issues": [{"key": f"TEST-{i}", "fields": {"summary": "naïve \"quoted\" ]}" * i, "n": [i, 1.5, None]}}
+                   for i in range(20)],
+        "nextPageToken": "abc", "isLast": False}
+
+
+def _parse(raw, chunk_size):
+    parser = ArrayStreamParser("issues")
+    items = []
+    for start in range(0, len(raw), chunk_size):
+        items += parser.feed(raw[start:start + chunk_size])
+    return items + parser.close(), parser.meta
+
+
+class TestArrayStreamParser(unittest.TestCase):
+
+    def test_any_chunking_yields_same_issues_and_meta(self):
+        raw = json.dumps(PAGE, ensure_ascii=False, indent=1).encode("utf-8")
+        for chunk_size in (1, 2, 13, 4096, len(raw)):
+            issues, meta = _parse(raw, chunk_size)
+            self.assertEqual(issues, PAGE["issues"], chunk_size)
+            self.assertEqual(meta, {"startAt": 0, "nextPageToken": "abc", "isLast": False})
+
+    def test_truncated_or_malformed_body_raises(self):
+        for raw in (b'{"issues": [{"key": "A"}', b'["not an object"]', b'{"issues": [1 2]}'):
+            with self.assertRaises(ValueError):
+                _parse(raw, 4)
+
+
+class TestStreamingClient(unittest.TestCase):
+
+    def setUp(self):
+        self.env = patch.dict('os.environ', ENV)
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        close_sessions()
+        reset_rate_limiters()
+
+    def test_stream_post_reads_chunks_and_closes(self):
+        client = JiraClient()
+        raw = json.dumps(PAGE).encode()
+        response = MagicMock(status_code=200, headers={"Content-Length": str(len(raw))})
+        response.iter_content.return_value = (raw[i:i + 100] for i in range(0, len(raw), 100))
+        with patch.object(client.session, 'request', return_value=response) as request:
+            issues = client.stream_post("/rest/api/3/search/jql", {"jql": "project = TEST"})
+            self.assertEqual([i["key"] for i in issues], [f"TEST-{i}" for i in range(20)])
+        self.assertTrue(request.call_args.kwargs["stream"])
+        self.assertEqual(issues.meta["nextPageToken"], "abc")
+        response.close.assert_called_once()
+
+    def test_paginators_stream_against_fake_server(self):
+        with FakeJiraServer() as server:
+            server.state.seed(120)
+            client = JiraClient(settings=server.settings())
+            paginator = SearchPaginator(client, "project = TEST", page_size=50)
+            self.assertTrue(paginator.stream)
+            self.assertEqual([len(page) for page in paginator.pages()], [50, 50, 20])
+
+            async def collect():
+                async_client = AsyncJiraClient(settings=server.settings())
+                try:
+                    return [i["key"] async for i in AsyncSearchPaginator(async_client, "project = TEST",
+                                                                        max_results=75)]
+                finally:
+                    await async_client.aclose()
+
+            self.assertEqual(len(asyncio.run(collect())), 75)
+
+
+if __name__ == '__main__':
+    unittest.main()
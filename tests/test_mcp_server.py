@@ -1,29 +1,31 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 import json
 
-# We need to import the functions from mcp_server. 
-# Since mcp_server instantiates FastMCP and JiraService at top level, 
-# importing it might trigger side effects or need mocking of dependencies during import if not careful.
-# However, FastMCP initialization is usually side-effect free until run().
-# JiraService initialization creates a JiraClient which reads env vars. 
-# We should mock JiraService class in mcp_server module.
+# mcp_server builds its service lazily (get_service), so importing it needs no credentials.
+# Setting src.mcp_server.jira_service makes get_service() return the mock.
 
 class TestMcpServer(unittest.TestCase):
     
     def setUp(self):
         # Patch the jira_service instance in mcp_server
-        self.patcher = patch('src.mcp_server.jira_service')
+        # Tools await the async service, so its methods must be AsyncMocks.
+        self.patcher = patch('src.mcp_server.jira_service', new_callable=AsyncMock)
         self.mock_service = self.patcher.start()
         
     def tearDown(self):
         self.patcher.stop()
+
+    def _search_returns(self, issues):
+        # The service applies search_tasks' per-issue `shape` as issues stream in.
+        self.mock_service.search.side_effect = lambda jql, fields, max_results, shape: [shape(i) for i in issues]
         
     def test_create_project_success(self):
         from src.mcp_server import create_project
         self.mock_service.create_project.return_value = True
         
-        result = create_project("TEST", "Test Project")
+        result = asyncio.run(create_project("TEST", "Test Project"))
         self.assertIn("created successfully", result)
         self.mock_service.create_project.assert_called_with("TEST", "Test Project")
 
@@ -31,24 +33,52 @@ class TestMcpServer(unittest.TestCase):
         from src.mcp_server import create_issue
         self.mock_service.create_issue.return_value = "TEST-10"
         
-        result = create_issue("Summary", "Desc")
+        result = asyncio.run(create_issue("Summary", "Desc"))
         self.assertIn("TEST-10", result)
         self.mock_service.create_issue.assert_called()
 
     def test_search_tasks(self):
         from src.mcp_server import search_tasks
-        # Mock client response for search
-        self.mock_service.client.post.return_value = {
-            "issues": [
-                {"key": "TEST-1", "fields": {"summary": "Task 1"}},
-                {"key": "TEST-2", "fields": {"summary": "Task 2"}}
-            ]
-        }
-        
-        result = search_tasks("project = TEST")
+        # Mock service response for search
+        self._search_returns([
+            {"key": "TEST-1", "fields": {"summary": "Task 1"}},
+            {"key": "TEST-2", "fields": {"summary": "Task 2"}}
+        ])
+
+        result = asyncio.run(search_tasks("project = TEST"))
         data = json.loads(result)
         self.assertEqual(len(data), 2)
         self.assertEqual(data[0]['key'], "TEST-1")
+        self.mock_service.search.assert_called_with("project = TEST", fields=None, max_results=50, shape=ANY)
+
+    def test_search_tasks_caps_max_results(self):
+        from src.mcp_server import search_tasks
+        self._search_returns([
+            {"key": "TEST-1", "fields": {"summary": "Task 1", "status": {"name": "Done"}}}
+        ])
+        result = asyncio.run(search_tasks("project = TEST", max_results=10**6, fields=["status"]))
+        self.assertEqual(json.loads(result), [{"key": "TEST-1", "status": "Done"}])
+        self.assertEqual(self.mock_service.search.call_args.kwargs["max_results"], 1000)
+
+    def test_tools_run_concurrently(self):
+        from src.mcp_server import get_issue
+
+        async def slow_get_issue_view(key, fields):
+            await asyncio.sleep(0.2)
+            return {"key": key, "summary": key, "status": "Done"}
+
+        self.mock_service.get_issue_view.side_effect = slow_get_issue_view
+
+        async def run_many():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            results = await asyncio.gather(*(get_issue(f"TEST-{i}") for i in range(5)))
+            return results, loop.time() - start
+
+        results, elapsed = asyncio.run(run_many())
+        self.assertEqual(len(results), 5)
+        # Five 0.2s calls overlap instead of taking ~1s serially.
+        self.assertLess(elapsed, 0.6)
 
 if __name__ == '__main__':
     unittest.main()
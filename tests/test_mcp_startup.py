@@ -0,0 +1,102 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import json, sys
+import src.mcp_server as server
+print(json.dumps({"service_built": server.jira_service is not None,
+                  "loaded": [m for m in ("src.async_jira_service", "requests") if m in sys.modules]}))
+"""
+
+
+def _env(**extra):
+    env = {k: v for k, v in os.environ.items() if not k.startswith("JIRA_")}
+    env.update(extra)
+    return env
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestMcpStartup(unittest.TestCase):
+    """Import stays lazy and the stdio server answers a tool call; timings are in benchmarks/bench_mcp_startup.py."""
+
+    def test_import_is_lazy_and_needs_no_credentials(self):
+        result = subprocess.run([sys.executable, "-c", IMPORT_PROBE], cwd=ROOT, env=_env(),
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        probe = json.loads(result.stdout)
+        self.assertFalse(probe["service_built"])
+        self.assertEqual(probe["loaded"], [])
+
+    def test_first_tool_response_over_stdio(self):
+        # Unreachable JIRA: the background pre-warm fails, which must not disturb stdio.
+        env = _env(JIRA_URL=f"http://127.0.0.1:{_closed_port()}", JIRA_USER_EMAIL="a",
+                   JIRA_API_TOKEN="b", JIRA_PROJECT_KEY="T", JIRA_CACHE_BACKEND="memory")
+        messages = [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize",
+             "params": {"protocolVersion": "2025-06-18", "capabilities": {},
+                        "clientInfo": {"name": "startup-test", "version": "0"}}},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call",
+             "params": {"name": "rate_limit_metrics", "arguments": {}}},
+        ]
+        process = subprocess.Popen([sys.executable, "-m", "src.mcp_server"], cwd=ROOT, env=env,
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, text=True)
+        watchdog = threading.Timer(60, process.kill)
+        watchdog.start()
+        try:
+            process.stdin.write("".join(json.dumps(m) + "\n" for m in messages))
+            process.stdin.flush()
+            response = None
+            for line in process.stdout:
+                message = json.loads(line)  # every stdout line must be protocol
+                if message.get("id") == 2:
+                    response = message
+                    break
+        finally:
+            watchdog.cancel()
+            process.kill()
+            process.wait()
+        self.assertIsNotNone(response)
+        self.assertFalse(response["result"].get("isError"))
+        self.assertIn("rate_per_second", response["result"]["content"][0]["text"])
+
+
+
+class TestStartupHook(unittest.TestCase):
+
+    @staticmethod
+    async def _session(server):
+        async with server.lifespan(server.mcp):
+            pass
+
+    def test_sse_app_runs_startup_once_per_process(self):
+        from starlette.testclient import TestClient
+        import src.mcp_server as server
+
+        with patch.dict(os.environ, {"MCP_PREWARM": "0"}), patch.object(server, "_started", False), \
+                patch.object(server, "resume_jobs") as resume_jobs, \
+                patch.object(server, "resume_outbox") as resume_outbox:
+            with TestClient(server.sse_app()) as client:
+                for _ in range(3):
+                    self.assertEqual(client.get("/metrics").status_code, 200)
+            asyncio.run(self._session(server))  # an SSE session enters the lifespan too
+        resume_jobs.assert_called_once_with()
+        resume_outbox.assert_called_once_with()
+
+if __name__ == '__main__':
+    unittest.main()
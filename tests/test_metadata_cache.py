@@ -0,0 +1,75 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.jira_service import JiraService
+from src.memory_cache import MemoryCache
+from src.metadata_cache import MetadataCache
+from src.sqlite_cache import SqliteCache
+
+
+class TestBackends(unittest.TestCase):
+
+    def _exercise(self, backend):
+        backend.set("a", {"v": 1}, ttl=60)
+        backend.set("b", [1, 2], ttl=60)
+        backend.set("c", "x", ttl=60)
+        backend.get("a")  # "a" becomes most recent; "b" is now LRU
+        backend.set("d", "y", ttl=60)
+        self.assertEqual(backend.get("a"), {"v": 1})
+        self.assertIsNone(backend.get("b"))
+        backend.set("gone", 1, ttl=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(backend.get("gone"))
+        backend.delete_prefix("c")
+        self.assertIsNone(backend.get("c"))
+
+    def test_memory_lru_and_ttl(self):
+        self._exercise(MemoryCache(max_entries=3))
+
+    def test_sqlite_lru_ttl_and_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            backend = SqliteCache(path, max_entries=3)
+            self._exercise(backend)
+            backend.close()
+            # A new process (new connection) starts warm.
+            self.assertEqual(SqliteCache(path).get("a"), {"v": 1})
+
+
+class TestServiceCaching(unittest.TestCase):
+
+    @patch('src.jira_service.JiraClient')
+    def setUp(self, MockJiraClient):
+        self.mock_client = MockJiraClient.return_value
+        self.mock_client.jira_url = "https://test.atlassian.net"
+        self.mock_client.project_key = "TEST"
+        self.service = JiraService(cache=MetadataCache(MemoryCache()))
+
+    def test_account_id_fetched_once(self):
+        self.mock_client.get.return_value = {"accountId": "abc"}
+        self.mock_client.put.return_value = True
+        self.service.assign_task("TEST-1")
+        self.service.assign_task("TEST-2")
+        self.assertEqual(self.mock_client.get.call_count, 1)
+
+    def test_statuses_listed_once_for_many_creates(self):
+        self.mock_client.get.return_value = [{"id": "1", "name": "To Do"}]
+        self.mock_client.post.side_effect = [{"id": "2"}, {"id": "3"}]
+        self.service.create_status("QA")
+        self.service.create_status("PO")
+        self.assertEqual(self.service.create_status("qa"), "2")
+        self.assertEqual(self.mock_client.get.call_count, 1)
+        self.assertEqual(self.mock_client.post.call_count, 2)
+
+    def test_transition_invalidates_issue_transitions(self):
+        self.mock_client.get.return_value = {"transitions": [{"id": "11", "name": "Done"}]}
+        self.mock_client.post.return_value = {}
+        self.service.transition_issue("TEST-1", "Done")
+        self.service.transition_issue("TEST-1", "Done")
+        self.assertEqual(self.mock_client.get.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
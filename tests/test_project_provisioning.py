@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from create_desktop_boards import generate_project_key
+from src.project_provisioning import ResumeLog, fetch_existing_projects, plan_projects, provision, unique_key
+
+
+class TestProjectProvisioning(unittest.TestCase):
+
+    def test_fetch_existing_projects_follows_pages(self):
+        client = MagicMock()
+        client.get.side_effect = [
+            {"values": [{"key": "LDS", "name": "Lds"}, {"key": "SOC", "name": "Soc"}], "isLast": False},
+            {"values": [{"key": "CDAA", "name": "Cdaa"}], "isLast": True},
+        ]
+        self.assertEqual(fetch_existing_projects(client, page_size=2), {"LDS": "Lds", "SOC": "Soc", "CDAA": "Cdaa"})
+        self.assertEqual(client.get.call_args.kwargs["params"], {"startAt": 2, "maxResults": 2})
+
+        client.get.side_effect = [{"values": [{"key": "A"}], "isLast": False}, None]
+        self.assertIsNone(fetch_existing_projects(client))
+
+    def test_unique_key(self):
+        self.assertEqual(unique_key("JDA", {"JDA"}), "JDA2")
+        self.assertEqual(unique_key("ABCDEFGHIJ", {"ABCDEFGHIJ", "ABCDEFGHI2"}), "ABCDEFGHI3")
+        self.assertEqual(unique_key("1X", set()), "P1X")
+
+    def test_plan_resolves_collisions_locally(self):
+        existing = {"JDA": "Jira Dev Ai", "JDAA": "Other"}
+        dirs = ["jira-dev-ai", "java_dev_app", "jira-data-api", "notes", "old-repo"]
+        steps = plan_projects(dirs, existing, generate_project_key, done={"old-repo": "OR"})
+        by_dir = {s["directory"]: (s["action"], s["key"]) for s in steps}
+        self.assertEqual(by_dir["jira-dev-ai"], ("exists", "JDA"))
+        self.assertEqual(by_dir["java_dev_app"], ("create", "JDA2"))
+        self.assertEqual(by_dir["jira-data-api"], ("create", "JDA3"))
+        self.assertEqual(by_dir["notes"], ("create", "NOTE"))
+        self.assertEqual(by_dir["old-repo"], ("done", "OR"))
+
+    def test_provision_records_resume_log(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            resume = ResumeLog(os.path.join(tmp, "resume.jsonl"))
+            service = MagicMock()
+            service.get_myself_account_id.return_value = "acc-1"
+            service.create_project.side_effect = lambda key, name, account_id: key != "FAIL"
+            steps = plan_projects(["alpha", "fail", "beta"], {"BETA": "Beta"},
+                                  lambda d: "FAIL" if d == "fail" else d)
+
+            report = provision(service, steps, max_workers=2, resume=resume)
+
+            self.assertEqual((report["succeeded"], report["failed"]), (1, 1))
+            service.get_myself_account_id.assert_called_once()
+            self.assertEqual(resume.load(), {"alpha": "ALPHA", "beta": "BETA"})
+            # A second run only retries the failure.
+            rerun = plan_projects(["alpha", "fail", "beta"], {}, lambda d: d.upper(), resume.load())
+            self.assertEqual([s["directory"] for s in rerun if s["action"] == "create"], ["fail"])
+
+    def test_dry_run_creates_nothing(self):
+        import create_desktop_boards
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.mkdir(os.path.join(tmp, "new-project"))
+            service = MagicMock()
+            service.client.get.return_value = {"values": [], "isLast": True}
+            with patch("create_desktop_boards.JiraService", return_value=service), patch("builtins.print"):
+                create_desktop_boards.main(["--path", tmp, "--dry-run", "--resume", os.path.join(tmp, "r.jsonl")])
+            service.create_project.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
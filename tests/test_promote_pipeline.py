@@ -0,0 +1,72 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from src.jira_service import JiraService
+from src.promote_pipeline import PromotePipeline
+
+ISSUE = {
+    "key": "TEST-1",
+    "fields": {"summary": "Summary", "status": {"name": "To Do"}},
+    "transitions": [{"id": "31", "name": "Done", "to": {"name": "DONE"}}],
+}
+
+
+class TestPromotePipeline(unittest.TestCase):
+
+    @patch('src.jira_service.JiraClient')
+    def setUp(self, MockJiraClient):
+        self.mock_client = MockJiraClient.return_value
+        self.mock_client.jira_url = "https://test.atlassian.net"
+        self.mock_client.project_key = "TEST"
+        self.service = JiraService()
+
+        def slow_get(endpoint, params=None):
+            time.sleep(0.1)
+            return ISSUE
+
+        def slow_post(endpoint, payload):
+            time.sleep(0.1)
+            return {}
+
+        self.mock_client.get.side_effect = slow_get
+        self.mock_client.post.side_effect = slow_post
+
+    def test_promote_overlaps_and_reuses_issue(self):
+        with patch.object(self.service, 'print_issue_details') as mock_print:
+            result = PromotePipeline(self.service).promote("TEST-1", "Done", "Shipped")
+
+        self.assertTrue(result["commented"])
+        self.assertTrue(result["moved"])
+        # One GET (issue + transitions) instead of GET transitions + GET details.
+        self.assertEqual(self.mock_client.get.call_count, 1)
+        self.assertEqual(self.mock_client.get.call_args.kwargs["params"]["expand"], "transitions")
+        self.assertEqual(self.mock_client.post.call_count, 2)
+        printed = mock_print.call_args.args[1]
+        self.assertEqual(printed["fields"]["status"], {"name": "DONE"})
+        self.assertLess(result["wall_seconds"], result["serial_estimate_seconds"])
+
+    def test_no_transition_when_comment_fails(self):
+        self.mock_client.post.side_effect = None
+        self.mock_client.post.return_value = None
+        result = PromotePipeline(self.service).promote("TEST-1", "Done", "Shipped")
+        self.assertFalse(result["moved"])
+        self.assertEqual(self.mock_client.post.call_count, 1)
+
+    def test_promote_many_bounded_concurrency(self):
+        report = PromotePipeline(self.service, max_workers=3).promote_many(
+            [f"TEST-{i}" for i in range(3)], "Done", "Shipped")
+        self.assertEqual(len(report["results"]), 3)
+        self.assertGreater(report["saved_seconds"], 0)
+
+    def test_promote_many_prints_in_key_order_after_all_finish(self):
+        keys = [f"TEST-{i}" for i in range(4)]
+        printed = []
+        with patch.object(self.service, 'print_issue_details',
+                          side_effect=lambda key, data: printed.append((key, self.mock_client.post.call_count))):
+            PromotePipeline(self.service, max_workers=4).promote_many(keys, "Done", "Shipped")
+        self.assertEqual([key for key, _ in printed], keys)
+        self.assertTrue(all(posts == 8 for _, posts in printed))  # comment + transition for every key first
+
+if __name__ == '__main__':
+    unittest.main()
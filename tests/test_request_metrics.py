@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from src.http_pool import close_sessions
+from src.jira_client import JiraClient
+from src.rate_limiter import TokenBucket, reset_rate_limiters
+from src.request_metrics import RequestEvent, RequestMetrics, endpoint_template, format_summary
+from src.retry_policy import RetryPolicy
+
+ENV = {
+    "JIRA_URL": "https://test.atlassian.net",
+    "JIRA_USER_EMAIL": "test@example.com",
+    "JIRA_API_TOKEN": "token",
+    "JIRA_PROJECT_KEY": "TEST",
+}
+
+
+class TestRequestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.env = patch.dict('os.environ', ENV)
+        self.env.start()
+        self.metrics = RequestMetrics()
+        self.client = JiraClient(limiter=TokenBucket(), retry_policy=RetryPolicy(max_retries=2, backoff_base=0.001))
+        self.client.metrics = self.metrics
+        self.client.observers = [self.metrics.record]
+
+    def tearDown(self):
+        self.env.stop()
+        close_sessions()
+        reset_rate_limiters()
+
+    def test_endpoint_template_bounds_labels(self):
+        self.assertEqual(endpoint_template("/rest/api/3/issue/ABC-12/transitions"),
+                         "/rest/api/3/issue/{key}/transitions")
+        self.assertEqual(endpoint_template("/rest/api/3/statuses/10001"), "/rest/api/3/statuses/{id}")
+        self.assertEqual(endpoint_template("/rest/api/3/project/SOC"), "/rest/api/3/project/{project}")
+        self.assertEqual(endpoint_template("/rest/api/3/project/search"), "/rest/api/3/project/search")
+
+    def test_client_reports_status_sizes_and_retries(self):
+        events = []
+        self.client.observers.append(events.append)
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "0"}, content=b"")
+        ok = MagicMock(status_code=200, headers={}, content=b'{"key": "TEST-1"}')
+        ok.json.return_value = {"key": "TEST-1"}
+        with patch.object(self.client.session, 'request', side_effect=[throttled, ok]):
+            self.client.post("/rest/api/3/issue/TEST-1/comment", {"body": "hi"})
+        event = events[0]
+        self.assertEqual((event.method, event.endpoint, event.status, event.retries),
+                         ("POST", "/rest/api/3/issue/{key}/comment", 200, 1))
+        self.assertEqual(event.response_bytes, len(ok.content))
+        self.assertGreater(event.request_bytes, 0)
+        row = self.metrics.summary()[0]
+        self.assertEqual((row["calls"], row["errors"], row["retries"]), (1, 0, 1))
+
+    def test_transport_errors_are_counted(self):
+        with patch.object(self.client.session, 'request', side_effect=requests.exceptions.ConnectionError("down")):
+            self.assertIsNone(self.client.get("/rest/api/3/myself"))
+        self.assertEqual(self.metrics.summary()[0]["statuses"], {"error": 1})
+        self.assertIn("1 JIRA calls", format_summary(self.metrics.summary()))
+
+    def test_prometheus_histogram(self):
+        for seconds in (0.003, 0.2, 20.0):
+            self.metrics.record(RequestEvent("GET", "/rest/api/3/myself", 200, seconds, 0.0, 0, 10, 0))
+        text = self.metrics.prometheus()
+        labels = 'method="GET",endpoint="/rest/api/3/myself"'
+        self.assertIn(f'jira_client_request_duration_seconds_bucket{{{labels},le="0.005"}} 1', text)
+        self.assertIn(f'jira_client_request_duration_seconds_bucket{{{labels},le="0.25"}} 2', text)
+        self.assertIn(f'jira_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3', text)
+        self.assertIn(f'jira_client_requests_total{{{labels},status="200"}} 3', text)
+        self.assertIn(f'jira_client_response_bytes_total{{{labels}}} 30', text)
+
+    def test_mcp_metrics_tool(self):
+        from src import mcp_server
+        with patch('src.request_metrics._metrics', self.metrics):
+            self.metrics.record(RequestEvent("GET", "/rest/api/3/myself", 200, 0.01, 0.0, 0, 10, 0))
+            text = asyncio.run(mcp_server.metrics())
+        self.assertIn("# TYPE jira_client_request_duration_seconds histogram", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
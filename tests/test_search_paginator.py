@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import requests
+
+from src.async_search_paginator import AsyncSearchPaginator
+from src.search_paginator import SearchPaginator
+
+
+def _pages(count, per_page=2):
+    """Fake /search/jql responses chained by nextPageToken."""
+    pages = []
+    for n in range(count):
+        page = {"issues": [{"key": f"TEST-{n * per_page + i}"} for i in range(per_page)]}
+        if n < count - 1:
+            page["nextPageToken"] = f"token-{n + 1}"
+        pages.append(page)
+    return pages
+
+
+class TestSearchPaginator(unittest.TestCase):
+
+    def test_follows_next_page_token(self):
+        client = MagicMock()
+        client.post.side_effect = _pages(3)
+        keys = [i["key"] for i in SearchPaginator(client, "project = TEST", page_size=2)]
+        self.assertEqual(keys, [f"TEST-{n}" for n in range(6)])
+        tokens = [c.args[1].get("nextPageToken") for c in client.post.call_args_list]
+        self.assertEqual(tokens, [None, "token-1", "token-2"])
+
+    def test_max_results_stops_paging(self):
+        client = MagicMock()
+        client.post.side_effect = _pages(10)
+        keys = [i["key"] for i in SearchPaginator(client, "project = TEST", page_size=2, max_results=3)]
+        self.assertEqual(keys, ["TEST-0", "TEST-1", "TEST-2"])
+        self.assertEqual(client.post.call_args_list[-1].args[1]["maxResults"], 1)
+
+    def test_error_marks_failed(self):
+        client = MagicMock()
+        client.post.return_value = None
+        paginator = SearchPaginator(client, "project = TEST")
+        self.assertEqual(list(paginator), [])
+        self.assertTrue(paginator.failed)
+
+    def test_stream_dropped_mid_page_marks_failed(self):
+        class DroppedStream:
+            meta = {"nextPageToken": "token-1"}
+
+            def __iter__(self):
+                yield {"key": "TEST-0"}
+                raise requests.exceptions.ChunkedEncodingError("connection broken")
+
+        client = MagicMock()
+        client.stream_post.return_value = DroppedStream()
+        paginator = SearchPaginator(client, "project = TEST", stream=True)
+        self.assertEqual([i["key"] for i in paginator], ["TEST-0"])
+        self.assertTrue(paginator.failed)
+
+    def test_early_break_stops_producer(self):
+        client = MagicMock()
+        client.post.side_effect = _pages(50)
+        paginator = SearchPaginator(client, "project = TEST", max_buffered_pages=1)
+        for _ in paginator:
+            break
+        # Only the current page plus the bounded prefetch buffer were fetched.
+        self.assertLessEqual(client.post.call_count, 3)
+
+
+class TestAsyncSearchPaginator(unittest.TestCase):
+
+    def test_follows_next_page_token(self):
+        client = AsyncMock()
+        client.post.side_effect = _pages(3)
+
+        async def collect():
+            return [i["key"] async for i in AsyncSearchPaginator(client, "project = TEST")]
+
+        self.assertEqual(len(asyncio.run(collect())), 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from src.async_jira_client import AsyncJiraClient
+from src.http_pool import close_sessions
+from src.jira_client import JiraClient
+from src.jira_settings import JiraSettings
+from src.rate_limiter import TokenBucket, reset_rate_limiters
+from src.request_metrics import RequestMetrics
+from src.single_flight import AsyncSingleFlight, SingleFlight
+
+SETTINGS = JiraSettings("https://test.atlassian.net", "test@example.com", "token", "TEST")
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_followers_share_leader_error(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "k", fail)
+            started.wait()
+            follower = pool.submit(flight.do, "k", fail)
+            for future in (leader, follower):
+                with self.assertRaises(RuntimeError):
+                    future.result()
+        self.assertEqual(flight.metrics(), {"executed_total": 1, "coalesced_total": 1, "in_flight": 0})
+
+    def test_callers_do_not_see_each_others_changes(self):
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fetch():
+            started.set()
+            release.wait(5)
+            return {"key": "TEST-1", "fields": {"labels": ["a"]}}
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "k", fetch)
+            started.wait()
+            follower = pool.submit(flight.do, "k", fetch)
+            while flight.metrics()["coalesced_total"] < 1:
+                time.sleep(0.001)
+            release.set()
+            (first, _), (second, shared) = leader.result(), follower.result()
+        first["fields"]["labels"].append("b")
+        first.pop("key")
+        self.assertTrue(shared)
+        self.assertEqual(second, {"key": "TEST-1", "fields": {"labels": ["a"]}})
+
+    def test_async_callers_do_not_see_each_others_changes(self):
+        flight = AsyncSingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return {"key": "TEST-1", "fields": {"labels": ["a"]}}
+
+        async def scenario():
+            leader = asyncio.ensure_future(flight.do("k", fetch))
+            await asyncio.sleep(0)
+            (first, _), (second, shared) = await asyncio.gather(leader, flight.do("k", fetch))
+            first["fields"]["labels"].append("b")
+            return second, shared
+
+        self.assertEqual(asyncio.run(scenario()), ({"key": "TEST-1", "fields": {"labels": ["a"]}}, True))
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        flight = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def scenario():
+            leader = asyncio.ensure_future(flight.do("k", slow))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.do("k", slow))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        self.assertEqual(asyncio.run(scenario()), ("value", True))
+
+
+class TestClientCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.env = patch.dict('os.environ', {"JIRA_URL": SETTINGS.jira_url, "JIRA_USER_EMAIL": "a",
+                                             "JIRA_API_TOKEN": "b", "JIRA_PROJECT_KEY": "TEST"})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        close_sessions()
+        reset_rate_limiters()
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        client = JiraClient(limiter=TokenBucket())
+        client.metrics = RequestMetrics()
+        client.observers = [client.metrics.record]
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.1)
+            response = MagicMock(status_code=200, content=b"{}")
+            response.json.return_value = {"key": "TEST-1"}
+            return response
+
+        with patch.object(client.session, 'request', side_effect=slow_request) as mock_request:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: client.get("/rest/api/3/issue/TEST-1", {"fields": "summary"}),
+                                        range(8)))
+            client.get("/rest/api/3/issue/TEST-1", {"fields": "status"})
+        self.assertEqual(results, [{"key": "TEST-1"}] * 8)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(client.single_flight.coalesced, 7)
+        self.assertEqual(client.metrics.summary()[0]["coalesced"], 7)
+
+    def test_async_searches_coalesce_but_writes_do_not(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"issues": []})
+
+        client = AsyncJiraClient(settings=SETTINGS, limiter=TokenBucket())
+        client._http = httpx.AsyncClient(base_url=SETTINGS.jira_url, transport=httpx.MockTransport(handler))
+
+        async def scenario():
+            search = {"jql": "project = TEST"}
+            await asyncio.gather(*(client.post("/rest/api/3/search/jql", search) for _ in range(5)),
+                                 *(client.post("/rest/api/3/issue/TEST-1/comment", {"body": "x"}) for _ in range(2)))
+
+        asyncio.run(scenario())
+        self.assertEqual(calls.count("/rest/api/3/search/jql"), 1)
+        self.assertEqual(calls.count("/rest/api/3/issue/TEST-1/comment"), 2)
+        self.assertEqual(client.single_flight.metrics()["coalesced_total"], 4)
+
+
+    def test_concurrent_streamed_searches_share_one_response(self):
+        client = JiraClient(limiter=TokenBucket())
+        raw = json.dumps({"issues": [{"key": f"TEST-{i}"} for i in range(50)], "isLast": True}).encode()
+        responses = []
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.1)
+            response = MagicMock(status_code=200, headers={})
+            response.iter_content.return_value = (raw[i:i + 64] for i in range(0, len(raw), 64))
+            responses.append(response)
+            return response
+
+        def search(_):
+            issues = client.stream_post("/rest/api/3/search/jql", {"jql": "project = TEST"})
+            return [issue["key"] for issue in issues], issues.meta
+
+        with patch.object(client.session, 'request', side_effect=slow_request):
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                results = list(pool.map(search, range(6)))
+            later = search(None)
+
+        self.assertEqual(results, [([f"TEST-{i}" for i in range(50)], {"isLast": True})] * 6)
+        self.assertEqual(later, results[0])
+        self.assertEqual(len(responses), 2)  # the later search is not coalesced
+        self.assertEqual(client.shared_streams.metrics(), {"executed_total": 2, "coalesced_total": 5, "in_flight": 0})
+        responses[0].close.assert_called_once()
+
+    def test_async_streamed_searches_share_one_response(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"issues": [{"key": f"TEST-{i}"} for i in range(30)], "isLast": True})
+
+        client = AsyncJiraClient(settings=SETTINGS, limiter=TokenBucket())
+        client._http = httpx.AsyncClient(base_url=SETTINGS.jira_url, transport=httpx.MockTransport(handler))
+
+        async def search(limit):
+            issues = await client.stream_post("/rest/api/3/search/jql", {"jql": "project = TEST"})
+            keys = []
+            try:
+                async for issue in issues:
+                    keys.append(issue["key"])
+                    if len(keys) == limit:
+                        break
+            finally:
+                await issues.aclose()
+            return keys
+
+        async def scenario():
+            return await asyncio.gather(search(None), search(5), search(None))
+
+        full, partial, again = asyncio.run(scenario())
+        self.assertEqual(calls, ["/rest/api/3/search/jql"])
+        self.assertEqual(full, again)
+        self.assertEqual((len(full), partial), (30, full[:5]))
+        self.assertEqual(client.shared_streams.metrics()["in_flight"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.jira_settings import JiraSettings
+from src.rate_limiter import reset_rate_limiters
+from src.tenant_registry import DEFAULT_SITE, TenantRegistry, build_tenant_service, project_routes
+
+SITES_ENV = {
+    "JIRA_URL": "https://main.example.net", "JIRA_USER_EMAIL": "a@example.com",
+    "JIRA_API_TOKEN": "t", "JIRA_PROJECT_KEY": "LDS",
+    "JIRA_SITES": "sec,partner",
+    "JIRA_SITE_SEC_URL": "https://sec.example.net", "JIRA_SITE_SEC_PROJECTS": "SOC, SOC2",
+    "JIRA_SITE_PARTNER_URL": "https://partner.example.net", "JIRA_SITE_PARTNER_PROJECT_KEY": "JDAA",
+    "JIRA_SITE_PARTNER_API_TOKEN": "p",
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTenantRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.factory = MagicMock(side_effect=lambda site: MagicMock(site=site, aclose=AsyncMock()))
+        self.registry = TenantRegistry(self.factory, max_idle=60, max_tenants=2,
+                                       routes={"SOC": "sec"}, clock=self.clock)
+
+    def test_resolve(self):
+        self.assertEqual(self.registry.resolve("SEC"), "sec")
+        self.assertEqual(self.registry.resolve(project_key="soc"), "sec")
+        self.assertEqual(self.registry.resolve(project_key="LDS"), DEFAULT_SITE)
+        self.assertEqual(self.registry.resolve(), DEFAULT_SITE)
+
+    def test_reuses_and_evicts_idle_tenants(self):
+        async def scenario():
+            first = self.registry.get("sec")
+            self.assertIs(self.registry.get("sec"), first)
+            self.clock.now = 61
+            self.registry.get("partner")  # "sec" has been idle too long
+            await asyncio.sleep(0)
+            return first
+
+        first = asyncio.run(scenario())
+        first.aclose.assert_awaited_once()
+        self.assertEqual(list(self.registry.metrics()["idle_seconds"]), ["partner"])
+        self.assertIsNot(self.registry.get("sec"), first)
+        self.assertEqual(self.registry.created, 3)
+
+    def test_checked_out_tenant_is_closed_after_its_last_call(self):
+        services = {}
+
+        async def call(site, gate):
+            with self.registry.checkout(site) as service:
+                services[site] = service
+                await gate.wait()
+
+        async def scenario():
+            gate = asyncio.Event()
+            busy = [asyncio.ensure_future(call(site, gate)) for site in ("a", "b")]
+            await asyncio.sleep(0)
+            self.clock.now = 61
+            self.registry.get("c")  # both are mid-call, so not idle; over max_tenants, "a" goes
+            self.assertEqual(self.registry.metrics()["in_use"], {"b": 1})
+            self.assertEqual(self.registry.metrics()["closing_after_use"], 1)
+            await asyncio.sleep(0)
+            services["a"].aclose.assert_not_awaited()  # evicted, but not closed under the running call
+            gate.set()
+            await asyncio.gather(*busy)
+            await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+        services["a"].aclose.assert_awaited_once()
+        services["b"].aclose.assert_not_awaited()
+        self.assertEqual(list(self.registry.metrics()["idle_seconds"]), ["b", "c"])
+        self.assertEqual(self.registry.metrics()["closing_after_use"], 0)
+
+    def test_bounded_by_max_tenants(self):
+        services = [self.registry.get(site) for site in ("a", "b", "a", "c")]
+        self.assertEqual(list(self.registry.metrics()["idle_seconds"]), ["a", "c"])
+        self.assertEqual(self.registry.evicted, 1)
+        services[1].aclose.assert_awaited_once()  # closed even with no running loop
+
+    def test_factory_runs_outside_the_lock(self):
+        def factory(site):
+            self.assertFalse(self.registry._lock.locked())
+            return MagicMock(site=site, aclose=AsyncMock())
+
+        self.registry.factory = factory
+        self.assertEqual(self.registry.get("a").site, "a")
+        self.assertEqual(self.registry.created, 1)
+
+
+class TestTenantSettings(unittest.TestCase):
+
+    @patch.dict("os.environ", SITES_ENV, clear=True)
+    @patch("src.jira_settings.load_dotenv")
+    def test_site_settings_and_isolation(self, _):
+        sec = JiraSettings.from_env("sec")
+        self.assertEqual((sec.jira_url, sec.token, sec.project_key), ("https://sec.example.net", "t", "SOC"))
+        self.assertEqual(JiraSettings.from_env("partner").token, "p")
+        self.assertEqual(project_routes(), {"SOC": "sec", "SOC2": "sec"})
+        with self.assertRaises(ValueError):
+            JiraSettings.from_env("unknown")
+
+        first, second = build_tenant_service("sec"), build_tenant_service("partner")
+        self.assertIsNot(first.client.limiter, second.client.limiter)
+        self.assertIsNot(first.cache.backend, second.cache.backend)
+        self.assertEqual(first.project_key, "SOC")
+
+        # Another name for the same JIRA site shares its rate budget.
+        with patch.dict("os.environ", {"JIRA_SITES": "sec,partner,soc", "JIRA_SITE_SOC_URL": "https://sec.example.net",
+                                       "JIRA_SITE_SOC_API_TOKEN": "s", "JIRA_SITE_SOC_PROJECT_KEY": "SOC"}):
+            self.assertIs(build_tenant_service("soc").client.limiter, first.client.limiter)
+        reset_rate_limiters()
+
+
+class TestMcpRouting(unittest.TestCase):
+
+    @patch.dict("os.environ", SITES_ENV, clear=True)
+    def test_tools_route_by_issue_project(self):
+        import src.mcp_server as server
+
+        default, sec = AsyncMock(), AsyncMock()
+        default.get_issue_view.return_value = {"key": "LDS-1"}
+        sec.get_issue_view.return_value = {"key": "SOC-1"}
+        registry = TenantRegistry(lambda site: sec, routes=project_routes())
+        with patch.object(server, "jira_service", default), patch.object(server, "_tenants", registry):
+            asyncio.run(server.get_issue("SOC-1"))
+            asyncio.run(server.get_issue("LDS-1"))
+        sec.get_issue_view.assert_awaited_once()
+        default.get_issue_view.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
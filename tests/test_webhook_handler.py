@@ -0,0 +1,130 @@
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from starlette.testclient import TestClient
+
+import src.mcp_server as mcp_server
+from src.issue_mirror import IssueMirror
+from src.memory_cache import MemoryCache
+from src.metadata_cache import MetadataCache
+from src.webhook_handler import WebhookHandler
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "webhooks")
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class TestWebhookHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mirror = IssueMirror(os.path.join(self.tmp.name, "mirror.sqlite3"))
+        self.cache = MetadataCache(MemoryCache())
+        self.handler = WebhookHandler(self.cache, self.mirror)
+
+    def tearDown(self):
+        self.mirror.close()
+        self.tmp.cleanup()
+
+    def test_issue_updated_refreshes_mirror_and_caches(self):
+        self.cache.put("issue_view", "TEST-42|summary", {"key": "TEST-42"})
+        self.cache.put("transitions", "TEST-42", {"transitions": []})
+        report = self.handler.handle(json.loads(_fixture("issue_updated_status.json")))
+
+        self.assertEqual(report["actions"], ["views_invalidated", "transitions_invalidated", "mirror_updated"])
+        self.assertIsNone(self.cache.get("issue_view", "TEST-42|summary"))
+        self.assertIsNone(self.cache.get("transitions", "TEST-42"))
+        stored = self.mirror.get("TEST-42")
+        self.assertEqual(stored["fields"]["status"]["name"], "IN PROGRESS")
+        self.assertNotIn("watches", stored["fields"])  # trimmed to mirrored fields
+
+    def test_stale_event_does_not_overwrite(self):
+        event = json.loads(_fixture("issue_updated_status.json"))
+        self.handler.handle(event)
+        event["issue"]["fields"].update(status={"name": "Done"}, updated="2026-10-18T09:00:00.000+0000")
+        self.handler.handle(event)
+        self.assertEqual(self.mirror.get("TEST-42")["fields"]["status"]["name"], "IN PROGRESS")
+
+    def test_comment_merges_known_issue_only(self):
+        comment = json.loads(_fixture("comment_created.json"))
+        self.assertEqual(self.handler.handle(comment)["actions"], ["views_invalidated"])
+        self.assertIsNone(self.mirror.get("TEST-42"))
+
+        self.handler.handle(json.loads(_fixture("issue_updated_status.json")))
+        self.assertIn("mirror_updated", self.handler.handle(comment)["actions"])
+        # Fields missing from the partial comment payload are kept.
+        self.assertEqual(self.mirror.get("TEST-42")["fields"]["updated"], "2026-10-18T10:05:00.000+0000")
+
+    def test_issue_deleted(self):
+        self.handler.handle(json.loads(_fixture("issue_updated_status.json")))
+        self.handler.handle(json.loads(_fixture("issue_deleted.json")))
+        self.assertIsNone(self.mirror.get("TEST-42"))
+        self.assertEqual(self.handler.metrics()["applied_total"],
+                         {"jira:issue_updated": 1, "jira:issue_deleted": 1})
+
+
+class TestWebhookRoute(unittest.TestCase):
+    """Local stand-in for JIRA: posts recorded webhook payloads to the SSE app."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mirror = IssueMirror(os.path.join(self.tmp.name, "mirror.sqlite3"))
+        service = MagicMock(cache=MetadataCache(MemoryCache()), mirror=self.mirror)
+        self.patchers = [patch("src.mcp_server.jira_service", service),
+                         patch.dict("src.mcp_server._webhook_handlers", clear=True),
+                         patch.dict(os.environ, {"JIRA_WEBHOOK_SECRET": "s3cret"})]
+        for patcher in self.patchers:
+            patcher.start()
+        self.client = TestClient(mcp_server.mcp.sse_app())
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.mirror.close()
+        self.tmp.cleanup()
+
+    def _post(self, body, secret=b"s3cret"):
+        signature = "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+        return self.client.post("/webhooks/jira", content=body,
+                                headers={"Content-Type": "application/json", "X-Hub-Signature": signature})
+
+    def test_post_recorded_payloads(self):
+        for name in ("issue_updated_status.json", "comment_created.json"):
+            response = self._post(_fixture(name))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["key"], "TEST-42")
+        self.assertEqual(self.mirror.get("TEST-42")["fields"]["status"]["name"], "IN PROGRESS")
+
+        self.assertEqual(self._post(b"{not json").status_code, 400)
+        self.assertEqual(len(mcp_server._webhook_handlers), 1)  # one handler reused across requests
+
+    def test_signature_required(self):
+        body = _fixture("issue_updated_status.json")
+        self.assertEqual(self.client.post("/webhooks/jira", content=body).status_code, 401)
+        self.assertEqual(self._post(body, secret=b"wrong").status_code, 401)
+        self.assertEqual(self._post(body).status_code, 200)
+
+    def test_unsigned_deliveries_refused_or_only_invalidate(self):
+        body = _fixture("issue_updated_status.json")
+        self.mirror.upsert([{"key": "TEST-42", "fields": {"summary": "Stored"}}])
+        with patch.dict(os.environ, {"JIRA_WEBHOOK_SECRET": ""}):
+            mcp_server._webhook_handlers.clear()
+            self.assertEqual(self.client.post("/webhooks/jira", content=body).status_code, 403)
+            self.assertEqual(self.mirror.get("TEST-42")["fields"]["summary"], "Stored")
+
+            mcp_server._webhook_handlers.clear()
+            with patch.dict(os.environ, {"JIRA_WEBHOOK_ALLOW_UNSIGNED": "1"}):
+                response = self.client.post("/webhooks/jira", content=body)
+        self.assertEqual(response.json()["actions"], ["views_invalidated", "mirror_invalidated"])
+        self.assertIsNone(self.mirror.get("TEST-42"))  # refetched from JIRA on the next read
+
+if __name__ == '__main__':
+    unittest.main()
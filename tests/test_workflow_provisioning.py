@@ -0,0 +1,119 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.jira_service import JiraService
+from src.memory_cache import MemoryCache
+from src.metadata_cache import MetadataCache
+from src.workflow_provisioning import (ColumnSpec, ProvisioningSpec, ProvisioningState, StatusSpec, WorkflowProvisioner,
+                                       diff_state, workflow_update_payload)
+
+STATUSES = [
+    {"id": "1", "name": "To Do", "statusCategory": {"key": "new"}},
+    {"id": "3", "name": "In Progress", "statusCategory": {"key": "indeterminate"}},
+    {"id": "5", "name": "Done", "statusCategory": {"key": "done"}},
+]
+
+SPEC = ProvisioningSpec(
+    statuses=(StatusSpec("To Do"), StatusSpec("QA TESTING", "IN_PROGRESS"), StatusSpec("Done", "DONE")),
+    workflow="CDAA Workflow",
+    columns=(ColumnSpec("To Do", ("To Do",)), ColumnSpec("QA", ("QA TESTING",)), ColumnSpec("Done", ("Done",))),
+    project_key="CDAA",
+)
+
+
+class FakeJira:
+    """Minimal JIRA for the endpoints the provisioner uses."""
+    def __init__(self):
+        self.statuses = list(STATUSES)
+        self.workflow = None
+        self.columns = [{"name": "To Do", "statuses": [{"id": "1"}]}]
+        self.calls = []
+
+    def get(self, endpoint, params=None):
+        self.calls.append(("GET", endpoint))
+        if endpoint == "/rest/api/3/status":
+            return self.statuses
+        if endpoint == "/rest/agile/1.0/board":
+            return {"values": [{"id": 45}]}
+        return {"columnConfig": {"columns": self.columns}}
+
+    def post(self, endpoint, payload):
+        self.calls.append(("POST", endpoint))
+        if endpoint == "/rest/api/3/statuses":
+            created = [{"id": str(100 + i), "name": s["name"],
+                        "statusCategory": {"key": "indeterminate"}} for i, s in enumerate(payload["statuses"])]
+            self.statuses += created
+            return created
+        if endpoint == "/rest/api/3/workflows":
+            if self.workflow is None:
+                return {"workflows": [], "statuses": []}
+            refs = [s["statusReference"] for s in self.workflow["statuses"]]
+            return {"workflows": [self.workflow],
+                    "statuses": [{"statusReference": s["id"], "name": s["name"]} for s in self.statuses
+                                 if s["id"] in refs]}
+        self.workflow = {"id": "wf-1", "version": {"id": "v1", "versionNumber": 1}, **payload["workflows"][0]}
+        return {"workflows": [self.workflow]}
+
+    def put(self, endpoint, payload):
+        self.calls.append(("PUT", endpoint))
+        self.columns = payload["columnConfig"]["columns"]
+        return True
+
+
+class TestWorkflowProvisioning(unittest.TestCase):
+
+    def setUp(self):
+        self.jira = FakeJira()
+        self.service = MagicMock(client=self.jira, cache=MetadataCache(MemoryCache()))
+
+    def test_provision_fresh_project_in_few_requests(self):
+        report = WorkflowProvisioner(self.service).provision(SPEC)
+        self.assertTrue(report["ok"], report["errors"])
+        self.assertEqual([s.name for s in report["plan"].create_statuses], ["QA TESTING"])
+        # statuses, workflow, board, board config + create statuses, create workflow, put columns
+        self.assertEqual(report["requests"], 7)
+        self.assertEqual(self.jira.columns[1], {"name": "QA", "statuses": [{"id": "100"}]})
+
+        again = WorkflowProvisioner(self.service).provision(SPEC)
+        self.assertTrue(again["plan"].is_empty())
+        self.assertEqual(again["requests"], 4)  # fetch only
+
+    def test_dry_run_changes_nothing(self):
+        report = WorkflowProvisioner(self.service).provision(SPEC, dry_run=True)
+        self.assertFalse(report["plan"].is_empty())
+        self.assertEqual([c for c in self.jira.calls if c[0] != "GET" and c[1] != "/rest/api/3/workflows"], [])
+
+    def test_diff_detects_category_and_missing_workflow_statuses(self):
+        state = ProvisioningState(statuses={"done": {"id": "5", "name": "Done", "category": "IN_PROGRESS"}},
+                                  workflow={"id": "w"}, workflow_statuses={"done"})
+        plan = diff_state(ProvisioningSpec((StatusSpec("Done", "DONE"), StatusSpec("New")), workflow="W"), state)
+        self.assertEqual(plan.update_statuses, [("5", StatusSpec("Done", "DONE"))])
+        self.assertEqual((plan.workflow_action, plan.workflow_missing), ("update", ["New"]))
+
+        workflow = {"id": "w", "version": {"id": "v"}, "statuses": [{"statusReference": "5"}],
+                    "transitions": [{"id": "1"}, {"id": "21"}]}
+        payload = workflow_update_payload(workflow, [("9", "New", "TODO")])["workflows"][0]
+        self.assertEqual(payload["transitions"][-1]["id"], "31")
+        self.assertEqual(len(payload["statuses"]), 2)
+
+
+class TestServiceProvisioning(unittest.TestCase):
+
+    @patch('src.jira_service.JiraClient')
+    def test_setup_soc_statuses_batches_creation(self, MockJiraClient):
+        client = MockJiraClient.return_value
+        client.project_key = "SOC"
+        client.get.return_value = STATUSES
+        client.post.side_effect = lambda endpoint, payload: [
+            {"id": str(i), "name": s["name"]} for i, s in enumerate(payload["statuses"])]
+        service = JiraService(cache=MetadataCache(MemoryCache()))
+        with patch("builtins.print"):
+            self.assertTrue(service.setup_soc_statuses())
+        self.assertEqual(client.get.call_count, 1)
+        client.post.assert_called_once()
+        # "DONE" already exists as "Done"; the other seven go in one request.
+        self.assertEqual(len(client.post.call_args.args[1]["statuses"]), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
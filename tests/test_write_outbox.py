@@ -0,0 +1,207 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from src.http_pool import PoolConfig
+from src.jira_client import JiraClient
+from src.jira_service import JiraService
+from src.rate_limiter import TokenBucket
+from src.retry_policy import RetryPolicy
+from src.write_outbox import FAILED, PENDING, SENDERS, SENT, Mutation, Outbox, OutboxStore, next_batch
+from tests.fake_jira_server import Faults, FakeJiraServer
+
+# Retries due at once, so drain() can be called again straight away.
+NO_BACKOFF = RetryPolicy(backoff_base=0.0)
+
+
+class TestNextBatch(unittest.TestCase):
+
+    def test_keeps_per_issue_order(self):
+        pending = [
+            Mutation(id="a", kind="add_comment", params={"issue_key": "TEST-1"}, next_attempt_at=100.0),
+            Mutation(id="b", kind="transition_issue", params={"issue_key": "TEST-1"}),
+            Mutation(id="c", kind="add_comment", params={"issue_key": "TEST-2"}),
+            Mutation(id="d", kind="add_comment", params={"issue_key": "TEST-2"}),
+            Mutation(id="e", kind="create_issue", params={}),
+            Mutation(id="f", kind="create_issue", params={}),
+        ]
+        # "a" is backing off, so "b" waits behind it; "d" waits for "c"; creates are unordered.
+        self.assertEqual([m.id for m in next_batch(pending, now=10.0, size=10)], ["c", "e", "f"])
+        self.assertEqual([m.id for m in next_batch(pending, now=10.0, size=2)], ["c", "e"])
+
+
+class TestOutbox(unittest.TestCase):
+    """Outbox over real HTTP against the in-process fake JIRA."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "outbox.sqlite3")
+        self.server = FakeJiraServer(seed=3).__enter__()
+        client = JiraClient(settings=self.server.settings(), pool_config=PoolConfig(), limiter=TokenBucket(),
+                            retry_policy=RetryPolicy(max_retries=0))
+        self.service = JiraService(client=client)
+        self.print = patch("builtins.print")
+        self.print.start()
+        self.outbox = self._outbox()
+
+    def tearDown(self):
+        self.outbox.close()
+        self.outbox.store.close()
+        self.print.stop()
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def _outbox(self, **kwargs):
+        kwargs.setdefault("retry_policy", NO_BACKOFF)
+        return Outbox(OutboxStore(self.path), service_factory=lambda site: self.service, **kwargs)
+
+    def _submit(self, kind, params, **kwargs):
+        # Store only: the tests call drain() instead of running the sender thread.
+        with patch.object(Outbox, "start"):
+            return self.outbox.submit(kind, params, **kwargs)
+
+    def test_writes_are_sent_in_order_with_creates_batched(self):
+        self.server.state.add_issue("TEST", "Existing")
+        created = [self._submit("create_issue", {"summary": f"New {i}", "description": "Body"})["id"]
+                   for i in range(3)]
+        comment = self._submit("add_comment", {"issue_key": "TEST-1", "comment_text": "First"})["id"]
+        moved = self._submit("transition_issue", {"issue_key": "TEST-1", "status_name": "Done"})["id"]
+
+        self.assertEqual(self.outbox.status(comment)["status"], PENDING)
+        self.assertEqual(self.outbox.drain(), 2)  # the transition waits for the comment on TEST-1
+
+        keys = [self.outbox.status(i)["result"]["key"] for i in created]
+        self.assertEqual(keys, ["TEST-2", "TEST-3", "TEST-4"])
+        self.assertEqual(self.outbox.status(comment)["status"], SENT)
+        self.assertEqual(self.outbox.status(moved)["result"], {"status": "Done"})
+        self.assertEqual(self.server.state.issues["TEST-1"]["fields"]["status"]["name"], "Done")
+        self.assertEqual(self.server.state.issues["TEST-2"]["properties"]["jira_agent.outbox"], {"id": created[0]})
+
+    def test_retries_through_an_outage(self):
+        self.server.state.add_issue("TEST", "Existing")
+        self.server.faults = Faults(error_rate=1.0)
+        entry = self._submit("add_comment", {"issue_key": "TEST-1", "comment_text": "Eventually"})
+
+        self.outbox.drain()
+        status = self.outbox.status(entry["id"])
+        self.assertEqual((status["status"], status["attempts"]), (PENDING, 1))
+
+        self.server.faults = Faults()
+        self.outbox.drain()
+        self.assertEqual(self.outbox.status(entry["id"])["status"], SENT)
+        self.assertEqual(len(self.server.state.comments["TEST-1"]), 1)
+
+    def test_lost_responses_are_not_applied_twice(self):
+        self.server.state.add_issue("TEST", "Existing")
+        post = self.service.client.post
+        lost = []
+
+        def post_losing_first_reply(endpoint, payload):
+            data = post(endpoint, payload)
+            if endpoint != "/rest/api/3/search/jql" and len(lost) < 2:
+                lost.append(endpoint)
+                return None  # JIRA applied the write but the reply never arrived
+            return data
+
+        created = self._submit("create_issue", {"summary": "Once", "description": ""})["id"]
+        comment = self._submit("add_comment", {"issue_key": "TEST-1", "comment_text": "Once"})["id"]
+        with patch.object(self.service.client, "post", side_effect=post_losing_first_reply):
+            self.outbox.drain()
+            self.outbox.drain()
+
+        self.assertEqual(len(lost), 2)
+        self.assertEqual(self.outbox.status(created)["result"], {"key": "TEST-2"})
+        self.assertEqual(sorted(self.server.state.issues), ["TEST-1", "TEST-2"])
+        self.assertEqual(self.outbox.status(comment)["status"], SENT)
+        self.assertEqual(len(self.server.state.comments["TEST-1"]), 1)
+
+    def test_log_survives_restart_and_dedupes_keys(self):
+        first = self._submit("update_issue", {"issue_key": "TEST-1", "summary": "Renamed"}, idempotency_key="k1")
+        again = self._submit("update_issue", {"issue_key": "TEST-1", "summary": "Other"}, idempotency_key="k1")
+        self.assertEqual(again["created_at"], first["created_at"])
+        with self.assertRaises(ValueError):
+            self._submit("update_issue", {"issue_key": "TEST-1"})  # nothing to change
+        with self.assertRaises(ValueError):
+            self._submit("delete_issue", {"issue_key": "TEST-1"})
+
+        self.outbox.store.close()
+        self.outbox = self._outbox()
+        self.assertEqual(self.outbox.store.counts(), {PENDING: 1})
+        self.assertEqual(self.outbox.store.get("k1").params["summary"], "Renamed")
+
+    def test_gives_up_after_max_attempts(self):
+        self.outbox = self._outbox(max_attempts=2)
+        entry = self._submit("assign_task", {"issue_key": "TEST-404", "account_id": "someone"})
+
+        self.outbox.drain()
+        self.outbox.drain()
+
+        status = self.outbox.status(entry["id"])
+        self.assertEqual((status["status"], status["attempts"]), (FAILED, 2))
+
+    def test_entries_claimed_elsewhere_are_not_sent_until_the_lease_expires(self):
+        self.server.state.add_issue("TEST", "Existing")
+        comment = self._submit("add_comment", {"issue_key": "TEST-1", "comment_text": "Once"})["id"]
+        moved = self._submit("transition_issue", {"issue_key": "TEST-1", "status_name": "Done"})["id"]
+        other = self._outbox()
+        self.addCleanup(other.store.close)
+
+        # Another process claimed the comment and sent it, then died before recording the reply.
+        held = other.store.claim([other.store.get(comment)], "other-process", lease=60)
+        SENDERS["add_comment"](self.service, held[0], **held[0].params)
+        self.assertEqual(self.outbox.drain(), 0)  # the transition waits behind the in-flight comment
+        self.assertEqual(self.server.state.issues["TEST-1"]["fields"]["status"]["name"], "READY FOR DEVELOPMENT")
+
+        with other.store._lock:  # the dead process's lease runs out
+            other.store._conn.execute("UPDATE mutations SET lease_until = 0 WHERE id = ?", (comment,))
+            other.store._conn.commit()
+        self.outbox.drain()
+        self.outbox.drain()
+
+        self.assertEqual(self.outbox.status(comment)["attempts"], 2)
+        self.assertEqual(len(self.server.state.comments["TEST-1"]), 1)
+        self.assertEqual(self.outbox.status(moved)["status"], SENT)
+
+    def test_senders_sharing_a_log_apply_each_write_once(self):
+        created = [self._submit("create_issue", {"summary": f"New {i}", "description": ""})["id"] for i in range(6)]
+        others = [self._outbox(batch_size=2) for _ in range(3)]
+        for outbox in others:
+            self.addCleanup(outbox.store.close)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(lambda outbox: outbox.drain(), others))
+
+        self.assertEqual(self.outbox.store.counts(), {SENT: 6})
+        self.assertEqual(len(self.server.state.issues), 6)
+        self.assertTrue(all(self.outbox.status(i)["attempts"] == 1 for i in created))
+
+    def test_sender_thread_flushes(self):
+        self.server.state.add_issue("TEST", "Existing")
+        self.outbox.submit("assign_task", {"issue_key": "TEST-1", "account_id": "someone"})
+
+        self.assertEqual(self.outbox.flush(timeout=5), 0)
+        self.assertEqual(self.server.state.issues["TEST-1"]["fields"]["assignee"]["accountId"], "someone")
+
+
+class TestOutboxTools(unittest.TestCase):
+
+    @patch.dict(os.environ, {"JIRA_WRITE_MODE": "outbox"})
+    def test_write_tools_queue_in_outbox_mode(self):
+        from src import mcp_server
+
+        outbox = MagicMock()
+        outbox.submit.return_value = {"id": "abc", "status": PENDING}
+        with patch.object(mcp_server, "_outbox", outbox), \
+                patch.object(mcp_server, "jira_service") as service:
+            reply = asyncio.run(mcp_server.add_comment("TEST-1", "Hello"))
+
+        self.assertIn("outbox entry abc", reply)
+        outbox.submit.assert_called_once_with("add_comment", {"issue_key": "TEST-1", "comment_text": "Hello"}, None)
+        service.add_comment.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
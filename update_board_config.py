@@ -1,66 +1,37 @@
 import sys
-import json
 from src.jira_service import JiraService
+from src.workflow_provisioning import ColumnSpec, ProvisioningSpec, StatusSpec
 
-def update_board_config():
+# Desired CDAA board layout. Status IDs are looked up by name at run time.
+BOARD_ID = 45
+COLUMNS = [
+    ("To Do", "TODO"),
+    ("READY FOR DEV", "TODO"),
+    ("In Progress", "IN_PROGRESS"),
+    ("QA TESTING", "IN_PROGRESS"),
+    ("PO Validation", "IN_PROGRESS"),
+    ("Done", "DONE"),
+]
+
+BOARD_SPEC = ProvisioningSpec(
+    statuses=tuple(StatusSpec(name, category) for name, category in COLUMNS),
+    columns=tuple(ColumnSpec(name, (name,)) for name, _ in COLUMNS),
+    board_id=BOARD_ID,
+)
+
+def update_board_config(dry_run=False):
     try:
         service = JiraService()
-        board_id = 45 
-        
-        # IDs from inspection and creation
-        # Default ones for CDAA:
-        todo_id = "10082" 
-        inprogress_id = "10083"
-        done_id = "10084"
-        
-        # Global ones we verified:
-        ready_dev_id = "10074"
-        qa_testing_id = "10081"
-        po_valid_id = "10080"
-        
-        # Construct config
-        columns_config = [
-            {"name": "To Do", "statuses": [{"id": todo_id}]},
-            {"name": "READY FOR DEV", "statuses": [{"id": ready_dev_id}]},
-            {"name": "In Progress", "statuses": [{"id": inprogress_id}]},
-            {"name": "QA TESTING", "statuses": [{"id": qa_testing_id}]},
-            {"name": "PO Validation", "statuses": [{"id": po_valid_id}]},
-            {"name": "Done", "statuses": [{"id": done_id}]}
-        ]
-        
-        payload = {
-            "columnConfig": {
-                "columns": columns_config
-            }
-        }
-        
-        print("Updating Board 45 Configuration...")
-        print(json.dumps(payload, indent=2))
-        
-        # Note: PUT to configuration might fail if statuses are not in workflow.
-        # But for Simplified Workflow, it might auto-add them.
-        # Check standard endpoint: PUT /rest/agile/1.0/board/{boardId}/configuration
-        # Docs say: "Update board configuration" is not available in Cloud Agile API PUBLICLY usually?
-        # Use PUT /rest/agile/1.0/board/{boardId} is for metadata.
-        # Actually, there is NO public endpoint to update board configuration in Jira Cloud Agile API.
-        
-        # However, we can try using the internal Greenhopper API or just try the endpoint in case it works (sometimes it does for specific apps).
-        # OR, we verify if we can do it.
-        # If not, we fall back to notifying user.
-        
-        # Let's try the PUT anyway.
-        # If 404 or 405, we know.
-        
-        resp = service.client.put(f"/rest/agile/1.0/board/{board_id}/configuration", payload)
-        
-        if resp:
-            print("Update Successful!")
-            print(json.dumps(resp, indent=2))
+        print(f"Updating Board {BOARD_ID} Configuration...")
+        # Note: there is no documented public endpoint to update board columns in
+        # JIRA Cloud; the PUT is attempted and a failure is reported.
+        report = service.provision(BOARD_SPEC, dry_run=dry_run)
+        if report["ok"]:
+            print("Board is up to date." if not dry_run else "Dry run: nothing was changed.")
         else:
             print("Update Failed (Likely not supported via Public API).")
-
     except Exception as e:
         print(f"Error: {e}")
 
 if __name__ == "__main__":
-    update_board_config()
+    update_board_config(dry_run="--dry-run" in sys.argv)